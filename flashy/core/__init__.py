@@ -31,12 +31,30 @@ from flashy.core.i18n import (
 )
 from flashy.core.levels import (
     Level,
+    LevelRegistry,
+    LevelSource,
     get_level,
+    get_levels,
     get_levels_for_world,
+    get_total_worlds,
+    use_levels,
+)
+from flashy.core.models import (
+    LevelResult,
+    PackedScores,
+    PackedStars,
+    PlayerProgress,
+    PlayerSummary,
+    ProblemResult,
 )
-from flashy.core.models import LevelResult, PlayerProgress, ProblemResult
 from flashy.core.number_parser import is_fuzzy_match, is_give_up, parse_spoken_number
-from flashy.core.problems import Operation, Problem, generate_problem
+from flashy.core.problems import (
+    Operation,
+    Problem,
+    ProblemBatch,
+    generate_problem,
+    generate_problems,
+)
 from flashy.core.scoring import (
     calculate_score,
     calculate_stars,
@@ -65,11 +83,19 @@ __all__ = [
     "WorldIntroDismissed",
     # levels
     "Level",
+    "LevelRegistry",
+    "LevelSource",
     "get_level",
+    "get_levels",
     "get_levels_for_world",
+    "get_total_worlds",
+    "use_levels",
     # models
     "LevelResult",
     "PlayerProgress",
+    "PackedScores",
+    "PackedStars",
+    "PlayerSummary",
     "ProblemResult",
     # number_parser
     "is_fuzzy_match",
@@ -78,7 +104,9 @@ __all__ = [
     # problems
     "Operation",
     "Problem",
+    "ProblemBatch",
     "generate_problem",
+    "generate_problems",
     # scoring
     "calculate_score",
     "calculate_stars",
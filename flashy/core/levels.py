@@ -1,8 +1,11 @@
 """Level definitions - curated problem sequences for each level."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
+from typing import Protocol
 
+from flashy.core.models import LEVELS_PER_WORLD
 from flashy.core.problems import Operation, Problem
 
 
@@ -30,6 +33,10 @@ class Level:
     time_limit: int | None = None  # Seconds, only for boss levels
 
 
+# Level number of review rounds (see flashy.core.review); no real level has it
+REVIEW_LEVEL_NUMBER = 0
+
+
 # Helper functions to create problems concisely
 def add(a: int, b: int) -> Problem:
     """Create an addition problem."""
@@ -920,24 +927,168 @@ LEVELS = [
 ]
 
 
+class LevelRegistry:
+    """Levels indexed once for constant-time lookups.
+
+    Levels are kept in a tuple ordered by number, so a lookup by number is
+    an index. Levels by world, by type and by operation are precomputed
+    tuples. The invariants the rest of the game relies on are checked when
+    the registry is built.
+    """
+
+    def __init__(
+        self, levels: Iterable[Level], levels_per_world: int = LEVELS_PER_WORLD
+    ) -> None:
+        """Build the registry.
+
+        Args:
+            levels: The levels, in any order.
+            levels_per_world: How many levels every world must have.
+
+        Raises:
+            ValueError: If the levels are not numbered 1..N without gaps,
+                or a world does not have levels_per_world levels in order.
+        """
+        ordered = tuple(sorted(levels, key=lambda level: level.number))
+        for index, level in enumerate(ordered):
+            if level.number != index + 1:
+                raise ValueError(
+                    f"Levels must be numbered 1..{len(ordered)} without gaps, "
+                    f"found level {level.number} at position {index + 1}"
+                )
+            world_number, in_world = divmod(index, levels_per_world)
+            if (level.world_number, level.level_in_world) != (
+                world_number + 1,
+                in_world + 1,
+            ):
+                raise ValueError(
+                    f"Level {level.number} should be level {in_world + 1} of "
+                    f"world {world_number + 1}, not level "
+                    f"{level.level_in_world} of world {level.world_number}"
+                )
+        if len(ordered) % levels_per_world:
+            raise ValueError(
+                f"World {len(ordered) // levels_per_world + 1} has "
+                f"{len(ordered) % levels_per_world} levels, "
+                f"expected {levels_per_world}"
+            )
+
+        self._levels = ordered
+        self._levels_per_world = levels_per_world
+        self._by_world = tuple(
+            ordered[start : start + levels_per_world]
+            for start in range(0, len(ordered), levels_per_world)
+        )
+        by_type: dict[LevelType, list[Level]] = {kind: [] for kind in LevelType}
+        by_operation: dict[Operation, list[Level]] = {op: [] for op in Operation}
+        for level in ordered:
+            by_type[level.level_type].append(level)
+            for operation in {problem.operation for problem in level.problems}:
+                by_operation[operation].append(level)
+        self._by_type = {kind: tuple(group) for kind, group in by_type.items()}
+        self._by_operation = {op: tuple(group) for op, group in by_operation.items()}
+
+    def __len__(self) -> int:
+        """Return the number of levels."""
+        return len(self._levels)
+
+    @property
+    def levels(self) -> tuple[Level, ...]:
+        """All levels, ordered by number."""
+        return self._levels
+
+    @property
+    def world_count(self) -> int:
+        """The number of worlds the levels fill."""
+        return len(self._by_world)
+
+    def get(self, level_num: int) -> Level | None:
+        """Get level by number. Returns None if level doesn't exist."""
+        if 1 <= level_num <= len(self._levels):
+            return self._levels[level_num - 1]
+        return None
+
+    def for_world(self, world_num: int) -> tuple[Level, ...]:
+        """Get the levels of a world, in order. Empty if it doesn't exist."""
+        if 1 <= world_num <= len(self._by_world):
+            return self._by_world[world_num - 1]
+        return ()
+
+    def of_type(self, level_type: LevelType) -> tuple[Level, ...]:
+        """Get every level of a type, ordered by number."""
+        return self._by_type[level_type]
+
+    def with_operation(self, operation: Operation) -> tuple[Level, ...]:
+        """Get every level with at least one problem of an operation."""
+        return self._by_operation[operation]
+
+
+class LevelSource(Protocol):
+    """Levels the game can be played with: a LevelRegistry or CompiledPack."""
+
+    @property
+    def world_count(self) -> int:
+        """The number of worlds the levels fill."""
+        ...
+
+    def __len__(self) -> int:
+        """Return the number of levels."""
+        ...
+
+    def get(self, level_num: int) -> Level | None:
+        """Get level by number. Returns None if level doesn't exist."""
+        ...
+
+    def for_world(self, world_num: int) -> tuple[Level, ...]:
+        """Get the levels of a world, in order. Empty if it doesn't exist."""
+        ...
+
+
+REGISTRY = LevelRegistry(LEVELS)
+
+# The levels being played; the built-in ones unless use_levels() was called
+_active: LevelSource = REGISTRY
+
+
+def use_levels(source: LevelSource | None) -> None:
+    """Play a different set of levels, e.g. a level pack.
+
+    Every lookup below, and so the game flow and level select screens,
+    use the new levels. Progress is kept by level number, so one install
+    should stick to one set of levels.
+
+    Args:
+        source: The levels to play, or None for the built-in levels.
+    """
+    global _active
+    _active = source if source is not None else REGISTRY
+
+
+def get_levels() -> LevelSource:
+    """Get the levels being played."""
+    return _active
+
+
 def get_level(level_num: int) -> Level | None:
     """Get level by number. Returns None if level doesn't exist."""
-    for level in LEVELS:
-        if level.number == level_num:
-            return level
-    return None
+    return _active.get(level_num)
 
 
 def get_next_level(current_level: int) -> Level | None:
     """Get the next level after the current one. Returns None if no more levels."""
-    return get_level(current_level + 1)
+    return _active.get(current_level + 1)
 
 
 def get_total_levels() -> int:
     """Return total number of levels available."""
-    return len(LEVELS)
+    return len(_active)
+
+
+def get_total_worlds() -> int:
+    """Return total number of worlds available."""
+    return _active.world_count
 
 
 def get_levels_for_world(world_num: int) -> list[Level]:
     """Get all levels in a specific world."""
-    return [level for level in LEVELS if level.world_number == world_num]
+    return list(_active.for_world(world_num))
@@ -1,14 +1,228 @@
 """Data models for game state - pure data, no I/O."""
 
-from dataclasses import dataclass, field
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, MutableMapping
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 
+# Level numbers map to worlds in blocks of this size
+LEVELS_PER_WORLD = 10
 
-@dataclass
+# Version byte of the packed PlayerProgress encoding
+_PACK_VERSION = 1
+_PACK_HEADER = struct.Struct("<BH")  # version, level count
+_MAX_SCORE = 0xFFFFFFFF
+
+
+def _check_level(level: int) -> int:
+    """Validate a level number used as a packed-table key."""
+    if not isinstance(level, int) or level < 1:
+        raise KeyError(level)
+    return level
+
+
+class PackedStars(MutableMapping[int, int]):
+    """Level number -> stars (1-3), packed 2 bits per level into an int.
+
+    Behaves like a dict of completed levels. The star total, the totals
+    per world and the highest level passed with 2+ stars are kept up to
+    date on every write, so progress queries never scan all levels.
+    Storing 0 stars removes the level.
+    """
+
+    __slots__ = ("_bits", "_count", "_total", "_world_totals", "_highest_passed")
+
+    def __init__(self, items: Mapping[int, int] | None = None) -> None:
+        self._bits = 0
+        self._count = 0
+        self._total = 0
+        self._world_totals: dict[int, int] = {}
+        self._highest_passed = 0
+        for level, stars in (items or {}).items():
+            self[level] = stars
+
+    def __getitem__(self, level: int) -> int:
+        stars = self.get(level, 0)
+        if not stars:
+            raise KeyError(level)
+        return stars
+
+    def get(self, level: int, default: int = 0) -> int:  # type: ignore[override]
+        """Get stars for a level without raising for missing levels."""
+        if not isinstance(level, int) or level < 1:
+            return default
+        return (self._bits >> (2 * (level - 1))) & 3 or default
+
+    def __setitem__(self, level: int, stars: int) -> None:
+        _check_level(level)
+        stars = int(stars)
+        if not 0 <= stars <= 3:
+            raise ValueError(f"Stars must be 0-3, got {stars}")
+        shift = 2 * (level - 1)
+        old = (self._bits >> shift) & 3
+        if stars == old:
+            return
+        self._bits = (self._bits & ~(3 << shift)) | (stars << shift)
+        self._count += (stars > 0) - (old > 0)
+        self._total += stars - old
+        world = (level - 1) // LEVELS_PER_WORLD + 1
+        self._world_totals[world] = self._world_totals.get(world, 0) + stars - old
+
+        if stars >= 2 and level > self._highest_passed:
+            self._highest_passed = level
+        elif old >= 2 and stars < 2 and level == self._highest_passed:
+            self._highest_passed = max(
+                (lvl for lvl, s in self.items() if s >= 2), default=0
+            )
+
+    def __delitem__(self, level: int) -> None:
+        if not self.get(level, 0):
+            raise KeyError(level)
+        self[level] = 0
+
+    def __iter__(self) -> Iterator[int]:
+        bits = self._bits
+        level = 1
+        while bits:
+            if bits & 3:
+                yield level
+            bits >>= 2
+            level += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    @property
+    def total(self) -> int:
+        """Sum of stars across all levels."""
+        return self._total
+
+    @property
+    def highest_passed(self) -> int:
+        """Highest level with 2+ stars (0 if none)."""
+        return self._highest_passed
+
+    @property
+    def max_level(self) -> int:
+        """Highest level with any stars (0 if none)."""
+        return (self._bits.bit_length() + 1) // 2
+
+    def world_total(self, world: int) -> int:
+        """Sum of stars across the levels of one world."""
+        return self._world_totals.get(world, 0)
+
+    def copy(self) -> "PackedStars":
+        """Copy the table."""
+        other = PackedStars()
+        other._bits = self._bits
+        other._count = self._count
+        other._total = self._total
+        other._world_totals = dict(self._world_totals)
+        other._highest_passed = self._highest_passed
+        return other
+
+
+class PackedScores(MutableMapping[int, int]):
+    """Level number -> best score, stored in an array('I') by level.
+
+    Behaves like a dict of scored levels, with the total kept up to date
+    on every write. Storing a score of 0 removes the level.
+    """
+
+    __slots__ = ("_scores", "_count", "_total")
+
+    def __init__(self, items: Mapping[int, int] | None = None) -> None:
+        self._scores = array("I")
+        self._count = 0
+        self._total = 0
+        for level, score in (items or {}).items():
+            self[level] = score
+
+    def __getitem__(self, level: int) -> int:
+        score = self.get(level, 0)
+        if not score:
+            raise KeyError(level)
+        return score
+
+    def get(self, level: int, default: int = 0) -> int:  # type: ignore[override]
+        """Get the score for a level without raising for missing levels."""
+        if not isinstance(level, int) or not 1 <= level <= len(self._scores):
+            return default
+        return self._scores[level - 1] or default
+
+    def __setitem__(self, level: int, score: int) -> None:
+        _check_level(level)
+        score = int(score)
+        if not 0 <= score <= _MAX_SCORE:
+            raise ValueError(f"Score out of range: {score}")
+        if level > len(self._scores):
+            if not score:
+                return
+            self._scores.extend([0] * (level - len(self._scores)))
+        old = self._scores[level - 1]
+        self._scores[level - 1] = score
+        self._count += (score > 0) - (old > 0)
+        self._total += score - old
+
+    def __delitem__(self, level: int) -> None:
+        if not self.get(level, 0):
+            raise KeyError(level)
+        self[level] = 0
+
+    def __iter__(self) -> Iterator[int]:
+        for index, score in enumerate(self._scores):
+            if score:
+                yield index + 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    @property
+    def total(self) -> int:
+        """Sum of best scores across all levels."""
+        return self._total
+
+    @property
+    def max_level(self) -> int:
+        """Highest level the array has room for."""
+        return len(self._scores)
+
+    def copy(self) -> "PackedScores":
+        """Copy the table."""
+        other = PackedScores()
+        other._scores = array("I", self._scores)
+        other._count = self._count
+        other._total = self._total
+        return other
+
+
+@dataclass(init=False)
 class PlayerProgress:
-    """Player's game progress - stars, best scores, and unlocked levels."""
+    """Player's game progress - stars, best scores, and unlocked levels.
+
+    stars and best_scores behave like dicts keyed by level number but are
+    stored packed (see PackedStars and PackedScores), so unlock and total
+    queries are O(1).
+    """
 
-    stars: dict[int, int] = field(default_factory=dict)  # level_number -> stars (1-3)
-    best_scores: dict[int, int] = field(default_factory=dict)  # level_number -> score
+    stars: PackedStars = field(default_factory=PackedStars)  # level -> stars (1-3)
+    best_scores: PackedScores = field(default_factory=PackedScores)  # level -> score
+
+    def __init__(
+        self,
+        stars: Mapping[int, int] | None = None,
+        best_scores: Mapping[int, int] | None = None,
+    ) -> None:
+        self.stars = PackedStars(stars)
+        self.best_scores = PackedScores(best_scores)
 
     def get_stars(self, level: int) -> int:
         """Get stars for a level (0 if not completed)."""
@@ -32,21 +246,21 @@ class PlayerProgress:
 
     def get_total_best_score(self) -> int:
         """Get sum of best scores across all levels."""
-        return sum(self.best_scores.values())
+        return self.best_scores.total
 
-    def get_highest_unlocked(self) -> int:
-        """Get the highest level that has been unlocked."""
-        if not self.stars:
-            return 1  # Start with level 1 unlocked
+    def get_total_stars(self) -> int:
+        """Get sum of stars across all levels."""
+        return self.stars.total
 
-        # Find highest completed level with 2+ stars
-        highest = 0
-        for level_num, star_count in self.stars.items():
-            if star_count >= 2:
-                highest = max(highest, level_num)
+    def get_world_stars(self, world: int) -> int:
+        """Get sum of stars across the levels of one world."""
+        return self.stars.world_total(world)
 
-        # Next level after highest completed is unlocked
-        return highest + 1
+    def get_highest_unlocked(self) -> int:
+        """Get the highest level that has been unlocked."""
+        # Next level after the highest completed with 2+ stars; level 1
+        # is always unlocked
+        return self.stars.highest_passed + 1
 
     def is_unlocked(self, level: int) -> bool:
         """Check if a level is unlocked (playable)."""
@@ -55,6 +269,77 @@ class PlayerProgress:
         # Level is unlocked if previous level has 2+ stars
         return self.get_stars(level - 1) >= 2
 
+    def copy(self) -> "PlayerProgress":
+        """Copy the progress without sharing any mutable state."""
+        progress = PlayerProgress()
+        progress.stars = self.stars.copy()
+        progress.best_scores = self.best_scores.copy()
+        return progress
+
+    def pack(self) -> bytes:
+        """Encode as a short fixed-size binary record.
+
+        The layout is a version byte and a level count (little-endian
+        uint16), then 2 bits of stars per level and a uint32 best score
+        per level. The size depends only on the highest level stored.
+        """
+        count = max(self.stars.max_level, self.best_scores.max_level)
+        star_bytes = self.stars._bits.to_bytes((count + 3) // 4, "little")
+        scores = array("I", (self.best_scores.get(lvl) for lvl in range(1, count + 1)))
+        if sys.byteorder != "little":
+            scores.byteswap()
+        return _PACK_HEADER.pack(_PACK_VERSION, count) + star_bytes + scores.tobytes()
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "PlayerProgress":
+        """Decode a record written by pack().
+
+        Raises:
+            ValueError: If the data is not a valid packed record.
+        """
+        if len(data) < _PACK_HEADER.size:
+            raise ValueError("Packed progress is truncated")
+        version, count = _PACK_HEADER.unpack_from(data)
+        if version != _PACK_VERSION:
+            raise ValueError(f"Unknown packed progress version {version}")
+        star_size = (count + 3) // 4
+        if len(data) != _PACK_HEADER.size + star_size + 4 * count:
+            raise ValueError("Packed progress has the wrong size")
+
+        offset = _PACK_HEADER.size
+        bits = int.from_bytes(data[offset : offset + star_size], "little")
+        scores = array("I", data[offset + star_size :])
+        if sys.byteorder != "little":
+            scores.byteswap()
+
+        stars = {}
+        for index in range(count):
+            value = (bits >> (2 * index)) & 3
+            if value:
+                stars[index + 1] = value
+        best_scores = {index + 1: score for index, score in enumerate(scores) if score}
+        return cls(stars=stars, best_scores=best_scores)
+
+
+@dataclass(frozen=True)
+class PlayerSummary:
+    """Per-player totals shown on the player select screen."""
+
+    name: str
+    total_stars: int = 0
+    highest_unlocked: int = 1
+    total_best_score: int = 0
+
+    @classmethod
+    def from_progress(cls, name: str, progress: PlayerProgress) -> "PlayerSummary":
+        """Summarize a player's progress."""
+        return cls(
+            name=name,
+            total_stars=progress.get_total_stars(),
+            highest_unlocked=progress.get_highest_unlocked(),
+            total_best_score=progress.get_total_best_score(),
+        )
+
 
 @dataclass
 class ProblemResult:
@@ -80,3 +365,41 @@ class LevelResult:
     best_streak: int
     total_time_seconds: float
     problems: list[ProblemResult]
+    player_name: str = ""
+    timestamp: datetime | None = None  # When the session was logged
+
+    def to_log_entry(self) -> dict:
+        """Convert to the JSON-ready dict stored in history logs.
+
+        Sessions without a timestamp are stamped with the current time.
+        """
+        timestamp = self.timestamp or datetime.now()
+        return {
+            "timestamp": timestamp.isoformat(),
+            "player": self.player_name,
+            "level_number": self.level_number,
+            "level_name": self.level_name,
+            "score": self.total_score,
+            "correct": self.correct_count,
+            "total": self.total_problems,
+            "best_streak": self.best_streak,
+            "time_seconds": self.total_time_seconds,
+            "problems": [asdict(p) for p in self.problems],
+        }
+
+    @classmethod
+    def from_log_entry(cls, entry: dict) -> "LevelResult":
+        """Create from a history log entry (see to_log_entry)."""
+        timestamp = entry.get("timestamp")
+        return cls(
+            level_number=entry["level_number"],
+            level_name=entry.get("level_name", ""),
+            total_score=entry.get("score", 0),
+            correct_count=entry.get("correct", 0),
+            total_problems=entry.get("total", 0),
+            best_streak=entry.get("best_streak", 0),
+            total_time_seconds=entry.get("time_seconds", 0.0),
+            problems=[ProblemResult(**p) for p in entry.get("problems", [])],
+            player_name=entry.get("player", ""),
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+        )
@@ -0,0 +1,284 @@
+"""Level packs - levels defined as data instead of Python literals.
+
+A pack is a mapping, usually read from a JSON or TOML file:
+
+    {
+        "name": "Times tables",
+        "worlds": [
+            {"levels": [
+                {"name": "Twos", "type": "intro", "problems": ["2 × 3", "2 × 4"]},
+                ...
+            ]},
+            ...
+        ]
+    }
+
+Levels are numbered by their position, and every world needs
+LEVELS_PER_WORLD levels. Problems are written "a op b" with op one of
++ - × x * ÷ /. Only boss levels have a time_limit, and they need one.
+
+parse_pack() validates a pack once. compile_pack() turns it into a compact
+binary form that CompiledPack reads back one world at a time, so opening a
+pack with thousands of levels only decodes the worlds that are used.
+Reading and caching pack files is done by flashy.packs.
+"""
+
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from flashy.core.levels import Level, LevelRegistry, LevelType
+from flashy.core.models import LEVELS_PER_WORLD
+from flashy.core.problems import Operation, Problem, parse_problem
+
+FORMAT_VERSION = 1
+_MAGIC = b"FLPK"
+
+# magic, version, world count, levels per world, pack name length
+_HEADER = struct.Struct("<4sHHHH")
+# level type, time limit (0 for none), name length, problem count
+_LEVEL = struct.Struct("<BHHH")
+# operand1, operand2, answer, operation
+_PROBLEM = struct.Struct("<iiiB")
+
+_LEVEL_TYPES = list(LevelType)
+_OPERATIONS = list(Operation)
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+
+
+@dataclass(frozen=True)
+class LevelPack:
+    """A validated level pack."""
+
+    name: str
+    levels: tuple[Level, ...]
+
+
+def parse_pack(
+    data: Mapping[str, Any], levels_per_world: int = LEVELS_PER_WORLD
+) -> LevelPack:
+    """Validate a pack and build its levels.
+
+    Args:
+        data: The decoded pack file.
+        levels_per_world: How many levels every world must have.
+
+    Returns:
+        The pack.
+
+    Raises:
+        ValueError: If the pack is not valid. The message says where.
+    """
+    name = data.get("name")
+    worlds = data.get("worlds")
+    if not isinstance(name, str) or not name:
+        raise ValueError("Pack needs a name")
+    if not isinstance(worlds, list) or not worlds:
+        raise ValueError("Pack needs a list of worlds")
+
+    levels: list[Level] = []
+    for world_number, world in enumerate(worlds, start=1):
+        world_levels = world.get("levels") if isinstance(world, Mapping) else None
+        if not isinstance(world_levels, list):
+            raise ValueError(f"World {world_number} needs a list of levels")
+        if len(world_levels) != levels_per_world:
+            raise ValueError(
+                f"World {world_number} has {len(world_levels)} levels, "
+                f"expected {levels_per_world}"
+            )
+        for level_in_world, entry in enumerate(world_levels, start=1):
+            where = f"World {world_number} level {level_in_world}"
+            try:
+                levels.append(
+                    _parse_level(
+                        entry, len(levels) + 1, world_number, level_in_world
+                    )
+                )
+            except ValueError as e:
+                raise ValueError(f"{where}: {e}") from None
+
+    # Numbering comes from positions, but keep the registry's checks in one place
+    LevelRegistry(levels, levels_per_world)
+    return LevelPack(name=name, levels=tuple(levels))
+
+
+def _parse_level(
+    entry: Any, number: int, world_number: int, level_in_world: int
+) -> Level:
+    """Build one level of a pack."""
+    if not isinstance(entry, Mapping):
+        raise ValueError("Level must be a table")
+    name = entry.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError("Level needs a name")
+    try:
+        level_type = LevelType(entry.get("type"))
+    except ValueError:
+        choices = ", ".join(kind.value for kind in LevelType)
+        raise ValueError(f"Level type must be one of {choices}") from None
+    problems = entry.get("problems")
+    if not isinstance(problems, list) or not problems:
+        raise ValueError("Level needs a list of problems")
+    if not all(isinstance(text, str) for text in problems):
+        raise ValueError("Problems must be strings")
+
+    time_limit = entry.get("time_limit")
+    if level_type == LevelType.BOSS:
+        if not isinstance(time_limit, int) or not 0 < time_limit <= 0xFFFF:
+            raise ValueError("Boss level needs a time_limit in seconds")
+    elif time_limit is not None:
+        raise ValueError("Only boss levels have a time_limit")
+
+    return Level(
+        number=number,
+        world_number=world_number,
+        level_in_world=level_in_world,
+        name=name,
+        level_type=level_type,
+        problems=tuple(_parse_problem(text) for text in problems),
+        time_limit=time_limit,
+    )
+
+
+def _parse_problem(text: str) -> Problem:
+    """Parse one problem of a pack, which has to fit the compiled form."""
+    problem = parse_problem(text)
+    numbers = (problem.operand1, problem.operand2, problem.answer)
+    if not all(_INT32_MIN <= n <= _INT32_MAX for n in numbers):
+        raise ValueError(f"Numbers out of range: {text!r}")
+    return problem
+
+
+def compile_pack(pack: LevelPack, levels_per_world: int = LEVELS_PER_WORLD) -> bytes:
+    """Encode a validated pack in the binary form CompiledPack reads.
+
+    The header and a table of world offsets come first, so one world can
+    be decoded without reading the others.
+    """
+    name = pack.name.encode()
+    worlds: list[bytes] = []
+    for start in range(0, len(pack.levels), levels_per_world):
+        chunk = bytearray()
+        for level in pack.levels[start : start + levels_per_world]:
+            level_name = level.name.encode()
+            chunk += _LEVEL.pack(
+                _LEVEL_TYPES.index(level.level_type),
+                level.time_limit or 0,
+                len(level_name),
+                len(level.problems),
+            )
+            chunk += level_name
+            for problem in level.problems:
+                chunk += _PROBLEM.pack(
+                    problem.operand1,
+                    problem.operand2,
+                    problem.answer,
+                    _OPERATIONS.index(problem.operation),
+                )
+        worlds.append(bytes(chunk))
+
+    offsets = [0]
+    for chunk in worlds:
+        offsets.append(offsets[-1] + len(chunk))
+    header = _HEADER.pack(
+        _MAGIC, FORMAT_VERSION, len(worlds), levels_per_world, len(name)
+    )
+    table = struct.pack(f"<{len(offsets)}I", *offsets)
+    return b"".join([header, name, table, *worlds])
+
+
+class CompiledPack:
+    """A compiled pack, decoded one world at a time on first use.
+
+    Has the same lookups as LevelRegistry. The data is trusted to come
+    from compile_pack(); only the header is checked.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """Read the pack header.
+
+        Args:
+            data: Bytes made by compile_pack().
+
+        Raises:
+            ValueError: If data is not a compiled pack of this version.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a compiled level pack")
+        magic, version, world_count, levels_per_world, name_length = (
+            _HEADER.unpack_from(data)
+        )
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a compiled level pack")
+        name_end = _HEADER.size + name_length
+        table = struct.Struct(f"<{world_count + 1}I")
+        self._data = data
+        self._name = data[_HEADER.size : name_end].decode()
+        self._offsets = table.unpack_from(data, name_end)
+        self._worlds_start = name_end + table.size
+        self._levels_per_world = levels_per_world
+        self._worlds: list[tuple[Level, ...] | None] = [None] * world_count
+
+    @property
+    def name(self) -> str:
+        """The pack's name."""
+        return self._name
+
+    @property
+    def world_count(self) -> int:
+        """The number of worlds in the pack."""
+        return len(self._worlds)
+
+    def __len__(self) -> int:
+        """Return the number of levels."""
+        return len(self._worlds) * self._levels_per_world
+
+    def get(self, level_num: int) -> Level | None:
+        """Get level by number. Returns None if level doesn't exist."""
+        if not 1 <= level_num <= len(self):
+            return None
+        world_index, in_world = divmod(level_num - 1, self._levels_per_world)
+        return self.for_world(world_index + 1)[in_world]
+
+    def for_world(self, world_num: int) -> tuple[Level, ...]:
+        """Get the levels of a world, in order. Empty if it doesn't exist."""
+        if not 1 <= world_num <= len(self._worlds):
+            return ()
+        levels = self._worlds[world_num - 1]
+        if levels is None:
+            levels = self._decode_world(world_num)
+            self._worlds[world_num - 1] = levels
+        return levels
+
+    def _decode_world(self, world_num: int) -> tuple[Level, ...]:
+        """Decode one world's levels."""
+        data = self._data
+        pos = self._worlds_start + self._offsets[world_num - 1]
+        first = (world_num - 1) * self._levels_per_world + 1
+        levels = []
+        for in_world in range(self._levels_per_world):
+            type_index, time_limit, name_length, problem_count = _LEVEL.unpack_from(
+                data, pos
+            )
+            pos += _LEVEL.size
+            name = data[pos : pos + name_length].decode()
+            pos += name_length
+            end = pos + problem_count * _PROBLEM.size
+            problems = tuple(
+                Problem(a, b, _OPERATIONS[op], answer)
+                for a, b, answer, op in _PROBLEM.iter_unpack(data[pos:end])
+            )
+            pos = end
+            levels.append(
+                Level(
+                    number=first + in_world,
+                    world_number=world_num,
+                    level_in_world=in_world + 1,
+                    name=name,
+                    level_type=_LEVEL_TYPES[type_index],
+                    problems=problems,
+                    time_limit=time_limit or None,
+                )
+            )
+        return tuple(levels)
@@ -1,9 +1,24 @@
 """Problem generation - pure functions for creating math problems."""
 
 import random
+import re
+from array import array
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:
+    # Optional (the "fast" extra); Pyodide builds use the pure-Python path
+    np = None
+
+# Batches are int64 columns, so every answer has to fit in one
+_INT64_MAX = 2**63 - 1
+
+# random.randint or a Random instance's bound randint
+RandInt = Callable[[int, int], int]
+
 
 class Operation(Enum):
     ADD = "+"
@@ -31,50 +46,104 @@ class Problem:
         return f"{self.operand1} {self.operation.value} {op2}"
 
 
-def generate_problem(operation: Operation, min_val: int, max_val: int) -> Problem:
+_SYMBOLS = {
+    "+": Operation.ADD,
+    "-": Operation.SUBTRACT,
+    "×": Operation.MULTIPLY,
+    "x": Operation.MULTIPLY,
+    "*": Operation.MULTIPLY,
+    "÷": Operation.DIVIDE,
+    "/": Operation.DIVIDE,
+}
+_PROBLEM_RE = re.compile(r"\s*(-?\d+)\s*([-+×x*÷/])\s*(?:(-?\d+)|\((-?\d+)\))\s*")
+
+
+def parse_problem(text: str) -> Problem:
+    """Parse a problem written like "12 - 5", "3 × 4" or "-1 - (-8)".
+
+    Reads what Problem.display() writes, and also accepts x, * and / for
+    multiplication and division.
+
+    Raises:
+        ValueError: If the text is not a problem, or a division is not
+            exact.
+    """
+    match = _PROBLEM_RE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Not a problem: {text!r}")
+    a = int(match.group(1))
+    b = int(match.group(3) or match.group(4))
+    operation = _SYMBOLS[match.group(2)]
+    if operation == Operation.ADD:
+        answer = a + b
+    elif operation == Operation.SUBTRACT:
+        answer = a - b
+    elif operation == Operation.MULTIPLY:
+        answer = a * b
+    else:
+        if b == 0 or a % b:
+            raise ValueError(f"Division must be exact: {text!r}")
+        answer = a // b
+    return Problem(a, b, operation, answer)
+
+
+def generate_problem(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    *,
+    rng: random.Random | None = None,
+) -> Problem:
     """Generate a random problem for the given operation and number range.
 
     For subtraction: ensures non-negative result.
     For division: ensures clean integer result (no remainder).
+
+    Args:
+        operation: The operation of the problem.
+        min_val: Smallest operand (for division, smallest answer and divisor).
+        max_val: Largest operand (for division, largest answer and divisor).
+        rng: Source of randomness. Defaults to the random module's.
     """
+    randint = rng.randint if rng is not None else random.randint
     if operation == Operation.ADD:
-        return _generate_addition(min_val, max_val)
+        return _generate_addition(min_val, max_val, randint)
     elif operation == Operation.SUBTRACT:
-        return _generate_subtraction(min_val, max_val)
+        return _generate_subtraction(min_val, max_val, randint)
     elif operation == Operation.MULTIPLY:
-        return _generate_multiplication(min_val, max_val)
+        return _generate_multiplication(min_val, max_val, randint)
     elif operation == Operation.DIVIDE:
-        return _generate_division(min_val, max_val)
+        return _generate_division(min_val, max_val, randint)
     else:
         raise ValueError(f"Unknown operation: {operation}")
 
 
-def _generate_addition(min_val: int, max_val: int) -> Problem:
-    a = random.randint(min_val, max_val)
-    b = random.randint(min_val, max_val)
+def _generate_addition(min_val: int, max_val: int, randint: RandInt) -> Problem:
+    a = randint(min_val, max_val)
+    b = randint(min_val, max_val)
     return Problem(operand1=a, operand2=b, operation=Operation.ADD, answer=a + b)
 
 
-def _generate_subtraction(min_val: int, max_val: int) -> Problem:
+def _generate_subtraction(min_val: int, max_val: int, randint: RandInt) -> Problem:
     # Generate two numbers and ensure a >= b for non-negative result
-    a = random.randint(min_val, max_val)
-    b = random.randint(min_val, max_val)
+    a = randint(min_val, max_val)
+    b = randint(min_val, max_val)
     if a < b:
         a, b = b, a
     return Problem(operand1=a, operand2=b, operation=Operation.SUBTRACT, answer=a - b)
 
 
-def _generate_multiplication(min_val: int, max_val: int) -> Problem:
-    a = random.randint(min_val, max_val)
-    b = random.randint(min_val, max_val)
+def _generate_multiplication(min_val: int, max_val: int, randint: RandInt) -> Problem:
+    a = randint(min_val, max_val)
+    b = randint(min_val, max_val)
     return Problem(operand1=a, operand2=b, operation=Operation.MULTIPLY, answer=a * b)
 
 
-def _generate_division(min_val: int, max_val: int) -> Problem:
+def _generate_division(min_val: int, max_val: int, randint: RandInt) -> Problem:
     # Generate answer and divisor, then compute dividend
     # This ensures clean integer division
-    answer = random.randint(min_val, max_val)
-    divisor = random.randint(min_val, max_val)
+    answer = randint(min_val, max_val)
+    divisor = randint(min_val, max_val)
     # Avoid division by zero
     if divisor == 0:
         divisor = 1
@@ -82,3 +151,133 @@ def _generate_division(min_val: int, max_val: int) -> Problem:
     return Problem(
         operand1=dividend, operand2=divisor, operation=Operation.DIVIDE, answer=answer
     )
+
+
+@dataclass(frozen=True)
+class ProblemBatch:
+    """Generated problems stored as columns.
+
+    Columns are NumPy int64 arrays when NumPy is available and
+    array("q") otherwise. Problem objects are only made when an item is
+    read, so a batch of thousands costs a few integers per problem.
+    """
+
+    operation: Operation
+    operand1: Sequence[int]
+    operand2: Sequence[int]
+    answer: Sequence[int]
+
+    def __len__(self) -> int:
+        """Return the number of problems."""
+        return len(self.answer)
+
+    def __getitem__(self, index: int) -> Problem:
+        """Make the problem at an index."""
+        return Problem(
+            operand1=int(self.operand1[index]),
+            operand2=int(self.operand2[index]),
+            operation=self.operation,
+            answer=int(self.answer[index]),
+        )
+
+    def __iter__(self) -> Iterator[Problem]:
+        """Make the problems in order."""
+        operation = self.operation
+        for a, b, answer in zip(self.operand1, self.operand2, self.answer, strict=True):
+            yield Problem(int(a), int(b), operation, int(answer))
+
+
+def generate_problems(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    n: int,
+    *,
+    rng: random.Random | None = None,
+) -> ProblemBatch:
+    """Generate n random problems at once, by the rules of generate_problem.
+
+    Operands are drawn a whole column at a time, with NumPy when it is
+    installed. The same rng seed gives the same batch on the same path,
+    but the NumPy and pure-Python paths draw different problems.
+
+    Args:
+        operation: The operation of every problem.
+        min_val: Smallest operand (for division, smallest answer and divisor).
+        max_val: Largest operand (for division, largest answer and divisor).
+        n: How many problems to generate.
+        rng: Source of randomness. Defaults to the random module's.
+
+    Returns:
+        The problems as a ProblemBatch.
+
+    Raises:
+        ValueError: If the range is empty, n is negative, or answers in
+            the range would not fit in 64 bits.
+    """
+    if min_val > max_val:
+        raise ValueError(f"Empty range: {min_val}..{max_val}")
+    if n < 0:
+        raise ValueError(f"Negative problem count: {n}")
+    if max(abs(min_val), abs(max_val)) ** 2 * 2 > _INT64_MAX:
+        raise ValueError(f"Range too large for a batch: {min_val}..{max_val}")
+    if np is not None:
+        return _generate_batch_numpy(operation, min_val, max_val, n, rng)
+    return _generate_batch_python(operation, min_val, max_val, n, rng)
+
+
+def _generate_batch_numpy(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    n: int,
+    rng: random.Random | None,
+) -> ProblemBatch:
+    assert np is not None  # Only called when NumPy imported
+    generator = np.random.default_rng(
+        rng.getrandbits(128) if rng is not None else None
+    )
+    a = generator.integers(min_val, max_val, size=n, endpoint=True, dtype=np.int64)
+    b = generator.integers(min_val, max_val, size=n, endpoint=True, dtype=np.int64)
+    if operation == Operation.ADD:
+        return ProblemBatch(operation, a, b, a + b)
+    elif operation == Operation.SUBTRACT:
+        # Larger operand first for a non-negative result
+        high, low = np.maximum(a, b), np.minimum(a, b)
+        return ProblemBatch(operation, high, low, high - low)
+    elif operation == Operation.MULTIPLY:
+        return ProblemBatch(operation, a, b, a * b)
+    elif operation == Operation.DIVIDE:
+        # a is the answer, b the divisor; zero divisors become 1
+        divisor = np.where(b == 0, 1, b)
+        return ProblemBatch(operation, a * divisor, divisor, a)
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+
+
+def _generate_batch_python(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    n: int,
+    rng: random.Random | None,
+) -> ProblemBatch:
+    choices = rng.choices if rng is not None else random.choices
+    values = range(min_val, max_val + 1)
+    a = choices(values, k=n)
+    b = choices(values, k=n)
+    if operation == Operation.ADD:
+        columns = (a, b, [x + y for x, y in zip(a, b, strict=True)])
+    elif operation == Operation.SUBTRACT:
+        high = list(map(max, a, b))
+        low = list(map(min, a, b))
+        columns = (high, low, [x - y for x, y in zip(high, low, strict=True)])
+    elif operation == Operation.MULTIPLY:
+        columns = (a, b, [x * y for x, y in zip(a, b, strict=True)])
+    elif operation == Operation.DIVIDE:
+        divisor = [y or 1 for y in b]
+        columns = ([x * y for x, y in zip(a, divisor, strict=True)], divisor, a)
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+    operand1, operand2, answer = (array("q", column) for column in columns)
+    return ProblemBatch(operation, operand1, operand2, answer)
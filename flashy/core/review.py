@@ -0,0 +1,274 @@
+"""Spaced-repetition review of individual math facts.
+
+A fact is one problem, e.g. 7 × 8, tracked apart from the level it was
+seen in. Each fact sits in a Leitner box: a right answer moves it up a
+box and a wrong one sends it back to the first, and the box decides how
+long until the fact is due again.
+
+ReviewScheduler keeps the facts in a heap keyed by due time, so picking
+the next fact and recording an answer are both O(log n); history only
+has to be replayed once, to build the first state. The state packs to
+a few bytes per fact for saving per player.
+
+Times are seconds since the epoch, passed in by the caller.
+
+review_level() turns the due facts into a round played like a level.
+Its sessions are logged under REVIEW_LEVEL_NUMBER, so replaying history
+counts them, but no stars or scores are kept for it.
+"""
+
+import heapq
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from flashy.core.levels import REVIEW_LEVEL_NUMBER, Level, LevelType
+from flashy.core.models import LevelResult, ProblemResult
+from flashy.core.problems import Operation, Problem, parse_problem
+
+# Seconds until a fact is due again, by box
+DEFAULT_INTERVALS = (
+    60,  # Wrong or new: again in the same session
+    10 * 60,
+    24 * 3600,
+    3 * 24 * 3600,
+    7 * 24 * 3600,
+    21 * 24 * 3600,
+    60 * 24 * 3600,
+)
+
+# Facts asked in one review round, at most
+REVIEW_ROUND_SIZE = 10
+
+# Version byte of the packed scheduler state
+_PACK_VERSION = 1
+_PACK_HEADER = struct.Struct("<BI")  # version, fact count
+# operand1, operand2, operation, box, due (epoch seconds), seen, correct
+_PACK_FACT = struct.Struct("<iiBBIHH")
+_OPERATIONS = list(Operation)
+_MAX_COUNT = 0xFFFF
+
+# Rebuild the heap when stale entries outnumber live ones this many times
+_COMPACT_RATIO = 2
+
+
+class Fact(NamedTuple):
+    """One math fact, e.g. Fact(7, Operation.MULTIPLY, 8)."""
+
+    operand1: int
+    operation: Operation
+    operand2: int
+
+    @classmethod
+    def of(cls, problem: Problem) -> "Fact":
+        """Get the fact a problem asks."""
+        return cls(problem.operand1, problem.operation, problem.operand2)
+
+    def problem(self) -> Problem:
+        """Make the problem for this fact."""
+        a, b = self.operand1, self.operand2
+        if self.operation == Operation.ADD:
+            answer = a + b
+        elif self.operation == Operation.SUBTRACT:
+            answer = a - b
+        elif self.operation == Operation.MULTIPLY:
+            answer = a * b
+        else:
+            answer = a // b
+        return Problem(a, b, self.operation, answer)
+
+
+@dataclass
+class FactState:
+    """How well one fact is known."""
+
+    box: int
+    due: float
+    seen: int = 0
+    correct: int = 0
+
+
+class ReviewScheduler:
+    """Per-player review queue of math facts, ordered by due time.
+
+    The heap holds (due, sequence, fact) entries. Rescheduling a fact
+    pushes a new entry and leaves the old one to be skipped when it
+    reaches the top, so updates never search the heap.
+    """
+
+    def __init__(self, intervals: tuple[int, ...] = DEFAULT_INTERVALS) -> None:
+        """Initialize an empty scheduler.
+
+        Args:
+            intervals: Seconds until a fact is due again, for each box.
+        """
+        self._intervals = intervals
+        self._facts: dict[Fact, FactState] = {}
+        self._heap: list[tuple[float, int, Fact]] = []
+        # Sequence number of each fact's live heap entry
+        self._live: dict[Fact, int] = {}
+        self._sequence = 0
+
+    @classmethod
+    def from_sessions(
+        cls,
+        sessions: Iterable[LevelResult],
+        intervals: tuple[int, ...] = DEFAULT_INTERVALS,
+    ) -> "ReviewScheduler":
+        """Build a scheduler by replaying logged sessions, oldest first.
+
+        Sessions without a timestamp are skipped.
+        """
+        scheduler = cls(intervals)
+        for session in sessions:
+            if session.timestamp is None:
+                continue
+            now = session.timestamp.timestamp()
+            for result in session.problems:
+                scheduler.record_result(result, now)
+        return scheduler
+
+    def __len__(self) -> int:
+        """Return the number of facts being tracked."""
+        return len(self._facts)
+
+    def __contains__(self, fact: object) -> bool:
+        """Return whether a fact is being tracked."""
+        return fact in self._facts
+
+    def state(self, fact: Fact) -> FactState | None:
+        """Get a copy of a fact's state, or None if it is not tracked."""
+        state = self._facts.get(fact)
+        return None if state is None else FactState(**vars(state))
+
+    def record(self, fact: Fact, correct: bool, now: float) -> None:
+        """Update a fact after it was answered. O(log n).
+
+        Args:
+            fact: The fact that was asked.
+            correct: Whether it was answered correctly.
+            now: When it was answered.
+        """
+        state = self._facts.get(fact)
+        if state is None:
+            state = self._facts[fact] = FactState(box=0, due=now)
+        state.box = min(state.box + 1, len(self._intervals) - 1) if correct else 0
+        state.due = now + self._intervals[state.box]
+        state.seen = min(state.seen + 1, _MAX_COUNT)
+        state.correct = min(state.correct + correct, _MAX_COUNT)
+        self._push(fact, state.due)
+
+    def record_problem(self, problem: Problem, correct: bool, now: float) -> None:
+        """Update the fact a problem asks. See record()."""
+        self.record(Fact.of(problem), correct, now)
+
+    def record_result(self, result: ProblemResult, now: float) -> None:
+        """Update the fact of a logged problem result.
+
+        Results whose problem text can't be read are ignored.
+        """
+        try:
+            problem = parse_problem(result.problem)
+        except ValueError:
+            return
+        self.record_problem(problem, result.is_correct, now)
+
+    def peek(self) -> tuple[Fact, float] | None:
+        """Get the fact due soonest and its due time, or None if empty."""
+        heap = self._heap
+        while heap:
+            due, sequence, fact = heap[0]
+            if self._live.get(fact) == sequence:
+                return fact, due
+            heapq.heappop(heap)  # Stale: the fact was rescheduled
+        return None
+
+    def next_due(self, now: float) -> Fact | None:
+        """Get the fact due soonest, if it is due by now. O(log n)."""
+        top = self.peek()
+        if top is None or top[1] > now:
+            return None
+        return top[0]
+
+    def due(self, now: float, limit: int = REVIEW_ROUND_SIZE) -> list[Fact]:
+        """Get up to limit facts due by now, soonest first. O(n log limit)."""
+        entries = (
+            entry
+            for entry in self._heap
+            if entry[0] <= now and self._live.get(entry[2]) == entry[1]
+        )
+        return [fact for _, _, fact in heapq.nsmallest(limit, entries)]
+
+    def _push(self, fact: Fact, due: float) -> None:
+        """Queue a fact's new due time, superseding any earlier entry."""
+        self._sequence += 1
+        self._live[fact] = self._sequence
+        heapq.heappush(self._heap, (due, self._sequence, fact))
+        if len(self._heap) > (_COMPACT_RATIO + 1) * len(self._live):
+            self._heap = [
+                entry for entry in self._heap if self._live[entry[2]] == entry[1]
+            ]
+            heapq.heapify(self._heap)
+
+    def to_bytes(self) -> bytes:
+        """Pack the state: 18 bytes per fact.
+
+        Due times are stored to the second.
+        """
+        parts = [_PACK_HEADER.pack(_PACK_VERSION, len(self._facts))]
+        for fact, state in self._facts.items():
+            parts.append(
+                _PACK_FACT.pack(
+                    fact.operand1,
+                    fact.operand2,
+                    _OPERATIONS.index(fact.operation),
+                    state.box,
+                    int(state.due),
+                    state.seen,
+                    state.correct,
+                )
+            )
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, intervals: tuple[int, ...] = DEFAULT_INTERVALS
+    ) -> "ReviewScheduler":
+        """Unpack a state made by to_bytes().
+
+        Raises:
+            ValueError: If the data is not a packed scheduler state.
+        """
+        if len(data) < _PACK_HEADER.size:
+            raise ValueError("Truncated review state")
+        version, count = _PACK_HEADER.unpack_from(data)
+        if version != _PACK_VERSION:
+            raise ValueError(f"Unknown review state version: {version}")
+        if len(data) != _PACK_HEADER.size + count * _PACK_FACT.size:
+            raise ValueError("Truncated review state")
+
+        scheduler = cls(intervals)
+        last_box = len(intervals) - 1
+        for a, b, op, box, due, seen, correct in _PACK_FACT.iter_unpack(
+            data[_PACK_HEADER.size :]
+        ):
+            fact = Fact(a, _OPERATIONS[op], b)
+            scheduler._facts[fact] = FactState(min(box, last_box), due, seen, correct)
+            scheduler._sequence += 1
+            scheduler._live[fact] = scheduler._sequence
+            scheduler._heap.append((due, scheduler._sequence, fact))
+        heapq.heapify(scheduler._heap)
+        return scheduler
+
+
+def review_level(facts: Iterable[Fact]) -> Level:
+    """Make a review round asking the given facts, in order."""
+    return Level(
+        number=REVIEW_LEVEL_NUMBER,
+        world_number=0,
+        level_in_world=0,
+        name="Review",
+        level_type=LevelType.BUILD,
+        problems=tuple(fact.problem() for fact in facts),
+    )
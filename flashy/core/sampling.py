@@ -0,0 +1,283 @@
+"""Constraint-aware problem sampling from precomputed candidate tables.
+
+Constraints narrow the problems generate_problem would make, e.g.
+two-digit addition with no carry:
+
+    ProblemSampler(Operation.ADD, 10, 99, [NoCarry()])
+
+or division facts with a divisor of at most 9:
+
+    ProblemSampler(Operation.DIVIDE, 0, 12, [Bounds("operand2", high=9)])
+
+Every problem allowed for an (operation, range, constraints) key is
+listed once in a candidate table, which is cached. Sampling then picks
+an index: O(1) per problem however tight the constraints are, where
+rejection sampling around generate_problem can take any number of draws.
+"""
+
+import random
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar, Literal
+
+from flashy.core.problems import Operation, Problem
+
+# Largest number of operand pairs a table may be built from
+MAX_CANDIDATES = 1_000_000
+
+
+class Constraint(ABC):
+    """A rule a problem must follow. Subclasses are frozen dataclasses."""
+
+    # Operations the constraint applies to; None for all
+    operations: ClassVar[frozenset[Operation] | None] = None
+
+    @abstractmethod
+    def allows(self, operand1: int, operand2: int, answer: int) -> bool:
+        """Return whether a problem satisfies the constraint."""
+
+
+def _has_carry(a: int, b: int) -> bool:
+    """Whether adding non-negative a and b carries in any column."""
+    while a or b:
+        if a % 10 + b % 10 >= 10:
+            return True
+        a, b = a // 10, b // 10
+    return False
+
+
+def _has_borrow(a: int, b: int) -> bool:
+    """Whether a - b (non-negative, a >= b) borrows in any column."""
+    while b:
+        if a % 10 < b % 10:
+            return True
+        a, b = a // 10, b // 10
+    return False
+
+
+@dataclass(frozen=True)
+class NoCarry(Constraint):
+    """Addition with no carry in any column. Operands must be non-negative."""
+
+    operations = frozenset({Operation.ADD})
+
+    def allows(self, operand1: int, operand2: int, answer: int) -> bool:
+        """Return whether a problem satisfies the constraint."""
+        return min(operand1, operand2) >= 0 and not _has_carry(operand1, operand2)
+
+
+@dataclass(frozen=True)
+class WithCarry(Constraint):
+    """Addition that carries in at least one column."""
+
+    operations = frozenset({Operation.ADD})
+
+    def allows(self, operand1: int, operand2: int, answer: int) -> bool:
+        """Return whether a problem satisfies the constraint."""
+        return min(operand1, operand2) >= 0 and _has_carry(operand1, operand2)
+
+
+@dataclass(frozen=True)
+class NoBorrow(Constraint):
+    """Subtraction with no borrowing. Operands must be non-negative."""
+
+    operations = frozenset({Operation.SUBTRACT})
+
+    def allows(self, operand1: int, operand2: int, answer: int) -> bool:
+        """Return whether a problem satisfies the constraint."""
+        return operand2 >= 0 and answer >= 0 and not _has_borrow(operand1, operand2)
+
+
+@dataclass(frozen=True)
+class WithBorrow(Constraint):
+    """Subtraction that borrows in at least one column."""
+
+    operations = frozenset({Operation.SUBTRACT})
+
+    def allows(self, operand1: int, operand2: int, answer: int) -> bool:
+        """Return whether a problem satisfies the constraint."""
+        return operand2 >= 0 and answer >= 0 and _has_borrow(operand1, operand2)
+
+
+@dataclass(frozen=True)
+class Bounds(Constraint):
+    """Keep one term of the problem within inclusive bounds."""
+
+    term: Literal["operand1", "operand2", "answer"]
+    low: int | None = None
+    high: int | None = None
+
+    def allows(self, operand1: int, operand2: int, answer: int) -> bool:
+        """Return whether a problem satisfies the constraint."""
+        value = {"operand1": operand1, "operand2": operand2, "answer": answer}[
+            self.term
+        ]
+        return (self.low is None or value >= self.low) and (
+            self.high is None or value <= self.high
+        )
+
+
+@dataclass(frozen=True)
+class CandidateTable:
+    """Every allowed problem for one key, stored as columns."""
+
+    operation: Operation
+    operand1: array
+    operand2: array
+    answer: array
+
+    def __len__(self) -> int:
+        """Return the number of candidates."""
+        return len(self.answer)
+
+    def __getitem__(self, index: int) -> Problem:
+        """Make the candidate at an index."""
+        return Problem(
+            operand1=self.operand1[index],
+            operand2=self.operand2[index],
+            operation=self.operation,
+            answer=self.answer[index],
+        )
+
+
+def candidate_table(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    constraints: Iterable[Constraint] = (),
+) -> CandidateTable:
+    """Get the table of allowed problems, building it on first use.
+
+    The range means what it does for generate_problem: operands for
+    addition, subtraction and multiplication (larger operand first for
+    subtraction), answer and divisor for division (divisor never zero).
+
+    Raises:
+        ValueError: If a constraint doesn't apply to the operation, or the
+            range has more than MAX_CANDIDATES operand pairs.
+    """
+    # Order and repeats don't change the table, so they share a cache entry
+    key = tuple(sorted(set(constraints), key=repr))
+    for constraint in key:
+        if constraint.operations is not None and operation not in constraint.operations:
+            raise ValueError(f"{constraint} does not apply to {operation.name}")
+    return _build_table(operation, min_val, max_val, key)
+
+
+@lru_cache(maxsize=128)
+def _build_table(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    constraints: tuple[Constraint, ...],
+) -> CandidateTable:
+    size = max(0, max_val - min_val + 1)
+    if size * size > MAX_CANDIDATES:
+        raise ValueError(f"Range too large for a table: {min_val}..{max_val}")
+
+    columns: tuple[array, array, array] = (array("q"), array("q"), array("q"))
+    values = range(min_val, max_val + 1)
+    for x in values:
+        for y in values:
+            if operation == Operation.ADD:
+                a, b, answer = x, y, x + y
+            elif operation == Operation.SUBTRACT:
+                if x < y:
+                    continue  # Counted once, as (y, x)
+                a, b, answer = x, y, x - y
+            elif operation == Operation.MULTIPLY:
+                a, b, answer = x, y, x * y
+            else:
+                if y == 0:
+                    continue
+                a, b, answer = x * y, y, x
+            if all(c.allows(a, b, answer) for c in constraints):
+                columns[0].append(a)
+                columns[1].append(b)
+                columns[2].append(answer)
+    return CandidateTable(operation, *columns)
+
+
+class ProblemSampler:
+    """Samples problems that satisfy a set of constraints.
+
+    sample() draws with replacement. draw() deals without replacement
+    from the whole table, one problem per call, until reset().
+    """
+
+    def __init__(
+        self,
+        operation: Operation,
+        min_val: int,
+        max_val: int,
+        constraints: Iterable[Constraint] = (),
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the sampler, building the candidate table if needed.
+
+        Args:
+            operation: The operation of every problem.
+            min_val: Smallest operand (for division, smallest answer and divisor).
+            max_val: Largest operand (for division, largest answer and divisor).
+            constraints: Rules every problem must follow.
+            rng: Source of randomness. Defaults to the random module's.
+
+        Raises:
+            ValueError: If no problem satisfies the constraints, or see
+                candidate_table().
+        """
+        self._table = candidate_table(operation, min_val, max_val, constraints)
+        if not self._table:
+            raise ValueError("No problems satisfy the constraints")
+        self._randrange = rng.randrange if rng is not None else random.randrange
+        self._sample = rng.sample if rng is not None else random.sample
+        self.reset()
+
+    def __len__(self) -> int:
+        """Return the number of distinct problems the sampler can give."""
+        return len(self._table)
+
+    @property
+    def remaining(self) -> int:
+        """How many problems draw() can still deal."""
+        return self._remaining
+
+    def sample(self) -> Problem:
+        """Pick a problem, with replacement."""
+        return self._table[self._randrange(len(self._table))]
+
+    def sample_many(self, k: int, replace: bool = True) -> list[Problem]:
+        """Pick k problems.
+
+        Raises:
+            ValueError: If replace is False and k is more than len(self).
+        """
+        if replace:
+            return [self.sample() for _ in range(k)]
+        return [self._table[i] for i in self._sample(range(len(self._table)), k)]
+
+    def draw(self) -> Problem:
+        """Deal the next problem without replacement.
+
+        A lazy Fisher-Yates shuffle: only swapped positions are stored, so
+        each draw is O(1) and nothing is copied up front.
+
+        Raises:
+            IndexError: If every problem has been dealt since reset().
+        """
+        if self._remaining == 0:
+            raise IndexError("Every problem has been drawn")
+        last = self._remaining - 1
+        pick = self._randrange(self._remaining)
+        index = self._swapped.get(pick, pick)
+        self._swapped[pick] = self._swapped.pop(last, last)
+        self._remaining = last
+        return self._table[index]
+
+    def reset(self) -> None:
+        """Put every problem back for draw()."""
+        self._swapped: dict[int, int] = {}
+        self._remaining = len(self._table)
@@ -0,0 +1,116 @@
+"""Seedable, reproducible problem streams.
+
+ProblemStream(seed, player, session) always generates the same problems,
+so a session can be regenerated from its seed instead of storing every
+problem. A stream has a private random.Random, never the global one.
+
+Streams split like NumPy's SeedSequence: spawn() derives children whose
+keys are hashes of the parent's key and the child's index, so children
+never share a sequence with each other or their parent. A pickled
+stream keeps its position and spawn count, so a parent sent to a
+process-pool worker never hands out a child that was already spawned.
+"""
+
+import hashlib
+import random
+from collections.abc import Iterable
+
+from flashy.core.problems import (
+    Operation,
+    Problem,
+    ProblemBatch,
+    generate_problem,
+    generate_problems,
+)
+from flashy.core.sampling import Constraint, ProblemSampler
+
+_KEY_SIZE = 32
+
+
+def _derive(*parts: bytes) -> bytes:
+    """Hash length-prefixed parts into a stream key."""
+    digest = hashlib.blake2b(digest_size=_KEY_SIZE)
+    for part in parts:
+        digest.update(len(part).to_bytes(4, "little"))
+        digest.update(part)
+    return digest.digest()
+
+
+class ProblemStream:
+    """A reproducible source of problems for one player and session."""
+
+    def __init__(self, seed: int, player: str = "", session: int | str = 0) -> None:
+        """Initialize the stream.
+
+        Args:
+            seed: The base seed, e.g. one per install or per class.
+            player: The player the problems are for.
+            session: Identifies the session, e.g. a counter or timestamp.
+        """
+        self._init_key(
+            _derive(
+                b"flashy.stream",
+                seed.to_bytes((seed.bit_length() + 8) // 8, "little", signed=True),
+                player.encode(),
+                str(session).encode(),
+            )
+        )
+
+    @classmethod
+    def from_key(cls, key: bytes) -> "ProblemStream":
+        """Recreate a stream from its key, at the start of its sequence."""
+        if len(key) != _KEY_SIZE:
+            raise ValueError(f"Stream keys are {_KEY_SIZE} bytes")
+        stream = cls.__new__(cls)
+        stream._init_key(key)
+        return stream
+
+    def _init_key(self, key: bytes) -> None:
+        self._key = key
+        self._rng = random.Random(int.from_bytes(key, "little"))
+        self._children = 0
+
+    @property
+    def key(self) -> bytes:
+        """The 32-byte key that identifies this stream."""
+        return self._key
+
+    @property
+    def rng(self) -> random.Random:
+        """The stream's generator, for functions that take an rng."""
+        return self._rng
+
+    def child(self, index: int) -> "ProblemStream":
+        """Get the index-th child stream. The same index gives the same child."""
+        return ProblemStream.from_key(
+            _derive(self._key, b"child", index.to_bytes(8, "little"))
+        )
+
+    def spawn(self, n: int) -> list["ProblemStream"]:
+        """Get n new child streams, e.g. one per worker.
+
+        Later calls continue the numbering, so they never repeat a child.
+        """
+        start = self._children
+        self._children += n
+        return [self.child(index) for index in range(start, start + n)]
+
+    def problem(self, operation: Operation, min_val: int, max_val: int) -> Problem:
+        """Generate the next problem, by the rules of generate_problem."""
+        return generate_problem(operation, min_val, max_val, rng=self._rng)
+
+    def problems(
+        self, operation: Operation, min_val: int, max_val: int, n: int
+    ) -> ProblemBatch:
+        """Generate the next n problems as a batch. See generate_problems."""
+        return generate_problems(operation, min_val, max_val, n, rng=self._rng)
+
+    def sampler(
+        self,
+        operation: Operation,
+        min_val: int,
+        max_val: int,
+        constraints: Iterable[Constraint] = (),
+    ) -> ProblemSampler:
+        """Get a constraint sampler that draws from this stream."""
+        return ProblemSampler(operation, min_val, max_val, constraints, rng=self._rng)
@@ -1,7 +1,8 @@
 """World definitions - story content and theming."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
+from flashy.core.levels import get_total_worlds
 from flashy.core.problems import Operation
 
 
@@ -183,10 +184,19 @@ WORLD_4 = World(
 
 WORLDS = [WORLD_1, WORLD_2, WORLD_3, WORLD_4]
 
+_WORLDS_BY_NUMBER = {world.number: world for world in WORLDS}
+
 
 def get_world(world_num: int) -> World | None:
-    """Get world by number. Returns None if world doesn't exist."""
-    for world in WORLDS:
-        if world.number == world_num:
-            return world
-    return None
+    """Get world by number. Returns None if world doesn't exist.
+
+    Worlds exist as far as the levels being played go (see use_levels).
+    Level packs can have more worlds than the built-in ones; those reuse
+    the built-in worlds' story and theme in turn.
+    """
+    if not 1 <= world_num <= get_total_worlds():
+        return None
+    world = _WORLDS_BY_NUMBER.get(world_num)
+    if world is None:
+        world = replace(WORLDS[(world_num - 1) % len(WORLDS)], number=world_num)
+    return world
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from flashy.core.levels import Level, get_level
-from flashy.core.models import LevelResult, ProblemResult
+from flashy.core.levels import REVIEW_LEVEL_NUMBER, Level, get_level
+from flashy.core.models import LevelResult, PlayerProgress, ProblemResult
 from flashy.core.number_parser import is_fuzzy_match
 from flashy.core.problems import Problem
 from flashy.core.scoring import calculate_score, calculate_stars, get_streak_multiplier
 
 if TYPE_CHECKING:
-    from flashy.storage.protocol import StorageBackend
+    from flashy.core.review import ReviewScheduler
+    from flashy.storage.checkpoint import CheckpointAnswer, CheckpointJournal
+    from flashy.storage.protocol import AsyncStorageBackend, StorageBackend
 
 
 @dataclass
@@ -43,11 +47,17 @@ class GameController:
         player_name: str,
         level_number: int,
         storage: StorageBackend | None = None,
+        journal: CheckpointJournal | None = None,
+        scheduler: ReviewScheduler | None = None,
+        level: Level | None = None,
     ) -> None:
         self.player_name = player_name
-        self.level_number = level_number
+        self.level_number = level.number if level is not None else level_number
         self._storage = storage  # Lazy load if None
-        level = get_level(level_number)
+        self._journal = journal  # Records each answer for resume, if set
+        self._scheduler = scheduler  # Fact review queue to update, if set
+        # A given level (such as a review round) is played as it is
+        level = level or get_level(level_number)
         if level is None:
             raise ValueError(f"Level {level_number} not found")
         self.level: Level = level
@@ -99,6 +109,11 @@ class GameController:
         """Time limit in seconds for this level, or None if untimed."""
         return self.level.time_limit
 
+    @property
+    def is_review(self) -> bool:
+        """Check if this is a review round rather than a level."""
+        return self.level_number == REVIEW_LEVEL_NUMBER
+
     @property
     def is_timed(self) -> bool:
         """Check if this level has a time limit (boss battle)."""
@@ -170,6 +185,11 @@ class GameController:
             )
         )
 
+        if self._journal is not None:
+            self._journal.append(self.problem_index, answer, time_taken)
+        if self._scheduler is not None:
+            self._scheduler.record_problem(problem, is_correct, time.time())
+
         # Advance to next problem
         self.problem_index += 1
 
@@ -181,39 +201,104 @@ class GameController:
             streak_multiplier=get_streak_multiplier(self.streak),
         )
 
+    def replay(self, answers: Iterable[CheckpointAnswer]) -> None:
+        """Re-submit journaled answers to resume an interrupted attempt.
+
+        The answers are not journaled again, and the review scheduler
+        already counted them. Problems are fixed per level, so the score
+        and streaks come out the same as the first time.
+
+        Args:
+            answers: Answers read back from a checkpoint journal.
+        """
+        journal, self._journal = self._journal, None
+        scheduler, self._scheduler = self._scheduler, None
+        try:
+            for answer in answers:
+                if answer.problem_index != self.problem_index or self.is_complete:
+                    break
+                self.submit_answer(answer.answer, answer.time_taken)
+        finally:
+            self._journal = journal
+            self._scheduler = scheduler
+
     def finish(self) -> tuple[int, bool]:
         """Finish the level. Saves progress and history.
 
+        A review round only logs its session: it has no progress to save.
+
         Returns:
             Tuple of (stars earned, is_new_best)
         """
-        stars = calculate_stars(
-            self.correct_count, self.total_problems, self.total_time
-        )
+        stars = self._calculate_stars()
 
         # Save progress via storage backend
-        progress = self.storage.load_progress(self.player_name)
+        is_new_best = False
+        if not self.is_review:
+            progress = self.storage.load_progress(self.player_name)
+            is_new_best = self._record_stars(progress, stars)
+            self.storage.save_progress(self.player_name, progress)
+
+        # Log session history via storage backend
+        self.storage.log_session(self._level_result())
+
+        if self._journal is not None:
+            self._journal.discard()
+        return stars, is_new_best
+
+    async def finish_async(self, storage: AsyncStorageBackend) -> tuple[int, bool]:
+        """Finish the level through an async storage backend.
+
+        Same as finish(), for callers running on an event loop.
+
+        Args:
+            storage: The async storage backend to save to.
+
+        Returns:
+            Tuple of (stars earned, is_new_best)
+        """
+        stars = self._calculate_stars()
+
+        is_new_best = False
+        if not self.is_review:
+            progress = await storage.load_progress(self.player_name)
+            is_new_best = self._record_stars(progress, stars)
+            await storage.save_progress(self.player_name, progress)
+        await storage.log_session(self._level_result())
+
+        if self._journal is not None:
+            self._journal.discard()
+        return stars, is_new_best
+
+    def _calculate_stars(self) -> int:
+        """Calculate the stars earned for this attempt."""
+        return calculate_stars(self.correct_count, self.total_problems, self.total_time)
+
+    def _record_stars(self, progress: PlayerProgress, stars: int) -> bool:
+        """Record this attempt's stars and score in progress.
+
+        Returns:
+            True if the attempt earned more stars than before.
+        """
         old_stars = progress.get_stars(self.level_number)
         progress.set_stars(self.level_number, stars)
         progress.set_best_score(self.level_number, self.total_score)
-        self.storage.save_progress(self.player_name, progress)
-
-        # Log session history via storage backend
-        self.storage.log_session(
-            LevelResult(
-                level_number=self.level_number,
-                level_name=self.level.name,
-                total_score=self.total_score,
-                correct_count=self.correct_count,
-                total_problems=self.total_problems,
-                best_streak=self.best_streak,
-                total_time_seconds=self.total_time,
-                problems=self.results,
-            )
+        return stars > old_stars
+
+    def _level_result(self) -> LevelResult:
+        """Build the history entry for this attempt."""
+        return LevelResult(
+            level_number=self.level_number,
+            level_name=self.level.name,
+            total_score=self.total_score,
+            correct_count=self.correct_count,
+            total_problems=self.total_problems,
+            best_streak=self.best_streak,
+            total_time_seconds=self.total_time,
+            problems=self.results,
+            player_name=self.player_name,
         )
 
-        return stars, stars > old_stars
-
     # --- Cheat methods for dev/testing ---
 
     def cheat_pass_all(self) -> None:
@@ -1,24 +1,30 @@
 """Session history logging and progress tracking.
 
-This module handles file I/O for player progress and session logging.
-Data models are imported from flashy.core.models.
+Module-level helpers for player progress and session logging. They all
+delegate to the default FileStorage so that every write path keeps the
+same on-disk layout and indexes. Progress loads go through an in-memory
+cache in front of it. Data models are imported from flashy.core.models.
 """
 
-import json
-from dataclasses import asdict
-from datetime import datetime
 from pathlib import Path
 
-from flashy.core.models import LevelResult, PlayerProgress, ProblemResult
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary, ProblemResult
+from flashy.storage import CachedStorage, get_default_storage
+from flashy.storage.checkpoint import CheckpointJournal
 
 # Re-export models for backward compatibility
 __all__ = [
     "LevelResult",
     "PlayerProgress",
+    "PlayerSummary",
     "ProblemResult",
+    "get_checkpoint_journal",
+    "get_history_dir",
     "get_history_path",
+    "get_player_history_dir",
     "get_players_dir",
     "get_speech_log_path",
+    "list_player_summaries",
     "list_players",
     "load_progress",
     "log_session",
@@ -27,9 +33,27 @@ __all__ = [
     "save_progress",
 ]
 
+# Progress cache in front of the default storage
+_cached_storage: CachedStorage | None = None
+
+
+def _storage() -> CachedStorage:
+    """Get the cached wrapper around the default storage."""
+    global _cached_storage
+    if _cached_storage is None:
+        _cached_storage = CachedStorage(get_default_storage())
+    return _cached_storage
+
+
+def get_history_dir() -> Path:
+    """Get the path to the shared history segments (sessions with no player)."""
+    history_dir = Path.home() / ".flashy" / "history"
+    history_dir.mkdir(parents=True, exist_ok=True)
+    return history_dir
+
 
 def get_history_path() -> Path:
-    """Get the path to the history file."""
+    """Get the path to the legacy single-file history log."""
     history_dir = Path.home() / ".flashy"
     history_dir.mkdir(exist_ok=True)
     return history_dir / "history.log"
@@ -47,50 +71,31 @@ def log_speech_recognition(
     parsed_number: int | None,
     expected: int | None,
     matched: bool,
+    partial: bool = False,
 ) -> None:
     """Log a speech recognition result for debugging.
 
+    Never blocks; see FileStorage.log_speech_recognition.
+
     Args:
         raw_transcript: The raw text from the speech recognizer
         parsed_number: The number parsed from the transcript (None if unparseable)
         expected: The expected answer (None if not provided)
         matched: Whether it was considered a match
+        partial: Whether this is a partial (in-progress) result
     """
-    log_path = get_speech_log_path()
-
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "transcript": raw_transcript,
-        "parsed": parsed_number,
-        "expected": expected,
-        "matched": matched,
-    }
-
-    with open(log_path, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _storage().log_speech_recognition(
+        raw_transcript, parsed_number, expected, matched, partial=partial
+    )
 
 
 def log_session(result: LevelResult) -> None:
     """Append a level result to the history log.
 
-    Each entry is a single JSON line with a timestamp.
+    Each entry is a single JSON line with a timestamp, written to the
+    current monthly segment of the player's history shard.
     """
-    history_path = get_history_path()
-
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "level_number": result.level_number,
-        "level_name": result.level_name,
-        "score": result.total_score,
-        "correct": result.correct_count,
-        "total": result.total_problems,
-        "best_streak": result.best_streak,
-        "time_seconds": result.total_time_seconds,
-        "problems": [asdict(p) for p in result.problems],
-    }
-
-    with open(history_path, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _storage().log_session(result)
 
 
 def get_players_dir() -> Path:
@@ -100,45 +105,36 @@ def get_players_dir() -> Path:
     return players_dir
 
 
+def get_player_history_dir(player_name: str) -> Path:
+    """Get the path to a player's history shard."""
+    return get_players_dir() / player_name / "history"
+
+
+def get_checkpoint_journal(player_name: str) -> CheckpointJournal:
+    """Get the journal of a player's attempt in progress, for resuming it."""
+    return get_default_storage().checkpoint_journal(player_name)
+
+
 def list_players() -> list[str]:
     """List all player names."""
-    players_dir = get_players_dir()
-    players = []
-    for path in players_dir.glob("*.json"):
-        players.append(path.stem)
-    return sorted(players)
+    return _storage().list_players()
 
 
-def load_progress(player_name: str) -> PlayerProgress:
-    """Load player progress from disk."""
-    players_dir = get_players_dir()
-    progress_path = players_dir / f"{player_name}.json"
+def list_player_summaries() -> list[PlayerSummary]:
+    """List every player with their progress totals, from the roster index."""
+    return _storage().list_player_summaries()
 
-    if not progress_path.exists():
-        return PlayerProgress()
 
-    try:
-        with open(progress_path) as f:
-            data = json.load(f)
-            # Convert string keys back to int (JSON only supports string keys)
-            stars = {int(k): v for k, v in data.get("stars", {}).items()}
-            return PlayerProgress(stars=stars)
-    except (json.JSONDecodeError, KeyError):
-        return PlayerProgress()
+def load_progress(player_name: str) -> PlayerProgress:
+    """Load player progress from disk."""
+    return _storage().load_progress(player_name)
 
 
 def save_progress(player_name: str, progress: PlayerProgress) -> None:
     """Save player progress to disk."""
-    players_dir = get_players_dir()
-    progress_path = players_dir / f"{player_name}.json"
-
-    data = {"stars": progress.stars}
-
-    with open(progress_path, "w") as f:
-        json.dump(data, f, indent=2)
+    _storage().save_progress(player_name, progress)
 
 
 def player_exists(player_name: str) -> bool:
     """Check if a player profile exists."""
-    players_dir = get_players_dir()
-    return (players_dir / f"{player_name}.json").exists()
+    return _storage().player_exists(player_name)
@@ -0,0 +1,105 @@
+"""Loading level packs from disk.
+
+Pack files (JSON or TOML, see flashy.core.packs) are validated and
+compiled once. The compiled form is cached under a name derived from the
+file's content hash, so later loads skip parsing and validation, and an
+edited pack is recompiled automatically.
+"""
+
+import hashlib
+import json
+import os
+import tomllib
+from pathlib import Path
+
+from flashy.core.packs import FORMAT_VERSION, CompiledPack, compile_pack, parse_pack
+
+PACK_SUFFIXES = (".json", ".toml")
+
+
+def get_packs_dir() -> Path:
+    """Get the directory teachers put pack files in."""
+    packs_dir = Path.home() / ".flashy" / "packs"
+    packs_dir.mkdir(parents=True, exist_ok=True)
+    return packs_dir
+
+
+def list_packs(packs_dir: Path | None = None) -> list[Path]:
+    """List the pack files in a directory, sorted by name."""
+    packs_dir = packs_dir or get_packs_dir()
+    return sorted(
+        path
+        for path in packs_dir.iterdir()
+        if path.is_file() and path.suffix in PACK_SUFFIXES
+    )
+
+
+def pack_cache_key(raw: bytes) -> str:
+    """Get the cache key for a pack file's contents.
+
+    The compiled format version is part of the key, so a format change
+    never reads an old cache entry.
+    """
+    digest = hashlib.blake2b(raw, digest_size=16)
+    digest.update(FORMAT_VERSION.to_bytes(2, "little"))
+    return digest.hexdigest()
+
+
+def load_pack(path: Path, cache_dir: Path | None = None) -> CompiledPack:
+    """Load a pack file, compiling it on first use.
+
+    Args:
+        path: A .json or .toml pack file.
+        cache_dir: Where compiled packs are kept. Defaults to a cache
+            directory next to the pack.
+
+    Returns:
+        The compiled pack. Worlds are decoded when first looked up.
+
+    Raises:
+        ValueError: If the file is not a valid pack.
+        OSError: If the file can't be read.
+    """
+    raw = path.read_bytes()
+    cache_dir = cache_dir or path.parent / "cache"
+    cached = cache_dir / f"{pack_cache_key(raw)}.bin"
+    try:
+        return CompiledPack(cached.read_bytes())
+    except (OSError, ValueError):
+        pass  # Not compiled yet, or an unreadable entry: compile again
+
+    compiled = _compile(path, raw)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_suffix(f".tmp-{os.getpid()}")
+    tmp.write_bytes(compiled)
+    os.replace(tmp, cached)
+    return CompiledPack(compiled)
+
+
+def compile_pack_file(path: Path) -> bytes:
+    """Validate a pack file and compile it, without using the cache.
+
+    Raises:
+        ValueError: If the file is not a valid pack.
+        OSError: If the file can't be read.
+    """
+    return _compile(path, path.read_bytes())
+
+
+def _compile(path: Path, raw: bytes) -> bytes:
+    """Compile a pack file's contents, naming the file in errors."""
+    try:
+        pack = parse_pack(_decode(path, raw))
+    except ValueError as e:  # Includes JSON, TOML and UTF-8 errors
+        raise ValueError(f"{path.name}: {e}") from None
+    return compile_pack(pack)
+
+
+def _decode(path: Path, raw: bytes) -> dict:
+    """Decode a pack file by its suffix."""
+    if path.suffix == ".toml":
+        return tomllib.loads(raw.decode())
+    data = json.loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError("Pack must be an object")
+    return data
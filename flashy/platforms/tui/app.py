@@ -1,11 +1,18 @@
 """Main Textual application for Flashy."""
 
+import argparse
+from pathlib import Path
+
 from textual.app import App
 from textual.binding import Binding
 
 from flashy.core.flow import AppStarted, GameEvent, GameFlow
+from flashy.core.levels import use_levels
 from flashy.core.models import PlayerProgress
+from flashy.packs import get_packs_dir, load_pack
 from flashy.platforms.tui.navigation import create_screen
+from flashy.platforms.tui.storage_service import StorageService
+from flashy.storage import CachedStorage, get_default_storage
 
 
 class FlashyApp(App):
@@ -18,10 +25,17 @@ class FlashyApp(App):
         Binding("q", "quit", "Quit", show=True),
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, storage: StorageService | None = None) -> None:
+        """Initialize the app.
+
+        Args:
+            storage: Storage service used by every screen. Defaults to one
+                over the default file storage with a progress cache.
+        """
         super().__init__()
         self.player_name: str | None = None
         self._flow = GameFlow()
+        self.storage = storage or StorageService(CachedStorage(get_default_storage()))
 
     def on_mount(self) -> None:
         """Called when app is mounted."""
@@ -46,6 +60,27 @@ class FlashyApp(App):
 
 
 def run_app() -> None:
-    """Run the Flashy TUI application."""
+    """Run the Flashy TUI application.
+
+    ``flashy --pack FILE`` plays the levels of a level pack (see
+    flashy.core.packs) instead of the built-in ones.
+    """
+    parser = argparse.ArgumentParser(prog="flashy", description=FlashyApp.TITLE)
+    parser.add_argument(
+        "--pack", type=Path, help="Level pack file (.json or .toml) to play"
+    )
+    args = parser.parse_args()
+    if args.pack is not None:
+        try:
+            use_levels(load_pack(args.pack, cache_dir=get_packs_dir() / "cache"))
+        except (OSError, ValueError) as e:
+            parser.error(f"Cannot load pack: {e}")
+
     app = FlashyApp()
-    app.run()
+    try:
+        app.run()
+    finally:
+        # Durability point: finish storage calls still in flight, then
+        # make sure queued history reaches the disk
+        app.storage.close()
+        get_default_storage().close()
@@ -12,11 +12,13 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
 from flashy.core.number_parser import is_fuzzy_match, is_give_up, parse_spoken_number
-from flashy.history import log_speech_recognition
 
 if TYPE_CHECKING:
     pass
 
+# (raw transcript, parsed number, expected, matched, partial=False)
+SpeechLogFn = Callable[..., None]
+
 SAMPLE_RATE = 16000
 VOSK_MODEL_NAME = "vosk-model-en-us-0.22-lgraph"
 VOSK_MODEL_URL = f"https://alphacephei.com/vosk/models/{VOSK_MODEL_NAME}.zip"
@@ -150,8 +152,18 @@ def _ensure_vosk_model() -> Path:
 class VoiceInputHandler:
     """Get answers via voice using Vosk speech recognition."""
 
-    def __init__(self) -> None:
-        """Initialize the voice input handler."""
+    def __init__(self, log_speech: SpeechLogFn | None = None) -> None:
+        """Initialize the voice input handler.
+
+        Args:
+            log_speech: Called with each recognition result for the debug
+                log. Defaults to flashy.history.log_speech_recognition.
+                Must not block; it runs in the audio loop.
+        """
+        if log_speech is None:
+            from flashy.history import log_speech_recognition as log_speech
+        self._log_speech = log_speech
+
         # Import here to make vosk optional
         import sounddevice as sd  # noqa: F401 - verify it's available
         from vosk import Model, SetLogLevel
@@ -255,7 +267,7 @@ class VoiceInputHandler:
                                 matched = expected is None or is_fuzzy_match(
                                     number, expected
                                 )
-                                log_speech_recognition(text, number, expected, matched)
+                                self._log_speech(text, number, expected, matched)
                                 return number, text
 
                             # Reset for next attempt
@@ -274,7 +286,9 @@ class VoiceInputHandler:
                             if expected is not None:
                                 number = parse_spoken_number(text)
                                 matched = is_fuzzy_match(number, expected)
-                                log_speech_recognition(text, number, expected, matched)
+                                self._log_speech(
+                                    text, number, expected, matched, partial=True
+                                )
                                 if matched:
                                     if not on_partial:
                                         print()  # Newline after partial
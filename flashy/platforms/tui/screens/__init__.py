@@ -8,6 +8,7 @@ from flashy.platforms.tui.screens.intro import IntroScreen
 from flashy.platforms.tui.screens.new_player import NewPlayerScreen
 from flashy.platforms.tui.screens.player_select import PlayerSelectScreen
 from flashy.platforms.tui.screens.result import ResultScreen
+from flashy.platforms.tui.screens.resume_prompt import ResumePromptScreen
 from flashy.platforms.tui.screens.world_intro import WorldIntroScreen
 from flashy.platforms.tui.screens.world_map import WorldMapScreen
 
@@ -20,6 +21,7 @@ __all__ = [
     "NewPlayerScreen",
     "PlayerSelectScreen",
     "ResultScreen",
+    "ResumePromptScreen",
     "WorldIntroScreen",
     "WorldMapScreen",
 ]
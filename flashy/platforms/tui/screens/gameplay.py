@@ -8,8 +8,11 @@ from textual.containers import Center, Vertical
 from textual.screen import Screen
 from textual.widgets import Footer, Header, Static
 
+from flashy.core.levels import Level
 from flashy.game import AnswerFeedback, GameController
+from flashy.platforms.tui.screens.resume_prompt import ResumePromptScreen
 from flashy.platforms.tui.voice import VoiceInput
+from flashy.storage.checkpoint import Checkpoint
 
 
 class GameplayScreen(Screen):
@@ -105,14 +108,35 @@ class GameplayScreen(Screen):
     }
     """
 
-    def __init__(self, player_name: str, level_number: int) -> None:
+    def __init__(
+        self, player_name: str, level_number: int, level: Level | None = None
+    ) -> None:
+        """Initialize the screen.
+
+        Args:
+            player_name: The player.
+            level_number: The level to play.
+            level: A level to play as it is instead, such as a review round.
+        """
+        from flashy.platforms.tui.base import get_app
+
         super().__init__()
         self.player_name = player_name
         self.level_number = level_number
-        self.controller = GameController(player_name, level_number)
+        # Every answer is journaled so a closed terminal can resume the
+        # attempt. A given level can't be rebuilt later, so isn't journaled.
+        self.journal = (
+            get_app(self).storage.checkpoint_journal(player_name)
+            if level is None
+            else None
+        )
+        self.controller = GameController(
+            player_name, level_number, journal=self.journal, level=level
+        )
         self.problem_start_time = 0.0  # When current problem started
         self.level_start_time = 0.0  # When level started (for timed levels)
         self._timer_interval = None  # Timer update interval
+        self._finishing = False  # Results are being saved
 
     def compose(self) -> ComposeResult:
         level = self.controller.level
@@ -125,6 +149,8 @@ class GameplayScreen(Screen):
                 title_classes = "boss-title" if is_boss else ""
                 if is_boss:
                     title_text = f"⚔️ BOSS: {level.name} ⚔️"
+                elif self.controller.is_review:
+                    title_text = f"🔁 {level.name}"
                 else:
                     title_text = f"Level {level.number}: {level.name}"
                 yield Static(title_text, id="level-title", classes=title_classes)
@@ -140,14 +166,42 @@ class GameplayScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Start the level."""
-        self.level_start_time = time.time()
+        """Start the level, offering to resume an interrupted attempt at it."""
+        checkpoint = self.journal.resume() if self.journal is not None else None
+        if checkpoint is None or not checkpoint.answers:
+            self._start(None)
+        elif checkpoint.level_number == self.level_number:
+            self.app.push_screen(
+                ResumePromptScreen(self.level_number, len(checkpoint.answers)),
+                lambda resume: self._start(checkpoint if resume else None),
+            )
+        else:
+            # The journal holds one attempt, so starting this level ends it
+            self.notify(
+                f"Your unfinished attempt at level {checkpoint.level_number} "
+                "was discarded."
+            )
+            self._start(None)
+
+    def _start(self, checkpoint: Checkpoint | None) -> None:
+        """Start the level, replaying a checkpoint's answers if given."""
+        if checkpoint is not None:
+            self.controller.replay(checkpoint.answers)
+        elif self.journal is not None:
+            self.journal.start(self.level_number)
+        # Time already spent counts against a timed level's limit
+        self.level_start_time = time.time() - self.controller.total_time
         # Start timer updates for timed levels
         if self.controller.is_timed:
             self._refresh_timer()
             self._timer_interval = self.set_interval(1.0, self._refresh_timer)
         self._show_problem()
 
+    def on_unmount(self) -> None:
+        """Close the journal; an unfinished attempt stays resumable."""
+        if self.journal is not None:
+            self.journal.close()
+
     def _refresh_timer(self) -> None:
         """Update the timer display and check for time expiry."""
         if not self.controller.is_timed:
@@ -282,15 +336,35 @@ class GameplayScreen(Screen):
 
     def _finish_level(self) -> None:
         """Finish the level and show results."""
-        from flashy.platforms.tui.screens.result import ResultScreen
+        if self._finishing:
+            return
+        self._finishing = True
 
         # Stop timer if running
         if self._timer_interval:
             self._timer_interval.stop()
             self._timer_interval = None
 
+        # Save on a worker so the screen stays responsive during disk I/O
+        self.run_worker(self._save_and_show_results(), exclusive=True)
+
+    async def _save_and_show_results(self) -> None:
+        """Save progress and history, then show the results screen."""
+        from flashy.platforms.tui.base import get_app
+        from flashy.platforms.tui.screens.result import ResultScreen
+
         # Finish via controller (saves progress and history)
-        stars, is_new_best = self.controller.finish()
+        storage = get_app(self).storage
+        stars, is_new_best = await self.controller.finish_async(storage)
+
+        if self.controller.is_review:
+            # Back to the world map: a review round has no stars to show
+            self.app.pop_screen()
+            self.app.notify(
+                f"Review done: {self.controller.correct_count} of "
+                f"{self.controller.total_problems} right."
+            )
+            return
 
         # Show results screen
         self.app.pop_screen()
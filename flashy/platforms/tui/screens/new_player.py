@@ -7,7 +7,7 @@ from textual.containers import Center, Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Input, Static
 
-from flashy.history import PlayerProgress, player_exists, save_progress
+from flashy.core.models import PlayerProgress
 
 
 class NewPlayerScreen(Screen):
@@ -70,9 +70,9 @@ class NewPlayerScreen(Screen):
         self.query_one("#name-input", Input).focus()
 
     @on(Button.Pressed, "#create-btn")
-    def create_pressed(self) -> None:
+    async def create_pressed(self) -> None:
         """Handle create button press."""
-        self._try_create()
+        await self._try_create()
 
     @on(Button.Pressed, "#cancel-btn")
     def cancel_pressed(self) -> None:
@@ -80,17 +80,18 @@ class NewPlayerScreen(Screen):
         self.app.pop_screen()
 
     @on(Input.Submitted)
-    def input_submitted(self) -> None:
+    async def input_submitted(self) -> None:
         """Handle enter press in input."""
-        self._try_create()
+        await self._try_create()
 
     def action_cancel(self) -> None:
         """Cancel and go back."""
         self.app.pop_screen()
 
-    def _try_create(self) -> None:
+    async def _try_create(self) -> None:
         """Try to create the player."""
         from flashy.core.flow import NewPlayerCreated
+        from flashy.platforms.tui.base import get_app
 
         name_input = self.query_one("#name-input", Input)
         error_label = self.query_one("#error-msg", Static)
@@ -106,15 +107,15 @@ class NewPlayerScreen(Screen):
             error_label.update("Please use letters and numbers only")
             return
 
-        if player_exists(safe_name):
+        storage = get_app(self).storage
+        if await storage.player_exists(safe_name):
             error_label.update(f"'{safe_name}' already exists!")
             return
 
         # Create player
-        save_progress(safe_name, PlayerProgress())
+        await storage.save_progress(safe_name, PlayerProgress())
+        storage.prefetch(safe_name)
 
         # Go back and use GameFlow for next screen
-        from flashy.platforms.tui.base import get_app
-
         self.app.pop_screen()
         get_app(self).navigate(NewPlayerCreated(safe_name))
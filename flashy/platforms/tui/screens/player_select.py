@@ -7,8 +7,6 @@ from textual.containers import Center, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, ListItem, ListView, Static
 
-from flashy.history import list_players, load_progress
-
 
 class PlayerSelectScreen(Screen):
     """Player selection screen."""
@@ -85,46 +83,52 @@ class PlayerSelectScreen(Screen):
                 yield Button("✨ New Player", id="new-player-btn", variant="primary")
         yield Footer()
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Populate player list on mount."""
-        self._refresh_players()
+        players = await self._refresh_players()
         # Focus list if there are players, otherwise focus the button
-        players = list_players()
         if players:
             self.query_one("#player-list", ListView).focus()
         else:
             self.query_one("#new-player-btn", Button).focus()
 
-    def _refresh_players(self) -> None:
-        """Refresh the player list."""
-        list_view = self.query_one("#player-list", ListView)
-        list_view.clear()
+    async def _refresh_players(self) -> list[str]:
+        """Refresh the player list.
 
-        players = list_players()
-        if players:
-            for name in players:
-                progress = load_progress(name)
-                total_stars = sum(progress.stars.values())
-                highest = progress.get_highest_unlocked()
+        Returns:
+            The names of the listed players.
+        """
+        from flashy.platforms.tui.base import get_app
 
-                stats_text = f"  ⭐ {total_stars} stars | Level {highest}"
+        # One read of the roster index gives every player's totals
+        summaries = await get_app(self).storage.list_player_summaries()
+
+        list_view = self.query_one("#player-list", ListView)
+        list_view.clear()
+        if summaries:
+            for summary in summaries:
+                stats_text = (
+                    f"  ⭐ {summary.total_stars} stars | "
+                    f"Level {summary.highest_unlocked}"
+                )
                 item = ListItem(
-                    Static(f"  {name}"),
+                    Static(f"  {summary.name}"),
                     Static(stats_text, classes="player-stats"),
-                    id=f"player-{name}",
+                    id=f"player-{summary.name}",
                 )
                 list_view.append(item)
         else:
             list_view.append(ListItem(Static("  No players yet!"), id="no-players"))
+        return [summary.name for summary in summaries]
 
     @on(ListView.Selected)
-    def player_selected(self, event: ListView.Selected) -> None:
+    async def player_selected(self, event: ListView.Selected) -> None:
         """Handle player selection."""
 
         item_id = event.item.id
         if item_id and item_id.startswith("player-"):
             player_name = item_id[7:]  # Remove "player-" prefix
-            self._start_game(player_name)
+            await self._start_game(player_name)
 
     @on(Button.Pressed, "#new-player-btn")
     def new_player_pressed(self) -> None:
@@ -143,12 +147,15 @@ class PlayerSelectScreen(Screen):
         """Quit the app."""
         self.app.exit()
 
-    def _start_game(self, player_name: str) -> None:
+    async def _start_game(self, player_name: str) -> None:
         """Start the game with selected player."""
         from flashy.core.flow import PlayerSelected
         from flashy.platforms.tui.base import get_app
 
-        progress = load_progress(player_name)
+        storage = get_app(self).storage
+        # Load progress and recent history for the screens that follow
+        storage.prefetch(player_name)
+        progress = await storage.load_progress(player_name)
         # Use GameFlow to determine where to go
         get_app(self).navigate(
             PlayerSelected(player_name, is_new_player=False),
@@ -6,6 +6,8 @@ from textual.containers import Center, Vertical
 from textual.screen import Screen
 from textual.widgets import Footer, Header, Static
 
+from flashy.core.models import LevelResult
+
 
 class ResultScreen(Screen):
     """Screen showing level results."""
@@ -36,6 +38,10 @@ class ResultScreen(Screen):
         text-style: bold;
     }
 
+    #previous {
+        color: $text-muted;
+    }
+
     #message {
         color: $text-muted;
     }
@@ -97,6 +103,15 @@ class ResultScreen(Screen):
                     score_text += f"  |  Best streak: {self.best_streak}"
                 yield Static(score_text, id="score-stats")
 
+                # Previous attempt, from the history prefetched on player select
+                previous = self._previous_attempt()
+                if previous is not None:
+                    yield Static(
+                        f"Last time: {previous.correct_count}/"
+                        f"{previous.total_problems}, score {previous.total_score}",
+                        id="previous",
+                    )
+
                 if self.stars < 2:
                     yield Static(
                         "You need 2 stars to unlock the next level.",
@@ -109,6 +124,18 @@ class ResultScreen(Screen):
                     )
         yield Footer()
 
+    def _previous_attempt(self) -> LevelResult | None:
+        """Get the attempt at this level before the one just finished."""
+        from flashy.platforms.tui.base import get_app
+
+        attempts = [
+            session
+            for session in get_app(self).storage.recent_sessions(self.player_name)
+            if session.level_number == self.level_number
+        ]
+        # The last one is the attempt just finished
+        return attempts[-2] if len(attempts) >= 2 else None
+
     def action_continue(self) -> None:
         """Continue to map (or boss victory if applicable)."""
         from flashy.core.flow import ResultContinue
@@ -0,0 +1,57 @@
+"""Resume prompt - shown when a level has an unfinished attempt."""
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Static
+
+from flashy.platforms.tui.base import STORY_CSS
+
+
+class ResumePromptScreen(ModalScreen[bool]):
+    """Ask whether to resume an interrupted attempt or start over.
+
+    Dismissed with True to resume, False to start over.
+    """
+
+    CSS = (
+        STORY_CSS
+        + """
+    ResumePromptScreen {
+        align: center middle;
+    }
+    """
+    )
+
+    BINDINGS = [
+        Binding("r", "resume", "Resume", show=True),
+        Binding("enter", "resume", "Resume"),
+        Binding("n", "start_over", "Start over", show=True),
+    ]
+
+    def __init__(self, level_number: int, answered: int) -> None:
+        super().__init__()
+        self.level_number = level_number
+        self.answered = answered
+
+    def compose(self) -> ComposeResult:
+        with Vertical(classes="story-box"):
+            yield Static("Unfinished level", classes="story-title")
+            yield Static(
+                f"You answered {self.answered} problem(s) of level "
+                f"{self.level_number} before it was interrupted.",
+                classes="story-text",
+            )
+            yield Static(
+                "Press R to carry on, or N to start the level over.",
+                classes="continue-hint",
+            )
+
+    def action_resume(self) -> None:
+        """Carry on with the interrupted attempt."""
+        self.dismiss(True)
+
+    def action_start_over(self) -> None:
+        """Discard the interrupted attempt."""
+        self.dismiss(False)
@@ -1,5 +1,7 @@
 """World map screen showing level progress."""
 
+import time
+
 from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -7,13 +9,14 @@ from textual.containers import Center, Vertical
 from textual.screen import Screen
 from textual.widgets import Footer, Header, ListItem, ListView, Static
 
-from flashy.history import load_progress
+from flashy.core.models import PlayerProgress
 
 
 class WorldMapScreen(Screen):
     """World map screen showing level progress with interactive level selection."""
 
     BINDINGS = [
+        Binding("r", "review", "Review", show=True),
         Binding("q", "quit", "Quit", show=True),
     ]
 
@@ -99,57 +102,64 @@ class WorldMapScreen(Screen):
         super().__init__()
         self.player_name = player_name
         self.selected_level = selected_level  # Level to highlight on open
-        # Determine world from selected_level or default to highest unlocked
-        if world_number is not None:
-            self.world_number = world_number
-        elif selected_level is not None:
+        # Determine world from selected_level, or once progress has loaded
+        # default to the highest unlocked
+        self.world_number: int | None = world_number
+        if world_number is None and selected_level is not None:
             self.world_number = (selected_level - 1) // 10 + 1
-        else:
-            self.world_number = self._get_current_world()
 
-    def _get_current_world(self) -> int:
+    def _get_current_world(self, progress: PlayerProgress) -> int:
         """Determine the current world based on progress."""
-        progress = load_progress(self.player_name)
+        from flashy.core.levels import get_total_worlds
+
         # Find highest world where level 1 is unlocked
-        for world_num in range(4, 0, -1):
+        for world_num in range(get_total_worlds(), 0, -1):
             first_level = (world_num - 1) * 10 + 1
             if progress.is_unlocked(first_level):
                 return world_num
         return 1
 
     def compose(self) -> ComposeResult:
-        from flashy.core.worlds import get_world
-
-        world = get_world(self.world_number)
-        if not world:
-            yield Static("World not found!")
-            return
-
         yield Header()
 
         with Center():
             with Vertical(id="map-box"):
-                emoji = world.theme_emoji
-                title = f"{emoji}  {world.name.upper()}  {emoji}"
-                yield Static(title, id="world-title")
+                # Filled in once progress has loaded
+                yield Static("", id="world-title")
                 yield Static(f"Player: {self.player_name}", id="player-info")
                 yield ListView(id="level-list")
                 yield Static("", id="error-msg")
-                yield Static("↑↓ Select • Enter Play • Q Quit", id="hint")
+                yield Static(
+                    "↑↓ Select • Enter Play • R Review • Q Quit", id="hint"
+                )
         yield Footer()
 
-    def on_mount(self) -> None:
-        """Populate level list and focus on current level."""
-        self._refresh_levels()
+    async def on_mount(self) -> None:
+        """Load progress, then populate level list and focus current level."""
+        from flashy.core.worlds import get_world
+        from flashy.platforms.tui.base import get_app
+
+        progress = await get_app(self).storage.load_progress(self.player_name)
+        if self.world_number is None:
+            self.world_number = self._get_current_world(progress)
 
-    def _refresh_levels(self) -> None:
+        world = get_world(self.world_number)
+        title = self.query_one("#world-title", Static)
+        if not world:
+            title.update("World not found!")
+            return
+        emoji = world.theme_emoji
+        title.update(f"{emoji}  {world.name.upper()}  {emoji}")
+        self._refresh_levels(progress)
+
+    def _refresh_levels(self, progress: PlayerProgress) -> None:
         """Refresh the level list."""
         from flashy.core.levels import get_levels_for_world
 
+        assert self.world_number is not None
         list_view = self.query_one("#level-list", ListView)
         list_view.clear()
 
-        progress = load_progress(self.player_name)
         levels = get_levels_for_world(self.world_number)
 
         # Find current playable level in this world (for default selection)
@@ -210,16 +220,17 @@ class WorldMapScreen(Screen):
             list_view.index = focus_index
 
     @on(ListView.Selected)
-    def level_selected(self, event: ListView.Selected) -> None:
+    async def level_selected(self, event: ListView.Selected) -> None:
         """Handle level selection."""
         from flashy.core.flow import LevelSelected
+        from flashy.platforms.tui.base import get_app
 
         item_id = event.item.id
         if not item_id or not item_id.startswith("level-"):
             return
 
         level_num = int(item_id[6:])  # Remove "level-" prefix
-        progress = load_progress(self.player_name)
+        progress = await get_app(self).storage.load_progress(self.player_name)
 
         error_msg = self.query_one("#error-msg", Static)
 
@@ -231,10 +242,25 @@ class WorldMapScreen(Screen):
         error_msg.update("")
 
         # Use GameFlow to determine where to go (gameplay, friend meet, or boss intro)
-        from flashy.platforms.tui.base import get_app
-
         get_app(self).navigate(LevelSelected(self.player_name, level_number=level_num))
 
+    async def action_review(self) -> None:
+        """Play a review round of the facts due for this player."""
+        from flashy.core.review import ReviewScheduler, review_level
+        from flashy.platforms.tui.base import get_app
+        from flashy.platforms.tui.screens.gameplay import GameplayScreen
+
+        storage = get_app(self).storage
+        sessions = [s async for s in storage.iter_sessions(self.player_name)]
+        scheduler = ReviewScheduler.from_sessions(sessions)
+        level = review_level(scheduler.due(time.time()))
+        if not level.problems:
+            self.notify("Nothing to review yet. Play a level first!")
+            return
+        self.app.push_screen(
+            GameplayScreen(self.player_name, level.number, level=level)
+        )
+
     def action_quit(self) -> None:
         """Quit to player select."""
         self.app.pop_screen()
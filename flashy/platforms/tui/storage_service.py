@@ -0,0 +1,182 @@
+"""Storage service shared by every TUI screen.
+
+FlashyApp owns one StorageService and screens reach storage only through
+it (``get_app(self).storage``), so the backend can be cached or swapped
+in one place. Calls run on a single storage worker thread and are awaited,
+so screens never block on the disk.
+
+When a player is selected, prefetch() loads their progress and recent
+session history on the worker, so the results screen can read that
+history from memory; saves and logged sessions made through the service
+keep it current. load_progress() still asks the backend each time (a
+CachedStorage answers from memory while the progress is unchanged), so a
+save by another process, such as a web sync or a second TUI, is seen and
+refreshes the snapshot.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
+from flashy.storage.checkpoint import CheckpointJournal
+from flashy.storage.protocol import StorageBackend
+from flashy.storage.threaded import ThreadedAsyncStorage
+
+# How far back prefetch() loads session history
+RECENT_HISTORY = timedelta(days=30)
+
+
+class StorageService:
+    """AsyncStorageBackend with an in-memory snapshot of one player.
+
+    The snapshot is only written on the worker thread, in order with the
+    storage calls, so it never goes back to an older state.
+    """
+
+    def __init__(
+        self, backend: StorageBackend, recent_history: timedelta = RECENT_HISTORY
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            backend: The synchronous storage backend to use.
+            recent_history: How far back prefetch() loads sessions.
+        """
+        self._backend = backend
+        self._async = ThreadedAsyncStorage(backend)
+        self._recent_history = recent_history
+        # (player, progress, recent sessions oldest first), replaced whole
+        self._snapshot: tuple[str, PlayerProgress, list[LevelResult]] | None = None
+        self._prefetch: Future[None] | None = None
+
+    @property
+    def backend(self) -> StorageBackend:
+        """The wrapped synchronous backend, for calls that must not wait."""
+        return self._backend
+
+    # --- Prefetch and snapshot ---
+
+    def prefetch(self, player_name: str) -> None:
+        """Start loading a player's progress and recent history.
+
+        Returns at once; the data is loaded on the storage worker.
+        """
+        self._prefetch = self._async.submit(self._fetch, player_name)
+
+    def _fetch(self, player_name: str) -> None:
+        """Load a player's snapshot. Runs on the storage worker."""
+        progress = self._backend.load_progress(player_name)
+        self._snapshot = (player_name, progress, self._recent(player_name))
+
+    def _recent(self, player_name: str) -> list[LevelResult]:
+        """Load a player's recent sessions. Runs on the storage worker."""
+        since = datetime.now() - self._recent_history
+        return list(self._backend.iter_sessions(player=player_name, since=since))
+
+    async def _wait_for_prefetch(self) -> None:
+        """Wait for a running prefetch to finish."""
+        if self._prefetch is not None and not self._prefetch.done():
+            await asyncio.wrap_future(self._prefetch)
+
+    def cached_progress(self, player_name: str) -> PlayerProgress | None:
+        """Get a player's progress as of the last prefetch, load or save."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] != player_name:
+            return None
+        return snapshot[1].copy()
+
+    def recent_sessions(self, player_name: str) -> list[LevelResult]:
+        """Get a player's prefetched recent sessions, oldest first."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] != player_name:
+            return []
+        return list(snapshot[2])
+
+    def checkpoint_journal(self, player_name: str) -> CheckpointJournal | None:
+        """Get a player's checkpoint journal, if the backend keeps one."""
+        journal = getattr(self._backend, "checkpoint_journal", None)
+        return journal(player_name) if journal is not None else None
+
+    # --- AsyncStorageBackend ---
+
+    async def load_progress(self, player_name: str) -> PlayerProgress:
+        """Load player progress, refreshing the snapshot if it changed."""
+        await self._wait_for_prefetch()
+        return await asyncio.wrap_future(
+            self._async.submit(self._load_progress, player_name)
+        )
+
+    def _load_progress(self, player_name: str) -> PlayerProgress:
+        """Load progress and revalidate the snapshot. Runs on the worker."""
+        progress = self._backend.load_progress(player_name)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == player_name:
+            if progress != snapshot[1]:
+                # Saved elsewhere, so sessions may have been logged too
+                self._snapshot = (player_name, progress, self._recent(player_name))
+        return progress.copy()
+
+    async def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
+        """Save player progress, updating the snapshot."""
+        await asyncio.wrap_future(
+            self._async.submit(self._save_progress, player_name, progress.copy())
+        )
+
+    def _save_progress(self, player_name: str, progress: PlayerProgress) -> None:
+        """Save progress and update the snapshot. Runs on the worker."""
+        self._backend.save_progress(player_name, progress)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == player_name:
+            self._snapshot = (player_name, progress, snapshot[2])
+
+    async def log_session(self, result: LevelResult) -> None:
+        """Log a completed level session, adding it to the snapshot."""
+        await asyncio.wrap_future(self._async.submit(self._log_session, result))
+
+    def _log_session(self, result: LevelResult) -> None:
+        """Log a session and update the snapshot. Runs on the worker."""
+        self._backend.log_session(result)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == result.player_name:
+            self._snapshot = (snapshot[0], snapshot[1], [*snapshot[2], result])
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[LevelResult]:
+        """Stream logged sessions in chronological order."""
+        return self._async.iter_sessions(player, level, since, until)
+
+    async def log_speech_recognition(
+        self,
+        raw_transcript: str,
+        parsed_number: int | None,
+        expected: int | None,
+        matched: bool,
+        partial: bool = False,
+    ) -> None:
+        """Log a speech recognition result for debugging."""
+        await self._async.log_speech_recognition(
+            raw_transcript, parsed_number, expected, matched, partial=partial
+        )
+
+    async def list_players(self) -> list[str]:
+        """List all player names."""
+        return await self._async.list_players()
+
+    async def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals."""
+        return await self._async.list_player_summaries()
+
+    async def player_exists(self, player_name: str) -> bool:
+        """Check if a player profile exists."""
+        return await self._async.player_exists(player_name)
+
+    def close(self) -> None:
+        """Finish queued storage calls and stop the worker thread."""
+        self._async.close()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from textual.message import Message
 from textual.widget import Widget
@@ -11,6 +11,8 @@ from textual.widgets import Static
 if TYPE_CHECKING:
     from textual.app import App
 
+    from flashy.platforms.tui.app import FlashyApp
+
 
 class VoiceInput(Widget):
     """Widget that wraps VoiceInputHandler for use in Textual."""
@@ -59,6 +61,7 @@ class VoiceInput(Widget):
     def on_mount(self) -> None:
         """Initialize and start listening."""
         self._app_ref = self.app
+        self._storage = cast("FlashyApp", self.app).storage
         self.run_worker(self._init_and_listen, thread=True)
 
     def _call_ui(self, callback, *args) -> None:
@@ -72,7 +75,11 @@ class VoiceInput(Widget):
             from flashy.platforms.tui.input_handler import VoiceInputHandler
 
             self._call_ui(self._set_status, "🎤 Loading model...")
-            self._handler = VoiceInputHandler()
+            # The backend's speech log queues entries, so the audio loop
+            # never waits for storage
+            self._handler = VoiceInputHandler(
+                log_speech=self._storage.backend.log_speech_recognition
+            )
 
             self._listening = True
             self._call_ui(self._set_status, "🎤 Listening...")
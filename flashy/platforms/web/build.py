@@ -31,8 +31,11 @@ def build():
         ("flashy/core/scoring.py", "flashy.core.scoring"),
         ("flashy/core/number_parser.py", "flashy.core.number_parser"),
         ("flashy/core/i18n.py", "flashy.core.i18n"),
-        ("flashy/core/worlds.py", "flashy.core.worlds"),
         ("flashy/core/levels.py", "flashy.core.levels"),
+        ("flashy/core/worlds.py", "flashy.core.worlds"),
+        # Reads compiled level packs; the packs themselves are fetched
+        # at startup, so they never add to the bundle
+        ("flashy/core/packs.py", "flashy.core.packs"),
         ("flashy/core/flow.py", "flashy.core.flow"),
         # Game controller
         ("flashy/game.py", "flashy.game"),
@@ -40,15 +40,229 @@ setattr(sys.modules["flashy.core"], "models", _mod)
 _code_flashy_core_models = """\
 \"\"\"Data models for game state - pure data, no I/O.\"\"\"
 
-from dataclasses import dataclass, field
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, MutableMapping
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 
+# Level numbers map to worlds in blocks of this size
+LEVELS_PER_WORLD = 10
 
-@dataclass
+# Version byte of the packed PlayerProgress encoding
+_PACK_VERSION = 1
+_PACK_HEADER = struct.Struct("<BH")  # version, level count
+_MAX_SCORE = 0xFFFFFFFF
+
+
+def _check_level(level: int) -> int:
+    \"\"\"Validate a level number used as a packed-table key.\"\"\"
+    if not isinstance(level, int) or level < 1:
+        raise KeyError(level)
+    return level
+
+
+class PackedStars(MutableMapping[int, int]):
+    \"\"\"Level number -> stars (1-3), packed 2 bits per level into an int.
+
+    Behaves like a dict of completed levels. The star total, the totals
+    per world and the highest level passed with 2+ stars are kept up to
+    date on every write, so progress queries never scan all levels.
+    Storing 0 stars removes the level.
+    \"\"\"
+
+    __slots__ = ("_bits", "_count", "_total", "_world_totals", "_highest_passed")
+
+    def __init__(self, items: Mapping[int, int] | None = None) -> None:
+        self._bits = 0
+        self._count = 0
+        self._total = 0
+        self._world_totals: dict[int, int] = {}
+        self._highest_passed = 0
+        for level, stars in (items or {}).items():
+            self[level] = stars
+
+    def __getitem__(self, level: int) -> int:
+        stars = self.get(level, 0)
+        if not stars:
+            raise KeyError(level)
+        return stars
+
+    def get(self, level: int, default: int = 0) -> int:  # type: ignore[override]
+        \"\"\"Get stars for a level without raising for missing levels.\"\"\"
+        if not isinstance(level, int) or level < 1:
+            return default
+        return (self._bits >> (2 * (level - 1))) & 3 or default
+
+    def __setitem__(self, level: int, stars: int) -> None:
+        _check_level(level)
+        stars = int(stars)
+        if not 0 <= stars <= 3:
+            raise ValueError(f"Stars must be 0-3, got {stars}")
+        shift = 2 * (level - 1)
+        old = (self._bits >> shift) & 3
+        if stars == old:
+            return
+        self._bits = (self._bits & ~(3 << shift)) | (stars << shift)
+        self._count += (stars > 0) - (old > 0)
+        self._total += stars - old
+        world = (level - 1) // LEVELS_PER_WORLD + 1
+        self._world_totals[world] = self._world_totals.get(world, 0) + stars - old
+
+        if stars >= 2 and level > self._highest_passed:
+            self._highest_passed = level
+        elif old >= 2 and stars < 2 and level == self._highest_passed:
+            self._highest_passed = max(
+                (lvl for lvl, s in self.items() if s >= 2), default=0
+            )
+
+    def __delitem__(self, level: int) -> None:
+        if not self.get(level, 0):
+            raise KeyError(level)
+        self[level] = 0
+
+    def __iter__(self) -> Iterator[int]:
+        bits = self._bits
+        level = 1
+        while bits:
+            if bits & 3:
+                yield level
+            bits >>= 2
+            level += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    @property
+    def total(self) -> int:
+        \"\"\"Sum of stars across all levels.\"\"\"
+        return self._total
+
+    @property
+    def highest_passed(self) -> int:
+        \"\"\"Highest level with 2+ stars (0 if none).\"\"\"
+        return self._highest_passed
+
+    @property
+    def max_level(self) -> int:
+        \"\"\"Highest level with any stars (0 if none).\"\"\"
+        return (self._bits.bit_length() + 1) // 2
+
+    def world_total(self, world: int) -> int:
+        \"\"\"Sum of stars across the levels of one world.\"\"\"
+        return self._world_totals.get(world, 0)
+
+    def copy(self) -> "PackedStars":
+        \"\"\"Copy the table.\"\"\"
+        other = PackedStars()
+        other._bits = self._bits
+        other._count = self._count
+        other._total = self._total
+        other._world_totals = dict(self._world_totals)
+        other._highest_passed = self._highest_passed
+        return other
+
+
+class PackedScores(MutableMapping[int, int]):
+    \"\"\"Level number -> best score, stored in an array('I') by level.
+
+    Behaves like a dict of scored levels, with the total kept up to date
+    on every write. Storing a score of 0 removes the level.
+    \"\"\"
+
+    __slots__ = ("_scores", "_count", "_total")
+
+    def __init__(self, items: Mapping[int, int] | None = None) -> None:
+        self._scores = array("I")
+        self._count = 0
+        self._total = 0
+        for level, score in (items or {}).items():
+            self[level] = score
+
+    def __getitem__(self, level: int) -> int:
+        score = self.get(level, 0)
+        if not score:
+            raise KeyError(level)
+        return score
+
+    def get(self, level: int, default: int = 0) -> int:  # type: ignore[override]
+        \"\"\"Get the score for a level without raising for missing levels.\"\"\"
+        if not isinstance(level, int) or not 1 <= level <= len(self._scores):
+            return default
+        return self._scores[level - 1] or default
+
+    def __setitem__(self, level: int, score: int) -> None:
+        _check_level(level)
+        score = int(score)
+        if not 0 <= score <= _MAX_SCORE:
+            raise ValueError(f"Score out of range: {score}")
+        if level > len(self._scores):
+            if not score:
+                return
+            self._scores.extend([0] * (level - len(self._scores)))
+        old = self._scores[level - 1]
+        self._scores[level - 1] = score
+        self._count += (score > 0) - (old > 0)
+        self._total += score - old
+
+    def __delitem__(self, level: int) -> None:
+        if not self.get(level, 0):
+            raise KeyError(level)
+        self[level] = 0
+
+    def __iter__(self) -> Iterator[int]:
+        for index, score in enumerate(self._scores):
+            if score:
+                yield index + 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    @property
+    def total(self) -> int:
+        \"\"\"Sum of best scores across all levels.\"\"\"
+        return self._total
+
+    @property
+    def max_level(self) -> int:
+        \"\"\"Highest level the array has room for.\"\"\"
+        return len(self._scores)
+
+    def copy(self) -> "PackedScores":
+        \"\"\"Copy the table.\"\"\"
+        other = PackedScores()
+        other._scores = array("I", self._scores)
+        other._count = self._count
+        other._total = self._total
+        return other
+
+
+@dataclass(init=False)
 class PlayerProgress:
-    \"\"\"Player's game progress - stars, best scores, and unlocked levels.\"\"\"
+    \"\"\"Player's game progress - stars, best scores, and unlocked levels.
+
+    stars and best_scores behave like dicts keyed by level number but are
+    stored packed (see PackedStars and PackedScores), so unlock and total
+    queries are O(1).
+    \"\"\"
 
-    stars: dict[int, int] = field(default_factory=dict)  # level_number -> stars (1-3)
-    best_scores: dict[int, int] = field(default_factory=dict)  # level_number -> score
+    stars: PackedStars = field(default_factory=PackedStars)  # level -> stars (1-3)
+    best_scores: PackedScores = field(default_factory=PackedScores)  # level -> score
+
+    def __init__(
+        self,
+        stars: Mapping[int, int] | None = None,
+        best_scores: Mapping[int, int] | None = None,
+    ) -> None:
+        self.stars = PackedStars(stars)
+        self.best_scores = PackedScores(best_scores)
 
     def get_stars(self, level: int) -> int:
         \"\"\"Get stars for a level (0 if not completed).\"\"\"
@@ -72,21 +286,21 @@ class PlayerProgress:
 
     def get_total_best_score(self) -> int:
         \"\"\"Get sum of best scores across all levels.\"\"\"
-        return sum(self.best_scores.values())
+        return self.best_scores.total
 
-    def get_highest_unlocked(self) -> int:
-        \"\"\"Get the highest level that has been unlocked.\"\"\"
-        if not self.stars:
-            return 1  # Start with level 1 unlocked
+    def get_total_stars(self) -> int:
+        \"\"\"Get sum of stars across all levels.\"\"\"
+        return self.stars.total
 
-        # Find highest completed level with 2+ stars
-        highest = 0
-        for level_num, star_count in self.stars.items():
-            if star_count >= 2:
-                highest = max(highest, level_num)
+    def get_world_stars(self, world: int) -> int:
+        \"\"\"Get sum of stars across the levels of one world.\"\"\"
+        return self.stars.world_total(world)
 
-        # Next level after highest completed is unlocked
-        return highest + 1
+    def get_highest_unlocked(self) -> int:
+        \"\"\"Get the highest level that has been unlocked.\"\"\"
+        # Next level after the highest completed with 2+ stars; level 1
+        # is always unlocked
+        return self.stars.highest_passed + 1
 
     def is_unlocked(self, level: int) -> bool:
         \"\"\"Check if a level is unlocked (playable).\"\"\"
@@ -95,6 +309,77 @@ class PlayerProgress:
         # Level is unlocked if previous level has 2+ stars
         return self.get_stars(level - 1) >= 2
 
+    def copy(self) -> "PlayerProgress":
+        \"\"\"Copy the progress without sharing any mutable state.\"\"\"
+        progress = PlayerProgress()
+        progress.stars = self.stars.copy()
+        progress.best_scores = self.best_scores.copy()
+        return progress
+
+    def pack(self) -> bytes:
+        \"\"\"Encode as a short fixed-size binary record.
+
+        The layout is a version byte and a level count (little-endian
+        uint16), then 2 bits of stars per level and a uint32 best score
+        per level. The size depends only on the highest level stored.
+        \"\"\"
+        count = max(self.stars.max_level, self.best_scores.max_level)
+        star_bytes = self.stars._bits.to_bytes((count + 3) // 4, "little")
+        scores = array("I", (self.best_scores.get(lvl) for lvl in range(1, count + 1)))
+        if sys.byteorder != "little":
+            scores.byteswap()
+        return _PACK_HEADER.pack(_PACK_VERSION, count) + star_bytes + scores.tobytes()
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "PlayerProgress":
+        \"\"\"Decode a record written by pack().
+
+        Raises:
+            ValueError: If the data is not a valid packed record.
+        \"\"\"
+        if len(data) < _PACK_HEADER.size:
+            raise ValueError("Packed progress is truncated")
+        version, count = _PACK_HEADER.unpack_from(data)
+        if version != _PACK_VERSION:
+            raise ValueError(f"Unknown packed progress version {version}")
+        star_size = (count + 3) // 4
+        if len(data) != _PACK_HEADER.size + star_size + 4 * count:
+            raise ValueError("Packed progress has the wrong size")
+
+        offset = _PACK_HEADER.size
+        bits = int.from_bytes(data[offset : offset + star_size], "little")
+        scores = array("I", data[offset + star_size :])
+        if sys.byteorder != "little":
+            scores.byteswap()
+
+        stars = {}
+        for index in range(count):
+            value = (bits >> (2 * index)) & 3
+            if value:
+                stars[index + 1] = value
+        best_scores = {index + 1: score for index, score in enumerate(scores) if score}
+        return cls(stars=stars, best_scores=best_scores)
+
+
+@dataclass(frozen=True)
+class PlayerSummary:
+    \"\"\"Per-player totals shown on the player select screen.\"\"\"
+
+    name: str
+    total_stars: int = 0
+    highest_unlocked: int = 1
+    total_best_score: int = 0
+
+    @classmethod
+    def from_progress(cls, name: str, progress: PlayerProgress) -> "PlayerSummary":
+        \"\"\"Summarize a player's progress.\"\"\"
+        return cls(
+            name=name,
+            total_stars=progress.get_total_stars(),
+            highest_unlocked=progress.get_highest_unlocked(),
+            total_best_score=progress.get_total_best_score(),
+        )
+
 
 @dataclass
 class ProblemResult:
@@ -120,6 +405,44 @@ class LevelResult:
     best_streak: int
     total_time_seconds: float
     problems: list[ProblemResult]
+    player_name: str = ""
+    timestamp: datetime | None = None  # When the session was logged
+
+    def to_log_entry(self) -> dict:
+        \"\"\"Convert to the JSON-ready dict stored in history logs.
+
+        Sessions without a timestamp are stamped with the current time.
+        \"\"\"
+        timestamp = self.timestamp or datetime.now()
+        return {
+            "timestamp": timestamp.isoformat(),
+            "player": self.player_name,
+            "level_number": self.level_number,
+            "level_name": self.level_name,
+            "score": self.total_score,
+            "correct": self.correct_count,
+            "total": self.total_problems,
+            "best_streak": self.best_streak,
+            "time_seconds": self.total_time_seconds,
+            "problems": [asdict(p) for p in self.problems],
+        }
+
+    @classmethod
+    def from_log_entry(cls, entry: dict) -> "LevelResult":
+        \"\"\"Create from a history log entry (see to_log_entry).\"\"\"
+        timestamp = entry.get("timestamp")
+        return cls(
+            level_number=entry["level_number"],
+            level_name=entry.get("level_name", ""),
+            total_score=entry.get("score", 0),
+            correct_count=entry.get("correct", 0),
+            total_problems=entry.get("total", 0),
+            best_streak=entry.get("best_streak", 0),
+            total_time_seconds=entry.get("time_seconds", 0.0),
+            problems=[ProblemResult(**p) for p in entry.get("problems", [])],
+            player_name=entry.get("player", ""),
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+        )
 
 """
 
@@ -136,9 +459,24 @@ _code_flashy_core_problems = """\
 \"\"\"Problem generation - pure functions for creating math problems.\"\"\"
 
 import random
+import re
+from array import array
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:
+    # Optional (the "fast" extra); Pyodide builds use the pure-Python path
+    np = None
+
+# Batches are int64 columns, so every answer has to fit in one
+_INT64_MAX = 2**63 - 1
+
+# random.randint or a Random instance's bound randint
+RandInt = Callable[[int, int], int]
+
 
 class Operation(Enum):
     ADD = "+"
@@ -166,50 +504,104 @@ class Problem:
         return f"{self.operand1} {self.operation.value} {op2}"
 
 
-def generate_problem(operation: Operation, min_val: int, max_val: int) -> Problem:
+_SYMBOLS = {
+    "+": Operation.ADD,
+    "-": Operation.SUBTRACT,
+    "×": Operation.MULTIPLY,
+    "x": Operation.MULTIPLY,
+    "*": Operation.MULTIPLY,
+    "÷": Operation.DIVIDE,
+    "/": Operation.DIVIDE,
+}
+_PROBLEM_RE = re.compile(r"\\s*(-?\\d+)\\s*([-+×x*÷/])\\s*(?:(-?\\d+)|\\((-?\\d+)\\))\\s*")
+
+
+def parse_problem(text: str) -> Problem:
+    \"\"\"Parse a problem written like "12 - 5", "3 × 4" or "-1 - (-8)".
+
+    Reads what Problem.display() writes, and also accepts x, * and / for
+    multiplication and division.
+
+    Raises:
+        ValueError: If the text is not a problem, or a division is not
+            exact.
+    \"\"\"
+    match = _PROBLEM_RE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Not a problem: {text!r}")
+    a = int(match.group(1))
+    b = int(match.group(3) or match.group(4))
+    operation = _SYMBOLS[match.group(2)]
+    if operation == Operation.ADD:
+        answer = a + b
+    elif operation == Operation.SUBTRACT:
+        answer = a - b
+    elif operation == Operation.MULTIPLY:
+        answer = a * b
+    else:
+        if b == 0 or a % b:
+            raise ValueError(f"Division must be exact: {text!r}")
+        answer = a // b
+    return Problem(a, b, operation, answer)
+
+
+def generate_problem(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    *,
+    rng: random.Random | None = None,
+) -> Problem:
     \"\"\"Generate a random problem for the given operation and number range.
 
     For subtraction: ensures non-negative result.
     For division: ensures clean integer result (no remainder).
+
+    Args:
+        operation: The operation of the problem.
+        min_val: Smallest operand (for division, smallest answer and divisor).
+        max_val: Largest operand (for division, largest answer and divisor).
+        rng: Source of randomness. Defaults to the random module's.
     \"\"\"
+    randint = rng.randint if rng is not None else random.randint
     if operation == Operation.ADD:
-        return _generate_addition(min_val, max_val)
+        return _generate_addition(min_val, max_val, randint)
     elif operation == Operation.SUBTRACT:
-        return _generate_subtraction(min_val, max_val)
+        return _generate_subtraction(min_val, max_val, randint)
     elif operation == Operation.MULTIPLY:
-        return _generate_multiplication(min_val, max_val)
+        return _generate_multiplication(min_val, max_val, randint)
     elif operation == Operation.DIVIDE:
-        return _generate_division(min_val, max_val)
+        return _generate_division(min_val, max_val, randint)
     else:
         raise ValueError(f"Unknown operation: {operation}")
 
 
-def _generate_addition(min_val: int, max_val: int) -> Problem:
-    a = random.randint(min_val, max_val)
-    b = random.randint(min_val, max_val)
+def _generate_addition(min_val: int, max_val: int, randint: RandInt) -> Problem:
+    a = randint(min_val, max_val)
+    b = randint(min_val, max_val)
     return Problem(operand1=a, operand2=b, operation=Operation.ADD, answer=a + b)
 
 
-def _generate_subtraction(min_val: int, max_val: int) -> Problem:
+def _generate_subtraction(min_val: int, max_val: int, randint: RandInt) -> Problem:
     # Generate two numbers and ensure a >= b for non-negative result
-    a = random.randint(min_val, max_val)
-    b = random.randint(min_val, max_val)
+    a = randint(min_val, max_val)
+    b = randint(min_val, max_val)
     if a < b:
         a, b = b, a
     return Problem(operand1=a, operand2=b, operation=Operation.SUBTRACT, answer=a - b)
 
 
-def _generate_multiplication(min_val: int, max_val: int) -> Problem:
-    a = random.randint(min_val, max_val)
-    b = random.randint(min_val, max_val)
+def _generate_multiplication(min_val: int, max_val: int, randint: RandInt) -> Problem:
+    a = randint(min_val, max_val)
+    b = randint(min_val, max_val)
     return Problem(operand1=a, operand2=b, operation=Operation.MULTIPLY, answer=a * b)
 
 
-def _generate_division(min_val: int, max_val: int) -> Problem:
+def _generate_division(min_val: int, max_val: int, randint: RandInt) -> Problem:
     # Generate answer and divisor, then compute dividend
     # This ensures clean integer division
-    answer = random.randint(min_val, max_val)
-    divisor = random.randint(min_val, max_val)
+    answer = randint(min_val, max_val)
+    divisor = randint(min_val, max_val)
     # Avoid division by zero
     if divisor == 0:
         divisor = 1
@@ -218,6 +610,136 @@ def _generate_division(min_val: int, max_val: int) -> Problem:
         operand1=dividend, operand2=divisor, operation=Operation.DIVIDE, answer=answer
     )
 
+
+@dataclass(frozen=True)
+class ProblemBatch:
+    \"\"\"Generated problems stored as columns.
+
+    Columns are NumPy int64 arrays when NumPy is available and
+    array("q") otherwise. Problem objects are only made when an item is
+    read, so a batch of thousands costs a few integers per problem.
+    \"\"\"
+
+    operation: Operation
+    operand1: Sequence[int]
+    operand2: Sequence[int]
+    answer: Sequence[int]
+
+    def __len__(self) -> int:
+        \"\"\"Return the number of problems.\"\"\"
+        return len(self.answer)
+
+    def __getitem__(self, index: int) -> Problem:
+        \"\"\"Make the problem at an index.\"\"\"
+        return Problem(
+            operand1=int(self.operand1[index]),
+            operand2=int(self.operand2[index]),
+            operation=self.operation,
+            answer=int(self.answer[index]),
+        )
+
+    def __iter__(self) -> Iterator[Problem]:
+        \"\"\"Make the problems in order.\"\"\"
+        operation = self.operation
+        for a, b, answer in zip(self.operand1, self.operand2, self.answer, strict=True):
+            yield Problem(int(a), int(b), operation, int(answer))
+
+
+def generate_problems(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    n: int,
+    *,
+    rng: random.Random | None = None,
+) -> ProblemBatch:
+    \"\"\"Generate n random problems at once, by the rules of generate_problem.
+
+    Operands are drawn a whole column at a time, with NumPy when it is
+    installed. The same rng seed gives the same batch on the same path,
+    but the NumPy and pure-Python paths draw different problems.
+
+    Args:
+        operation: The operation of every problem.
+        min_val: Smallest operand (for division, smallest answer and divisor).
+        max_val: Largest operand (for division, largest answer and divisor).
+        n: How many problems to generate.
+        rng: Source of randomness. Defaults to the random module's.
+
+    Returns:
+        The problems as a ProblemBatch.
+
+    Raises:
+        ValueError: If the range is empty, n is negative, or answers in
+            the range would not fit in 64 bits.
+    \"\"\"
+    if min_val > max_val:
+        raise ValueError(f"Empty range: {min_val}..{max_val}")
+    if n < 0:
+        raise ValueError(f"Negative problem count: {n}")
+    if max(abs(min_val), abs(max_val)) ** 2 * 2 > _INT64_MAX:
+        raise ValueError(f"Range too large for a batch: {min_val}..{max_val}")
+    if np is not None:
+        return _generate_batch_numpy(operation, min_val, max_val, n, rng)
+    return _generate_batch_python(operation, min_val, max_val, n, rng)
+
+
+def _generate_batch_numpy(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    n: int,
+    rng: random.Random | None,
+) -> ProblemBatch:
+    assert np is not None  # Only called when NumPy imported
+    generator = np.random.default_rng(
+        rng.getrandbits(128) if rng is not None else None
+    )
+    a = generator.integers(min_val, max_val, size=n, endpoint=True, dtype=np.int64)
+    b = generator.integers(min_val, max_val, size=n, endpoint=True, dtype=np.int64)
+    if operation == Operation.ADD:
+        return ProblemBatch(operation, a, b, a + b)
+    elif operation == Operation.SUBTRACT:
+        # Larger operand first for a non-negative result
+        high, low = np.maximum(a, b), np.minimum(a, b)
+        return ProblemBatch(operation, high, low, high - low)
+    elif operation == Operation.MULTIPLY:
+        return ProblemBatch(operation, a, b, a * b)
+    elif operation == Operation.DIVIDE:
+        # a is the answer, b the divisor; zero divisors become 1
+        divisor = np.where(b == 0, 1, b)
+        return ProblemBatch(operation, a * divisor, divisor, a)
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+
+
+def _generate_batch_python(
+    operation: Operation,
+    min_val: int,
+    max_val: int,
+    n: int,
+    rng: random.Random | None,
+) -> ProblemBatch:
+    choices = rng.choices if rng is not None else random.choices
+    values = range(min_val, max_val + 1)
+    a = choices(values, k=n)
+    b = choices(values, k=n)
+    if operation == Operation.ADD:
+        columns = (a, b, [x + y for x, y in zip(a, b, strict=True)])
+    elif operation == Operation.SUBTRACT:
+        high = list(map(max, a, b))
+        low = list(map(min, a, b))
+        columns = (high, low, [x - y for x, y in zip(high, low, strict=True)])
+    elif operation == Operation.MULTIPLY:
+        columns = (a, b, [x * y for x, y in zip(a, b, strict=True)])
+    elif operation == Operation.DIVIDE:
+        divisor = [y or 1 for y in b]
+        columns = ([x * y for x, y in zip(a, divisor, strict=True)], divisor, a)
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+    operand1, operand2, answer = (array("q", column) for column in columns)
+    return ProblemBatch(operation, operand1, operand2, answer)
+
 """
 
 exec(_code_flashy_core_problems, sys.modules["flashy.core.problems"].__dict__)
@@ -1098,297 +1620,99 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
 
 exec(_code_flashy_core_i18n, sys.modules["flashy.core.i18n"].__dict__)
 
-# === flashy.core.worlds ===
+# === flashy.core.levels ===
 # Create module
-_mod = ModuleType("flashy.core.worlds")
+_mod = ModuleType("flashy.core.levels")
 _mod.__package__ = "flashy.core"
-sys.modules["flashy.core.worlds"] = _mod
-setattr(sys.modules["flashy.core"], "worlds", _mod)
+sys.modules["flashy.core.levels"] = _mod
+setattr(sys.modules["flashy.core"], "levels", _mod)
 
-_code_flashy_core_worlds = """\
-\"\"\"World definitions - story content and theming.\"\"\"
+_code_flashy_core_levels = """\
+\"\"\"Level definitions - curated problem sequences for each level.\"\"\"
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from enum import Enum
+from typing import Protocol
+
+from flashy.core.models import LEVELS_PER_WORLD
+from flashy.core.problems import Operation, Problem
 
-from flashy.core.problems import Operation
+
+class LevelType(Enum):
+    \"\"\"Type of level determining its role in the world.\"\"\"
+
+    INTRO = "intro"  # Easy warmup levels (1-3)
+    BUILD = "build"  # Building difficulty (4-5)
+    FRIEND = "friend"  # Meet a friend, story moment (6)
+    CHALLENGE = "challenge"  # Harder levels (7-8)
+    PREBOSS = "preboss"  # Tough preparation (9)
+    BOSS = "boss"  # Timed boss battle (10)
 
 
 @dataclass(frozen=True)
-class World:
-    \"\"\"Configuration for a game world.\"\"\"
+class Level:
+    \"\"\"Configuration for a game level with curated problems.\"\"\"
 
-    number: int
+    number: int  # Global level number (1-40)
+    world_number: int  # Which world (1-4)
+    level_in_world: int  # Position in world (1-10)
     name: str
-    theme_emoji: str
-    operation: Operation
-    friend_name: str
-    friend_emoji: str
-    boss_name: str
-    boss_emoji: str
-    intro_text: str
-    friend_text: str
-    boss_intro: str
-    boss_defeat: str
-    background: str  # Path relative to assets/ folder
-    # Visual theming for world map
-    path_color: str  # SVG path stroke color
-    node_color: str  # Level node background color
-    node_glow: str  # Level node glow/shadow color
-    # Map layout - list of waypoints the path passes through (0-100 coordinate space)
-    # Format: "x1,y1 x2,y2 x3,y3 ..." - the curve will smoothly pass through each point
-    map_waypoints: str
+    level_type: LevelType
+    problems: tuple[Problem, ...]  # Curated problem sequence
+    time_limit: int | None = None  # Seconds, only for boss levels
 
 
-# World definitions
-WORLD_1 = World(
+# Level number of review rounds (see flashy.core.review); no real level has it
+REVIEW_LEVEL_NUMBER = 0
+
+
+# Helper functions to create problems concisely
+def add(a: int, b: int) -> Problem:
+    \"\"\"Create an addition problem.\"\"\"
+    return Problem(a, b, Operation.ADD, a + b)
+
+
+def sub(a: int, b: int) -> Problem:
+    \"\"\"Create a subtraction problem (a - b).\"\"\"
+    return Problem(a, b, Operation.SUBTRACT, a - b)
+
+
+def mul(a: int, b: int) -> Problem:
+    \"\"\"Create a multiplication problem.\"\"\"
+    return Problem(a, b, Operation.MULTIPLY, a * b)
+
+
+def div(a: int, b: int) -> Problem:
+    \"\"\"Create a division problem (a / b).\"\"\"
+    return Problem(a, b, Operation.DIVIDE, a // b)
+
+
+# =============================================================================
+# WORLD 1: ADDITION ALPS (Levels 1-10)
+# =============================================================================
+
+LEVEL_1 = Level(
     number=1,
-    name="Addition Alps",
-    theme_emoji="🏔️",
-    operation=Operation.ADD,
-    friend_name="Carry",
-    friend_emoji="🦉",
-    boss_name="Summit",
-    boss_emoji="🐐",
-    intro_text=(
-        "Flashy woke up alone in the cold mountains.\\n"
-        '"Where am I? I need to find my way home!"\\n'
-        "The only way forward is up through the Addition Alps..."
-    ),
-    friend_text=(
-        '"Hoo-hoo! I\\'m Carry the Owl!"\\n'
-        '"I\\'ve watched many travelers climb these peaks."\\n'
-        '"Remember: when numbers get big, just carry on!"\\n'
-        '"Let me help you on your journey home."'
-    ),
-    boss_intro=(
-        '"So, little pup, you think you can cross MY mountain?"\\n'
-        '"I am Summit, guardian of the Alps!"\\n'
-        '"Prove your addition skills... if you can keep up!"'
-    ),
-    boss_defeat=(
-        '"Impressive, little one! You\\'ve earned passage."\\n'
-        '"The path ahead leads to the Subtraction Swamp."\\n'
-        '"May your numbers stay strong!"'
+    world_number=1,
+    level_in_world=1,
+    name="Trailhead",
+    level_type=LevelType.INTRO,
+    problems=(
+        add(1, 1),
+        add(2, 1),
+        add(3, 2),
+        add(2, 2),
+        add(1, 4),
+        add(4, 3),
+        add(5, 6),
+        add(3, 3),
+        add(4, 2),
+        add(5, 5),
     ),
-    background="backgrounds/world-1-addition-alps.webp",
-    path_color="#4d350b",  # Warm cream trail
-    node_color="#2d5a3d",  # Forest green
-    node_glow="#4a8c5c",  # Lighter green glow
-    # Waypoints: start at bottom, zigzag up the mountain
-    map_waypoints="75,82 50,82 22,70 33,45 50,65 65,65 75,47 65,25 52,15",
 )
 
-WORLD_2 = World(
-    number=2,
-    name="Subtraction Swamp",
-    theme_emoji="🌿",
-    operation=Operation.SUBTRACT,
-    friend_name="Borrow",
-    friend_emoji="🐢",
-    boss_name="Minus",
-    boss_emoji="🐸",
-    intro_text=(
-        "The mountains gave way to murky wetlands.\\n"
-        '"It\\'s so foggy here... but I must keep going!"\\n'
-        "Flashy stepped carefully into the Subtraction Swamp..."
-    ),
-    friend_text=(
-        '"Slow down there, young pup!"\\n'
-        "\\"I'm Borrow the Turtle. I've lived here for centuries.\\"\\n"
-        '"When you need to take away more than you have,"\\n'
-        '"just borrow from your neighbor. Works every time!"'
-    ),
-    boss_intro=(
-        '"RIBBIT! Who dares enter my swamp?"\\n'
-        '"I am Minus, the Frog King!"\\n'
-        '"Let\\'s see if you can subtract as fast as I can jump!"'
-    ),
-    boss_defeat=(
-        '"RIBBIT... you\\'ve bested me, small one."\\n'
-        '"The meadows lie ahead. Enjoy the flowers!"\\n'
-        '"Hop along now!"'
-    ),
-    background="backgrounds/world-2-subtraction-swamp.webp",
-    path_color="#C4D95C",  # Mossy green
-    node_color="#6c5e0f",  # Swamp green
-    node_glow="#d3a769",  # Murky glow
-    map_waypoints="30,90 55,85 80,70 85,45 40,70 40,50 75,40 50,15",
-)
-
-WORLD_3 = World(
-    number=3,
-    name="Multiplication Meadows",
-    theme_emoji="🌸",
-    operation=Operation.MULTIPLY,
-    friend_name="Times",
-    friend_emoji="🐰",
-    boss_name="Countess Calculata",
-    boss_emoji="🦊",
-    intro_text=(
-        "Beautiful flowers swayed in the breeze.\\n"
-        '"What a lovely place... but I must keep moving!"\\n'
-        "The Multiplication Meadows bloomed with possibility..."
-    ),
-    friend_text=(
-        '"Oh my, oh my! A visitor!" *hops excitedly*\\n'
-        '"I\\'m Times the Rabbit! I multiply EVERYTHING!"\\n'
-        '"One carrot becomes two, two become four!"\\n'
-        '"Multiplication is just fast addition, you know!"'
-    ),
-    boss_intro=(
-        '"Well, well... the lost puppy arrives."\\n'
-        '"I am Countess Calculata, master of multiplication!"\\n'
-        '"Beat me, and the desert path shall open!"'
-    ),
-    boss_defeat=(
-        '"Magnificent! You\\'ve mastered multiplication!"\\n'
-        '"The desert lies ahead. Stay hydrated!"\\n'
-        '"Your home draws ever closer."'
-    ),
-    background="backgrounds/world-3-multiplication-meadows.webp",
-    path_color="#e8c4d4",  # Soft pink
-    node_color="#7a4a6a",  # Meadow purple
-    node_glow="#b888a8",  # Floral glow
-    map_waypoints="90,80 50,80 20,90 10,68 50,60 65,60 72,45 40,35 10,40",
-)
-
-WORLD_4 = World(
-    number=4,
-    name="Division Desert",
-    theme_emoji="🏜️",
-    operation=Operation.DIVIDE,
-    friend_name="Remainder",
-    friend_emoji="🐪",
-    boss_name="The Sphinx of Splits",
-    boss_emoji="🦁",
-    intro_text=(
-        "The heat hit Flashy like a wall.\\n"
-        '"So hot... but I can almost smell home!"\\n'
-        "The Division Desert stretched endlessly before..."
-    ),
-    friend_text=(
-        '"Ah, a traveler! I am Remainder the Camel."\\n'
-        '"I carry what\\'s left over from every division."\\n'
-        '"Remember: divide means to share equally!"\\n'
-        '"Split it up fair, and you\\'ll find your answer."'
-    ),
-    boss_intro=(
-        '"HALT, wanderer! None pass without solving my riddles."\\n'
-        '"I am the Sphinx of Splits!"\\n'
-        '"Divide correctly, or be lost to the sands forever!"'
-    ),
-    boss_defeat=(
-        '"You have wisdom beyond your years, young pup."\\n'
-        '"Look there, beyond the dunes..."\\n'
-        '"Is that... your HOME?"'
-    ),
-    background="backgrounds/world-4-division-desert.webp",
-    path_color="#d3c749",  # Sandy trail
-    node_color="#d17109",  # Desert gold
-    node_glow="#fcb519",  # Golden glow
-    map_waypoints="80,90 40,90 40,80 70,70 65,55 35,55 40,35 80,40 65,15",
-)
-
-WORLDS = [WORLD_1, WORLD_2, WORLD_3, WORLD_4]
-
-
-def get_world(world_num: int) -> World | None:
-    \"\"\"Get world by number. Returns None if world doesn't exist.\"\"\"
-    for world in WORLDS:
-        if world.number == world_num:
-            return world
-    return None
-
-"""
-
-exec(_code_flashy_core_worlds, sys.modules["flashy.core.worlds"].__dict__)
-
-# === flashy.core.levels ===
-# Create module
-_mod = ModuleType("flashy.core.levels")
-_mod.__package__ = "flashy.core"
-sys.modules["flashy.core.levels"] = _mod
-setattr(sys.modules["flashy.core"], "levels", _mod)
-
-_code_flashy_core_levels = """\
-\"\"\"Level definitions - curated problem sequences for each level.\"\"\"
-
-from dataclasses import dataclass
-from enum import Enum
-
-from flashy.core.problems import Operation, Problem
-
-
-class LevelType(Enum):
-    \"\"\"Type of level determining its role in the world.\"\"\"
-
-    INTRO = "intro"  # Easy warmup levels (1-3)
-    BUILD = "build"  # Building difficulty (4-5)
-    FRIEND = "friend"  # Meet a friend, story moment (6)
-    CHALLENGE = "challenge"  # Harder levels (7-8)
-    PREBOSS = "preboss"  # Tough preparation (9)
-    BOSS = "boss"  # Timed boss battle (10)
-
-
-@dataclass(frozen=True)
-class Level:
-    \"\"\"Configuration for a game level with curated problems.\"\"\"
-
-    number: int  # Global level number (1-40)
-    world_number: int  # Which world (1-4)
-    level_in_world: int  # Position in world (1-10)
-    name: str
-    level_type: LevelType
-    problems: tuple[Problem, ...]  # Curated problem sequence
-    time_limit: int | None = None  # Seconds, only for boss levels
-
-
-# Helper functions to create problems concisely
-def add(a: int, b: int) -> Problem:
-    \"\"\"Create an addition problem.\"\"\"
-    return Problem(a, b, Operation.ADD, a + b)
-
-
-def sub(a: int, b: int) -> Problem:
-    \"\"\"Create a subtraction problem (a - b).\"\"\"
-    return Problem(a, b, Operation.SUBTRACT, a - b)
-
-
-def mul(a: int, b: int) -> Problem:
-    \"\"\"Create a multiplication problem.\"\"\"
-    return Problem(a, b, Operation.MULTIPLY, a * b)
-
-
-def div(a: int, b: int) -> Problem:
-    \"\"\"Create a division problem (a / b).\"\"\"
-    return Problem(a, b, Operation.DIVIDE, a // b)
-
-
-# =============================================================================
-# WORLD 1: ADDITION ALPS (Levels 1-10)
-# =============================================================================
-
-LEVEL_1 = Level(
-    number=1,
-    world_number=1,
-    level_in_world=1,
-    name="Trailhead",
-    level_type=LevelType.INTRO,
-    problems=(
-        add(1, 1),
-        add(2, 1),
-        add(3, 2),
-        add(2, 2),
-        add(1, 4),
-        add(4, 3),
-        add(5, 6),
-        add(3, 3),
-        add(4, 2),
-        add(5, 5),
-    ),
-)
-
-LEVEL_2 = Level(
+LEVEL_2 = Level(
     number=2,
     world_number=1,
     level_in_world=2,
@@ -2233,44 +2557,700 @@ LEVELS = [
 ]
 
 
+class LevelRegistry:
+    \"\"\"Levels indexed once for constant-time lookups.
+
+    Levels are kept in a tuple ordered by number, so a lookup by number is
+    an index. Levels by world, by type and by operation are precomputed
+    tuples. The invariants the rest of the game relies on are checked when
+    the registry is built.
+    \"\"\"
+
+    def __init__(
+        self, levels: Iterable[Level], levels_per_world: int = LEVELS_PER_WORLD
+    ) -> None:
+        \"\"\"Build the registry.
+
+        Args:
+            levels: The levels, in any order.
+            levels_per_world: How many levels every world must have.
+
+        Raises:
+            ValueError: If the levels are not numbered 1..N without gaps,
+                or a world does not have levels_per_world levels in order.
+        \"\"\"
+        ordered = tuple(sorted(levels, key=lambda level: level.number))
+        for index, level in enumerate(ordered):
+            if level.number != index + 1:
+                raise ValueError(
+                    f"Levels must be numbered 1..{len(ordered)} without gaps, "
+                    f"found level {level.number} at position {index + 1}"
+                )
+            world_number, in_world = divmod(index, levels_per_world)
+            if (level.world_number, level.level_in_world) != (
+                world_number + 1,
+                in_world + 1,
+            ):
+                raise ValueError(
+                    f"Level {level.number} should be level {in_world + 1} of "
+                    f"world {world_number + 1}, not level "
+                    f"{level.level_in_world} of world {level.world_number}"
+                )
+        if len(ordered) % levels_per_world:
+            raise ValueError(
+                f"World {len(ordered) // levels_per_world + 1} has "
+                f"{len(ordered) % levels_per_world} levels, "
+                f"expected {levels_per_world}"
+            )
+
+        self._levels = ordered
+        self._levels_per_world = levels_per_world
+        self._by_world = tuple(
+            ordered[start : start + levels_per_world]
+            for start in range(0, len(ordered), levels_per_world)
+        )
+        by_type: dict[LevelType, list[Level]] = {kind: [] for kind in LevelType}
+        by_operation: dict[Operation, list[Level]] = {op: [] for op in Operation}
+        for level in ordered:
+            by_type[level.level_type].append(level)
+            for operation in {problem.operation for problem in level.problems}:
+                by_operation[operation].append(level)
+        self._by_type = {kind: tuple(group) for kind, group in by_type.items()}
+        self._by_operation = {op: tuple(group) for op, group in by_operation.items()}
+
+    def __len__(self) -> int:
+        \"\"\"Return the number of levels.\"\"\"
+        return len(self._levels)
+
+    @property
+    def levels(self) -> tuple[Level, ...]:
+        \"\"\"All levels, ordered by number.\"\"\"
+        return self._levels
+
+    @property
+    def world_count(self) -> int:
+        \"\"\"The number of worlds the levels fill.\"\"\"
+        return len(self._by_world)
+
+    def get(self, level_num: int) -> Level | None:
+        \"\"\"Get level by number. Returns None if level doesn't exist.\"\"\"
+        if 1 <= level_num <= len(self._levels):
+            return self._levels[level_num - 1]
+        return None
+
+    def for_world(self, world_num: int) -> tuple[Level, ...]:
+        \"\"\"Get the levels of a world, in order. Empty if it doesn't exist.\"\"\"
+        if 1 <= world_num <= len(self._by_world):
+            return self._by_world[world_num - 1]
+        return ()
+
+    def of_type(self, level_type: LevelType) -> tuple[Level, ...]:
+        \"\"\"Get every level of a type, ordered by number.\"\"\"
+        return self._by_type[level_type]
+
+    def with_operation(self, operation: Operation) -> tuple[Level, ...]:
+        \"\"\"Get every level with at least one problem of an operation.\"\"\"
+        return self._by_operation[operation]
+
+
+class LevelSource(Protocol):
+    \"\"\"Levels the game can be played with: a LevelRegistry or CompiledPack.\"\"\"
+
+    @property
+    def world_count(self) -> int:
+        \"\"\"The number of worlds the levels fill.\"\"\"
+        ...
+
+    def __len__(self) -> int:
+        \"\"\"Return the number of levels.\"\"\"
+        ...
+
+    def get(self, level_num: int) -> Level | None:
+        \"\"\"Get level by number. Returns None if level doesn't exist.\"\"\"
+        ...
+
+    def for_world(self, world_num: int) -> tuple[Level, ...]:
+        \"\"\"Get the levels of a world, in order. Empty if it doesn't exist.\"\"\"
+        ...
+
+
+REGISTRY = LevelRegistry(LEVELS)
+
+# The levels being played; the built-in ones unless use_levels() was called
+_active: LevelSource = REGISTRY
+
+
+def use_levels(source: LevelSource | None) -> None:
+    \"\"\"Play a different set of levels, e.g. a level pack.
+
+    Every lookup below, and so the game flow and level select screens,
+    use the new levels. Progress is kept by level number, so one install
+    should stick to one set of levels.
+
+    Args:
+        source: The levels to play, or None for the built-in levels.
+    \"\"\"
+    global _active
+    _active = source if source is not None else REGISTRY
+
+
+def get_levels() -> LevelSource:
+    \"\"\"Get the levels being played.\"\"\"
+    return _active
+
+
 def get_level(level_num: int) -> Level | None:
     \"\"\"Get level by number. Returns None if level doesn't exist.\"\"\"
-    for level in LEVELS:
-        if level.number == level_num:
-            return level
-    return None
+    return _active.get(level_num)
 
 
 def get_next_level(current_level: int) -> Level | None:
     \"\"\"Get the next level after the current one. Returns None if no more levels.\"\"\"
-    return get_level(current_level + 1)
+    return _active.get(current_level + 1)
 
 
 def get_total_levels() -> int:
     \"\"\"Return total number of levels available.\"\"\"
-    return len(LEVELS)
+    return len(_active)
+
+
+def get_total_worlds() -> int:
+    \"\"\"Return total number of worlds available.\"\"\"
+    return _active.world_count
 
 
 def get_levels_for_world(world_num: int) -> list[Level]:
     \"\"\"Get all levels in a specific world.\"\"\"
-    return [level for level in LEVELS if level.world_number == world_num]
+    return list(_active.for_world(world_num))
 
 """
 
 exec(_code_flashy_core_levels, sys.modules["flashy.core.levels"].__dict__)
 
-# === flashy.core.flow ===
+# === flashy.core.worlds ===
 # Create module
-_mod = ModuleType("flashy.core.flow")
+_mod = ModuleType("flashy.core.worlds")
 _mod.__package__ = "flashy.core"
-sys.modules["flashy.core.flow"] = _mod
-setattr(sys.modules["flashy.core"], "flow", _mod)
+sys.modules["flashy.core.worlds"] = _mod
+setattr(sys.modules["flashy.core"], "worlds", _mod)
 
-_code_flashy_core_flow = """\
-\"\"\"Game flow state machine - defines screen transitions.
+_code_flashy_core_worlds = """\
+\"\"\"World definitions - story content and theming.\"\"\"
 
-This module owns all navigation logic. Screens emit events, and GameFlow
-determines what screen to show next. This ensures consistent game flow
+from dataclasses import dataclass, replace
+
+from flashy.core.levels import get_total_worlds
+from flashy.core.problems import Operation
+
+
+@dataclass(frozen=True)
+class World:
+    \"\"\"Configuration for a game world.\"\"\"
+
+    number: int
+    name: str
+    theme_emoji: str
+    operation: Operation
+    friend_name: str
+    friend_emoji: str
+    boss_name: str
+    boss_emoji: str
+    intro_text: str
+    friend_text: str
+    boss_intro: str
+    boss_defeat: str
+    background: str  # Path relative to assets/ folder
+    # Visual theming for world map
+    path_color: str  # SVG path stroke color
+    node_color: str  # Level node background color
+    node_glow: str  # Level node glow/shadow color
+    # Map layout - list of waypoints the path passes through (0-100 coordinate space)
+    # Format: "x1,y1 x2,y2 x3,y3 ..." - the curve will smoothly pass through each point
+    map_waypoints: str
+
+
+# World definitions
+WORLD_1 = World(
+    number=1,
+    name="Addition Alps",
+    theme_emoji="🏔️",
+    operation=Operation.ADD,
+    friend_name="Carry",
+    friend_emoji="🦉",
+    boss_name="Summit",
+    boss_emoji="🐐",
+    intro_text=(
+        "Flashy woke up alone in the cold mountains.\\n"
+        '"Where am I? I need to find my way home!"\\n'
+        "The only way forward is up through the Addition Alps..."
+    ),
+    friend_text=(
+        '"Hoo-hoo! I\\'m Carry the Owl!"\\n'
+        '"I\\'ve watched many travelers climb these peaks."\\n'
+        '"Remember: when numbers get big, just carry on!"\\n'
+        '"Let me help you on your journey home."'
+    ),
+    boss_intro=(
+        '"So, little pup, you think you can cross MY mountain?"\\n'
+        '"I am Summit, guardian of the Alps!"\\n'
+        '"Prove your addition skills... if you can keep up!"'
+    ),
+    boss_defeat=(
+        '"Impressive, little one! You\\'ve earned passage."\\n'
+        '"The path ahead leads to the Subtraction Swamp."\\n'
+        '"May your numbers stay strong!"'
+    ),
+    background="backgrounds/world-1-addition-alps.webp",
+    path_color="#4d350b",  # Warm cream trail
+    node_color="#2d5a3d",  # Forest green
+    node_glow="#4a8c5c",  # Lighter green glow
+    # Waypoints: start at bottom, zigzag up the mountain
+    map_waypoints="75,82 50,82 22,70 33,45 50,65 65,65 75,47 65,25 52,15",
+)
+
+WORLD_2 = World(
+    number=2,
+    name="Subtraction Swamp",
+    theme_emoji="🌿",
+    operation=Operation.SUBTRACT,
+    friend_name="Borrow",
+    friend_emoji="🐢",
+    boss_name="Minus",
+    boss_emoji="🐸",
+    intro_text=(
+        "The mountains gave way to murky wetlands.\\n"
+        '"It\\'s so foggy here... but I must keep going!"\\n'
+        "Flashy stepped carefully into the Subtraction Swamp..."
+    ),
+    friend_text=(
+        '"Slow down there, young pup!"\\n'
+        "\\"I'm Borrow the Turtle. I've lived here for centuries.\\"\\n"
+        '"When you need to take away more than you have,"\\n'
+        '"just borrow from your neighbor. Works every time!"'
+    ),
+    boss_intro=(
+        '"RIBBIT! Who dares enter my swamp?"\\n'
+        '"I am Minus, the Frog King!"\\n'
+        '"Let\\'s see if you can subtract as fast as I can jump!"'
+    ),
+    boss_defeat=(
+        '"RIBBIT... you\\'ve bested me, small one."\\n'
+        '"The meadows lie ahead. Enjoy the flowers!"\\n'
+        '"Hop along now!"'
+    ),
+    background="backgrounds/world-2-subtraction-swamp.webp",
+    path_color="#C4D95C",  # Mossy green
+    node_color="#6c5e0f",  # Swamp green
+    node_glow="#d3a769",  # Murky glow
+    map_waypoints="30,90 55,85 80,70 85,45 40,70 40,50 75,40 50,15",
+)
+
+WORLD_3 = World(
+    number=3,
+    name="Multiplication Meadows",
+    theme_emoji="🌸",
+    operation=Operation.MULTIPLY,
+    friend_name="Times",
+    friend_emoji="🐰",
+    boss_name="Countess Calculata",
+    boss_emoji="🦊",
+    intro_text=(
+        "Beautiful flowers swayed in the breeze.\\n"
+        '"What a lovely place... but I must keep moving!"\\n'
+        "The Multiplication Meadows bloomed with possibility..."
+    ),
+    friend_text=(
+        '"Oh my, oh my! A visitor!" *hops excitedly*\\n'
+        '"I\\'m Times the Rabbit! I multiply EVERYTHING!"\\n'
+        '"One carrot becomes two, two become four!"\\n'
+        '"Multiplication is just fast addition, you know!"'
+    ),
+    boss_intro=(
+        '"Well, well... the lost puppy arrives."\\n'
+        '"I am Countess Calculata, master of multiplication!"\\n'
+        '"Beat me, and the desert path shall open!"'
+    ),
+    boss_defeat=(
+        '"Magnificent! You\\'ve mastered multiplication!"\\n'
+        '"The desert lies ahead. Stay hydrated!"\\n'
+        '"Your home draws ever closer."'
+    ),
+    background="backgrounds/world-3-multiplication-meadows.webp",
+    path_color="#e8c4d4",  # Soft pink
+    node_color="#7a4a6a",  # Meadow purple
+    node_glow="#b888a8",  # Floral glow
+    map_waypoints="90,80 50,80 20,90 10,68 50,60 65,60 72,45 40,35 10,40",
+)
+
+WORLD_4 = World(
+    number=4,
+    name="Division Desert",
+    theme_emoji="🏜️",
+    operation=Operation.DIVIDE,
+    friend_name="Remainder",
+    friend_emoji="🐪",
+    boss_name="The Sphinx of Splits",
+    boss_emoji="🦁",
+    intro_text=(
+        "The heat hit Flashy like a wall.\\n"
+        '"So hot... but I can almost smell home!"\\n'
+        "The Division Desert stretched endlessly before..."
+    ),
+    friend_text=(
+        '"Ah, a traveler! I am Remainder the Camel."\\n'
+        '"I carry what\\'s left over from every division."\\n'
+        '"Remember: divide means to share equally!"\\n'
+        '"Split it up fair, and you\\'ll find your answer."'
+    ),
+    boss_intro=(
+        '"HALT, wanderer! None pass without solving my riddles."\\n'
+        '"I am the Sphinx of Splits!"\\n'
+        '"Divide correctly, or be lost to the sands forever!"'
+    ),
+    boss_defeat=(
+        '"You have wisdom beyond your years, young pup."\\n'
+        '"Look there, beyond the dunes..."\\n'
+        '"Is that... your HOME?"'
+    ),
+    background="backgrounds/world-4-division-desert.webp",
+    path_color="#d3c749",  # Sandy trail
+    node_color="#d17109",  # Desert gold
+    node_glow="#fcb519",  # Golden glow
+    map_waypoints="80,90 40,90 40,80 70,70 65,55 35,55 40,35 80,40 65,15",
+)
+
+WORLDS = [WORLD_1, WORLD_2, WORLD_3, WORLD_4]
+
+_WORLDS_BY_NUMBER = {world.number: world for world in WORLDS}
+
+
+def get_world(world_num: int) -> World | None:
+    \"\"\"Get world by number. Returns None if world doesn't exist.
+
+    Worlds exist as far as the levels being played go (see use_levels).
+    Level packs can have more worlds than the built-in ones; those reuse
+    the built-in worlds' story and theme in turn.
+    \"\"\"
+    if not 1 <= world_num <= get_total_worlds():
+        return None
+    world = _WORLDS_BY_NUMBER.get(world_num)
+    if world is None:
+        world = replace(WORLDS[(world_num - 1) % len(WORLDS)], number=world_num)
+    return world
+
+"""
+
+exec(_code_flashy_core_worlds, sys.modules["flashy.core.worlds"].__dict__)
+
+# === flashy.core.packs ===
+# Create module
+_mod = ModuleType("flashy.core.packs")
+_mod.__package__ = "flashy.core"
+sys.modules["flashy.core.packs"] = _mod
+setattr(sys.modules["flashy.core"], "packs", _mod)
+
+_code_flashy_core_packs = """\
+\"\"\"Level packs - levels defined as data instead of Python literals.
+
+A pack is a mapping, usually read from a JSON or TOML file:
+
+    {
+        "name": "Times tables",
+        "worlds": [
+            {"levels": [
+                {"name": "Twos", "type": "intro", "problems": ["2 × 3", "2 × 4"]},
+                ...
+            ]},
+            ...
+        ]
+    }
+
+Levels are numbered by their position, and every world needs
+LEVELS_PER_WORLD levels. Problems are written "a op b" with op one of
++ - × x * ÷ /. Only boss levels have a time_limit, and they need one.
+
+parse_pack() validates a pack once. compile_pack() turns it into a compact
+binary form that CompiledPack reads back one world at a time, so opening a
+pack with thousands of levels only decodes the worlds that are used.
+Reading and caching pack files is done by flashy.packs.
+\"\"\"
+
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from flashy.core.levels import Level, LevelRegistry, LevelType
+from flashy.core.models import LEVELS_PER_WORLD
+from flashy.core.problems import Operation, Problem, parse_problem
+
+FORMAT_VERSION = 1
+_MAGIC = b"FLPK"
+
+# magic, version, world count, levels per world, pack name length
+_HEADER = struct.Struct("<4sHHHH")
+# level type, time limit (0 for none), name length, problem count
+_LEVEL = struct.Struct("<BHHH")
+# operand1, operand2, answer, operation
+_PROBLEM = struct.Struct("<iiiB")
+
+_LEVEL_TYPES = list(LevelType)
+_OPERATIONS = list(Operation)
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+
+
+@dataclass(frozen=True)
+class LevelPack:
+    \"\"\"A validated level pack.\"\"\"
+
+    name: str
+    levels: tuple[Level, ...]
+
+
+def parse_pack(
+    data: Mapping[str, Any], levels_per_world: int = LEVELS_PER_WORLD
+) -> LevelPack:
+    \"\"\"Validate a pack and build its levels.
+
+    Args:
+        data: The decoded pack file.
+        levels_per_world: How many levels every world must have.
+
+    Returns:
+        The pack.
+
+    Raises:
+        ValueError: If the pack is not valid. The message says where.
+    \"\"\"
+    name = data.get("name")
+    worlds = data.get("worlds")
+    if not isinstance(name, str) or not name:
+        raise ValueError("Pack needs a name")
+    if not isinstance(worlds, list) or not worlds:
+        raise ValueError("Pack needs a list of worlds")
+
+    levels: list[Level] = []
+    for world_number, world in enumerate(worlds, start=1):
+        world_levels = world.get("levels") if isinstance(world, Mapping) else None
+        if not isinstance(world_levels, list):
+            raise ValueError(f"World {world_number} needs a list of levels")
+        if len(world_levels) != levels_per_world:
+            raise ValueError(
+                f"World {world_number} has {len(world_levels)} levels, "
+                f"expected {levels_per_world}"
+            )
+        for level_in_world, entry in enumerate(world_levels, start=1):
+            where = f"World {world_number} level {level_in_world}"
+            try:
+                levels.append(
+                    _parse_level(
+                        entry, len(levels) + 1, world_number, level_in_world
+                    )
+                )
+            except ValueError as e:
+                raise ValueError(f"{where}: {e}") from None
+
+    # Numbering comes from positions, but keep the registry's checks in one place
+    LevelRegistry(levels, levels_per_world)
+    return LevelPack(name=name, levels=tuple(levels))
+
+
+def _parse_level(
+    entry: Any, number: int, world_number: int, level_in_world: int
+) -> Level:
+    \"\"\"Build one level of a pack.\"\"\"
+    if not isinstance(entry, Mapping):
+        raise ValueError("Level must be a table")
+    name = entry.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError("Level needs a name")
+    try:
+        level_type = LevelType(entry.get("type"))
+    except ValueError:
+        choices = ", ".join(kind.value for kind in LevelType)
+        raise ValueError(f"Level type must be one of {choices}") from None
+    problems = entry.get("problems")
+    if not isinstance(problems, list) or not problems:
+        raise ValueError("Level needs a list of problems")
+    if not all(isinstance(text, str) for text in problems):
+        raise ValueError("Problems must be strings")
+
+    time_limit = entry.get("time_limit")
+    if level_type == LevelType.BOSS:
+        if not isinstance(time_limit, int) or not 0 < time_limit <= 0xFFFF:
+            raise ValueError("Boss level needs a time_limit in seconds")
+    elif time_limit is not None:
+        raise ValueError("Only boss levels have a time_limit")
+
+    return Level(
+        number=number,
+        world_number=world_number,
+        level_in_world=level_in_world,
+        name=name,
+        level_type=level_type,
+        problems=tuple(_parse_problem(text) for text in problems),
+        time_limit=time_limit,
+    )
+
+
+def _parse_problem(text: str) -> Problem:
+    \"\"\"Parse one problem of a pack, which has to fit the compiled form.\"\"\"
+    problem = parse_problem(text)
+    numbers = (problem.operand1, problem.operand2, problem.answer)
+    if not all(_INT32_MIN <= n <= _INT32_MAX for n in numbers):
+        raise ValueError(f"Numbers out of range: {text!r}")
+    return problem
+
+
+def compile_pack(pack: LevelPack, levels_per_world: int = LEVELS_PER_WORLD) -> bytes:
+    \"\"\"Encode a validated pack in the binary form CompiledPack reads.
+
+    The header and a table of world offsets come first, so one world can
+    be decoded without reading the others.
+    \"\"\"
+    name = pack.name.encode()
+    worlds: list[bytes] = []
+    for start in range(0, len(pack.levels), levels_per_world):
+        chunk = bytearray()
+        for level in pack.levels[start : start + levels_per_world]:
+            level_name = level.name.encode()
+            chunk += _LEVEL.pack(
+                _LEVEL_TYPES.index(level.level_type),
+                level.time_limit or 0,
+                len(level_name),
+                len(level.problems),
+            )
+            chunk += level_name
+            for problem in level.problems:
+                chunk += _PROBLEM.pack(
+                    problem.operand1,
+                    problem.operand2,
+                    problem.answer,
+                    _OPERATIONS.index(problem.operation),
+                )
+        worlds.append(bytes(chunk))
+
+    offsets = [0]
+    for chunk in worlds:
+        offsets.append(offsets[-1] + len(chunk))
+    header = _HEADER.pack(
+        _MAGIC, FORMAT_VERSION, len(worlds), levels_per_world, len(name)
+    )
+    table = struct.pack(f"<{len(offsets)}I", *offsets)
+    return b"".join([header, name, table, *worlds])
+
+
+class CompiledPack:
+    \"\"\"A compiled pack, decoded one world at a time on first use.
+
+    Has the same lookups as LevelRegistry. The data is trusted to come
+    from compile_pack(); only the header is checked.
+    \"\"\"
+
+    def __init__(self, data: bytes) -> None:
+        \"\"\"Read the pack header.
+
+        Args:
+            data: Bytes made by compile_pack().
+
+        Raises:
+            ValueError: If data is not a compiled pack of this version.
+        \"\"\"
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a compiled level pack")
+        magic, version, world_count, levels_per_world, name_length = (
+            _HEADER.unpack_from(data)
+        )
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a compiled level pack")
+        name_end = _HEADER.size + name_length
+        table = struct.Struct(f"<{world_count + 1}I")
+        self._data = data
+        self._name = data[_HEADER.size : name_end].decode()
+        self._offsets = table.unpack_from(data, name_end)
+        self._worlds_start = name_end + table.size
+        self._levels_per_world = levels_per_world
+        self._worlds: list[tuple[Level, ...] | None] = [None] * world_count
+
+    @property
+    def name(self) -> str:
+        \"\"\"The pack's name.\"\"\"
+        return self._name
+
+    @property
+    def world_count(self) -> int:
+        \"\"\"The number of worlds in the pack.\"\"\"
+        return len(self._worlds)
+
+    def __len__(self) -> int:
+        \"\"\"Return the number of levels.\"\"\"
+        return len(self._worlds) * self._levels_per_world
+
+    def get(self, level_num: int) -> Level | None:
+        \"\"\"Get level by number. Returns None if level doesn't exist.\"\"\"
+        if not 1 <= level_num <= len(self):
+            return None
+        world_index, in_world = divmod(level_num - 1, self._levels_per_world)
+        return self.for_world(world_index + 1)[in_world]
+
+    def for_world(self, world_num: int) -> tuple[Level, ...]:
+        \"\"\"Get the levels of a world, in order. Empty if it doesn't exist.\"\"\"
+        if not 1 <= world_num <= len(self._worlds):
+            return ()
+        levels = self._worlds[world_num - 1]
+        if levels is None:
+            levels = self._decode_world(world_num)
+            self._worlds[world_num - 1] = levels
+        return levels
+
+    def _decode_world(self, world_num: int) -> tuple[Level, ...]:
+        \"\"\"Decode one world's levels.\"\"\"
+        data = self._data
+        pos = self._worlds_start + self._offsets[world_num - 1]
+        first = (world_num - 1) * self._levels_per_world + 1
+        levels = []
+        for in_world in range(self._levels_per_world):
+            type_index, time_limit, name_length, problem_count = _LEVEL.unpack_from(
+                data, pos
+            )
+            pos += _LEVEL.size
+            name = data[pos : pos + name_length].decode()
+            pos += name_length
+            end = pos + problem_count * _PROBLEM.size
+            problems = tuple(
+                Problem(a, b, _OPERATIONS[op], answer)
+                for a, b, answer, op in _PROBLEM.iter_unpack(data[pos:end])
+            )
+            pos = end
+            levels.append(
+                Level(
+                    number=first + in_world,
+                    world_number=world_num,
+                    level_in_world=in_world + 1,
+                    name=name,
+                    level_type=_LEVEL_TYPES[type_index],
+                    problems=problems,
+                    time_limit=time_limit or None,
+                )
+            )
+        return tuple(levels)
+
+"""
+
+exec(_code_flashy_core_packs, sys.modules["flashy.core.packs"].__dict__)
+
+# === flashy.core.flow ===
+# Create module
+_mod = ModuleType("flashy.core.flow")
+_mod.__package__ = "flashy.core"
+sys.modules["flashy.core.flow"] = _mod
+setattr(sys.modules["flashy.core"], "flow", _mod)
+
+_code_flashy_core_flow = """\
+\"\"\"Game flow state machine - defines screen transitions.
+
+This module owns all navigation logic. Screens emit events, and GameFlow
+determines what screen to show next. This ensures consistent game flow
 across all platforms (TUI, web, iOS).
 \"\"\"
 
@@ -2613,17 +3593,21 @@ _code_flashy_game = """\
 
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from flashy.core.levels import Level, get_level
-from flashy.core.models import LevelResult, ProblemResult
+from flashy.core.levels import REVIEW_LEVEL_NUMBER, Level, get_level
+from flashy.core.models import LevelResult, PlayerProgress, ProblemResult
 from flashy.core.number_parser import is_fuzzy_match
 from flashy.core.problems import Problem
 from flashy.core.scoring import calculate_score, calculate_stars, get_streak_multiplier
 
 if TYPE_CHECKING:
-    from flashy.storage.protocol import StorageBackend
+    from flashy.core.review import ReviewScheduler
+    from flashy.storage.checkpoint import CheckpointAnswer, CheckpointJournal
+    from flashy.storage.protocol import AsyncStorageBackend, StorageBackend
 
 
 @dataclass
@@ -2654,11 +3638,17 @@ class GameController:
         player_name: str,
         level_number: int,
         storage: StorageBackend | None = None,
+        journal: CheckpointJournal | None = None,
+        scheduler: ReviewScheduler | None = None,
+        level: Level | None = None,
     ) -> None:
         self.player_name = player_name
-        self.level_number = level_number
+        self.level_number = level.number if level is not None else level_number
         self._storage = storage  # Lazy load if None
-        level = get_level(level_number)
+        self._journal = journal  # Records each answer for resume, if set
+        self._scheduler = scheduler  # Fact review queue to update, if set
+        # A given level (such as a review round) is played as it is
+        level = level or get_level(level_number)
         if level is None:
             raise ValueError(f"Level {level_number} not found")
         self.level: Level = level
@@ -2710,6 +3700,11 @@ class GameController:
         \"\"\"Time limit in seconds for this level, or None if untimed.\"\"\"
         return self.level.time_limit
 
+    @property
+    def is_review(self) -> bool:
+        \"\"\"Check if this is a review round rather than a level.\"\"\"
+        return self.level_number == REVIEW_LEVEL_NUMBER
+
     @property
     def is_timed(self) -> bool:
         \"\"\"Check if this level has a time limit (boss battle).\"\"\"
@@ -2781,6 +3776,11 @@ class GameController:
             )
         )
 
+        if self._journal is not None:
+            self._journal.append(self.problem_index, answer, time_taken)
+        if self._scheduler is not None:
+            self._scheduler.record_problem(problem, is_correct, time.time())
+
         # Advance to next problem
         self.problem_index += 1
 
@@ -2792,39 +3792,104 @@ class GameController:
             streak_multiplier=get_streak_multiplier(self.streak),
         )
 
+    def replay(self, answers: Iterable[CheckpointAnswer]) -> None:
+        \"\"\"Re-submit journaled answers to resume an interrupted attempt.
+
+        The answers are not journaled again, and the review scheduler
+        already counted them. Problems are fixed per level, so the score
+        and streaks come out the same as the first time.
+
+        Args:
+            answers: Answers read back from a checkpoint journal.
+        \"\"\"
+        journal, self._journal = self._journal, None
+        scheduler, self._scheduler = self._scheduler, None
+        try:
+            for answer in answers:
+                if answer.problem_index != self.problem_index or self.is_complete:
+                    break
+                self.submit_answer(answer.answer, answer.time_taken)
+        finally:
+            self._journal = journal
+            self._scheduler = scheduler
+
     def finish(self) -> tuple[int, bool]:
         \"\"\"Finish the level. Saves progress and history.
 
+        A review round only logs its session: it has no progress to save.
+
         Returns:
             Tuple of (stars earned, is_new_best)
         \"\"\"
-        stars = calculate_stars(
-            self.correct_count, self.total_problems, self.total_time
-        )
+        stars = self._calculate_stars()
 
         # Save progress via storage backend
-        progress = self.storage.load_progress(self.player_name)
+        is_new_best = False
+        if not self.is_review:
+            progress = self.storage.load_progress(self.player_name)
+            is_new_best = self._record_stars(progress, stars)
+            self.storage.save_progress(self.player_name, progress)
+
+        # Log session history via storage backend
+        self.storage.log_session(self._level_result())
+
+        if self._journal is not None:
+            self._journal.discard()
+        return stars, is_new_best
+
+    async def finish_async(self, storage: AsyncStorageBackend) -> tuple[int, bool]:
+        \"\"\"Finish the level through an async storage backend.
+
+        Same as finish(), for callers running on an event loop.
+
+        Args:
+            storage: The async storage backend to save to.
+
+        Returns:
+            Tuple of (stars earned, is_new_best)
+        \"\"\"
+        stars = self._calculate_stars()
+
+        is_new_best = False
+        if not self.is_review:
+            progress = await storage.load_progress(self.player_name)
+            is_new_best = self._record_stars(progress, stars)
+            await storage.save_progress(self.player_name, progress)
+        await storage.log_session(self._level_result())
+
+        if self._journal is not None:
+            self._journal.discard()
+        return stars, is_new_best
+
+    def _calculate_stars(self) -> int:
+        \"\"\"Calculate the stars earned for this attempt.\"\"\"
+        return calculate_stars(self.correct_count, self.total_problems, self.total_time)
+
+    def _record_stars(self, progress: PlayerProgress, stars: int) -> bool:
+        \"\"\"Record this attempt's stars and score in progress.
+
+        Returns:
+            True if the attempt earned more stars than before.
+        \"\"\"
         old_stars = progress.get_stars(self.level_number)
         progress.set_stars(self.level_number, stars)
         progress.set_best_score(self.level_number, self.total_score)
-        self.storage.save_progress(self.player_name, progress)
-
-        # Log session history via storage backend
-        self.storage.log_session(
-            LevelResult(
-                level_number=self.level_number,
-                level_name=self.level.name,
-                total_score=self.total_score,
-                correct_count=self.correct_count,
-                total_problems=self.total_problems,
-                best_streak=self.best_streak,
-                total_time_seconds=self.total_time,
-                problems=self.results,
-            )
+        return stars > old_stars
+
+    def _level_result(self) -> LevelResult:
+        \"\"\"Build the history entry for this attempt.\"\"\"
+        return LevelResult(
+            level_number=self.level_number,
+            level_name=self.level.name,
+            total_score=self.total_score,
+            correct_count=self.correct_count,
+            total_problems=self.total_problems,
+            best_streak=self.best_streak,
+            total_time_seconds=self.total_time,
+            problems=self.results,
+            player_name=self.player_name,
         )
 
-        return stars, stars > old_stars
-
     # --- Cheat methods for dev/testing ---
 
     def cheat_pass_all(self) -> None:
@@ -2860,10 +3925,10 @@ _code_flashy_platforms_web_storage = """\
 \"\"\"Web storage backend using browser localStorage via Pyodide.\"\"\"
 
 import json
-from dataclasses import asdict
+from collections.abc import Iterator
 from datetime import datetime
 
-from flashy.core.models import LevelResult, PlayerProgress
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
 
 # When running in Pyodide, js module gives access to browser APIs
 try:
@@ -2872,6 +3937,9 @@ except ImportError:
     # Fallback for testing outside browser
     localStorage = None
 
+# Session log entries per history chunk key
+HISTORY_CHUNK_SIZE = 50
+
 
 class WebStorage:
     \"\"\"Storage backend using browser localStorage.
@@ -2879,20 +3947,41 @@ class WebStorage:
     Data is stored as JSON strings with the following keys:
     - flashy_players: List of player names
     - flashy_player_{name}: Player progress JSON
-    - flashy_history: Array of session log entries
+    - flashy_history_head: {"chunks": n} - number of history chunks
+    - flashy_history_0000, flashy_history_0001, ...: Arrays of up to
+      HISTORY_CHUNK_SIZE session log entries, oldest first
+
+    Appending a session only rewrites the last chunk and the head, so the
+    cost does not grow with total history. A single-array flashy_history
+    key from older versions is split into chunks on first use.
     \"\"\"
 
+    def __init__(self, local_storage=None) -> None:
+        \"\"\"Initialize web storage.
+
+        Args:
+            local_storage: Object with getItem/setItem/removeItem to use
+                instead of the browser's localStorage (e.g. for tests).
+        \"\"\"
+        self._store = local_storage if local_storage is not None else localStorage
+
     def _get(self, key: str) -> str | None:
         \"\"\"Get a value from localStorage.\"\"\"
-        if localStorage is None:
+        if self._store is None:
             return None
-        return localStorage.getItem(key)
+        return self._store.getItem(key)
 
     def _set(self, key: str, value: str) -> None:
         \"\"\"Set a value in localStorage.\"\"\"
-        if localStorage is None:
+        if self._store is None:
+            return
+        self._store.setItem(key, value)
+
+    def _remove(self, key: str) -> None:
+        \"\"\"Remove a value from localStorage.\"\"\"
+        if self._store is None:
             return
-        localStorage.setItem(key, value)
+        self._store.removeItem(key)
 
     def load_progress(self, player_name: str) -> PlayerProgress:
         \"\"\"Load player progress from localStorage.\"\"\"
@@ -2905,7 +3994,7 @@ class WebStorage:
             stars = {int(k): v for k, v in data.get("stars", {}).items()}
             best_scores = {int(k): v for k, v in data.get("best_scores", {}).items()}
             return PlayerProgress(stars=stars, best_scores=best_scores)
-        except (json.JSONDecodeError, KeyError):
+        except (json.JSONDecodeError, KeyError, ValueError):
             return PlayerProgress()
 
     def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
@@ -2917,46 +4006,115 @@ class WebStorage:
             self._set("flashy_players", json.dumps(players))
 
         # Save progress
-        data = {"stars": progress.stars, "best_scores": progress.best_scores}
+        data = {
+            "stars": dict(progress.stars),
+            "best_scores": dict(progress.best_scores),
+        }
         self._set(f"flashy_player_{player_name}", json.dumps(data))
 
     def log_session(self, result: LevelResult) -> None:
-        \"\"\"Append a session result to history.\"\"\"
-        history_str = self._get("flashy_history") or "[]"
-        try:
-            history = json.loads(history_str)
-        except json.JSONDecodeError:
-            history = []
-
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "level_number": result.level_number,
-            "level_name": result.level_name,
-            "score": result.total_score,
-            "correct": result.correct_count,
-            "total": result.total_problems,
-            "best_streak": result.best_streak,
-            "time_seconds": result.total_time_seconds,
-            "problems": [asdict(p) for p in result.problems],
-        }
-
-        history.append(entry)
-        self._set("flashy_history", json.dumps(history))
+        \"\"\"Append a session result to history, rewriting only the last chunk.\"\"\"
+        chunk_count = self._history_chunk_count()
+        chunk = self._load_history_chunk(chunk_count - 1) if chunk_count else []
+        if not chunk_count or len(chunk) >= HISTORY_CHUNK_SIZE:
+            chunk = []
+            chunk_count += 1
+
+        chunk.append(result.to_log_entry())
+        self._set(_history_chunk_key(chunk_count - 1), json.dumps(chunk))
+        self._set("flashy_history_head", json.dumps({"chunks": chunk_count}))
+
+    def iter_history(self) -> Iterator[dict]:
+        \"\"\"Yield session log entries oldest first, one chunk at a time.\"\"\"
+        for index in range(self._history_chunk_count()):
+            yield from self._load_history_chunk(index)
 
     def load_history(self) -> list[dict]:
         \"\"\"Load session history from localStorage.\"\"\"
-        history_str = self._get("flashy_history") or "[]"
+        return list(self.iter_history())
+
+    def _history_chunk_count(self) -> int:
+        \"\"\"Read the history head, migrating single-key history first.\"\"\"
+        head_str = self._get("flashy_history_head")
+        if head_str:
+            try:
+                return int(json.loads(head_str)["chunks"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                return self._rebuild_history_head()
+        return self._migrate_legacy_history()
+
+    def _rebuild_history_head(self) -> int:
+        \"\"\"Recount the history chunks after a corrupt head.
+
+        Chunks are written in order, so the count is the first missing
+        chunk key. Rewriting the head stops the next log_session from
+        overwriting chunk 0.
+        \"\"\"
+        count = 0
+        while self._get(_history_chunk_key(count)) is not None:
+            count += 1
+        self._set("flashy_history_head", json.dumps({"chunks": count}))
+        return count
+
+    def _load_history_chunk(self, index: int) -> list[dict]:
+        \"\"\"Load one history chunk (empty if missing or unreadable).\"\"\"
+        chunk_str = self._get(_history_chunk_key(index)) or "[]"
         try:
-            return json.loads(history_str)
+            return json.loads(chunk_str)
         except json.JSONDecodeError:
             return []
 
+    def _migrate_legacy_history(self) -> int:
+        \"\"\"Split a legacy flashy_history array into chunk keys.
+
+        Returns:
+            The number of chunks written.
+        \"\"\"
+        legacy_str = self._get("flashy_history")
+        try:
+            history = json.loads(legacy_str) if legacy_str else []
+        except json.JSONDecodeError:
+            history = []
+
+        chunk_count = 0
+        for start in range(0, len(history), HISTORY_CHUNK_SIZE):
+            chunk = history[start : start + HISTORY_CHUNK_SIZE]
+            self._set(_history_chunk_key(chunk_count), json.dumps(chunk))
+            chunk_count += 1
+        if legacy_str is not None:
+            self._set("flashy_history_head", json.dumps({"chunks": chunk_count}))
+            self._remove("flashy_history")
+        return chunk_count
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]:
+        \"\"\"Stream logged sessions in chronological order, chunk by chunk.\"\"\"
+        since_iso = since.isoformat() if since else None
+        until_iso = until.isoformat() if until else None
+        for entry in self.iter_history():
+            if player is not None and entry.get("player") != player:
+                continue
+            if level is not None and entry.get("level_number") != level:
+                continue
+            timestamp = entry.get("timestamp", "")
+            if since_iso is not None and timestamp < since_iso:
+                continue
+            if until_iso is not None and timestamp >= until_iso:
+                continue
+            yield LevelResult.from_log_entry(entry)
+
     def log_speech_recognition(
         self,
         raw_transcript: str,
         parsed_number: int | None,
         expected: int | None,
         matched: bool,
+        partial: bool = False,
     ) -> None:
         \"\"\"Log speech recognition (stored in memory only for web).\"\"\"
         # For web, we might just console.log this or skip
@@ -2972,10 +4130,22 @@ class WebStorage:
         except json.JSONDecodeError:
             return []
 
+    def list_player_summaries(self) -> list[PlayerSummary]:
+        \"\"\"List every player with their progress totals.\"\"\"
+        return [
+            PlayerSummary.from_progress(name, self.load_progress(name))
+            for name in sorted(self.list_players())
+        ]
+
     def player_exists(self, player_name: str) -> bool:
         \"\"\"Check if a player exists.\"\"\"
         return player_name in self.list_players()
 
+
+def _history_chunk_key(index: int) -> str:
+    \"\"\"Get the localStorage key of a history chunk.\"\"\"
+    return f"flashy_history_{index:04d}"
+
 """
 
 exec(_code_flashy_platforms_web_storage, sys.modules["flashy.platforms.web.storage"].__dict__)
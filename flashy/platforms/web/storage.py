@@ -1,10 +1,10 @@
 """Web storage backend using browser localStorage via Pyodide."""
 
 import json
-from dataclasses import asdict
+from collections.abc import Iterator
 from datetime import datetime
 
-from flashy.core.models import LevelResult, PlayerProgress
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
 
 # When running in Pyodide, js module gives access to browser APIs
 try:
@@ -13,6 +13,9 @@ except ImportError:
     # Fallback for testing outside browser
     localStorage = None
 
+# Session log entries per history chunk key
+HISTORY_CHUNK_SIZE = 50
+
 
 class WebStorage:
     """Storage backend using browser localStorage.
@@ -20,20 +23,41 @@ class WebStorage:
     Data is stored as JSON strings with the following keys:
     - flashy_players: List of player names
     - flashy_player_{name}: Player progress JSON
-    - flashy_history: Array of session log entries
+    - flashy_history_head: {"chunks": n} - number of history chunks
+    - flashy_history_0000, flashy_history_0001, ...: Arrays of up to
+      HISTORY_CHUNK_SIZE session log entries, oldest first
+
+    Appending a session only rewrites the last chunk and the head, so the
+    cost does not grow with total history. A single-array flashy_history
+    key from older versions is split into chunks on first use.
     """
 
+    def __init__(self, local_storage=None) -> None:
+        """Initialize web storage.
+
+        Args:
+            local_storage: Object with getItem/setItem/removeItem to use
+                instead of the browser's localStorage (e.g. for tests).
+        """
+        self._store = local_storage if local_storage is not None else localStorage
+
     def _get(self, key: str) -> str | None:
         """Get a value from localStorage."""
-        if localStorage is None:
+        if self._store is None:
             return None
-        return localStorage.getItem(key)
+        return self._store.getItem(key)
 
     def _set(self, key: str, value: str) -> None:
         """Set a value in localStorage."""
-        if localStorage is None:
+        if self._store is None:
+            return
+        self._store.setItem(key, value)
+
+    def _remove(self, key: str) -> None:
+        """Remove a value from localStorage."""
+        if self._store is None:
             return
-        localStorage.setItem(key, value)
+        self._store.removeItem(key)
 
     def load_progress(self, player_name: str) -> PlayerProgress:
         """Load player progress from localStorage."""
@@ -46,7 +70,7 @@ class WebStorage:
             stars = {int(k): v for k, v in data.get("stars", {}).items()}
             best_scores = {int(k): v for k, v in data.get("best_scores", {}).items()}
             return PlayerProgress(stars=stars, best_scores=best_scores)
-        except (json.JSONDecodeError, KeyError):
+        except (json.JSONDecodeError, KeyError, ValueError):
             return PlayerProgress()
 
     def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
@@ -58,46 +82,115 @@ class WebStorage:
             self._set("flashy_players", json.dumps(players))
 
         # Save progress
-        data = {"stars": progress.stars, "best_scores": progress.best_scores}
+        data = {
+            "stars": dict(progress.stars),
+            "best_scores": dict(progress.best_scores),
+        }
         self._set(f"flashy_player_{player_name}", json.dumps(data))
 
     def log_session(self, result: LevelResult) -> None:
-        """Append a session result to history."""
-        history_str = self._get("flashy_history") or "[]"
-        try:
-            history = json.loads(history_str)
-        except json.JSONDecodeError:
-            history = []
-
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "level_number": result.level_number,
-            "level_name": result.level_name,
-            "score": result.total_score,
-            "correct": result.correct_count,
-            "total": result.total_problems,
-            "best_streak": result.best_streak,
-            "time_seconds": result.total_time_seconds,
-            "problems": [asdict(p) for p in result.problems],
-        }
-
-        history.append(entry)
-        self._set("flashy_history", json.dumps(history))
+        """Append a session result to history, rewriting only the last chunk."""
+        chunk_count = self._history_chunk_count()
+        chunk = self._load_history_chunk(chunk_count - 1) if chunk_count else []
+        if not chunk_count or len(chunk) >= HISTORY_CHUNK_SIZE:
+            chunk = []
+            chunk_count += 1
+
+        chunk.append(result.to_log_entry())
+        self._set(_history_chunk_key(chunk_count - 1), json.dumps(chunk))
+        self._set("flashy_history_head", json.dumps({"chunks": chunk_count}))
+
+    def iter_history(self) -> Iterator[dict]:
+        """Yield session log entries oldest first, one chunk at a time."""
+        for index in range(self._history_chunk_count()):
+            yield from self._load_history_chunk(index)
 
     def load_history(self) -> list[dict]:
         """Load session history from localStorage."""
-        history_str = self._get("flashy_history") or "[]"
+        return list(self.iter_history())
+
+    def _history_chunk_count(self) -> int:
+        """Read the history head, migrating single-key history first."""
+        head_str = self._get("flashy_history_head")
+        if head_str:
+            try:
+                return int(json.loads(head_str)["chunks"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                return self._rebuild_history_head()
+        return self._migrate_legacy_history()
+
+    def _rebuild_history_head(self) -> int:
+        """Recount the history chunks after a corrupt head.
+
+        Chunks are written in order, so the count is the first missing
+        chunk key. Rewriting the head stops the next log_session from
+        overwriting chunk 0.
+        """
+        count = 0
+        while self._get(_history_chunk_key(count)) is not None:
+            count += 1
+        self._set("flashy_history_head", json.dumps({"chunks": count}))
+        return count
+
+    def _load_history_chunk(self, index: int) -> list[dict]:
+        """Load one history chunk (empty if missing or unreadable)."""
+        chunk_str = self._get(_history_chunk_key(index)) or "[]"
         try:
-            return json.loads(history_str)
+            return json.loads(chunk_str)
         except json.JSONDecodeError:
             return []
 
+    def _migrate_legacy_history(self) -> int:
+        """Split a legacy flashy_history array into chunk keys.
+
+        Returns:
+            The number of chunks written.
+        """
+        legacy_str = self._get("flashy_history")
+        try:
+            history = json.loads(legacy_str) if legacy_str else []
+        except json.JSONDecodeError:
+            history = []
+
+        chunk_count = 0
+        for start in range(0, len(history), HISTORY_CHUNK_SIZE):
+            chunk = history[start : start + HISTORY_CHUNK_SIZE]
+            self._set(_history_chunk_key(chunk_count), json.dumps(chunk))
+            chunk_count += 1
+        if legacy_str is not None:
+            self._set("flashy_history_head", json.dumps({"chunks": chunk_count}))
+            self._remove("flashy_history")
+        return chunk_count
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]:
+        """Stream logged sessions in chronological order, chunk by chunk."""
+        since_iso = since.isoformat() if since else None
+        until_iso = until.isoformat() if until else None
+        for entry in self.iter_history():
+            if player is not None and entry.get("player") != player:
+                continue
+            if level is not None and entry.get("level_number") != level:
+                continue
+            timestamp = entry.get("timestamp", "")
+            if since_iso is not None and timestamp < since_iso:
+                continue
+            if until_iso is not None and timestamp >= until_iso:
+                continue
+            yield LevelResult.from_log_entry(entry)
+
     def log_speech_recognition(
         self,
         raw_transcript: str,
         parsed_number: int | None,
         expected: int | None,
         matched: bool,
+        partial: bool = False,
     ) -> None:
         """Log speech recognition (stored in memory only for web)."""
         # For web, we might just console.log this or skip
@@ -113,6 +206,18 @@ class WebStorage:
         except json.JSONDecodeError:
             return []
 
+    def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals."""
+        return [
+            PlayerSummary.from_progress(name, self.load_progress(name))
+            for name in sorted(self.list_players())
+        ]
+
     def player_exists(self, player_name: str) -> bool:
         """Check if a player exists."""
         return player_name in self.list_players()
+
+
+def _history_chunk_key(index: int) -> str:
+    """Get the localStorage key of a history chunk."""
+    return f"flashy_history_{index:04d}"
@@ -1,14 +1,25 @@
 """Storage abstraction for player data and session history.
 
-This package provides a protocol for storage backends and a default
-file-based implementation.
+This package provides a protocol for storage backends, a default
+file-based implementation, an SQLite implementation, a remote backend
+for a Flashy sync server, a caching wrapper for any backend and an async
+adapter for event-loop driven UIs.
 """
 
+from flashy.storage.cached import CachedStorage
 from flashy.storage.file_storage import FileStorage, get_default_storage
-from flashy.storage.protocol import StorageBackend
+from flashy.storage.http_storage import HttpStorage
+from flashy.storage.protocol import AsyncStorageBackend, StorageBackend
+from flashy.storage.sqlite_storage import SqliteStorage
+from flashy.storage.threaded import ThreadedAsyncStorage
 
 __all__ = [
+    "AsyncStorageBackend",
+    "CachedStorage",
     "FileStorage",
+    "HttpStorage",
+    "SqliteStorage",
     "StorageBackend",
+    "ThreadedAsyncStorage",
     "get_default_storage",
 ]
@@ -0,0 +1,522 @@
+"""Compact binary session history with mmap random access.
+
+A binary history is a directory of three append-only files:
+
+- ``sessions.bin``: one fixed-size header per session, pointing at a
+  contiguous range of problem records.
+- ``problems.bin``: one fixed-size record per problem, storing the
+  operation code and operands instead of the display string.
+- ``strings.txt``: newline-separated player and level names (and any
+  problem text that is not a plain "a op b" problem), referenced by index.
+
+Both ``.bin`` files start with a small header naming the format version
+and record size. Readers mmap them and decode only the records they
+touch, so scanning session headers never parses problem data.
+
+Times are stored in whole milliseconds and timestamps in microseconds, so
+a round trip rounds time values to the millisecond.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from flashy.core.models import LevelResult, ProblemResult
+from flashy.core.problems import Operation, Problem, parse_problem
+
+FORMAT_VERSION = 1
+SESSIONS_NAME = "sessions.bin"
+PROBLEMS_NAME = "problems.bin"
+STRINGS_NAME = "strings.txt"
+
+_FILE_HEADER = struct.Struct("<4sHH")  # magic, version, record size
+_SESSIONS_MAGIC = b"FLSS"
+_PROBLEMS_MAGIC = b"FLSP"
+
+# timestamp (us since epoch), player, level name, level number, correct,
+# total, best streak, problem count, score, time (ms), first problem
+_SESSION = struct.Struct("<qIIHHHHHIII")
+# operation code, flags, operand1, operand2, given answer, time (ms), points
+_PROBLEM = struct.Struct("<BBiiiII")
+
+_FLAG_CORRECT = 1
+_FLAG_NO_ANSWER = 2
+
+# Code 0 marks problem text that did not parse; operand1 is then its
+# string index and operand2 the correct answer
+_RAW_PROBLEM = 0
+_OPERATION_CODES = {
+    Operation.ADD: 1,
+    Operation.SUBTRACT: 2,
+    Operation.MULTIPLY: 3,
+    Operation.DIVIDE: 4,
+}
+_OPERATIONS = {code: op for op, code in _OPERATION_CODES.items()}
+
+_EPOCH = datetime(1970, 1, 1)
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+
+
+def _answer(operation: Operation, operand1: int, operand2: int) -> int:
+    """Compute the correct answer of a problem."""
+    if operation == Operation.ADD:
+        return operand1 + operand2
+    if operation == Operation.SUBTRACT:
+        return operand1 - operand2
+    if operation == Operation.MULTIPLY:
+        return operand1 * operand2
+    return operand1 // operand2 if operand2 else 0
+
+
+def _millis(seconds: float) -> int:
+    """Convert seconds to whole milliseconds for an unsigned field."""
+    return max(0, min(round(seconds * 1000), 2**32 - 1))
+
+
+@dataclass(frozen=True)
+class SessionRecord:
+    """A decoded session header, without its problems."""
+
+    index: int
+    timestamp: datetime
+    player_name: str
+    level_number: int
+    level_name: str
+    total_score: int
+    correct_count: int
+    total_problems: int
+    best_streak: int
+    total_time_seconds: float
+    first_problem: int
+    problem_count: int
+
+
+class BinaryHistoryWriter:
+    """Appends level results to a binary history directory.
+
+    Only one writer may append to a directory at a time.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Open (creating if needed) a binary history directory.
+
+        Args:
+            directory: Directory holding the history files.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        strings_path = directory / STRINGS_NAME
+        strings = _read_strings(strings_path)
+        self._strings: dict[str, int] = {}
+        for index, value in enumerate(strings):
+            self._strings.setdefault(value, index)
+        self._string_count = len(strings)
+
+        self._sessions = _open_records(
+            directory / SESSIONS_NAME, _SESSIONS_MAGIC, _SESSION
+        )
+        self._problems = _open_records(
+            directory / PROBLEMS_NAME, _PROBLEMS_MAGIC, _PROBLEM
+        )
+        self._problem_count = (
+            self._problems.tell() - _FILE_HEADER.size
+        ) // _PROBLEM.size
+        self._strings_file = open(strings_path, "ab")
+        # Drop a partial line left by an interrupted append
+        self._strings_file.truncate(sum(len(value.encode()) + 1 for value in strings))
+
+    def __enter__(self) -> "BinaryHistoryWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def append(self, result: LevelResult) -> None:
+        """Append one level result.
+
+        Problem records are written before the session header, so an
+        interrupted append leaves unreferenced problems, never a session
+        pointing at missing ones.
+        """
+        first_problem = self._problem_count
+        self._problems.write(
+            b"".join(self._pack_problem(problem) for problem in result.problems)
+        )
+        self._problems.flush()
+        self._problem_count += len(result.problems)
+
+        timestamp = result.timestamp or datetime.now()
+        self._sessions.write(
+            _SESSION.pack(
+                _to_micros(timestamp),
+                self._string_id(result.player_name),
+                self._string_id(result.level_name),
+                result.level_number,
+                result.correct_count,
+                result.total_problems,
+                result.best_streak,
+                len(result.problems),
+                max(0, result.total_score),
+                _millis(result.total_time_seconds),
+                first_problem,
+            )
+        )
+        self._sessions.flush()
+
+    def close(self) -> None:
+        """Close the history files."""
+        self._sessions.close()
+        self._problems.close()
+        self._strings_file.close()
+
+    def _string_id(self, value: str) -> int:
+        """Get the index of a string, adding it to the table if needed."""
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = self._string_count
+            self._string_count += 1
+            self._strings_file.write((value.replace("\n", " ") + "\n").encode())
+            self._strings_file.flush()
+        return index
+
+    def _pack_problem(self, problem: ProblemResult) -> bytes:
+        """Pack one problem result into a fixed-size record."""
+        flags = _FLAG_CORRECT if problem.is_correct else 0
+        given = problem.given_answer
+        if given is None:
+            flags |= _FLAG_NO_ANSWER
+            given = 0
+        # Answers beyond 32 bits are always wrong; clamp rather than fail
+        given = max(_INT32_MIN, min(given, _INT32_MAX))
+
+        code, operand1, operand2 = self._encode_problem(problem)
+        return _PROBLEM.pack(
+            code,
+            flags,
+            operand1,
+            operand2,
+            given,
+            _millis(problem.time_seconds),
+            max(0, problem.points),
+        )
+
+    def _encode_problem(self, problem: ProblemResult) -> tuple[int, int, int]:
+        """Encode problem text as (operation code, operand1, operand2)."""
+        text = problem.problem
+        try:
+            parsed = parse_problem(text)
+        except ValueError:
+            parsed = None
+        # Only text that decodes back unchanged is packed, so "3 x 4" or an
+        # answer that disagrees with the operands round-trips as written
+        if (
+            parsed is not None
+            and parsed.display() == text
+            and parsed.answer == problem.correct_answer
+            and all(
+                _INT32_MIN <= n <= _INT32_MAX
+                for n in (parsed.operand1, parsed.operand2)
+            )
+        ):
+            code = _OPERATION_CODES[parsed.operation]
+            return code, parsed.operand1, parsed.operand2
+        answer = max(_INT32_MIN, min(problem.correct_answer, _INT32_MAX))
+        return _RAW_PROBLEM, self._string_id(problem.problem), answer
+
+
+class BinaryHistoryReader:
+    """Memory-mapped reader for a binary history directory.
+
+    The reader sees the sessions that existed when it was opened; call
+    refresh() to pick up later appends.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Open a binary history directory for reading.
+
+        Raises:
+            ValueError: If a history file has an unknown format.
+        """
+        self._dir = directory
+        self._sessions: mmap.mmap | None = None
+        self._problems: mmap.mmap | None = None
+        self._strings: list[str] = []
+        self.refresh()
+
+    def __enter__(self) -> "BinaryHistoryReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def refresh(self) -> None:
+        """Re-map the files to include sessions appended since opening."""
+        self.close()
+        self._sessions = _map_records(
+            self._dir / SESSIONS_NAME, _SESSIONS_MAGIC, _SESSION
+        )
+        self._problems = _map_records(
+            self._dir / PROBLEMS_NAME, _PROBLEMS_MAGIC, _PROBLEM
+        )
+        self._strings = _read_strings(self._dir / STRINGS_NAME)
+
+    def close(self) -> None:
+        """Unmap the history files."""
+        for mapped in (self._sessions, self._problems):
+            if mapped is not None:
+                mapped.close()
+        self._sessions = self._problems = None
+
+    def __len__(self) -> int:
+        """Number of complete sessions."""
+        return _record_count(self._sessions, _SESSION)
+
+    def session(self, index: int) -> SessionRecord:
+        """Decode one session header.
+
+        Raises:
+            IndexError: If there is no session with that index.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        assert self._sessions is not None
+        offset = _FILE_HEADER.size + index * _SESSION.size
+        return self._decode_session(index, _SESSION.unpack_from(self._sessions, offset))
+
+    def sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[SessionRecord]:
+        """Scan session headers, skipping problem data entirely.
+
+        Args:
+            player: Only sessions for this player.
+            level: Only sessions for this level number.
+            since: Only sessions logged at or after this time.
+            until: Only sessions logged before this time.
+
+        Yields:
+            Matching session headers, in the order they were appended.
+        """
+        if self._sessions is None:
+            return
+        player_id = None
+        if player is not None:
+            if player not in self._strings:
+                return
+            player_id = self._strings.index(player)
+        since_us = _to_micros(since) if since else None
+        until_us = _to_micros(until) if until else None
+
+        end = _FILE_HEADER.size + len(self) * _SESSION.size
+        view = memoryview(self._sessions)[_FILE_HEADER.size : end]
+        try:
+            for index, fields in enumerate(_SESSION.iter_unpack(view)):
+                if player_id is not None and fields[1] != player_id:
+                    continue
+                if level is not None and fields[3] != level:
+                    continue
+                if since_us is not None and fields[0] < since_us:
+                    continue
+                if until_us is not None and fields[0] >= until_us:
+                    continue
+                yield self._decode_session(index, fields)
+        finally:
+            view.release()
+
+    def problems(self, session: SessionRecord) -> list[ProblemResult]:
+        """Decode the problem results of one session."""
+        if self._problems is None:
+            return []
+        available = _record_count(self._problems, _PROBLEM)
+        stop = min(session.first_problem + session.problem_count, available)
+        start = _FILE_HEADER.size + session.first_problem * _PROBLEM.size
+        end = _FILE_HEADER.size + stop * _PROBLEM.size
+        if end <= start:
+            return []
+        view = memoryview(self._problems)[start:end]
+        try:
+            return [self._decode_problem(f) for f in _PROBLEM.iter_unpack(view)]
+        finally:
+            view.release()
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]:
+        """Yield matching sessions as full level results.
+
+        Takes the same filters as sessions().
+        """
+        for session in self.sessions(player, level, since, until):
+            yield LevelResult(
+                level_number=session.level_number,
+                level_name=session.level_name,
+                total_score=session.total_score,
+                correct_count=session.correct_count,
+                total_problems=session.total_problems,
+                best_streak=session.best_streak,
+                total_time_seconds=session.total_time_seconds,
+                problems=self.problems(session),
+                player_name=session.player_name,
+                timestamp=session.timestamp,
+            )
+
+    def _string(self, index: int) -> str:
+        """Look up a string table entry."""
+        return self._strings[index] if index < len(self._strings) else ""
+
+    def _decode_session(self, index: int, fields: tuple) -> SessionRecord:
+        """Build a SessionRecord from unpacked header fields."""
+        (
+            timestamp_us,
+            player_id,
+            level_name_id,
+            level_number,
+            correct,
+            total,
+            best_streak,
+            problem_count,
+            score,
+            time_ms,
+            first_problem,
+        ) = fields
+        return SessionRecord(
+            index=index,
+            timestamp=_EPOCH + timedelta(microseconds=timestamp_us),
+            player_name=self._string(player_id),
+            level_number=level_number,
+            level_name=self._string(level_name_id),
+            total_score=score,
+            correct_count=correct,
+            total_problems=total,
+            best_streak=best_streak,
+            total_time_seconds=time_ms / 1000,
+            first_problem=first_problem,
+            problem_count=problem_count,
+        )
+
+    def _decode_problem(self, fields: tuple) -> ProblemResult:
+        """Build a ProblemResult from unpacked problem fields."""
+        code, flags, operand1, operand2, given, time_ms, points = fields
+        operation = _OPERATIONS.get(code)
+        if operation is None:
+            text, answer = self._string(operand1), operand2
+        else:
+            answer = _answer(operation, operand1, operand2)
+            text = Problem(operand1, operand2, operation, answer).display()
+        return ProblemResult(
+            problem=text,
+            correct_answer=answer,
+            given_answer=None if flags & _FLAG_NO_ANSWER else given,
+            is_correct=bool(flags & _FLAG_CORRECT),
+            time_seconds=time_ms / 1000,
+            points=points,
+        )
+
+
+def write_binary_history(directory: Path, results: Iterable[LevelResult]) -> int:
+    """Append level results to a binary history directory.
+
+    Useful for converting a JSON history, e.g.
+    ``write_binary_history(path, storage.iter_sessions())``.
+
+    Returns:
+        The number of sessions written.
+    """
+    count = 0
+    with BinaryHistoryWriter(directory) as writer:
+        for result in results:
+            writer.append(result)
+            count += 1
+    return count
+
+
+def _to_micros(timestamp: datetime) -> int:
+    """Convert a naive timestamp to microseconds since the epoch."""
+    return (timestamp.replace(tzinfo=None) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _read_strings(path: Path) -> list[str]:
+    """Read the string table, ignoring a trailing partial line."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    complete = data[: data.rfind(b"\n") + 1]
+    return complete.decode("utf-8").split("\n")[:-1]
+
+
+def _open_records(path: Path, magic: bytes, record: struct.Struct):
+    """Open a record file for appending, writing its header if new.
+
+    A partial record left by an interrupted append is truncated away.
+
+    Raises:
+        ValueError: If the file has an unknown format.
+    """
+    f = open(path, "a+b")
+    f.seek(0, 2)
+    if f.tell() == 0:
+        f.write(_FILE_HEADER.pack(magic, FORMAT_VERSION, record.size))
+        f.flush()
+        return f
+
+    f.seek(0)
+    try:
+        _check_header(f.read(_FILE_HEADER.size), path, magic, record)
+    except ValueError:
+        f.close()
+        raise
+    size = f.seek(0, 2)
+    whole = _FILE_HEADER.size + (size - _FILE_HEADER.size) // record.size * record.size
+    if whole != size:
+        f.truncate(whole)
+    f.seek(whole)
+    return f
+
+
+def _map_records(path: Path, magic: bytes, record: struct.Struct) -> mmap.mmap | None:
+    """Map a record file read-only, or None if it does not exist yet.
+
+    Raises:
+        ValueError: If the file has an unknown format.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        if f.seek(0, 2) < _FILE_HEADER.size:
+            return None
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        _check_header(mapped[: _FILE_HEADER.size], path, magic, record)
+    except ValueError:
+        mapped.close()
+        raise
+    return mapped
+
+
+def _check_header(data: bytes, path: Path, magic: bytes, record: struct.Struct) -> None:
+    """Validate a record file header."""
+    if len(data) < _FILE_HEADER.size:
+        raise ValueError(f"{path} is truncated")
+    file_magic, version, size = _FILE_HEADER.unpack(data)
+    if file_magic != magic or version != FORMAT_VERSION or size != record.size:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} history file")
+
+
+def _record_count(mapped: mmap.mmap | None, record: struct.Struct) -> int:
+    """Count the complete records in a mapped file."""
+    if mapped is None:
+        return 0
+    return (len(mapped) - _FILE_HEADER.size) // record.size
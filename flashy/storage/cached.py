@@ -0,0 +1,154 @@
+"""In-memory progress cache for any storage backend.
+
+Screens load the same player's progress several times per navigation.
+CachedStorage keeps parsed PlayerProgress objects in a small LRU so those
+repeat loads skip the disk and JSON parsing. Saves are written through to
+the wrapped backend.
+
+If the backend has a ``progress_version(player_name)`` method, its value
+is stored with each cached entry and checked on every hit, so a write by
+another process (or another storage instance) is picked up on the next
+load. Backends without it rely on write-through alone.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from datetime import datetime
+from typing import Any
+
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
+from flashy.storage.protocol import StorageBackend
+
+
+class CachedStorage:
+    """Storage backend wrapper with an LRU cache of player progress.
+
+    Every other operation is passed straight to the wrapped backend.
+    """
+
+    def __init__(self, backend: StorageBackend, max_entries: int = 32) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: The storage backend to wrap.
+            max_entries: Maximum number of players kept in the cache.
+        """
+        self._backend = backend
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Hashable, PlayerProgress]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        # Held across a backend save and the version read that follows it
+        self._save_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> StorageBackend:
+        """The wrapped storage backend."""
+        return self._backend
+
+    def _version(self, player_name: str) -> Hashable:
+        """Get the backend's current version of a player's progress."""
+        version = getattr(self._backend, "progress_version", None)
+        return version(player_name) if version is not None else None
+
+    def _store(
+        self, player_name: str, version: Hashable, progress: PlayerProgress
+    ) -> None:
+        """Cache a copy of progress read or written at the given version."""
+        entry = (version, progress.copy())
+        with self._lock:
+            self._entries[player_name] = entry
+            self._entries.move_to_end(player_name)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def load_progress(self, player_name: str) -> PlayerProgress:
+        """Load player progress, from the cache when it is still current."""
+        # Read the version first, so a write racing with the load below
+        # leaves a stale version rather than stale progress in the cache
+        version = self._version(player_name)
+        with self._lock:
+            entry = self._entries.get(player_name)
+        if entry is not None and entry[0] == version:
+            with self._lock:
+                self.hits += 1
+                if player_name in self._entries:
+                    self._entries.move_to_end(player_name)
+            return entry[1].copy()
+
+        with self._lock:
+            self.misses += 1
+        progress = self._backend.load_progress(player_name)
+        self._store(player_name, version, progress)
+        return progress
+
+    def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
+        """Save player progress to the backend and the cache.
+
+        Saves through this cache are serialized with their version read,
+        so the version cached with the progress is the one this save
+        wrote, never a concurrent writer's newer one.
+        """
+        with self._save_lock:
+            self._backend.save_progress(player_name, progress)
+            version = self._version(player_name)
+            self._store(player_name, version, progress)
+
+    def invalidate(self, player_name: str | None = None) -> None:
+        """Drop one player's cached progress, or every player's.
+
+        Args:
+            player_name: The player to drop. None clears the cache.
+        """
+        with self._lock:
+            if player_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(player_name, None)
+
+    def log_session(self, result: LevelResult) -> None:
+        """Log a completed level session."""
+        self._backend.log_session(result)
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]:
+        """Stream logged sessions in chronological order."""
+        return self._backend.iter_sessions(player, level, since, until)
+
+    def log_speech_recognition(
+        self,
+        raw_transcript: str,
+        parsed_number: int | None,
+        expected: int | None,
+        matched: bool,
+        partial: bool = False,
+    ) -> None:
+        """Log a speech recognition result for debugging."""
+        self._backend.log_speech_recognition(
+            raw_transcript, parsed_number, expected, matched, partial=partial
+        )
+
+    def list_players(self) -> list[str]:
+        """List all player names."""
+        return self._backend.list_players()
+
+    def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals."""
+        return self._backend.list_player_summaries()
+
+    def player_exists(self, player_name: str) -> bool:
+        """Check if a player profile exists."""
+        return self._backend.player_exists(player_name)
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass backend-specific methods (flush, close, ...) through."""
+        return getattr(self._backend, name)
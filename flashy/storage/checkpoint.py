@@ -0,0 +1,165 @@
+"""Append-only checkpoint journal for an attempt in progress.
+
+GameController keeps an attempt's results in memory until finish(). The
+journal records every answer as it is submitted, so an attempt survives a
+crash or a closed terminal and can be resumed.
+
+A journal file is a 16-byte header (magic, version, level number, start
+time) followed by one 16-byte record per answer: problem index, flags,
+given answer and time taken. Appending is a single os.write() of one
+record on a file descriptor kept open, with no fsync and nothing
+rewritten, so it costs microseconds. Written bytes are in the OS page
+cache, which survives the process being killed; a torn last record is
+ignored on load.
+
+Levels have a fixed problem sequence, so replaying the recorded answers
+through submit_answer() rebuilds the exact score and streak.
+"""
+
+import os
+import struct
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+FORMAT_VERSION = 1
+_MAGIC = b"FLCK"
+
+# magic, version, level number, start time (us since epoch)
+_HEADER = struct.Struct("<4sHHq")
+# problem index, flags, given answer, time taken (seconds)
+_ANSWER = struct.Struct("<HBxid")
+
+_FLAG_NO_ANSWER = 1
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+
+
+@dataclass(frozen=True)
+class CheckpointAnswer:
+    """One journaled answer."""
+
+    problem_index: int
+    answer: int | None
+    time_taken: float
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """An attempt read back from a journal."""
+
+    level_number: int
+    started: datetime
+    answers: tuple[CheckpointAnswer, ...]
+
+
+class CheckpointJournal:
+    """A player's checkpoint journal file.
+
+    Holds at most one attempt: start() replaces whatever was there.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the journal. Nothing is opened until start/resume.
+
+        Args:
+            path: The journal file.
+        """
+        self._path = path
+        self._fd: int | None = None
+
+    @property
+    def path(self) -> Path:
+        """The journal file."""
+        return self._path
+
+    def start(self, level_number: int, started: datetime | None = None) -> None:
+        """Begin journaling a new attempt, replacing any earlier one.
+
+        Args:
+            level_number: The level being attempted.
+            started: When the attempt started. Defaults to now.
+        """
+        self.close()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        started = started or datetime.now()
+        header = _HEADER.pack(
+            _MAGIC,
+            FORMAT_VERSION,
+            level_number,
+            round(started.timestamp() * 1_000_000),
+        )
+        self._fd = os.open(self._path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.write(self._fd, header)
+
+    def resume(self) -> Checkpoint | None:
+        """Reopen the journaled attempt to append more answers.
+
+        A torn record left by a crash is cut off first.
+
+        Returns:
+            The attempt so far, or None if there is none to resume.
+        """
+        self.close()
+        checkpoint = self.load()
+        if checkpoint is None:
+            return None
+        fd = os.open(self._path, os.O_WRONLY)
+        os.ftruncate(fd, _HEADER.size + len(checkpoint.answers) * _ANSWER.size)
+        os.lseek(fd, 0, os.SEEK_END)
+        self._fd = fd
+        return checkpoint
+
+    def append(self, problem_index: int, answer: int | None, time_taken: float) -> None:
+        """Record one submitted answer. Does nothing if not started."""
+        if self._fd is None:
+            return
+        flags = _FLAG_NO_ANSWER if answer is None else 0
+        # Out of range answers are wrong anyway; clamping keeps them wrong
+        value = max(_INT32_MIN, min(answer or 0, _INT32_MAX))
+        os.write(self._fd, _ANSWER.pack(problem_index, flags, value, time_taken))
+
+    def load(self) -> Checkpoint | None:
+        """Read the journaled attempt.
+
+        Returns:
+            The attempt, or None if there is no readable journal.
+        """
+        try:
+            data = self._path.read_bytes()
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, level_number, started_us = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            return None
+
+        # Only whole records; a crash mid-write can leave a partial one
+        count = (len(data) - _HEADER.size) // _ANSWER.size
+        end = _HEADER.size + count * _ANSWER.size
+        answers = tuple(
+            CheckpointAnswer(
+                problem_index=index,
+                answer=None if flags & _FLAG_NO_ANSWER else answer,
+                time_taken=time_taken,
+            )
+            for index, flags, answer, time_taken in _ANSWER.iter_unpack(
+                data[_HEADER.size : end]
+            )
+        )
+        return Checkpoint(
+            level_number=level_number,
+            started=datetime.fromtimestamp(started_us / 1_000_000),
+            answers=answers,
+        )
+
+    def discard(self) -> None:
+        """Close and delete the journal (the attempt finished)."""
+        self.close()
+        self._path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the file, keeping the journal for a later resume."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,107 @@
+"""Daily per-level aggregates for compacted session history.
+
+Old sessions are folded into one DailyAggregate per player, level and
+day. An aggregate keeps the trends (attempts, scores, accuracy and how
+long answers took) without every ProblemResult.
+"""
+
+import bisect
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+# Sessions older than this are compacted by default
+DEFAULT_RETENTION = timedelta(days=365)
+
+# Upper bounds (seconds) of the answer time histogram buckets; the last
+# bucket counts everything slower
+TIME_BUCKETS = (1.0, 2.0, 3.0, 5.0, 8.0, 13.0)
+
+
+@dataclass
+class DailyAggregate:
+    """Totals of one player's sessions on one level on one day."""
+
+    player_name: str
+    level_number: int
+    day: date
+    attempts: int = 0
+    best_score: int = 0
+    total_score: int = 0
+    correct_count: int = 0
+    total_problems: int = 0
+    total_time_seconds: float = 0.0
+    # Answer counts per TIME_BUCKETS bucket
+    time_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(TIME_BUCKETS) + 1)
+    )
+
+    @property
+    def key(self) -> tuple[str, int, date]:
+        """The (player, level, day) this aggregate covers."""
+        return (self.player_name, self.level_number, self.day)
+
+    def add_entry(self, entry: dict) -> None:
+        """Fold one history log entry (see LevelResult.to_log_entry) in."""
+        score = entry.get("score", 0)
+        self.attempts += 1
+        self.best_score = max(self.best_score, score)
+        self.total_score += score
+        self.correct_count += entry.get("correct", 0)
+        self.total_problems += entry.get("total", 0)
+        self.total_time_seconds += entry.get("time_seconds", 0.0)
+        for problem in entry.get("problems", []):
+            bucket = bisect.bisect_left(TIME_BUCKETS, problem.get("time_seconds", 0))
+            self.time_histogram[bucket] += 1
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-ready dict."""
+        return {
+            "player": self.player_name,
+            "level_number": self.level_number,
+            "day": self.day.isoformat(),
+            "attempts": self.attempts,
+            "best_score": self.best_score,
+            "total_score": self.total_score,
+            "correct": self.correct_count,
+            "total": self.total_problems,
+            "time_seconds": self.total_time_seconds,
+            "time_histogram": self.time_histogram,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DailyAggregate":
+        """Create from a dict written by to_dict()."""
+        return cls(
+            player_name=data["player"],
+            level_number=data["level_number"],
+            day=date.fromisoformat(data["day"]),
+            attempts=data.get("attempts", 0),
+            best_score=data.get("best_score", 0),
+            total_score=data.get("total_score", 0),
+            correct_count=data.get("correct", 0),
+            total_problems=data.get("total", 0),
+            total_time_seconds=data.get("time_seconds", 0.0),
+            time_histogram=list(data["time_histogram"]),
+        )
+
+
+def fold_entries(
+    aggregates: dict[tuple[str, int, date], DailyAggregate],
+    entries: Iterable[dict],
+) -> int:
+    """Fold history log entries into a dict of aggregates keyed by key.
+
+    Returns:
+        The number of entries folded.
+    """
+    count = 0
+    for entry in entries:
+        day = date.fromisoformat(entry["timestamp"][:10])
+        key = (entry.get("player", ""), entry.get("level_number", 0), day)
+        aggregate = aggregates.get(key)
+        if aggregate is None:
+            aggregate = aggregates[key] = DailyAggregate(*key)
+        aggregate.add_entry(entry)
+        count += 1
+    return count
@@ -1,27 +1,105 @@
 """File-based storage implementation."""
 
+import heapq
+import itertools
 import json
-from dataclasses import asdict
-from datetime import datetime
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
-from flashy.core.models import LevelResult, PlayerProgress
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
+from flashy.storage.checkpoint import CheckpointJournal
+from flashy.storage.compaction import DEFAULT_RETENTION, DailyAggregate
+from flashy.storage.history_segments import (
+    DEFAULT_MAX_SEGMENT_BYTES,
+    SegmentedHistory,
+    entry_matches,
+)
+from flashy.storage.speech_log import SpeechLogger
+from flashy.storage.write_behind import WriteBehindLog
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; writes there are atomic but not merged
+    # under a lock
+    fcntl = None
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on path (created if missing)."""
+    with open(path, "a") as f:
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _write_json_atomic(path: Path, data: object, **dump_kwargs) -> None:
+    """Write JSON to a temp file next to path, then rename it into place.
+
+    Readers see either the old or the new file, never a partial one.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
 class FileStorage:
     """File-based storage backend.
 
     Stores player progress and session logs in the user's home directory.
+    A roster index (roster.json) keeps each player's summary so the player
+    list can be shown without parsing every progress file. Progress and
+    roster writes hold an advisory lock under locks/ and merge with what
+    is on disk, so several processes can share a base directory.
+
+    Session history is sharded per player: a background writer appends to
+    monthly, size-capped segments under players/<name>/history/ (history/
+    for sessions without a player). Call flush() to wait for it.
     """
 
-    def __init__(self, base_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        base_dir: Path | None = None,
+        fsync_interval: float | None = 5.0,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ) -> None:
         """Initialize file storage.
 
         Args:
             base_dir: Base directory for storage. Defaults to ~/.flashy
+            fsync_interval: Seconds between fsyncs of the history log, or
+                None to only fsync on flush().
+            max_segment_bytes: Size at which a history segment is sealed
+                and compressed.
         """
         self._base_dir = base_dir or (Path.home() / ".flashy")
         self._base_dir.mkdir(exist_ok=True)
+        self._max_segment_bytes = max_segment_bytes
+        self._history_writer = WriteBehindLog(fsync_interval=fsync_interval)
+        self._history = SegmentedHistory(
+            self._history_dir, self._history_writer, max_segment_bytes
+        )
+        self._shards: dict[str, SegmentedHistory] = {}
+        self._shards_lock = threading.Lock()
+        self._speech_logger = SpeechLogger(self._speech_log_path)
 
     @property
     def _players_dir(self) -> Path:
@@ -31,9 +109,45 @@ class FileStorage:
         return players_dir
 
     @property
-    def _history_path(self) -> Path:
-        """Get the history file path."""
-        return self._base_dir / "history.log"
+    def _locks_dir(self) -> Path:
+        """Get the directory of advisory lock files, creating it if needed."""
+        locks_dir = self._base_dir / "locks"
+        locks_dir.mkdir(exist_ok=True)
+        return locks_dir
+
+    @property
+    def _roster_path(self) -> Path:
+        """Get the roster index file path."""
+        return self._base_dir / "roster.json"
+
+    @property
+    def _history_dir(self) -> Path:
+        """Get the shared history segment directory path."""
+        return self._base_dir / "history"
+
+    def _player_history(self, player_name: str) -> SegmentedHistory:
+        """Get a player's history shard, or the shared history if unnamed."""
+        if not player_name:
+            return self._history
+        with self._shards_lock:
+            shard = self._shards.get(player_name)
+            if shard is None:
+                shard = self._shards[player_name] = SegmentedHistory(
+                    self._players_dir / player_name / "history",
+                    self._history_writer,
+                    self._max_segment_bytes,
+                )
+        return shard
+
+    def _sharded_players(self) -> list[str]:
+        """List players that have a history shard."""
+        return sorted(
+            path.parent.name for path in self._players_dir.glob("*/history")
+        )
+
+    def checkpoint_journal(self, player_name: str) -> CheckpointJournal:
+        """Get the journal of a player's attempt in progress."""
+        return CheckpointJournal(self._players_dir / player_name / "checkpoint.bin")
 
     @property
     def _speech_log_path(self) -> Path:
@@ -42,44 +156,232 @@ class FileStorage:
 
     def load_progress(self, player_name: str) -> PlayerProgress:
         """Load player progress from disk."""
-        progress_path = self._players_dir / f"{player_name}.json"
-
-        if not progress_path.exists():
-            return PlayerProgress()
+        progress = self._read_progress(self._players_dir / f"{player_name}.json")
+        return progress or PlayerProgress()
 
+    def _read_progress(self, progress_path: Path) -> PlayerProgress | None:
+        """Read a progress file, or None if it is missing or unreadable."""
         try:
             with open(progress_path) as f:
                 data = json.load(f)
                 # Convert string keys back to int (JSON only supports string keys)
                 stars = {int(k): v for k, v in data.get("stars", {}).items()}
-                return PlayerProgress(stars=stars)
-        except (json.JSONDecodeError, KeyError):
-            return PlayerProgress()
+                best_scores = {
+                    int(k): v for k, v in data.get("best_scores", {}).items()
+                }
+                return PlayerProgress(stars=stars, best_scores=best_scores)
+        except (OSError, json.JSONDecodeError, KeyError, AttributeError, ValueError):
+            return None
+
+    def progress_version(self, player_name: str) -> tuple[int, int, int] | None:
+        """Get a token that changes whenever a player's progress file does.
+
+        Progress files are replaced atomically, so every save gives the
+        file a new inode even when the mtime resolution is coarse.
+
+        Returns:
+            (inode, mtime_ns, size) of the progress file, or None if the
+            player has no progress file.
+        """
+        try:
+            stat = (self._players_dir / f"{player_name}.json").stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
     def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
-        """Save player progress to disk."""
+        """Save player progress to disk and update the roster index.
+
+        The save is merged with the progress already on disk, keeping the
+        most stars and the best score of each level, so concurrent writers
+        never lose each other's results. progress is updated in place with
+        the merged result.
+        """
         progress_path = self._players_dir / f"{player_name}.json"
-        data = {"stars": progress.stars}
+        with _file_lock(self._locks_dir / f"{player_name}.lock"):
+            on_disk = self._read_progress(progress_path)
+            if on_disk is not None:
+                for level, stars in on_disk.stars.items():
+                    progress.set_stars(level, stars)
+                for level, score in on_disk.best_scores.items():
+                    progress.set_best_score(level, score)
+            data = {
+                "stars": dict(progress.stars),
+                "best_scores": dict(progress.best_scores),
+            }
+            _write_json_atomic(progress_path, data, indent=2)
 
-        with open(progress_path, "w") as f:
-            json.dump(data, f, indent=2)
+        with _file_lock(self._locks_dir / "roster.lock"):
+            roster = self._load_roster()
+            roster[player_name] = PlayerSummary.from_progress(player_name, progress)
+            self._save_roster(roster)
 
     def log_session(self, result: LevelResult) -> None:
-        """Append a level result to the history log."""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "level_number": result.level_number,
-            "level_name": result.level_name,
-            "score": result.total_score,
-            "correct": result.correct_count,
-            "total": result.total_problems,
-            "best_streak": result.best_streak,
-            "time_seconds": result.total_time_seconds,
-            "problems": [asdict(p) for p in result.problems],
-        }
+        """Queue a level result to be appended to the history log.
+
+        The entry goes to the player's own history shard. The write and any
+        segment rotation happen on a background thread so the caller does
+        not wait for the disk.
+        """
+        self._player_history(result.player_name).append(result.to_log_entry())
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]:
+        """Stream logged sessions in chronological order.
+
+        Waits for queued history writes first. A query for one player
+        reads only that player's shard, plus the shared history/ and legacy
+        history.log left from before sharding (see migrate_history()).
+        Sealed segments are skipped using the manifest's player set and
+        time range.
+        """
+        self._history_writer.flush(durable=False)
+        since_iso = since.isoformat() if since else None
+        until_iso = until.isoformat() if until else None
+
+        legacy = (
+            entry
+            for entry in self._iter_legacy_entries()
+            if entry_matches(entry, player, since_iso, until_iso)
+        )
+        shared = self._history.iter_entries(player, since_iso, until_iso)
+        if player is None:
+            names = self._sharded_players()
+        else:
+            names = [player] if player else []
+        shards = [
+            self._player_history(name).iter_entries(None, since_iso, until_iso)
+            for name in names
+        ]
+
+        merged = heapq.merge(
+            itertools.chain(legacy, shared),
+            *shards,
+            key=lambda entry: entry.get("timestamp", ""),
+        )
+        for entry in merged:
+            if level is None or entry.get("level_number") == level:
+                yield LevelResult.from_log_entry(entry)
 
-        with open(self._history_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+    def migrate_history(self) -> int:
+        """Split pre-sharding history into per-player shards.
+
+        Entries of the legacy history.log and of the shared history/
+        segments are appended to their player's shard; entries without a
+        player go back to the shared history. The old files are kept as
+        history.log.migrated-<time> and history.migrated-<time>/ until
+        deleted by hand. Interrupting a migration leaves the backups
+        intact but may leave some entries already copied to shards.
+
+        Returns:
+            The number of entries moved to player shards.
+        """
+        self._history_writer.flush()
+        suffix = datetime.now().strftime("migrated-%Y%m%d%H%M%S%f")
+
+        legacy_path = self._base_dir / "history.log"
+        sources: list[Iterator[dict]] = []
+        if legacy_path.exists():
+            legacy_backup = legacy_path.with_name(f"history.log.{suffix}")
+            os.replace(legacy_path, legacy_backup)
+            sources.append(_iter_log_entries(legacy_backup))
+        if self._history_dir.exists():
+            shared_backup = self._history_dir.with_name(f"history.{suffix}")
+            # Reads go through a throwaway SegmentedHistory; nothing is
+            # appended to it
+            self._history_writer.call(
+                lambda: os.replace(self._history_dir, shared_backup)
+            )
+            sources.append(
+                SegmentedHistory(shared_backup, self._history_writer).iter_entries()
+            )
+
+        moved = 0
+        for entry in itertools.chain(*sources):
+            player = entry.get("player", "")
+            self._player_history(player).append(entry)
+            if player:
+                moved += 1
+        self._history_writer.flush()
+        return moved
+
+    def compact_history(self, older_than: timedelta = DEFAULT_RETENTION) -> int:
+        """Fold old sessions into daily per-player, per-level aggregates.
+
+        Sealed history segments whose sessions are all older than the
+        horizon are replaced by aggregates (see iter_aggregates()); their
+        sessions no longer appear in iter_sessions(). Recent sessions stay
+        raw.
+
+        Args:
+            older_than: Retention horizon for raw sessions.
+
+        Returns:
+            The number of sessions folded into aggregates.
+        """
+        before = (datetime.now() - older_than).isoformat()
+        histories = [self._history] + [
+            self._player_history(name) for name in self._sharded_players()
+        ]
+        return sum(history.compact(before) for history in histories)
+
+    def iter_aggregates(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> Iterator[DailyAggregate]:
+        """Stream daily aggregates of compacted sessions, oldest day first.
+
+        Args:
+            player: Only aggregates for this player.
+            level: Only aggregates for this level number.
+            since: Only days on or after this date.
+            until: Only days before this date.
+        """
+        if player is None:
+            names = ["", *self._sharded_players()]
+        else:
+            names = [player]
+        shards = [
+            (
+                aggregate
+                for aggregate in self._player_history(name).aggregates()
+                if player is None or aggregate.player_name == player
+            )
+            for name in names
+        ]
+        for aggregate in heapq.merge(*shards, key=lambda a: a.day):
+            if level is not None and aggregate.level_number != level:
+                continue
+            if since is not None and aggregate.day < since:
+                continue
+            if until is not None and aggregate.day >= until:
+                continue
+            yield aggregate
+
+    def _iter_legacy_entries(self) -> Iterator[dict]:
+        """Yield entries of the pre-segmentation history.log, if present."""
+        legacy_path = self._base_dir / "history.log"
+        if not legacy_path.exists():
+            return iter(())
+        return _iter_log_entries(legacy_path)
+
+    def flush(self) -> None:
+        """Write and fsync all queued history entries."""
+        self._history_writer.flush()
+        self._speech_logger.flush()
+
+    def close(self) -> None:
+        """Flush queued log entries and stop the background writers."""
+        self._history_writer.close()
+        self._speech_logger.close()
 
     def log_speech_recognition(
         self,
@@ -87,18 +389,16 @@ class FileStorage:
         parsed_number: int | None,
         expected: int | None,
         matched: bool,
+        partial: bool = False,
     ) -> None:
-        """Log a speech recognition result for debugging."""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "transcript": raw_transcript,
-            "parsed": parsed_number,
-            "expected": expected,
-            "matched": matched,
-        }
+        """Queue a speech recognition result for the debug log.
 
-        with open(self._speech_log_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        Never blocks: partial results are rate limited and entries are
+        dropped if the background writer falls behind.
+        """
+        self._speech_logger.log(
+            raw_transcript, parsed_number, expected, matched, partial=partial
+        )
 
     def list_players(self) -> list[str]:
         """List all player names."""
@@ -107,10 +407,75 @@ class FileStorage:
             players.append(path.stem)
         return sorted(players)
 
+    def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals.
+
+        Reads the roster index; it is rebuilt from the progress files if
+        it is missing or unreadable.
+        """
+        roster = self._read_roster()
+        if roster is None:
+            # Rebuild under the lock save_progress holds, so the rebuilt
+            # index can't overwrite an entry saved meanwhile
+            with _file_lock(self._locks_dir / "roster.lock"):
+                roster = self._load_roster()
+        return [roster[name] for name in sorted(roster)]
+
     def player_exists(self, player_name: str) -> bool:
         """Check if a player profile exists."""
         return (self._players_dir / f"{player_name}.json").exists()
 
+    def _read_roster(self) -> dict[str, PlayerSummary] | None:
+        """Read the roster index, or None if it is missing or unreadable."""
+        try:
+            with open(self._roster_path) as f:
+                data = json.load(f)
+            return {
+                name: PlayerSummary(name=name, **summary)
+                for name, summary in data.items()
+            }
+        except (OSError, json.JSONDecodeError, TypeError, AttributeError):
+            return None
+
+    def _load_roster(self) -> dict[str, PlayerSummary]:
+        """Load the roster index, rebuilding it if needed.
+
+        The caller must hold roster.lock.
+        """
+        roster = self._read_roster()
+        return self._rebuild_roster() if roster is None else roster
+
+    def _rebuild_roster(self) -> dict[str, PlayerSummary]:
+        """Rebuild the roster index by reading every progress file."""
+        roster = {
+            name: PlayerSummary.from_progress(name, self.load_progress(name))
+            for name in self.list_players()
+        }
+        self._save_roster(roster)
+        return roster
+
+    def _save_roster(self, roster: dict[str, PlayerSummary]) -> None:
+        """Write the roster index."""
+        data = {
+            name: {
+                "total_stars": summary.total_stars,
+                "highest_unlocked": summary.highest_unlocked,
+                "total_best_score": summary.total_best_score,
+            }
+            for name, summary in roster.items()
+        }
+        _write_json_atomic(self._roster_path, data)
+
+
+def _iter_log_entries(path: Path) -> Iterator[dict]:
+    """Yield the parsed entries of a JSONL log, skipping bad lines."""
+    with open(path) as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
 
 # Default storage instance
 _default_storage: FileStorage | None = None
@@ -0,0 +1,398 @@
+"""Rotating, compressed session history segments.
+
+History is appended to an active segment per month (``2026-10.jsonl``).
+A segment is sealed when a new month starts or when it grows past a size
+limit: it is gzip-compressed to ``2026-10.000.jsonl.gz`` and recorded in
+``manifest.json`` with its time range, player set and record count.
+Readers use the manifest to skip sealed segments that cannot match a
+query, so reads cost what was asked for rather than lifetime usage.
+
+Sealed segments older than a retention horizon can be compacted: their
+sessions are folded into daily per-level aggregates in
+``aggregates.json`` and the segments are deleted.
+"""
+
+import gzip
+import heapq
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from flashy.storage.compaction import DailyAggregate, fold_entries
+from flashy.storage.write_behind import WriteBehindLog
+
+MANIFEST_NAME = "manifest.json"
+AGGREGATES_NAME = "aggregates.json"
+ACTIVE_SUFFIX = ".jsonl"
+SEALED_SUFFIX = ".jsonl.gz"
+
+# Rotate a segment once it reaches this size, even mid-month
+DEFAULT_MAX_SEGMENT_BYTES = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SegmentInfo:
+    """Manifest entry describing a sealed segment."""
+
+    file: str
+    month: str
+    first_timestamp: str
+    last_timestamp: str
+    players: tuple[str, ...]
+    record_count: int
+
+    def may_match(
+        self,
+        player: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> bool:
+        """Check whether the segment can hold entries matching a query.
+
+        Args:
+            player: Only entries for this player.
+            since: Only entries at or after this ISO timestamp.
+            until: Only entries before this ISO timestamp.
+        """
+        if player is not None and player not in self.players:
+            return False
+        if since is not None and self.last_timestamp < since:
+            return False
+        if until is not None and self.first_timestamp >= until:
+            return False
+        return True
+
+
+def entry_matches(
+    entry: dict,
+    player: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> bool:
+    """Check a history entry against a player and ISO time range filter."""
+    if player is not None and entry.get("player") != player:
+        return False
+    timestamp = entry.get("timestamp", "")
+    if since is not None and timestamp < since:
+        return False
+    if until is not None and timestamp >= until:
+        return False
+    return True
+
+
+def _timestamp_of(entry: dict) -> str:
+    """Get the ISO timestamp of a history entry, or "" if it has none."""
+    return entry.get("timestamp", "")
+
+
+def _month_of(timestamp: str) -> str:
+    """Get the "YYYY-MM" month of an ISO timestamp."""
+    return timestamp[:7]
+
+
+class SegmentedHistory:
+    """Month and size rotated JSONL history stored in one directory.
+
+    Appends go through a WriteBehindLog; rotation runs on its writer
+    thread after the lines have been written, so appends never wait for
+    compression.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        writer: WriteBehindLog,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ) -> None:
+        """Initialize segmented history.
+
+        Args:
+            directory: Directory holding the segments and manifest.
+            writer: Background writer used for appends.
+            max_segment_bytes: Size at which an active segment is sealed.
+        """
+        self._dir = directory
+        self._writer = writer
+        self._max_segment_bytes = max_segment_bytes
+        self._active: Path | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        """The directory holding the segments."""
+        return self._dir
+
+    def append(self, entry: dict) -> None:
+        """Queue a history entry. The entry must have an ISO "timestamp"."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        path = self._dir / f"{_month_of(entry['timestamp'])}{ACTIVE_SUFFIX}"
+        self._writer.append(path, entry, on_written=self._after_write)
+
+    def segments(self) -> list[SegmentInfo]:
+        """List sealed segments in chronological order."""
+        try:
+            with open(self._dir / MANIFEST_NAME) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return []
+        return [
+            SegmentInfo(**{**segment, "players": tuple(segment["players"])})
+            for segment in data.get("segments", [])
+        ]
+
+    def active_segments(self) -> list[Path]:
+        """List active (not yet sealed) segment files, oldest first."""
+        if not self._dir.exists():
+            return []
+        return sorted(
+            path
+            for path in self._dir.iterdir()
+            if path.name.endswith(ACTIVE_SUFFIX) and not path.name.startswith(".")
+        )
+
+    def iter_entries(
+        self,
+        player: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[dict]:
+        """Yield history entries in chronological order.
+
+        Sealed segments whose manifest entry rules out a match are not
+        opened. Entries are filtered by player and time range. At most one
+        month's matches are held in memory at a time.
+
+        Args:
+            player: Only entries for this player.
+            since: Only entries at or after this ISO timestamp.
+            until: Only entries before this ISO timestamp.
+        """
+        sealed = [s for s in self.segments() if s.may_match(player, since, until)]
+        by_month: dict[str, list[Path]] = {}
+        for segment in sealed:
+            by_month.setdefault(segment.month, []).append(self._dir / segment.file)
+        for path in self.active_segments():
+            by_month.setdefault(path.name[: -len(ACTIVE_SUFFIX)], []).append(path)
+
+        for month in sorted(by_month):
+            # Size rotation splits a month over several segments, and a
+            # segment can hold older sessions appended later (for example
+            # by an import). Segments are size-capped, so each is sorted in
+            # memory and the month's segments are merged.
+            runs = [
+                sorted(
+                    (
+                        entry
+                        for entry in self._read_segment(path)
+                        if entry_matches(entry, player, since, until)
+                    ),
+                    key=_timestamp_of,
+                )
+                for path in by_month[month]
+            ]
+            yield from heapq.merge(*runs, key=_timestamp_of)
+
+    def aggregates(self) -> list[DailyAggregate]:
+        """List the daily aggregates of compacted sessions, oldest first."""
+        return self._load_aggregates()[1]
+
+    def compact(self, before: str) -> int:
+        """Fold sealed segments that end before a time into aggregates.
+
+        Active segments of earlier months are sealed first. Segments
+        holding any session at or after ``before`` stay raw, as does the
+        active segment of the current month. Runs on the writer thread so
+        it cannot race with rotation.
+
+        Args:
+            before: ISO timestamp of the retention horizon.
+
+        Returns:
+            The number of sessions folded into aggregates.
+        """
+        folded: list[int] = []
+        self._writer.call(lambda: folded.append(self._compact(before)))
+        return folded[0]
+
+    def _compact(self, before: str) -> int:
+        """Compact old sealed segments. Runs on the writer thread."""
+        with self._lock:
+            # Active segments of months before the horizon get no more
+            # appends in normal use; seal them so they can be compacted
+            for path in self.active_segments():
+                if path.name[: -len(ACTIVE_SUFFIX)] < _month_of(before):
+                    self._seal(path)
+                    if self._active == path:
+                        self._active = None
+
+            segments = self.segments()
+            old = [s for s in segments if s.last_timestamp < before]
+            if not old:
+                return 0
+
+            # Segments listed as compacted were folded in by a run that
+            # stopped before updating the manifest; don't fold them twice
+            compacted, aggregate_list = self._load_aggregates()
+            aggregates = {aggregate.key: aggregate for aggregate in aggregate_list}
+            folded = 0
+            for segment in old:
+                if segment.file not in compacted:
+                    path = self._dir / segment.file
+                    folded += fold_entries(aggregates, self._read_segment(path))
+            self._write_aggregates(
+                [segment.file for segment in old], aggregates.values()
+            )
+
+            self._write_manifest([s for s in segments if s not in old])
+            for segment in old:
+                (self._dir / segment.file).unlink(missing_ok=True)
+            # The names may be reused by later seals, so forget them
+            self._write_aggregates([], aggregates.values())
+            return folded
+
+    def _load_aggregates(self) -> tuple[set[str], list[DailyAggregate]]:
+        """Read the compacted segment names and the aggregates."""
+        try:
+            with open(self._dir / AGGREGATES_NAME) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return set(), []
+        aggregates = [DailyAggregate.from_dict(d) for d in data.get("days", [])]
+        return set(data.get("compacted", [])), aggregates
+
+    def _write_aggregates(
+        self, compacted: list[str], aggregates: Iterable[DailyAggregate]
+    ) -> None:
+        """Atomically replace the aggregates file."""
+        data = {
+            "compacted": compacted,
+            "days": [
+                aggregate.to_dict()
+                for aggregate in sorted(
+                    aggregates, key=lambda a: (a.day, a.player_name, a.level_number)
+                )
+            ],
+        }
+        self._write_json(AGGREGATES_NAME, data)
+
+    def seal_all(self) -> None:
+        """Seal every active segment once queued appends are written."""
+        self._writer.call(self._seal_all)
+
+    def _seal_all(self) -> None:
+        """Seal every active segment. Runs on the writer thread."""
+        with self._lock:
+            for path in self.active_segments():
+                self._seal(path)
+            self._active = None
+
+    def _read_segment(self, path: Path) -> Iterator[dict]:
+        """Yield the parsed entries of one segment, skipping bad lines."""
+        opener = gzip.open if path.name.endswith(SEALED_SUFFIX) else open
+        try:
+            with opener(path, "rt") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            # Sealed by the writer thread while we were listing
+            return
+
+    def _after_write(self, path: Path) -> None:
+        """Rotate segments after a write. Runs on the writer thread."""
+        with self._lock:
+            if self._active != path:
+                # New month, or first write since startup: seal any other
+                # active segment left behind
+                for other in self.active_segments():
+                    if other != path:
+                        self._seal(other)
+                self._active = path
+            if path.exists() and path.stat().st_size >= self._max_segment_bytes:
+                self._seal(path)
+                self._active = None
+
+    def _seal(self, path: Path) -> None:
+        """Compress an active segment and record it in the manifest.
+
+        Must be called with the lock held.
+        """
+        month = path.name[: -len(ACTIVE_SUFFIX)]
+        segments = self.segments()
+        # Compaction removes segments from the manifest, so count up to
+        # the first name that is neither listed nor left on disk
+        listed = {segment.file for segment in segments}
+        sequence = 0
+        while True:
+            sealed_name = f"{month}.{sequence:03d}{SEALED_SUFFIX}"
+            sealed_path = self._dir / sealed_name
+            if sealed_name not in listed and not sealed_path.exists():
+                break
+            sequence += 1
+        tmp_path = self._dir / f".{sealed_name}.tmp"
+
+        first = last = None
+        players: set[str] = set()
+        count = 0
+        with open(path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+            for line in src:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                dst.write(line if line.endswith(b"\n") else line + b"\n")
+                timestamp = entry.get("timestamp", "")
+                first = timestamp if first is None else min(first, timestamp)
+                last = timestamp if last is None else max(last, timestamp)
+                players.add(entry.get("player", ""))
+                count += 1
+
+        if count == 0:
+            tmp_path.unlink()
+            path.unlink()
+            return
+
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, sealed_path)
+
+        segments.append(
+            SegmentInfo(
+                file=sealed_name,
+                month=month,
+                first_timestamp=first or "",
+                last_timestamp=last or "",
+                players=tuple(sorted(players)),
+                record_count=count,
+            )
+        )
+        self._write_manifest(segments)
+        path.unlink()
+
+    def _write_manifest(self, segments: list[SegmentInfo]) -> None:
+        """Atomically replace the manifest."""
+        data = {"segments": [asdict(segment) for segment in segments]}
+        self._write_json(MANIFEST_NAME, data)
+
+    def _write_json(self, name: str, data: dict) -> None:
+        """Atomically replace a JSON file in the segment directory.
+
+        The temp file has a unique name, so processes sharing the
+        directory can't write over each other's.
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=self._dir, prefix=f".{name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, self._dir / name)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
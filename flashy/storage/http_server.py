@@ -0,0 +1,200 @@
+"""Small Flashy sync HTTP server backed by any storage backend.
+
+Serves the API used by HttpStorage:
+
+- GET /players: JSON list of player names
+- GET /players/summaries: JSON list of PlayerSummary fields
+- GET /players/<name>/progress: {"stars": ..., "best_scores": ...}, or 404
+- GET /sessions?player=&level=&since=&until=: sessions as JSON lines,
+  oldest first
+- POST /batch: {"records": [...]} of queued client records. Progress is
+  merged keeping the best stars and scores; sessions already received are
+  dropped by content hash, so clients can safely resend a batch.
+
+Connections are kept alive (HTTP/1.1). Used as the stand-in server in
+tests, and by scripts/sync_server.py to share a FileStorage.
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import asdict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import cast
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from flashy.core.models import LevelResult, PlayerProgress
+from flashy.storage.protocol import StorageBackend
+from flashy.storage.sync import merge_progress, session_hash
+
+# Session hashes remembered for dropping resent batches
+RECENT_SESSIONS = 100_000
+
+
+class SyncServer(ThreadingHTTPServer):
+    """Threaded HTTP server exposing a storage backend to HttpStorage."""
+
+    daemon_threads = True
+
+    def __init__(
+        self, storage: StorageBackend, address: tuple[str, int] = ("127.0.0.1", 0)
+    ) -> None:
+        """Initialize the server. Port 0 picks a free port.
+
+        Args:
+            storage: Backend holding the shared data.
+            address: (host, port) to listen on.
+        """
+        super().__init__(address, _SyncHandler)
+        self.storage = storage
+        # Writes are serialized so progress merges don't interleave
+        self._lock = threading.Lock()
+        self._recent: deque[bytes] = deque(maxlen=RECENT_SESSIONS)
+        self._recent_set: set[bytes] = set()
+        self._thread: threading.Thread | None = None
+        self.connections = 0
+        self.batches = 0
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="flashy-sync-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def apply_batch(self, records: list[dict]) -> None:
+        """Apply a batch of client records to the storage backend."""
+        with self._lock:
+            self.batches += 1
+            for record in records:
+                kind = record.get("kind")
+                if kind == "progress":
+                    self._merge_progress(record)
+                elif kind == "session":
+                    self._add_session(LevelResult.from_log_entry(record))
+                elif kind == "speech":
+                    self.storage.log_speech_recognition(
+                        record.get("raw", ""),
+                        record.get("parsed"),
+                        record.get("expected"),
+                        bool(record.get("matched")),
+                    )
+
+    def _merge_progress(self, record: dict) -> None:
+        name = record["player"]
+        sent = PlayerProgress(
+            stars={int(k): v for k, v in record.get("stars", {}).items()},
+            best_scores={int(k): v for k, v in record.get("best_scores", {}).items()},
+        )
+        merged = merge_progress([self.storage.load_progress(name), sent])
+        self.storage.save_progress(name, merged)
+
+    def _add_session(self, result: LevelResult) -> None:
+        digest = session_hash(result)
+        if digest in self._recent_set:
+            return
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_set.discard(self._recent[0])
+        self._recent.append(digest)
+        self._recent_set.add(digest)
+        self.storage.log_session(result)
+
+
+class _SyncHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def _sync_server(self) -> SyncServer:
+        """The server this handler belongs to."""
+        return cast(SyncServer, self.server)
+
+    def setup(self) -> None:
+        super().setup()
+        self._sync_server.connections += 1
+
+    def log_message(self, format: str, *args: object) -> None:
+        # Keep test and terminal output quiet
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data: object, status: int = 200) -> None:
+        self._send(status, json.dumps(data).encode(), "application/json")
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+        storage = self._sync_server.storage
+
+        if parts == ["players"]:
+            self._send_json(storage.list_players())
+        elif parts == ["players", "summaries"]:
+            self._send_json(
+                [asdict(summary) for summary in storage.list_player_summaries()]
+            )
+        elif len(parts) == 3 and parts[0] == "players" and parts[2] == "progress":
+            if not storage.player_exists(parts[1]):
+                self._send_json({"error": "no such player"}, status=404)
+                return
+            progress = storage.load_progress(parts[1])
+            self._send_json(
+                {
+                    "stars": dict(progress.stars),
+                    "best_scores": dict(progress.best_scores),
+                }
+            )
+        elif parts == ["sessions"]:
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            sessions = storage.iter_sessions(
+                player=query.get("player"),
+                level=int(query["level"]) if "level" in query else None,
+                since=_parse_time(query.get("since")),
+                until=_parse_time(query.get("until")),
+            )
+            body = b"".join(
+                json.dumps(result.to_log_entry()).encode() + b"\n"
+                for result in sessions
+            )
+            self._send(200, body, "application/x-ndjson")
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if urlsplit(self.path).path != "/batch":
+            self._send_json({"error": "not found"}, status=404)
+            return
+        try:
+            records = json.loads(body)["records"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            self._send_json({"error": "bad batch"}, status=400)
+            return
+        self._sync_server.apply_batch(records)
+        self._send_json({"accepted": len(records)})
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
@@ -0,0 +1,487 @@
+"""Remote storage backend talking to a Flashy sync HTTP API.
+
+Lab machines share central progress through a small HTTP API (see
+flashy.storage.http_server for the endpoints and a stand-in server).
+Connections are kept alive in a small pool, so a busy client reuses a
+handful of sockets instead of opening one per call.
+
+Writes never wait for the network. save_progress, log_session and
+log_speech_recognition append a record to an on-disk outbox; a
+background thread posts the outbox in batches every ``flush_interval``
+seconds. While the server is unreachable the outbox keeps growing and is
+sent once it is back, including after a restart. Records the server
+refuses, and queue files that can't be read, are set aside as rejected-
+files instead of being retried forever. The server merges
+progress by keeping the best stars and scores and drops sessions it has
+already seen, so resending a batch is harmless.
+"""
+
+import http.client
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote, urlencode, urlsplit
+
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
+from flashy.storage.sync import merge_progress
+
+OUTBOX_NAME = "outbox.jsonl"
+SENDING_PREFIX = "sending-"
+REJECTED_PREFIX = "rejected-"
+
+logger = logging.getLogger(__name__)
+
+
+class ServerError(Exception):
+    """The sync server answered with an unexpected status."""
+
+
+# Errors that mean the server could not be reached or dropped the connection
+_NETWORK_ERRORS = (OSError, http.client.HTTPException)
+# Errors after which reads fall back to local state and sends are retried
+_UNAVAILABLE = (*_NETWORK_ERRORS, ServerError)
+
+
+class _ConnectionPool:
+    """A fixed-size pool of keep-alive HTTP connections to one server."""
+
+    def __init__(self, base_url: str, size: int, timeout: float) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme == "https":
+            self._connection_class: type[http.client.HTTPConnection] = (
+                http.client.HTTPSConnection
+            )
+        elif parts.scheme == "http":
+            self._connection_class = http.client.HTTPConnection
+        else:
+            raise ValueError(f"Unsupported URL scheme: {base_url}")
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        return self._connection_class(self._host, self._port, timeout=self._timeout)
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Take a connection, waiting while all of them are in use.
+
+        Returns:
+            The connection, and whether it was reused from an earlier call.
+        """
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        """Return a connection; close it instead if it cannot be reused."""
+        if reusable:
+            self._idle.put(conn)
+        else:
+            conn.close()
+        self._slots.release()
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class HttpStorage:
+    """Storage backend that keeps progress and history on a sync server.
+
+    Reads go to the server. If it cannot be reached, progress and the
+    player list fall back to what this client last saw or saved, so play
+    can continue offline; iter_sessions() raises instead, as it cannot
+    answer without the server.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        queue_dir: Path | None = None,
+        flush_interval: float = 2.0,
+        batch_size: int = 200,
+        pool_size: int = 4,
+        timeout: float = 5.0,
+    ) -> None:
+        """Initialize the remote backend and start the sender thread.
+
+        Args:
+            base_url: Server URL, e.g. "http://flashy-hub:8765".
+            queue_dir: Directory of the on-disk outbox. Defaults to
+                ~/.flashy/outbox
+            flush_interval: Seconds between background sends of the
+                outbox.
+            batch_size: Maximum records per POST.
+            pool_size: Maximum connections open at once.
+            timeout: Socket timeout in seconds.
+        """
+        self._pool = _ConnectionPool(base_url, pool_size, timeout)
+        if queue_dir is None:
+            queue_dir = Path.home() / ".flashy" / "outbox"
+        queue_dir.mkdir(parents=True, exist_ok=True)
+        self._queue_dir = queue_dir
+        self._batch_size = batch_size
+        # Guards the outbox file; _send_lock keeps one sender at a time
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        # Last progress seen or saved per player, for offline reads
+        self._known: dict[str, PlayerProgress] = {}
+        self.online = True
+
+        self._stop = threading.Event()
+        self._flush_interval = flush_interval
+        self._sender = threading.Thread(
+            target=self._run_sender, name="flashy-http-sender", daemon=True
+        )
+        self._sender.start()
+
+    @property
+    def _outbox_path(self) -> Path:
+        return self._queue_dir / OUTBOX_NAME
+
+    # --- HTTP ---
+
+    def _request(
+        self, method: str, path: str, body: object | None = None
+    ) -> tuple[int, bytes]:
+        """Send a request and read the whole response.
+
+        A reused connection the server has since closed is retried once on
+        a fresh one.
+
+        Raises:
+            OSError, http.client.HTTPException: If the server is unreachable.
+        """
+        data = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if data is not None else {}
+        while True:
+            conn, reused = self._pool.acquire()
+            try:
+                conn.request(method, self._pool.prefix + path, data, headers)
+                response = conn.getresponse()
+                payload = response.read()
+            except _NETWORK_ERRORS:
+                self._pool.release(conn, reusable=False)
+                if reused:
+                    continue
+                self.online = False
+                raise
+            self._pool.release(conn, reusable=not response.will_close)
+            self.online = True
+            return response.status, payload
+
+    def _get_json(self, path: str) -> object | None:
+        """GET a JSON document; None if the server has no such resource."""
+        status, payload = self._request("GET", path)
+        if status == 404:
+            return None
+        if status != 200:
+            raise ServerError(f"GET {path} returned {status}")
+        try:
+            return json.loads(payload)
+        except ValueError:
+            raise ServerError(f"GET {path} returned malformed JSON") from None
+
+    def _get_list(self, path: str) -> list:
+        """GET a JSON list; empty if the server has no such resource."""
+        data = self._get_json(path)
+        if data is None:
+            return []
+        if not isinstance(data, list):
+            raise ServerError(f"GET {path} did not return a list")
+        return data
+
+    # --- Outbox ---
+
+    def _enqueue(self, record: dict) -> None:
+        """Append a record to the on-disk outbox."""
+        line = json.dumps(record) + "\n"
+        with self._lock, open(self._outbox_path, "a") as f:
+            f.write(line)
+
+    def _run_sender(self) -> None:
+        """Send the outbox periodically until closed."""
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self._send_outbox()
+            except _UNAVAILABLE:
+                # Offline: keep the records and try again next interval
+                continue
+            except Exception:
+                # Keep the thread alive so the outbox is still sent later
+                logger.exception("Sending the outbox failed")
+
+    def _send_outbox(self) -> None:
+        """Post every queued record, oldest first, in batches.
+
+        The outbox is renamed to a sending- file first, so new records
+        keep being appended while it is sent. A batch is removed from the
+        file only after the server accepted it. A batch the server refuses
+        as malformed (400), or a file that can't be read, is moved to a
+        rejected- file.
+
+        Raises:
+            OSError, http.client.HTTPException, ServerError: If a batch
+                could not be delivered. Unsent records stay queued.
+        """
+        with self._send_lock:
+            with self._lock:
+                if self._outbox_path.exists() and self._outbox_path.stat().st_size:
+                    name = f"{SENDING_PREFIX}{time.time_ns()}.jsonl"
+                    os.replace(self._outbox_path, self._queue_dir / name)
+
+            for path in sorted(self._queue_dir.glob(f"{SENDING_PREFIX}*.jsonl")):
+                try:
+                    records = _read_records(path)
+                except ValueError:
+                    logger.warning("Setting aside unreadable outbox file %s", path)
+                    os.replace(path, self._rejected_path())
+                    continue
+                for start in range(0, len(records), self._batch_size):
+                    batch = records[start : start + self._batch_size]
+                    try:
+                        status, _ = self._request("POST", "/batch", {"records": batch})
+                        if status == 400:
+                            # Resending won't help; keep the records aside
+                            logger.warning("Server refused %d records", len(batch))
+                            _rewrite_lines(self._rejected_path(), batch)
+                            continue
+                        if status != 200:
+                            raise ServerError(f"POST /batch returned {status}")
+                    except BaseException:
+                        _rewrite_lines(path, records[start:])
+                        raise
+                path.unlink()
+
+    def _rejected_path(self) -> Path:
+        """Get a new path to set refused records aside in."""
+        return self._queue_dir / f"{REJECTED_PREFIX}{time.time_ns()}.jsonl"
+
+    def flush(self) -> None:
+        """Send every queued record now.
+
+        Raises:
+            OSError, http.client.HTTPException, ServerError: If the server
+                could not be reached. The records stay queued.
+        """
+        self._send_outbox()
+
+    def close(self) -> None:
+        """Stop the sender, try a last send and close the connections.
+
+        Records that could not be sent stay on disk for the next start.
+        """
+        self._stop.set()
+        self._sender.join()
+        try:
+            self._send_outbox()
+        except _UNAVAILABLE:
+            pass
+        self._pool.close()
+
+    # --- StorageBackend ---
+
+    def load_progress(self, player_name: str) -> PlayerProgress:
+        """Load player progress from the server.
+
+        Saves still in the outbox are merged in. Offline, the progress
+        last seen or saved by this client is returned.
+        """
+        known = self._known.get(player_name, PlayerProgress())
+        try:
+            remote = _parse_progress(
+                self._get_json(f"/players/{quote(player_name, safe='')}/progress")
+            )
+        except _UNAVAILABLE:
+            return known.copy()
+        progress = merge_progress([known, remote])
+        self._known[player_name] = progress.copy()
+        return progress
+
+    def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
+        """Queue player progress for the server."""
+        self._known[player_name] = merge_progress(
+            [self._known.get(player_name, PlayerProgress()), progress]
+        )
+        self._enqueue(
+            {
+                "kind": "progress",
+                "player": player_name,
+                "stars": dict(progress.stars),
+                "best_scores": dict(progress.best_scores),
+            }
+        )
+
+    def log_session(self, result: LevelResult) -> None:
+        """Queue a completed level session for the server."""
+        self._enqueue({"kind": "session", **result.to_log_entry()})
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]:
+        """Stream logged sessions from the server in chronological order.
+
+        Queued sessions are sent first so they are included.
+
+        Raises:
+            OSError, http.client.HTTPException: If the server is unreachable.
+        """
+        self.flush()
+        query = {
+            key: value
+            for key, value in (
+                ("player", player),
+                ("level", level),
+                ("since", since.isoformat() if since else None),
+                ("until", until.isoformat() if until else None),
+            )
+            if value is not None
+        }
+        path = "/sessions" + (f"?{urlencode(query)}" if query else "")
+
+        conn, _ = self._pool.acquire()
+        finished = False
+        try:
+            conn.request("GET", self._pool.prefix + path)
+            response = conn.getresponse()
+            if response.status != 200:
+                response.read()
+                finished = not response.will_close
+                raise ServerError(f"GET {path} returned {response.status}")
+            # Parse line by line instead of loading the whole response
+            for line in response:
+                yield LevelResult.from_log_entry(json.loads(line))
+            finished = not response.will_close
+        finally:
+            # A response abandoned halfway leaves the connection unusable
+            self._pool.release(conn, reusable=finished)
+
+    def log_speech_recognition(
+        self,
+        raw_transcript: str,
+        parsed_number: int | None,
+        expected: int | None,
+        matched: bool,
+        partial: bool = False,
+    ) -> None:
+        """Queue a final speech recognition result for the server.
+
+        Partial results are not sent; they would flood the outbox.
+        """
+        if partial:
+            return
+        self._enqueue(
+            {
+                "kind": "speech",
+                "raw": raw_transcript,
+                "parsed": parsed_number,
+                "expected": expected,
+                "matched": matched,
+            }
+        )
+
+    def list_players(self) -> list[str]:
+        """List all player names (this client's known players offline)."""
+        try:
+            players = self._get_list("/players")
+            if not all(isinstance(name, str) for name in players):
+                raise ServerError("Malformed player list")
+        except _UNAVAILABLE:
+            return sorted(self._known)
+        return sorted(set(players) | set(self._known))
+
+    def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals."""
+        try:
+            summaries = _parse_summaries(self._get_list("/players/summaries"))
+        except _UNAVAILABLE:
+            summaries = {}
+        # Progress saved here but not yet sent is at least as good
+        for name, progress in self._known.items():
+            local = PlayerSummary.from_progress(name, progress)
+            remote = summaries.get(name)
+            if remote is None or local.total_stars > remote.total_stars:
+                summaries[name] = local
+        return [summaries[name] for name in sorted(summaries)]
+
+    def player_exists(self, player_name: str) -> bool:
+        """Check if a player profile exists."""
+        return player_name in self.list_players()
+
+
+def _parse_progress(data: object) -> PlayerProgress:
+    """Build progress from a server response (None if it had none).
+
+    Raises:
+        ServerError: If the response is not a progress document.
+    """
+    if data is None:
+        return PlayerProgress()
+    if not isinstance(data, dict):
+        raise ServerError("Progress is not an object")
+    try:
+        return PlayerProgress(
+            stars={int(k): v for k, v in data.get("stars", {}).items()},
+            best_scores={int(k): v for k, v in data.get("best_scores", {}).items()},
+        )
+    except (AttributeError, TypeError, ValueError) as e:
+        raise ServerError(f"Malformed progress: {e}") from None
+
+
+def _parse_summaries(data: list) -> dict[str, PlayerSummary]:
+    """Build player summaries by name from a server response.
+
+    Raises:
+        ServerError: If an item is not a player summary.
+    """
+    try:
+        return {item["name"]: PlayerSummary(**item) for item in data}
+    except (KeyError, TypeError) as e:
+        raise ServerError(f"Malformed player summary: {e}") from None
+
+
+def _read_records(path: Path) -> list[dict]:
+    """Read a queue file, skipping a torn last line or corrupt lines.
+
+    Raises:
+        ValueError: If the file is not UTF-8 text.
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+    return records
+
+
+def _rewrite_lines(path: Path, records: list[dict]) -> None:
+    """Atomically replace a queue file with the given records."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+    os.replace(tmp_path, path)
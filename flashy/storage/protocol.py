@@ -1,8 +1,10 @@
-"""Storage protocol defining the interface for storage backends."""
+"""Storage protocols defining the interfaces for storage backends."""
 
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
 from typing import Protocol
 
-from flashy.core.models import LevelResult, PlayerProgress
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
 
 
 class StorageBackend(Protocol):
@@ -40,20 +42,48 @@ class StorageBackend(Protocol):
         """
         ...
 
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]:
+        """Stream logged sessions in chronological order.
+
+        Sessions are yielded lazily; the full history is never loaded at
+        once. Backends push the filters down to storage where they can.
+
+        Args:
+            player: Only sessions for this player.
+            level: Only sessions for this level number.
+            since: Only sessions logged at or after this time.
+            until: Only sessions logged before this time.
+
+        Yields:
+            Matching level results, oldest first, with timestamps set.
+        """
+        ...
+
     def log_speech_recognition(
         self,
         raw_transcript: str,
         parsed_number: int | None,
         expected: int | None,
         matched: bool,
+        partial: bool = False,
     ) -> None:
         """Log a speech recognition result for debugging.
 
+        Called from the audio loop, so implementations should not block
+        on slow I/O.
+
         Args:
             raw_transcript: The raw text from the speech recognizer.
             parsed_number: The number parsed from the transcript (None if unparseable).
             expected: The expected answer (None if not provided).
             matched: Whether it was considered a match.
+            partial: Whether this is a partial (in-progress) result.
         """
         ...
 
@@ -65,6 +95,14 @@ class StorageBackend(Protocol):
         """
         ...
 
+    def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals.
+
+        Returns:
+            Player summaries sorted by name.
+        """
+        ...
+
     def player_exists(self, player_name: str) -> bool:
         """Check if a player profile exists.
 
@@ -75,3 +113,57 @@ class StorageBackend(Protocol):
             True if the player exists, False otherwise.
         """
         ...
+
+
+class AsyncStorageBackend(Protocol):
+    """Async variant of StorageBackend for event-loop driven UIs.
+
+    Methods mirror StorageBackend but are awaited, so a slow disk delays
+    the data rather than blocking the caller's event loop. See
+    StorageBackend for the meaning of each method.
+    """
+
+    async def load_progress(self, player_name: str) -> PlayerProgress:
+        """Load player progress."""
+        ...
+
+    async def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
+        """Save player progress."""
+        ...
+
+    async def log_session(self, result: LevelResult) -> None:
+        """Log a completed level session."""
+        ...
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[LevelResult]:
+        """Stream logged sessions in chronological order."""
+        ...
+
+    async def log_speech_recognition(
+        self,
+        raw_transcript: str,
+        parsed_number: int | None,
+        expected: int | None,
+        matched: bool,
+        partial: bool = False,
+    ) -> None:
+        """Log a speech recognition result for debugging."""
+        ...
+
+    async def list_players(self) -> list[str]:
+        """List all player names."""
+        ...
+
+    async def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals."""
+        ...
+
+    async def player_exists(self, player_name: str) -> bool:
+        """Check if a player profile exists."""
+        ...
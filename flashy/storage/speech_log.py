@@ -0,0 +1,93 @@
+"""Speech recognition debug log.
+
+Voice input logs every changed partial transcript from inside the loop
+that drains the audio queue. SpeechLogger keeps that loop independent of
+disk latency: entries are queued and serialized on a background thread,
+partial results are rate limited, and entries are dropped rather than
+blocking when the queue backs up.
+"""
+
+import time
+from datetime import datetime
+from pathlib import Path
+
+from flashy.storage.write_behind import WriteBehindLog
+
+
+class SpeechLogger:
+    """Queue-backed, non-blocking speech recognition logger."""
+
+    def __init__(
+        self,
+        path: Path,
+        partial_interval: float = 0.5,
+        max_pending: int = 256,
+    ) -> None:
+        """Initialize the logger.
+
+        Args:
+            path: The log file to append to.
+            partial_interval: Minimum seconds between logged partial
+                results. Final results are always logged. 0 logs every
+                partial result.
+            max_pending: Maximum queued entries before new entries are
+                dropped.
+        """
+        self._path = path
+        self._partial_interval = partial_interval
+        self._last_partial = float("-inf")
+        # Debug log: no periodic fsync, losing the tail on power loss is fine
+        self._writer = WriteBehindLog(fsync_interval=None, max_pending=max_pending)
+        self.sampled_out = 0
+
+    @property
+    def dropped(self) -> int:
+        """Number of entries dropped because the queue was full."""
+        return self._writer.dropped
+
+    def log(
+        self,
+        raw_transcript: str,
+        parsed_number: int | None,
+        expected: int | None,
+        matched: bool,
+        partial: bool = False,
+    ) -> bool:
+        """Queue a speech recognition result. Never blocks.
+
+        Args:
+            raw_transcript: The raw text from the speech recognizer.
+            parsed_number: The number parsed from the transcript.
+            expected: The expected answer.
+            matched: Whether it was considered a match.
+            partial: Whether this is a partial (in-progress) result.
+
+        Returns:
+            True if the entry was queued, False if it was rate limited or
+            dropped.
+        """
+        now = time.monotonic()
+        # Matched partials end the question, so they are always kept
+        if partial and not matched:
+            if now - self._last_partial < self._partial_interval:
+                self.sampled_out += 1
+                return False
+            self._last_partial = now
+
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "transcript": raw_transcript,
+            "parsed": parsed_number,
+            "expected": expected,
+            "matched": matched,
+            "partial": partial,
+        }
+        return self._writer.append(self._path, entry)
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written."""
+        self._writer.flush(durable=False)
+
+    def close(self) -> None:
+        """Write queued entries and stop the background thread."""
+        self._writer.close()
@@ -0,0 +1,419 @@
+"""SQLite-based storage implementation.
+
+Keeps players, per-level progress and per-problem results in indexed
+tables so per-player and per-level history lookups do not have to scan
+the whole log. The database runs in WAL mode, which keeps appends cheap
+and lets readers proceed while a session is being written.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Generator
+from datetime import datetime
+from pathlib import Path
+
+from flashy.core.models import (
+    LevelResult,
+    PlayerProgress,
+    PlayerSummary,
+    ProblemResult,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS level_progress (
+    player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    level_number INTEGER NOT NULL,
+    stars INTEGER NOT NULL DEFAULT 0,
+    best_score INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_id, level_number)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER REFERENCES players(id) ON DELETE CASCADE,
+    timestamp TEXT NOT NULL,
+    level_number INTEGER NOT NULL,
+    level_name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL,
+    time_seconds REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_sessions_player_time
+    ON sessions(player_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_sessions_level_time
+    ON sessions(level_number, timestamp);
+CREATE INDEX IF NOT EXISTS idx_sessions_time
+    ON sessions(timestamp);
+
+CREATE TABLE IF NOT EXISTS problem_results (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    problem TEXT NOT NULL,
+    correct_answer INTEGER NOT NULL,
+    given_answer INTEGER,
+    is_correct INTEGER NOT NULL,
+    time_seconds REAL NOT NULL,
+    points INTEGER NOT NULL,
+    PRIMARY KEY (session_id, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS speech_log (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    transcript TEXT NOT NULL,
+    parsed INTEGER,
+    expected INTEGER,
+    matched INTEGER NOT NULL,
+    partial INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class SqliteStorage:
+    """SQLite storage backend.
+
+    Stores everything in a single database file, by default
+    ~/.flashy/flashy.db. A single connection is shared between threads
+    and guarded by a lock.
+    """
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        """Initialize SQLite storage.
+
+        Args:
+            db_path: Database file path. Defaults to ~/.flashy/flashy.db
+        """
+        if db_path is None:
+            base_dir = Path.home() / ".flashy"
+            base_dir.mkdir(exist_ok=True)
+            db_path = base_dir / "flashy.db"
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._progress_writes = 0
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is durable in WAL mode except on power loss, and avoids an
+        # fsync per committed session.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _player_id(self, player_name: str, create: bool = False) -> int | None:
+        """Look up a player's row id, optionally creating the player.
+
+        Must be called with the lock held.
+        """
+        row = self._conn.execute(
+            "SELECT id FROM players WHERE name = ?", (player_name,)
+        ).fetchone()
+        if row is not None:
+            return row[0]
+        if not create:
+            return None
+        cursor = self._conn.execute(
+            "INSERT INTO players (name) VALUES (?)", (player_name,)
+        )
+        return cursor.lastrowid
+
+    def load_progress(self, player_name: str) -> PlayerProgress:
+        """Load player progress from the database."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT lp.level_number, lp.stars, lp.best_score
+                FROM level_progress lp JOIN players p ON p.id = lp.player_id
+                WHERE p.name = ?
+                """,
+                (player_name,),
+            ).fetchall()
+
+        progress = PlayerProgress()
+        for level_number, stars, best_score in rows:
+            if stars:
+                progress.stars[level_number] = stars
+            if best_score:
+                progress.best_scores[level_number] = best_score
+        return progress
+
+    def progress_version(self, player_name: str) -> tuple[int, int]:
+        """Get a token that changes whenever stored progress may have.
+
+        PRAGMA data_version changes when another connection commits; the
+        write counter covers saves made through this connection.
+        """
+        with self._lock:
+            (data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+            return (data_version, self._progress_writes)
+
+    def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
+        """Save player progress, replacing any previously stored levels."""
+        levels = set(progress.stars) | set(progress.best_scores)
+        rows = [
+            (level, progress.get_stars(level), progress.get_best_score(level))
+            for level in sorted(levels)
+        ]
+
+        with self._lock, self._conn:
+            player_id = self._player_id(player_name, create=True)
+            self._conn.execute(
+                "DELETE FROM level_progress WHERE player_id = ?", (player_id,)
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO level_progress
+                    (player_id, level_number, stars, best_score)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(player_id, *row) for row in rows],
+            )
+            self._progress_writes += 1
+
+    def log_session(self, result: LevelResult) -> None:
+        """Insert a level result and its problem results."""
+        timestamp = (result.timestamp or datetime.now()).isoformat()
+
+        with self._lock, self._conn:
+            player_id = (
+                self._player_id(result.player_name, create=True)
+                if result.player_name
+                else None
+            )
+            cursor = self._conn.execute(
+                """
+                INSERT INTO sessions (
+                    player_id, timestamp, level_number, level_name, score,
+                    correct, total, best_streak, time_seconds
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    player_id,
+                    timestamp,
+                    result.level_number,
+                    result.level_name,
+                    result.total_score,
+                    result.correct_count,
+                    result.total_problems,
+                    result.best_streak,
+                    result.total_time_seconds,
+                ),
+            )
+            session_id = cursor.lastrowid
+            self._conn.executemany(
+                """
+                INSERT INTO problem_results (
+                    session_id, position, problem, correct_answer,
+                    given_answer, is_correct, time_seconds, points
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        session_id,
+                        position,
+                        p.problem,
+                        p.correct_answer,
+                        p.given_answer,
+                        p.is_correct,
+                        p.time_seconds,
+                        p.points,
+                    )
+                    for position, p in enumerate(result.problems)
+                ],
+            )
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Generator[LevelResult, None, None]:
+        """Stream logged sessions in chronological order.
+
+        Filters run in SQL against the session indexes. Rows are streamed
+        from a dedicated read connection, so iterating does not hold the
+        storage lock and does not block concurrent writes. Closing the
+        generator early releases the read cursor.
+        """
+        yield from self._query_sessions(player, level, since, until)
+
+    def load_sessions(
+        self,
+        player_name: str | None = None,
+        level_number: int | None = None,
+        limit: int | None = None,
+    ) -> list[LevelResult]:
+        """Load logged sessions, most recent first.
+
+        Args:
+            player_name: Only include sessions for this player.
+            level_number: Only include sessions for this level.
+            limit: Maximum number of sessions to return.
+
+        Returns:
+            Matching level results, newest first.
+        """
+        return list(
+            self._query_sessions(
+                player_name, level_number, newest_first=True, limit=limit
+            )
+        )
+
+    def _query_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        newest_first: bool = False,
+        limit: int | None = None,
+    ) -> Generator[LevelResult, None, None]:
+        """Stream sessions joined with their problem results."""
+        clauses = []
+        params: list[object] = []
+        if player is not None:
+            clauses.append("p.name = ?")
+            params.append(player)
+        if level is not None:
+            clauses.append("s.level_number = ?")
+            params.append(level)
+        if since is not None:
+            clauses.append("s.timestamp >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            clauses.append("s.timestamp < ?")
+            params.append(until.isoformat())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "DESC" if newest_first else "ASC"
+        limit_sql = ""
+        if limit is not None:
+            limit_sql = "LIMIT ?"
+            params.append(limit)
+
+        # WAL lets this reader run alongside the main connection's writes
+        conn = sqlite3.connect(self._db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT s.*, pr.position, pr.problem, pr.correct_answer,
+                       pr.given_answer, pr.is_correct,
+                       pr.time_seconds AS problem_seconds, pr.points
+                FROM (
+                    SELECT s.*, COALESCE(p.name, '') AS player
+                    FROM sessions s LEFT JOIN players p ON p.id = s.player_id
+                    {where}
+                    ORDER BY s.timestamp {order}, s.id {order}
+                    {limit_sql}
+                ) s
+                LEFT JOIN problem_results pr ON pr.session_id = s.id
+                ORDER BY s.timestamp {order}, s.id {order}, pr.position
+                """,
+                params,
+            )
+            current: LevelResult | None = None
+            current_id = None
+            for row in rows:
+                if row["id"] != current_id:
+                    if current is not None:
+                        yield current
+                    current_id = row["id"]
+                    current = LevelResult(
+                        level_number=row["level_number"],
+                        level_name=row["level_name"],
+                        total_score=row["score"],
+                        correct_count=row["correct"],
+                        total_problems=row["total"],
+                        best_streak=row["best_streak"],
+                        total_time_seconds=row["time_seconds"],
+                        problems=[],
+                        player_name=row["player"],
+                        timestamp=datetime.fromisoformat(row["timestamp"]),
+                    )
+                if current is not None and row["position"] is not None:
+                    current.problems.append(
+                        ProblemResult(
+                            problem=row["problem"],
+                            correct_answer=row["correct_answer"],
+                            given_answer=row["given_answer"],
+                            is_correct=bool(row["is_correct"]),
+                            time_seconds=row["problem_seconds"],
+                            points=row["points"],
+                        )
+                    )
+            if current is not None:
+                yield current
+        finally:
+            conn.close()
+
+    def log_speech_recognition(
+        self,
+        raw_transcript: str,
+        parsed_number: int | None,
+        expected: int | None,
+        matched: bool,
+        partial: bool = False,
+    ) -> None:
+        """Log a speech recognition result for debugging."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO speech_log
+                    (timestamp, transcript, parsed, expected, matched, partial)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    datetime.now().isoformat(),
+                    raw_transcript,
+                    parsed_number,
+                    expected,
+                    matched,
+                    partial,
+                ),
+            )
+
+    def list_players(self) -> list[str]:
+        """List all player names."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name FROM players ORDER BY name"
+            ).fetchall()
+        return [name for (name,) in rows]
+
+    def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT p.name,
+                       COALESCE(SUM(lp.stars), 0) AS total_stars,
+                       COALESCE(MAX(CASE WHEN lp.stars >= 2
+                                    THEN lp.level_number END), 0) + 1
+                           AS highest_unlocked,
+                       COALESCE(SUM(lp.best_score), 0) AS total_best_score
+                FROM players p LEFT JOIN level_progress lp ON lp.player_id = p.id
+                GROUP BY p.id
+                ORDER BY p.name
+                """
+            ).fetchall()
+        return [PlayerSummary(**dict(row)) for row in rows]
+
+    def player_exists(self, player_name: str) -> bool:
+        """Check if a player profile exists."""
+        with self._lock:
+            return self._player_id(player_name) is not None
@@ -0,0 +1,234 @@
+"""Merge progress and session history from several Flashy installs.
+
+Each machine exports its storage to a bundle file (gzip-compressed JSON
+lines: a header, one line per player's progress, then every session in
+chronological order). Bundles, or other storages directly, are merged
+into a target storage:
+
+- Progress is combined per level, keeping the most stars and the best
+  score seen anywhere.
+- Sessions from all sources are k-way merged by timestamp and streamed
+  into the target. A session is skipped when one with the same content
+  hash is already in the target or was merged earlier. Copies of a
+  session share its timestamp, so only one month of hashes is held at a
+  time and memory stays bounded however long the history is.
+
+Compacted history (daily aggregates) is not synced.
+"""
+
+import gzip
+import hashlib
+import heapq
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Protocol
+
+from flashy.core.models import LevelResult, PlayerProgress
+from flashy.storage.protocol import StorageBackend
+
+BUNDLE_VERSION = 1
+
+
+class SyncSource(Protocol):
+    """The read side of StorageBackend that syncing needs."""
+
+    def list_players(self) -> list[str]: ...
+
+    def load_progress(self, player_name: str) -> PlayerProgress: ...
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]: ...
+
+
+@dataclass
+class SyncReport:
+    """What a sync changed in the target."""
+
+    players: int = 0
+    sessions_added: int = 0
+    duplicates_skipped: int = 0
+
+
+def session_hash(result: LevelResult) -> bytes:
+    """Hash a session's content, so copies from other machines match."""
+    data = json.dumps(result.to_log_entry(), sort_keys=True).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def merge_progress(progresses: Iterable[PlayerProgress]) -> PlayerProgress:
+    """Combine progress, keeping the most stars and best score per level."""
+    merged = PlayerProgress()
+    for progress in progresses:
+        for level, stars in progress.stars.items():
+            merged.set_stars(level, stars)
+        for level, score in progress.best_scores.items():
+            merged.set_best_score(level, score)
+    return merged
+
+
+def sync_storage(sources: Sequence[SyncSource], target: StorageBackend) -> SyncReport:
+    """Merge the progress and history of several sources into a target.
+
+    Args:
+        sources: Storages or bundles to read from.
+        target: Storage to merge into. Its own sessions are never
+            duplicated.
+
+    Returns:
+        Counts of what was merged.
+    """
+    report = SyncReport()
+
+    players = sorted({name for source in sources for name in source.list_players()})
+    for name in players:
+        progress = merge_progress(
+            [target.load_progress(name)]
+            + [source.load_progress(name) for source in sources]
+        )
+        target.save_progress(name, progress)
+    report.players = len(players)
+
+    month_end: datetime | None = None
+    known: set[bytes] = set()
+    merged = heapq.merge(
+        *(source.iter_sessions() for source in sources), key=_session_time
+    )
+    for result in merged:
+        timestamp = _session_time(result)
+        if month_end is None or timestamp >= month_end:
+            # Entering a new month: load the target's hashes for it. The
+            # sessions logged so far are all earlier, so reading the target
+            # here never races with our own writes.
+            month_start = timestamp.replace(
+                day=1, hour=0, minute=0, second=0, microsecond=0
+            )
+            month_end = _next_month(month_start)
+            known = {
+                session_hash(existing)
+                for existing in target.iter_sessions(since=month_start, until=month_end)
+            }
+
+        digest = session_hash(result)
+        if digest in known:
+            report.duplicates_skipped += 1
+            continue
+        known.add(digest)
+        target.log_session(result)
+        report.sessions_added += 1
+    return report
+
+
+def export_bundle(source: SyncSource, path: Path) -> int:
+    """Write a storage's progress and history to a bundle file.
+
+    Args:
+        source: Storage to export.
+        path: Bundle file to write.
+
+    Returns:
+        The number of sessions exported.
+    """
+    count = 0
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "header", "version": BUNDLE_VERSION}) + "\n")
+        for name in sorted(source.list_players()):
+            progress = source.load_progress(name)
+            record = {
+                "type": "progress",
+                "player": name,
+                "stars": dict(progress.stars),
+                "best_scores": dict(progress.best_scores),
+            }
+            f.write(json.dumps(record) + "\n")
+        for result in source.iter_sessions():
+            f.write(json.dumps({"type": "session", **result.to_log_entry()}) + "\n")
+            count += 1
+    return count
+
+
+class BundleSource:
+    """A bundle file read as a sync source.
+
+    Progress is loaded up front (it is small); sessions are streamed from
+    the file on each iter_sessions() call.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open a bundle and read its progress records.
+
+        Args:
+            path: Bundle file written by export_bundle().
+
+        Raises:
+            ValueError: If the file is not a bundle this version can read.
+        """
+        self._path = path
+        self._progress: dict[str, PlayerProgress] = {}
+        for record in self._records():
+            if record.get("type") == "session":
+                break
+            if record.get("type") == "progress":
+                self._progress[record["player"]] = PlayerProgress(
+                    stars={int(k): v for k, v in record["stars"].items()},
+                    best_scores={int(k): v for k, v in record["best_scores"].items()},
+                )
+
+    def _records(self) -> Iterator[dict]:
+        """Yield the bundle's records after checking its header."""
+        with gzip.open(self._path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header != {"type": "header", "version": BUNDLE_VERSION}:
+                raise ValueError(f"{self._path} is not a Flashy sync bundle")
+            for line in f:
+                yield json.loads(line)
+
+    def list_players(self) -> list[str]:
+        """List the players in the bundle."""
+        return sorted(self._progress)
+
+    def load_progress(self, player_name: str) -> PlayerProgress:
+        """Get a player's progress (empty if not in the bundle)."""
+        progress = self._progress.get(player_name)
+        return progress.copy() if progress is not None else PlayerProgress()
+
+    def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[LevelResult]:
+        """Stream the bundle's sessions in chronological order."""
+        for record in self._records():
+            if record.get("type") != "session":
+                continue
+            result = LevelResult.from_log_entry(record)
+            if player is not None and result.player_name != player:
+                continue
+            if level is not None and result.level_number != level:
+                continue
+            if since is not None and _session_time(result) < since:
+                continue
+            if until is not None and _session_time(result) >= until:
+                continue
+            yield result
+
+
+def _session_time(result: LevelResult) -> datetime:
+    """Get a session's timestamp, treating a missing one as earliest."""
+    return result.timestamp or datetime.min
+
+
+def _next_month(month_start: datetime) -> datetime:
+    """Get the start of the month after month_start."""
+    if month_start.month == 12:
+        return month_start.replace(year=month_start.year + 1, month=1)
+    return month_start.replace(month=month_start.month + 1)
@@ -0,0 +1,137 @@
+"""Thread-pool adapter exposing a StorageBackend as an AsyncStorageBackend.
+
+Each call runs the wrapped backend's method on a worker thread and is
+awaited, so the event loop keeps handling input and rendering while the
+disk is slow.
+"""
+
+import asyncio
+import functools
+import itertools
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import TypeVar
+
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
+from flashy.storage.protocol import StorageBackend
+
+T = TypeVar("T")
+
+
+class ThreadedAsyncStorage:
+    """AsyncStorageBackend that runs a StorageBackend on a worker thread.
+
+    Calls run one at a time, in the order they were made, so a save is
+    always visible to a load started after it. Use ``backend`` for the
+    occasional call that has to stay synchronous.
+    """
+
+    def __init__(self, backend: StorageBackend, session_batch_size: int = 64) -> None:
+        """Initialize the adapter.
+
+        Args:
+            backend: The synchronous storage backend to wrap.
+            session_batch_size: Sessions fetched per worker call when
+                streaming iter_sessions().
+        """
+        self._backend = backend
+        self._session_batch_size = session_batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="flashy-storage"
+        )
+
+    @property
+    def backend(self) -> StorageBackend:
+        """The wrapped synchronous backend."""
+        return self._backend
+
+    def submit(self, fn: Callable[..., T], *args, **kwargs) -> Future[T]:
+        """Queue fn on the worker thread without waiting for it.
+
+        It runs in order with the storage calls made before and after.
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    async def _run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run fn on the worker thread and wait for the result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def load_progress(self, player_name: str) -> PlayerProgress:
+        """Load player progress."""
+        return await self._run(self._backend.load_progress, player_name)
+
+    async def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
+        """Save player progress."""
+        await self._run(self._backend.save_progress, player_name, progress)
+
+    async def log_session(self, result: LevelResult) -> None:
+        """Log a completed level session."""
+        await self._run(self._backend.log_session, result)
+
+    async def iter_sessions(
+        self,
+        player: str | None = None,
+        level: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncGenerator[LevelResult, None]:
+        """Stream logged sessions, reading them in batches on the worker.
+
+        If the consumer stops early, the backend's iterator is closed on
+        the worker, releasing whatever it holds open (such as a SQLite
+        cursor).
+        """
+        sessions = await self._run(
+            self._backend.iter_sessions, player, level, since, until
+        )
+        try:
+            while True:
+                batch = await self._run(
+                    list, itertools.islice(sessions, self._session_batch_size)
+                )
+                if not batch:
+                    return
+                for result in batch:
+                    yield result
+        finally:
+            close = getattr(sessions, "close", None)
+            if close is not None:
+                await self._run(close)
+
+    async def log_speech_recognition(
+        self,
+        raw_transcript: str,
+        parsed_number: int | None,
+        expected: int | None,
+        matched: bool,
+        partial: bool = False,
+    ) -> None:
+        """Log a speech recognition result for debugging."""
+        await self._run(
+            self._backend.log_speech_recognition,
+            raw_transcript,
+            parsed_number,
+            expected,
+            matched,
+            partial=partial,
+        )
+
+    async def list_players(self) -> list[str]:
+        """List all player names."""
+        return await self._run(self._backend.list_players)
+
+    async def list_player_summaries(self) -> list[PlayerSummary]:
+        """List every player with their progress totals."""
+        return await self._run(self._backend.list_player_summaries)
+
+    async def player_exists(self, player_name: str) -> bool:
+        """Check if a player profile exists."""
+        return await self._run(self._backend.player_exists, player_name)
+
+    def close(self) -> None:
+        """Finish queued calls and stop the worker thread."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,290 @@
+"""Write-behind appender for log files.
+
+Appends are queued and written by a background thread, so callers on the
+UI thread never wait for the disk. Records may be queued as plain dicts,
+in which case the JSON encoding also happens on the background thread.
+Queued lines are grouped per file and written in batches; files are
+fsynced every ``fsync_interval`` seconds or when a caller asks for a
+durable flush.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class _Append:
+    path: Path
+    record: str | dict
+    on_written: Callable[[Path], None] | None = None
+
+
+@dataclass
+class _Flush:
+    done: threading.Event
+    durable: bool
+
+
+@dataclass
+class _Call:
+    fn: Callable[[], None]
+    done: threading.Event
+    error: BaseException | None = None
+
+
+class WriteBehindLog:
+    """Background appender for newline-delimited log files.
+
+    Lines for the same file are written in the order they were appended.
+    Pending lines are flushed when the interpreter exits, including after
+    an unhandled exception.
+    """
+
+    def __init__(
+        self,
+        fsync_interval: float | None = 5.0,
+        max_batch: int = 512,
+        max_pending: int = 0,
+    ) -> None:
+        """Initialize the appender.
+
+        Args:
+            fsync_interval: Seconds between fsyncs of written files. None
+                disables periodic fsync; data is then only fsynced on a
+                durable flush.
+            max_batch: Maximum queued lines written per batch.
+            max_pending: Maximum queued lines before append() drops new
+                lines instead of queueing them. 0 means unbounded.
+        """
+        self._fsync_interval = fsync_interval
+        self._max_batch = max_batch
+        self._queue: queue.Queue[_Append | _Flush | _Call | None] = queue.Queue(
+            max_pending
+        )
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self._error: Exception | None = None
+        self._dirty: set[Path] = set()
+        self._last_fsync = time.monotonic()
+        self.dropped = 0
+
+    def append(
+        self,
+        path: Path,
+        record: str | dict,
+        on_written: Callable[[Path], None] | None = None,
+    ) -> bool:
+        """Queue a line to be appended to a file.
+
+        Args:
+            path: The file to append to.
+            record: The line to write, without a trailing newline, or a
+                dict to be written as one line of JSON.
+            on_written: Called with the path on the writer thread once the
+                batch containing this line has been written. Callbacks
+                shared by several lines of a batch run once.
+
+        Returns:
+            True if the line was queued, False if it was dropped because
+            the queue is full or the appender is closed.
+        """
+        if self._closed:
+            self.dropped += 1
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(_Append(path, record, on_written))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def flush(self, durable: bool = True) -> None:
+        """Block until every queued line has been written.
+
+        Args:
+            durable: Also fsync the written files before returning.
+
+        Raises:
+            OSError: If a background write failed since the last flush.
+            Exception: Whatever an on_written callback raised since the
+                last flush.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(_Flush(done, durable))
+            done.wait()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def call(self, fn: Callable[[], None]) -> None:
+        """Run fn on the writer thread once everything queued is written.
+
+        Blocks until fn has run. Use this for maintenance (such as
+        rotating files) that must not race with queued appends.
+
+        Raises:
+            RuntimeError: If the appender is closed.
+            Exception: Whatever fn raised.
+        """
+        if self._closed:
+            raise RuntimeError("WriteBehindLog is closed")
+        self._ensure_started()
+        item = _Call(fn, threading.Event())
+        self._queue.put(item)
+        item.done.wait()
+        if item.error is not None:
+            raise item.error
+
+    def close(self) -> None:
+        """Write and fsync everything still queued, then stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._release_waiters()
+        atexit.unregister(self.close)
+
+    def _release_waiters(self) -> None:
+        """Wake callers whose flush or call was queued after the stop."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, _Call):
+                item.error = RuntimeError("WriteBehindLog is closed")
+            if isinstance(item, (_Call, _Flush)):
+                item.done.set()
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread on first use."""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="flashy-write-behind", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        while True:
+            try:
+                item = self._queue.get(timeout=self._time_to_fsync())
+            except queue.Empty:
+                # Idle with unsynced data: the periodic fsync is due
+                self._fsync()
+                continue
+            batch = [item]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Handle items in queue order, writing runs of appends together
+            appends: list[_Append] = []
+            stopping = False
+            for entry in batch:
+                if isinstance(entry, _Append):
+                    appends.append(entry)
+                    continue
+                self._write(appends)
+                appends = []
+                if entry is None:
+                    stopping = True
+                elif isinstance(entry, _Flush):
+                    if entry.durable:
+                        self._fsync()
+                    entry.done.set()
+                else:
+                    try:
+                        entry.fn()
+                    except BaseException as e:
+                        entry.error = e
+                    entry.done.set()
+            self._write(appends)
+
+            if stopping:
+                self._fsync()
+                return
+            if self._fsync_due():
+                self._fsync()
+
+    def _time_to_fsync(self) -> float | None:
+        """Seconds until the next periodic fsync, or None to wait forever."""
+        if self._fsync_interval is None or not self._dirty:
+            return None
+        elapsed = time.monotonic() - self._last_fsync
+        return max(0.0, self._fsync_interval - elapsed)
+
+    def _fsync_due(self) -> bool:
+        """Check whether the periodic fsync interval has passed."""
+        if self._fsync_interval is None:
+            return False
+        return time.monotonic() - self._last_fsync >= self._fsync_interval
+
+    def _write(self, appends: list[_Append]) -> None:
+        """Append a batch of lines, opening each file once."""
+        by_path: dict[Path, list[str]] = {}
+        callbacks: dict[tuple[Path, Callable[[Path], None]], None] = {}
+        for entry in appends:
+            record = entry.record
+            try:
+                line = record if isinstance(record, str) else json.dumps(record)
+            except (TypeError, ValueError) as e:
+                self._error = e
+                continue
+            by_path.setdefault(entry.path, []).append(line + "\n")
+            if entry.on_written is not None:
+                callbacks[(entry.path, entry.on_written)] = None
+
+        for path, lines in by_path.items():
+            try:
+                with open(path, "a") as f:
+                    f.write("".join(lines))
+                self._dirty.add(path)
+            except OSError as e:
+                self._error = e
+
+        for path, callback in callbacks:
+            # A failing callback must not stop the writer thread, or every
+            # later flush() would wait forever
+            try:
+                callback(path)
+            except Exception as e:
+                self._error = e
+
+    def _fsync(self) -> None:
+        """Fsync every file written since the last fsync."""
+        for path in self._dirty:
+            try:
+                # No O_CREAT: the file may have been rotated away since
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                self._error = e
+                continue
+            try:
+                os.fsync(fd)
+            except OSError as e:
+                self._error = e
+            finally:
+                os.close(fd)
+        self._dirty.clear()
+        self._last_fsync = time.monotonic()
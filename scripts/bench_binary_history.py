@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Compare the binary history format with the JSONL history.
+
+Writes the same synthetic sessions (see bench_storage.py) as JSONL and as
+a binary history, then reports file sizes and the time of:
+
+- score_scan: sum every session's score (binary: headers only)
+- full_read: decode every session with its problems
+
+Results are written as JSON. The results checked in as
+benchmarks/binary_history.json came from:
+
+    poetry run python scripts/bench_binary_history.py \\
+        -o benchmarks/binary_history.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from bench_storage import iter_population_sessions, parse_population
+
+from flashy.core.models import LevelResult
+from flashy.storage.binary_history import BinaryHistoryReader, write_binary_history
+
+
+def median_seconds(fn: Callable[[], Any], reps: int) -> float:
+    """Time fn and return the median of reps calls."""
+    times = []
+    for _ in range(reps):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def bench(players: int, sessions: int, reps: int, seed: int) -> dict[str, Any]:
+    """Write both formats for one population and time reading them."""
+    rng = random.Random(seed)
+    results = list(
+        iter_population_sessions(rng, players, sessions, datetime(2026, 1, 1))
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl = Path(tmp) / "history.jsonl"
+        with open(jsonl, "w") as f:
+            for result in results:
+                f.write(json.dumps(result.to_log_entry()) + "\n")
+        directory = Path(tmp) / "binary"
+        write_binary_history(directory, results)
+        binary_bytes = sum(p.stat().st_size for p in directory.iterdir())
+        jsonl_bytes = jsonl.stat().st_size
+
+        def jsonl_scores() -> int:
+            with open(jsonl) as f:
+                return sum(json.loads(line)["score"] for line in f)
+
+        def jsonl_full() -> list[LevelResult]:
+            with open(jsonl) as f:
+                return [LevelResult.from_log_entry(json.loads(line)) for line in f]
+
+        with BinaryHistoryReader(directory) as reader:
+            timings = {
+                "score_scan": (
+                    median_seconds(jsonl_scores, reps),
+                    median_seconds(
+                        lambda: sum(s.total_score for s in reader.sessions()), reps
+                    ),
+                ),
+                "full_read": (
+                    median_seconds(jsonl_full, reps),
+                    median_seconds(lambda: list(reader.iter_sessions()), reps),
+                ),
+            }
+
+    report: dict[str, Any] = {
+        "players": players,
+        "sessions": sessions,
+        "problems": sum(len(r.problems) for r in results),
+        "jsonl_bytes": jsonl_bytes,
+        "binary_bytes": binary_bytes,
+        "size_ratio": round(jsonl_bytes / binary_bytes, 2),
+    }
+    for name, (jsonl_time, binary_time) in timings.items():
+        report[name] = {
+            "jsonl_ms": round(jsonl_time * 1000, 3),
+            "binary_ms": round(binary_time * 1000, 3),
+            "speedup": round(jsonl_time / binary_time, 2),
+        }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare binary and JSONL history files"
+    )
+    parser.add_argument(
+        "--population",
+        type=parse_population,
+        default="100x200",
+        help="<players>x<sessions> to write (default: 100x200)",
+    )
+    parser.add_argument("--reps", type=int, default=5, help="Timed calls per read")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "-o", "--output", type=Path, help="Write results JSON here (default: stdout)"
+    )
+    args = parser.parse_args()
+
+    players, sessions = args.population
+    print(f"Benchmarking {players}x{sessions}...", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "reps": args.reps,
+            "seed": args.seed,
+        },
+        "results": [bench(players, sessions, args.reps, args.seed)],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
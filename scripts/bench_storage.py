@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Benchmark storage backends against synthetic player populations.
+
+Each population is "<players>x<sessions>": that many players with that
+many logged sessions each. For every backend and population a fresh store
+is seeded, then load_progress, save_progress, log_session, list_players,
+list_player_summaries and history reads are timed.
+
+Results are written as JSON. Pass --compare with an earlier results file
+to fail (exit 1) when an operation got slower than --max-ratio allows,
+so the script can be used as a regression gate.
+
+Usage:
+    poetry run python scripts/bench_storage.py
+    poetry run python scripts/bench_storage.py --populations 1x100000,10000x10
+    poetry run python scripts/bench_storage.py --backends file,web -o bench.json
+    poetry run python scripts/bench_storage.py --compare baseline.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from flashy.core.levels import get_level
+from flashy.core.models import LevelResult, PlayerProgress, ProblemResult
+from flashy.platforms.web.storage import WebStorage
+from flashy.storage import CachedStorage, FileStorage, SqliteStorage
+
+DEFAULT_POPULATIONS = "1x10,1x1000,100x100"
+TOTAL_LEVELS = 40
+
+
+class MemoryLocalStorage:
+    """In-memory stand-in for the browser's localStorage."""
+
+    def __init__(self) -> None:
+        self._items: dict[str, str] = {}
+
+    def getItem(self, key: str) -> str | None:  # noqa: N802 - browser API
+        return self._items.get(key)
+
+    def setItem(self, key: str, value: str) -> None:  # noqa: N802 - browser API
+        self._items[key] = value
+
+    def removeItem(self, key: str) -> None:  # noqa: N802 - browser API
+        self._items.pop(key, None)
+
+
+# Backend name -> factory taking a scratch directory
+BACKENDS: dict[str, Callable[[Path], Any]] = {
+    "file": lambda path: FileStorage(base_dir=path),
+    "cached-file": lambda path: CachedStorage(FileStorage(base_dir=path)),
+    "sqlite": lambda path: SqliteStorage(db_path=path / "flashy.db"),
+    "web": lambda path: WebStorage(MemoryLocalStorage()),
+}
+
+
+def parse_population(spec: str) -> tuple[int, int]:
+    """Parse a "<players>x<sessions>" population spec."""
+    players, _, sessions = spec.partition("x")
+    try:
+        return int(players), int(sessions)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Bad population {spec!r}, expected <players>x<sessions>"
+        ) from None
+
+
+def player_name(index: int) -> str:
+    """Get the synthetic name of a player."""
+    return f"player{index:05d}"
+
+
+def make_progress(rng: random.Random) -> PlayerProgress:
+    """Make progress with a random number of completed levels."""
+    completed = rng.randint(1, TOTAL_LEVELS)
+    return PlayerProgress(
+        stars={level: rng.randint(1, 3) for level in range(1, completed + 1)},
+        best_scores={
+            level: rng.randint(100, 5000) for level in range(1, completed + 1)
+        },
+    )
+
+
+def make_session(
+    rng: random.Random, player: str, timestamp: datetime
+) -> LevelResult:
+    """Make a plausible session result for one level attempt."""
+    level_number = rng.randint(1, TOTAL_LEVELS)
+    level = get_level(level_number)
+    assert level is not None
+    problems = []
+    for problem in level.problems:
+        is_correct = rng.random() < 0.8
+        problems.append(
+            ProblemResult(
+                problem=problem.display(),
+                correct_answer=problem.answer,
+                given_answer=problem.answer if is_correct else problem.answer + 1,
+                is_correct=is_correct,
+                time_seconds=round(rng.uniform(0.5, 8.0), 2),
+                points=100 if is_correct else 0,
+            )
+        )
+    correct = sum(p.is_correct for p in problems)
+    return LevelResult(
+        level_number=level_number,
+        level_name=level.name,
+        total_score=sum(p.points for p in problems),
+        correct_count=correct,
+        total_problems=len(problems),
+        best_streak=correct,
+        total_time_seconds=sum(p.time_seconds for p in problems),
+        problems=problems,
+        player_name=player,
+        timestamp=timestamp,
+    )
+
+
+def iter_population_sessions(
+    rng: random.Random, players: int, sessions: int, now: datetime
+) -> Iterator[LevelResult]:
+    """Yield every player's sessions over the past year, oldest first."""
+    times = sorted(
+        (now - timedelta(seconds=rng.randint(0, 365 * 86400)), index)
+        for index in range(players)
+        for _ in range(sessions)
+    )
+    for timestamp, index in times:
+        yield make_session(rng, player_name(index), timestamp)
+
+
+def seed(storage: Any, rng: random.Random, players: int, sessions: int) -> None:
+    """Fill a store with a synthetic population."""
+    now = datetime.now()
+    for index in range(players):
+        storage.save_progress(player_name(index), make_progress(rng))
+    for result in iter_population_sessions(rng, players, sessions, now):
+        storage.log_session(result)
+    flush = getattr(storage, "flush", None)
+    if flush is not None:
+        flush()
+
+
+def time_calls(fn: Callable[[], Any], reps: int) -> dict[str, float]:
+    """Call fn reps times and summarize the timings in microseconds."""
+    samples = []
+    for _ in range(reps):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    samples.sort()
+    return {
+        "reps": reps,
+        "mean_us": statistics.fmean(samples),
+        "median_us": statistics.median(samples),
+        "p95_us": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        "min_us": samples[0],
+    }
+
+
+def bench_backend(
+    name: str, players: int, sessions: int, reps: int, seed_value: int
+) -> list[dict[str, Any]]:
+    """Seed one backend with a population and time each operation."""
+    rng = random.Random(seed_value)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="flashy-bench-") as tmp:
+        storage = BACKENDS[name](Path(tmp))
+        try:
+            start = time.perf_counter()
+            seed(storage, rng, players, sessions)
+            seed_seconds = time.perf_counter() - start
+
+            def pick() -> str:
+                return player_name(rng.randrange(players))
+
+            history_reps = max(1, reps // 10)
+            now = datetime.now()
+            operations: list[tuple[str, Callable[[], Any], int]] = [
+                ("load_progress", lambda: storage.load_progress(pick()), reps),
+                (
+                    "save_progress",
+                    lambda: storage.save_progress(pick(), make_progress(rng)),
+                    reps,
+                ),
+                (
+                    "log_session",
+                    lambda: storage.log_session(make_session(rng, pick(), now)),
+                    reps,
+                ),
+                ("list_players", storage.list_players, history_reps),
+                ("list_player_summaries", storage.list_player_summaries, history_reps),
+                (
+                    "iter_sessions_player",
+                    lambda: list(storage.iter_sessions(player=pick())),
+                    history_reps,
+                ),
+                (
+                    "iter_sessions_last_week",
+                    lambda: list(
+                        storage.iter_sessions(since=now - timedelta(days=7))
+                    ),
+                    history_reps,
+                ),
+            ]
+            for op, fn, op_reps in operations:
+                results.append({"op": op, **time_calls(fn, op_reps)})
+        finally:
+            close = getattr(storage, "close", None)
+            if close is not None:
+                close()
+
+    for result in results:
+        result.update(backend=name, players=players, sessions=sessions)
+    results.append(
+        {
+            "op": "seed",
+            "backend": name,
+            "players": players,
+            "sessions": sessions,
+            "seconds": seed_seconds,
+        }
+    )
+    return results
+
+
+def result_key(result: dict[str, Any]) -> tuple[str, int, int, str]:
+    """Identify a result across runs."""
+    return (result["backend"], result["players"], result["sessions"], result["op"])
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], max_ratio: float
+) -> list[str]:
+    """List the operations whose median slowed by more than max_ratio."""
+    before = {result_key(r): r for r in baseline if "median_us" in r}
+    regressions = []
+    for result in results:
+        old = before.get(result_key(result))
+        if old is None or "median_us" not in result or old["median_us"] <= 0:
+            continue
+        ratio = result["median_us"] / old["median_us"]
+        if ratio > max_ratio:
+            backend, players, sessions, op = result_key(result)
+            regressions.append(
+                f"{backend} {players}x{sessions} {op}: "
+                f"{old['median_us']:.1f}us -> {result['median_us']:.1f}us "
+                f"({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark storage backends")
+    parser.add_argument(
+        "--backends",
+        default=",".join(BACKENDS),
+        help=f"Comma-separated backends (default: {','.join(BACKENDS)})",
+    )
+    parser.add_argument(
+        "--populations",
+        default=DEFAULT_POPULATIONS,
+        help=f"Comma-separated <players>x<sessions> (default: {DEFAULT_POPULATIONS})",
+    )
+    parser.add_argument(
+        "--reps", type=int, default=50, help="Timed calls per operation"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "-o", "--output", type=Path, help="Write results JSON here (default: stdout)"
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="Earlier results JSON to check against"
+    )
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=1.5,
+        help="Slowdown of a median that counts as a regression (default: 1.5)",
+    )
+    args = parser.parse_args()
+
+    backends = args.backends.split(",")
+    unknown = [name for name in backends if name not in BACKENDS]
+    if unknown:
+        parser.error(f"Unknown backends: {', '.join(unknown)}")
+    populations = [parse_population(spec) for spec in args.populations.split(",")]
+
+    results = []
+    for players, sessions in populations:
+        for name in backends:
+            print(f"Benchmarking {name} with {players}x{sessions}...", file=sys.stderr)
+            results += bench_backend(name, players, sessions, args.reps, args.seed)
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "reps": args.reps,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.max_ratio)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Fold old session history into daily per-level aggregates.
+
+Sessions older than the retention horizon are replaced by one aggregate
+per player, level and day (attempts, scores, accuracy and an answer time
+histogram). Recent sessions stay raw.
+
+Usage:
+    poetry run python scripts/compact_history.py
+    poetry run python scripts/compact_history.py --days 180
+    poetry run python scripts/compact_history.py --base-dir /path/to/.flashy
+"""
+
+import argparse
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+from flashy.storage import FileStorage
+from flashy.storage.compaction import DEFAULT_RETENTION
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compact old session history")
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=DEFAULT_RETENTION.days,
+        help=f"Keep sessions newer than this raw (default: {DEFAULT_RETENTION.days})",
+    )
+    parser.add_argument(
+        "--base-dir",
+        type=Path,
+        default=Path.home() / ".flashy",
+        help="Flashy data directory (default: ~/.flashy)",
+    )
+    args = parser.parse_args()
+
+    if not args.base_dir.is_dir():
+        print(f"No Flashy data found at {args.base_dir}")
+        return 1
+
+    storage = FileStorage(base_dir=args.base_dir)
+    try:
+        folded = storage.compact_history(timedelta(days=args.days))
+    finally:
+        storage.close()
+    print(f"Folded {folded} sessions into daily aggregates")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
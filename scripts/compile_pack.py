@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Compile a level pack for the web version.
+
+The web game loads a compiled pack given in its URL, e.g.
+``index.html?pack=packs/times-tables.flpk``. Put the compiled file next
+to the site; it is fetched at startup and never added to the bundle.
+
+Usage:
+    poetry run python scripts/compile_pack.py times-tables.toml
+    poetry run python scripts/compile_pack.py times-tables.toml out.flpk
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from flashy.core.packs import CompiledPack
+from flashy.packs import compile_pack_file
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compile a Flashy level pack")
+    parser.add_argument("pack", type=Path, help="Pack file (.json or .toml)")
+    parser.add_argument(
+        "output",
+        type=Path,
+        nargs="?",
+        help="Compiled file to write (default: the pack's name with .flpk)",
+    )
+    args = parser.parse_args()
+
+    try:
+        compiled = compile_pack_file(args.pack)
+    except (OSError, ValueError) as e:
+        print(f"Cannot compile {args.pack}: {e}")
+        return 1
+    output = args.output or args.pack.with_suffix(".flpk")
+    output.write_bytes(compiled)
+    pack = CompiledPack(compiled)
+    print(f"Wrote {output}: {pack.name}, {len(pack)} levels, {len(compiled)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Split shared session history into per-player history shards.
+
+Moves entries from ~/.flashy/history.log and ~/.flashy/history/ into
+~/.flashy/players/<name>/history/. The old files are kept with a
+".migrated-<time>" suffix; delete them once the migration looks right.
+
+Usage:
+    poetry run python scripts/migrate_history.py
+    poetry run python scripts/migrate_history.py --base-dir /path/to/.flashy
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from flashy.storage import FileStorage
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Shard history per player")
+    parser.add_argument(
+        "--base-dir",
+        type=Path,
+        default=Path.home() / ".flashy",
+        help="Flashy data directory (default: ~/.flashy)",
+    )
+    args = parser.parse_args()
+
+    if not args.base_dir.is_dir():
+        print(f"No Flashy data found at {args.base_dir}")
+        return 1
+
+    storage = FileStorage(base_dir=args.base_dir)
+    try:
+        moved = storage.migrate_history()
+    finally:
+        storage.close()
+    print(f"Moved {moved} sessions into per-player history shards")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
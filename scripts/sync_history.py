@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Sync progress and session history between Flashy installs.
+
+Export each machine's data to a bundle, then import the bundles (or other
+Flashy data directories) on one machine. Progress keeps the most stars and
+best score per level; sessions are merged by time and never duplicated.
+Export the merged result again to hand it back to the other machines.
+
+Usage:
+    poetry run python scripts/sync_history.py export room1.flashy.gz
+    poetry run python scripts/sync_history.py import room1.flashy.gz room2.flashy.gz
+    poetry run python scripts/sync_history.py import /mnt/laptop/.flashy
+    poetry run python scripts/sync_history.py --base-dir /path/to/.flashy export out.gz
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from flashy.storage import FileStorage
+from flashy.storage.sync import BundleSource, export_bundle, sync_storage
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Sync Flashy history")
+    parser.add_argument(
+        "--base-dir",
+        type=Path,
+        default=Path.home() / ".flashy",
+        help="Flashy data directory to export from or import into "
+        "(default: ~/.flashy)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="Write a bundle")
+    export_parser.add_argument("bundle", type=Path, help="Bundle file to write")
+    import_parser = commands.add_parser("import", help="Merge bundles or data dirs")
+    import_parser.add_argument(
+        "sources", type=Path, nargs="+", help="Bundle files or Flashy data directories"
+    )
+    args = parser.parse_args()
+
+    if args.command == "export":
+        if not args.base_dir.is_dir():
+            print(f"No Flashy data found at {args.base_dir}")
+            return 1
+        storage = FileStorage(base_dir=args.base_dir)
+        try:
+            count = export_bundle(storage, args.bundle)
+        finally:
+            storage.close()
+        print(f"Exported {count} sessions to {args.bundle}")
+        return 0
+
+    sources: list[FileStorage | BundleSource] = []
+    for path in args.sources:
+        try:
+            if path.is_dir():
+                sources.append(FileStorage(base_dir=path))
+            else:
+                sources.append(BundleSource(path))
+        except (OSError, ValueError) as e:
+            print(f"Cannot read {path}: {e}")
+            _close_sources(sources)
+            return 1
+
+    target = FileStorage(base_dir=args.base_dir)
+    try:
+        report = sync_storage(sources, target)
+    finally:
+        target.close()
+        _close_sources(sources)
+    print(
+        f"Merged {report.players} players: {report.sessions_added} sessions added, "
+        f"{report.duplicates_skipped} duplicates skipped"
+    )
+    return 0
+
+
+def _close_sources(sources: list[FileStorage | BundleSource]) -> None:
+    """Close the sources that hold open storage."""
+    for source in sources:
+        if isinstance(source, FileStorage):
+            source.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
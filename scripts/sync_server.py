@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Serve a Flashy data directory to lab machines over HTTP.
+
+Clients connect with HttpStorage("http://<host>:<port>"). Progress and
+session history are kept in a FileStorage on this machine.
+
+Usage:
+    poetry run python scripts/sync_server.py
+    poetry run python scripts/sync_server.py --host 0.0.0.0 --port 8765
+    poetry run python scripts/sync_server.py --base-dir /srv/flashy
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from flashy.storage import FileStorage
+from flashy.storage.http_server import SyncServer
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve Flashy data over HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument(
+        "--base-dir",
+        type=Path,
+        default=Path.home() / ".flashy",
+        help="Flashy data directory to serve (default: ~/.flashy)",
+    )
+    args = parser.parse_args()
+
+    args.base_dir.mkdir(parents=True, exist_ok=True)
+    storage = FileStorage(base_dir=args.base_dir)
+    server = SyncServer(storage, (args.host, args.port))
+    print(f"Serving {args.base_dir} at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        storage.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
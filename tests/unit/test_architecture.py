@@ -30,8 +30,12 @@ CORE_MODULES = [
     "flashy.core.levels",
     "flashy.core.models",
     "flashy.core.number_parser",
+    "flashy.core.packs",
     "flashy.core.problems",
+    "flashy.core.review",
+    "flashy.core.sampling",
     "flashy.core.scoring",
+    "flashy.core.streams",
     "flashy.core.worlds",
 ]
 
@@ -0,0 +1,138 @@
+"""Tests for the binary history format."""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from flashy.core.models import LevelResult, ProblemResult
+from flashy.storage.binary_history import (
+    PROBLEMS_NAME,
+    SESSIONS_NAME,
+    BinaryHistoryReader,
+    BinaryHistoryWriter,
+    write_binary_history,
+)
+
+
+def _result(
+    level: int = 1, minutes: int = 0, player: str = "alice", problems: int = 2
+) -> LevelResult:
+    return LevelResult(
+        level_number=level,
+        level_name=f"Level {level}",
+        total_score=1200,
+        correct_count=1,
+        total_problems=problems,
+        best_streak=1,
+        total_time_seconds=4.5,
+        problems=[
+            ProblemResult(f"{748 + i} + 129", 877 + i, 877 + i, True, 2.25, 1200)
+            for i in range(problems)
+        ],
+        player_name=player,
+        timestamp=datetime(2026, 10, 1, 9, 30) + timedelta(minutes=minutes),
+    )
+
+
+class TestBinaryHistory:
+    """Tests for writing and reading binary history."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        result = _result()
+        result.problems += [
+            ProblemResult("-1 - (-8)", 7, None, False, 5.0, 0),
+            ProblemResult("56 ÷ 7", 8, 9, False, 1.5, 0),
+            ProblemResult("what is six?", 6, 6, True, 0.75, 100),
+            # Parses, but is not how Problem.display() writes it
+            ProblemResult("3 x 4", 12, 12, True, 1.0, 100),
+        ]
+        write_binary_history(tmp_path, [result])
+
+        with BinaryHistoryReader(tmp_path) as reader:
+            assert list(reader.iter_sessions()) == [result]
+
+    def test_header_scan_filters(self, tmp_path: Path) -> None:
+        write_binary_history(
+            tmp_path,
+            [
+                _result(1, minutes=0),
+                _result(2, minutes=1, player="bob"),
+                _result(1, minutes=2),
+                _result(3, minutes=3),
+            ],
+        )
+
+        with BinaryHistoryReader(tmp_path) as reader:
+            assert len(reader) == 4
+            alice = [s.level_number for s in reader.sessions(player="alice")]
+            assert alice == [1, 1, 3]
+            assert [s.index for s in reader.sessions(level=1)] == [0, 2]
+            since = datetime(2026, 10, 1, 9, 31)
+            until = datetime(2026, 10, 1, 9, 33)
+            assert [s.index for s in reader.sessions(since=since, until=until)] == [
+                1,
+                2,
+            ]
+            assert list(reader.sessions(player="nobody")) == []
+
+    def test_random_access_decodes_one_session(self, tmp_path: Path) -> None:
+        write_binary_history(tmp_path, [_result(i, minutes=i) for i in range(1, 6)])
+
+        with BinaryHistoryReader(tmp_path) as reader:
+            session = reader.session(3)
+            assert session.level_number == 4
+            assert [p.problem for p in reader.problems(session)] == [
+                "748 + 129",
+                "749 + 129",
+            ]
+            with pytest.raises(IndexError):
+                reader.session(5)
+
+    def test_much_smaller_than_json(self, tmp_path: Path) -> None:
+        results = [_result(minutes=i, problems=10) for i in range(100)]
+        write_binary_history(tmp_path, results)
+
+        json_size = sum(len(json.dumps(r.to_log_entry())) + 1 for r in results)
+        binary_size = sum(f.stat().st_size for f in tmp_path.iterdir())
+        assert binary_size * 5 < json_size
+
+    def test_reopen_appends_and_refresh(self, tmp_path: Path) -> None:
+        write_binary_history(tmp_path, [_result(1)])
+        with BinaryHistoryReader(tmp_path) as reader:
+            write_binary_history(tmp_path, [_result(2, player="bob")])
+            assert len(reader) == 1
+            reader.refresh()
+            assert [r.player_name for r in reader.iter_sessions()] == [
+                "alice",
+                "bob",
+            ]
+            assert [len(r.problems) for r in reader.iter_sessions()] == [2, 2]
+
+    def test_partial_records_are_ignored_and_repaired(self, tmp_path: Path) -> None:
+        write_binary_history(tmp_path, [_result(1)])
+        with open(tmp_path / SESSIONS_NAME, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        with open(tmp_path / PROBLEMS_NAME, "ab") as f:
+            f.write(b"\x01")
+
+        with BinaryHistoryReader(tmp_path) as reader:
+            assert len(reader) == 1
+
+        write_binary_history(tmp_path, [_result(2)])
+        with BinaryHistoryReader(tmp_path) as reader:
+            assert [r.level_number for r in reader.iter_sessions()] == [1, 2]
+            assert list(reader.iter_sessions())[1] == _result(2)
+
+    def test_unknown_format_is_rejected(self, tmp_path: Path) -> None:
+        (tmp_path / SESSIONS_NAME).write_bytes(b"NOPE\x01\x00\x24\x00")
+        with pytest.raises(ValueError):
+            BinaryHistoryReader(tmp_path)
+        with pytest.raises(ValueError):
+            BinaryHistoryWriter(tmp_path)
+
+    def test_empty_directory(self, tmp_path: Path) -> None:
+        with BinaryHistoryReader(tmp_path / "missing") as reader:
+            assert len(reader) == 0
+            assert list(reader.iter_sessions()) == []
@@ -0,0 +1,144 @@
+"""Tests for the in-memory progress cache."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from flashy.core.models import PlayerProgress
+from flashy.storage import CachedStorage, FileStorage, SqliteStorage
+
+
+@pytest.fixture
+def file_storage(tmp_path: Path):
+    storage = FileStorage(base_dir=tmp_path)
+    yield storage
+    storage.close()
+
+
+class RacingBackend:
+    """Backend whose first save pauses after writing, for a second save."""
+
+    def __init__(self) -> None:
+        self.progress = PlayerProgress()
+        self.version = 0
+        self.paused = threading.Event()
+        self.second_saved = threading.Event()
+
+    def progress_version(self, player_name: str) -> int:
+        return self.version
+
+    def load_progress(self, player_name: str) -> PlayerProgress:
+        return self.progress.copy()
+
+    def save_progress(self, player_name: str, progress: PlayerProgress) -> None:
+        self.progress = progress.copy()
+        self.version += 1
+        if self.version == 1:
+            self.paused.set()
+            self.second_saved.wait(timeout=0.2)
+        else:
+            self.second_saved.set()
+
+
+class TestCachedStorage:
+    """Tests for CachedStorage over the file backend."""
+
+    def test_repeat_loads_hit_the_cache(self, file_storage: FileStorage) -> None:
+        file_storage.save_progress("alice", PlayerProgress(stars={1: 3}))
+        cache = CachedStorage(file_storage)
+
+        for _ in range(4):
+            assert cache.load_progress("alice").stars == {1: 3}
+
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_save_writes_through(self, file_storage: FileStorage) -> None:
+        cache = CachedStorage(file_storage)
+        cache.save_progress("alice", PlayerProgress(stars={2: 1}))
+
+        assert file_storage.load_progress("alice").stars == {2: 1}
+        assert cache.load_progress("alice").stars == {2: 1}
+        assert cache.misses == 0
+
+    def test_returned_progress_is_a_copy(self, file_storage: FileStorage) -> None:
+        cache = CachedStorage(file_storage)
+        cache.save_progress("alice", PlayerProgress(stars={1: 1}))
+
+        cache.load_progress("alice").stars[1] = 3
+
+        assert cache.load_progress("alice").stars == {1: 1}
+
+    def test_external_write_invalidates(
+        self, file_storage: FileStorage, tmp_path: Path
+    ) -> None:
+        """A save by another storage instance is seen on the next load."""
+        cache = CachedStorage(file_storage)
+        cache.save_progress("alice", PlayerProgress(stars={1: 1}))
+
+        other = FileStorage(base_dir=tmp_path)
+        other.save_progress("alice", PlayerProgress(stars={1: 1, 2: 3}))
+        other.close()
+
+        assert cache.load_progress("alice").stars == {1: 1, 2: 3}
+        assert cache.misses == 1
+
+    def test_concurrent_saves_cache_their_own_version(self) -> None:
+        backend = RacingBackend()
+        cache = CachedStorage(backend)  # type: ignore[arg-type]
+        first = threading.Thread(
+            target=cache.save_progress, args=("alice", PlayerProgress(stars={1: 1}))
+        )
+        first.start()
+        backend.paused.wait()
+        cache.save_progress("alice", PlayerProgress(stars={1: 3}))
+        first.join()
+
+        assert backend.progress.stars == {1: 3}
+        assert cache.load_progress("alice").stars == {1: 3}
+
+    def test_lru_eviction(self, file_storage: FileStorage) -> None:
+        cache = CachedStorage(file_storage, max_entries=2)
+        for name in ("a", "b"):
+            cache.save_progress(name, PlayerProgress())
+        cache.load_progress("a")  # b is now least recently used
+        cache.save_progress("c", PlayerProgress())
+
+        cache.load_progress("a")
+        cache.load_progress("b")
+
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_invalidate(self, file_storage: FileStorage) -> None:
+        cache = CachedStorage(file_storage)
+        cache.save_progress("alice", PlayerProgress())
+        cache.invalidate("alice")
+        cache.load_progress("alice")
+        assert cache.misses == 1
+
+    def test_passes_other_methods_through(self, file_storage: FileStorage) -> None:
+        cache = CachedStorage(file_storage)
+        cache.save_progress("alice", PlayerProgress(stars={1: 2}))
+
+        assert cache.list_players() == ["alice"]
+        assert cache.player_exists("alice")
+        cache.flush()  # FileStorage-specific, reached via passthrough
+
+
+class TestCachedSqliteStorage:
+    """Tests for CachedStorage over the SQLite backend."""
+
+    def test_other_connection_write_invalidates(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "flashy.db"
+        backend = SqliteStorage(db_path)
+        cache = CachedStorage(backend)
+        cache.save_progress("alice", PlayerProgress(stars={1: 1}))
+        assert cache.load_progress("alice").stars == {1: 1}
+
+        other = SqliteStorage(db_path)
+        other.save_progress("alice", PlayerProgress(stars={1: 3}))
+        other.close()
+
+        assert cache.load_progress("alice").stars == {1: 3}
+        assert (cache.hits, cache.misses) == (1, 1)
+        backend.close()
@@ -0,0 +1,126 @@
+"""Tests for the per-answer checkpoint journal and resuming attempts."""
+
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from flashy.game import GameController
+from flashy.storage import FileStorage
+from flashy.storage.checkpoint import CheckpointJournal
+
+
+def _play(controller: GameController, count: int) -> None:
+    """Answer count problems: right, then wrong, alternately."""
+    for i in range(count):
+        problem = controller.current_problem
+        assert problem is not None
+        answer = problem.answer if i % 2 == 0 else None
+        controller.submit_answer(answer, time_taken=1.25 + i)
+
+
+class TestCheckpointJournal:
+    """Tests for CheckpointJournal."""
+
+    def test_records_are_fixed_size(self, tmp_path: Path) -> None:
+        journal = CheckpointJournal(tmp_path / "checkpoint.bin")
+        journal.start(3)
+        journal.append(0, 12, 1.5)
+        journal.append(1, None, 2.0)
+        journal.close()
+
+        assert journal.path.stat().st_size == 16 + 2 * 16
+        checkpoint = journal.load()
+        assert checkpoint is not None
+        assert checkpoint.level_number == 3
+        answers = [
+            (a.problem_index, a.answer, a.time_taken) for a in checkpoint.answers
+        ]
+        assert answers == [(0, 12, 1.5), (1, None, 2.0)]
+
+    def test_torn_record_is_dropped_on_resume(self, tmp_path: Path) -> None:
+        journal = CheckpointJournal(tmp_path / "checkpoint.bin")
+        journal.start(1)
+        journal.append(0, 5, 1.0)
+        journal.close()
+        with open(journal.path, "ab") as f:
+            f.write(b"\x01\x00\x00")  # Crash mid-write
+
+        checkpoint = journal.resume()
+        assert checkpoint is not None and len(checkpoint.answers) == 1
+        journal.append(1, 6, 1.0)
+        journal.close()
+
+        reloaded = journal.load()
+        assert reloaded is not None
+        assert [a.answer for a in reloaded.answers] == [5, 6]
+
+    def test_missing_or_foreign_file(self, tmp_path: Path) -> None:
+        journal = CheckpointJournal(tmp_path / "checkpoint.bin")
+        assert journal.load() is None
+        assert journal.resume() is None
+
+        journal.path.write_bytes(b"not a checkpoint journal")
+        assert journal.load() is None
+
+    def test_append_is_cheap(self, tmp_path: Path) -> None:
+        journal = CheckpointJournal(tmp_path / "checkpoint.bin")
+        journal.start(1)
+        start = time.perf_counter()
+        for i in range(1000):
+            journal.append(i % 10, i, 1.0)
+        per_append = (time.perf_counter() - start) / 1000
+        journal.close()
+
+        # Generous bound; a single os.write is a few microseconds
+        assert per_append < 0.001
+
+
+class TestResume:
+    """Tests for resuming a GameController attempt from its journal."""
+
+    def test_resumed_attempt_matches_the_original(self, tmp_path: Path) -> None:
+        path = tmp_path / "checkpoint.bin"
+        journal = CheckpointJournal(path)
+        journal.start(1)
+        original = GameController("amy", 1, storage=MagicMock(), journal=journal)
+        _play(original, 5)
+        journal.close()  # The terminal was closed
+
+        journal = CheckpointJournal(path)
+        checkpoint = journal.resume()
+        assert checkpoint is not None
+        resumed = GameController("amy", 1, storage=MagicMock(), journal=journal)
+        resumed.replay(checkpoint.answers)
+
+        assert resumed.problem_index == original.problem_index == 5
+        assert resumed.total_score == original.total_score
+        assert resumed.streak == original.streak
+        assert resumed.results == original.results
+        # Replaying does not journal the answers twice
+        assert path.stat().st_size == 16 + 5 * 16
+
+    def test_finish_discards_the_journal(self, tmp_path: Path) -> None:
+        storage = MagicMock()
+        storage.load_progress.return_value = MagicMock(
+            get_stars=MagicMock(return_value=0)
+        )
+        journal = CheckpointJournal(tmp_path / "checkpoint.bin")
+        journal.start(1)
+        controller = GameController("amy", 1, storage=storage, journal=journal)
+        controller.cheat_pass_all()
+
+        controller.finish()
+
+        assert not journal.path.exists()
+
+    def test_file_storage_journal_location(self, tmp_path: Path) -> None:
+        storage = FileStorage(base_dir=tmp_path)
+        try:
+            journal = storage.checkpoint_journal("amy")
+            journal.start(2)
+            journal.close()
+        finally:
+            storage.close()
+
+        assert journal.path == tmp_path / "players" / "amy" / "checkpoint.bin"
+        assert storage.list_players() == []
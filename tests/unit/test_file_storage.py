@@ -0,0 +1,287 @@
+"""Tests for the file storage backend."""
+
+import json
+import multiprocessing
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from flashy.core.models import LevelResult, PlayerProgress, PlayerSummary
+from flashy.storage import FileStorage
+
+
+def _save_levels(base_dir: Path, levels: range) -> None:
+    """Save one level at a time from a separate process."""
+    storage = FileStorage(base_dir=base_dir)
+    for level in levels:
+        storage.save_progress(
+            "alice", PlayerProgress(stars={level: 3}, best_scores={level: level})
+        )
+    storage.close()
+
+
+@pytest.fixture
+def storage(tmp_path: Path):
+    storage = FileStorage(base_dir=tmp_path)
+    yield storage
+    storage.close()
+
+
+class TestFileStorageProgress:
+    """Tests for player progress persistence."""
+
+    def test_save_and_load_roundtrip(self, storage: FileStorage) -> None:
+        progress = PlayerProgress(stars={1: 3, 2: 2}, best_scores={1: 2700})
+        storage.save_progress("alice", progress)
+        assert storage.load_progress("alice") == progress
+
+    def test_save_leaves_no_temp_files(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        storage.save_progress("alice", PlayerProgress(stars={1: 3}))
+        leftovers = [p.name for p in tmp_path.rglob(".*") if p.is_file()]
+        assert leftovers == []
+
+    def test_save_merges_with_disk(self, storage: FileStorage) -> None:
+        """A stale save keeps the best stars and scores already on disk."""
+        storage.save_progress(
+            "alice", PlayerProgress(stars={1: 3, 2: 1}, best_scores={1: 900})
+        )
+        stale = PlayerProgress(stars={1: 2, 3: 2}, best_scores={1: 500, 3: 400})
+        storage.save_progress("alice", stale)
+
+        expected = PlayerProgress(
+            stars={1: 3, 2: 1, 3: 2}, best_scores={1: 900, 3: 400}
+        )
+        assert storage.load_progress("alice") == expected
+        assert stale == expected
+
+    def test_concurrent_writers_lose_nothing(self, tmp_path: Path) -> None:
+        """Saves from several processes are all kept."""
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=_save_levels, args=(tmp_path, range(i, 41, 4)))
+            for i in range(1, 5)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert all(worker.exitcode == 0 for worker in workers)
+
+        storage = FileStorage(base_dir=tmp_path)
+        progress = storage.load_progress("alice")
+        assert progress.stars == dict.fromkeys(range(1, 41), 3)
+        assert storage.list_player_summaries()[0].total_stars == 120
+        storage.close()
+
+    def test_load_unreadable_file_is_empty(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        storage.save_progress("alice", PlayerProgress(stars={1: 3}))
+        (tmp_path / "players" / "alice.json").write_text("{trunc")
+        assert storage.load_progress("alice") == PlayerProgress()
+
+
+class TestRosterIndex:
+    """Tests for the roster summary index."""
+
+    def test_empty_roster(self, storage: FileStorage) -> None:
+        assert storage.list_player_summaries() == []
+
+    def test_save_updates_roster(self, storage: FileStorage) -> None:
+        storage.save_progress(
+            "bob", PlayerProgress(stars={1: 3, 2: 2}, best_scores={1: 500, 2: 300})
+        )
+        storage.save_progress("alice", PlayerProgress())
+
+        assert storage.list_player_summaries() == [
+            PlayerSummary("alice", total_stars=0, highest_unlocked=1),
+            PlayerSummary(
+                "bob", total_stars=5, highest_unlocked=3, total_best_score=800
+            ),
+        ]
+
+    def test_summaries_do_not_read_progress_files(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        storage.save_progress("alice", PlayerProgress(stars={1: 3}))
+        # Corrupt the progress file; the roster alone answers the query
+        (tmp_path / "players" / "alice.json").write_text("not json")
+        assert storage.list_player_summaries()[0].total_stars == 3
+
+    def test_missing_roster_is_rebuilt(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        players_dir = tmp_path / "players"
+        players_dir.mkdir(exist_ok=True)
+        (players_dir / "carol.json").write_text(json.dumps({"stars": {"1": 2}}))
+
+        summaries = storage.list_player_summaries()
+
+        assert summaries == [PlayerSummary("carol", 2, 2, 0)]
+        assert (tmp_path / "roster.json").exists()
+
+    def test_rebuild_holds_the_roster_lock(
+        self,
+        storage: FileStorage,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        fcntl = pytest.importorskip("fcntl")
+        storage.save_progress("alice", PlayerProgress(stars={1: 3}))
+        (tmp_path / "roster.json").write_text("{trunc")
+        rebuild = storage._rebuild_roster
+        held = []
+
+        def checked_rebuild():
+            # A save from another process would have to wait for the rebuild
+            with open(tmp_path / "locks" / "roster.lock") as f:
+                try:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    held.append(True)
+                else:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return rebuild()
+
+        monkeypatch.setattr(storage, "_rebuild_roster", checked_rebuild)
+
+        assert storage.list_player_summaries()[0].total_stars == 3
+        assert held == [True]
+
+
+class TestFileStorageHistory:
+    """Tests for session history logging."""
+
+    def test_log_session_is_written_after_flush(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        storage.log_session(
+            LevelResult(1, "Trailhead", 100, 1, 1, 1, 1.0, [], player_name="amy")
+        )
+        storage.flush()
+
+        [segment] = (tmp_path / "players" / "amy" / "history").glob("*.jsonl")
+        lines = segment.read_text().splitlines()
+        assert json.loads(lines[0])["player"] == "amy"
+
+    def test_unnamed_sessions_use_shared_history(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        storage.log_session(LevelResult(1, "Trailhead", 100, 1, 1, 1, 1.0, []))
+        storage.flush()
+
+        assert len(list((tmp_path / "history").glob("*.jsonl"))) == 1
+        assert [s.player_name for s in storage.iter_sessions(player="")] == [""]
+
+    def test_iter_sessions_filters_and_orders(self, storage: FileStorage) -> None:
+        for day, player, level in ((2, "amy", 1), (1, "amy", 2), (3, "ben", 1)):
+            storage.log_session(
+                LevelResult(
+                    level_number=level,
+                    level_name=f"Level {level}",
+                    total_score=day,
+                    correct_count=1,
+                    total_problems=1,
+                    best_streak=1,
+                    total_time_seconds=1.0,
+                    problems=[],
+                    player_name=player,
+                    timestamp=datetime(2026, 10, day),
+                )
+            )
+
+        assert [s.total_score for s in storage.iter_sessions()] == [1, 2, 3]
+        assert [s.total_score for s in storage.iter_sessions(player="amy")] == [1, 2]
+        assert [s.total_score for s in storage.iter_sessions(level=1)] == [2, 3]
+        recent = storage.iter_sessions(since=datetime(2026, 10, 2))
+        assert [s.player_name for s in recent] == ["amy", "ben"]
+
+    def test_iter_sessions_reads_legacy_log(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        legacy = LevelResult(1, "Trailhead", 50, 1, 1, 1, 1.0, [])
+        legacy.timestamp = datetime(2025, 1, 1)
+        (tmp_path / "history.log").write_text(json.dumps(legacy.to_log_entry()) + "\n")
+
+        assert list(storage.iter_sessions()) == [legacy]
+
+
+class TestHistoryMigration:
+    """Tests for splitting shared history into player shards."""
+
+    def _result(self, player: str, day: int) -> LevelResult:
+        return LevelResult(
+            1, "Trailhead", day, 1, 1, 1, 1.0, [], player, datetime(2025, 1, day)
+        )
+
+    def test_migrate_splits_legacy_and_shared_history(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        legacy = [self._result("amy", 1), self._result("ben", 2)]
+        (tmp_path / "history.log").write_text(
+            "".join(json.dumps(r.to_log_entry()) + "\n" for r in legacy)
+        )
+        shared = tmp_path / "history"
+        shared.mkdir()
+        (shared / "2025-01.jsonl").write_text(
+            json.dumps(self._result("amy", 3).to_log_entry())
+            + "\n"
+            + json.dumps(self._result("", 4).to_log_entry())
+            + "\n"
+        )
+
+        assert storage.migrate_history() == 3
+
+        assert not (tmp_path / "history.log").exists()
+        assert len(list(tmp_path.glob("history.log.migrated-*"))) == 1
+        amy = [s.total_score for s in storage.iter_sessions(player="amy")]
+        assert amy == [1, 3]
+        assert [s.total_score for s in storage.iter_sessions()] == [1, 2, 3, 4]
+        assert (tmp_path / "players" / "ben" / "history").is_dir()
+
+        # A second run has nothing left to move
+        assert storage.migrate_history() == 0
+        assert [s.total_score for s in storage.iter_sessions()] == [1, 2, 3, 4]
+
+    def test_player_query_skips_other_shards(
+        self, storage: FileStorage, tmp_path: Path
+    ) -> None:
+        storage.log_session(self._result("amy", 1))
+        storage.log_session(self._result("ben", 2))
+        storage.flush()
+        ben_dir = tmp_path / "players" / "ben" / "history"
+        for segment in ben_dir.iterdir():
+            segment.write_text("not json\n")
+
+        assert [s.total_score for s in storage.iter_sessions(player="amy")] == [1]
+
+
+class TestHistoryCompaction:
+    """Tests for compacting old history across player shards."""
+
+    def test_compact_history(self, storage: FileStorage) -> None:
+        old = datetime.now() - timedelta(days=400)
+        for player, level in (("amy", 1), ("amy", 1), ("ben", 2)):
+            storage.log_session(
+                LevelResult(level, "L", 100, 1, 1, 1, 1.0, [], player, old)
+            )
+        storage.log_session(
+            LevelResult(1, "L", 100, 1, 1, 1, 1.0, [], "amy", datetime.now())
+        )
+        storage.flush()
+
+        assert storage.compact_history() == 3
+
+        assert [s.player_name for s in storage.iter_sessions()] == ["amy"]
+        aggregates = list(storage.iter_aggregates())
+        assert [(a.player_name, a.attempts) for a in aggregates] == [
+            ("amy", 2),
+            ("ben", 1),
+        ]
+        assert [a.player_name for a in storage.iter_aggregates(player="ben")] == [
+            "ben"
+        ]
+        assert list(storage.iter_aggregates(level=3)) == []
@@ -1,10 +1,12 @@
 """Tests for GameController."""
 
+import asyncio
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
+from flashy.core.models import PlayerProgress
 from flashy.game import AnswerFeedback, GameController
 
 
@@ -230,6 +232,33 @@ class TestGameController:
         stars, _ = controller.finish()
         assert stars == 3  # Perfect and fast
 
+    def test_finish_async_saves_through_async_storage(self) -> None:
+        saved: dict[str, Any] = {}
+
+        class FakeAsyncStorage:
+            async def load_progress(self, player_name: str) -> PlayerProgress:
+                return PlayerProgress(stars={1: 1})
+
+            async def save_progress(
+                self, player_name: str, progress: PlayerProgress
+            ) -> None:
+                saved["progress"] = progress
+
+            async def log_session(self, result: Any) -> None:
+                saved["result"] = result
+
+        controller = GameController("test_player", 1)
+        controller.cheat_pass_all()
+
+        stars, is_new_best = asyncio.run(
+            controller.finish_async(FakeAsyncStorage())  # type: ignore[arg-type]
+        )
+
+        assert stars == 3
+        assert is_new_best is True
+        assert saved["progress"].get_stars(1) == 3
+        assert saved["result"].total_score == controller.total_score
+
     def test_results_recorded(self) -> None:
         controller = GameController("test_player", 1)
 
@@ -0,0 +1,208 @@
+"""Tests for rotating, compressed history segments."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from flashy.storage.history_segments import SegmentedHistory
+from flashy.storage.write_behind import WriteBehindLog
+
+
+def entry(timestamp: str, player: str = "alice", score: int = 100) -> dict:
+    return {"timestamp": timestamp, "player": player, "score": score}
+
+
+@pytest.fixture
+def writer():
+    writer = WriteBehindLog(fsync_interval=None)
+    yield writer
+    writer.close()
+
+
+class TestRotation:
+    """Tests for sealing segments."""
+
+    def test_new_month_seals_previous_segment(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        history.append(entry("2026-09-30T23:59:00"))
+        writer.flush()
+        history.append(entry("2026-10-01T00:01:00"))
+        writer.flush()
+
+        [segment] = history.segments()
+        assert segment.file == "2026-09.000.jsonl.gz"
+        assert segment.record_count == 1
+        assert history.active_segments() == [tmp_path / "2026-10.jsonl"]
+
+    def test_size_limit_seals_segment(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer, max_segment_bytes=200)
+        for minute in range(10):
+            history.append(entry(f"2026-10-01T10:{minute:02d}:00"))
+            writer.flush()
+
+        segments = history.segments()
+        assert len(segments) >= 2
+        assert [s.file for s in segments][:2] == [
+            "2026-10.000.jsonl.gz",
+            "2026-10.001.jsonl.gz",
+        ]
+        total = sum(s.record_count for s in segments)
+        total += sum(len(p.read_text().splitlines()) for p in history.active_segments())
+        assert total == 10
+
+    def test_sealed_segment_is_gzip_with_manifest(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        history.append(entry("2026-10-02T09:00:00", player="bob"))
+        history.append(entry("2026-10-01T09:00:00", player="alice"))
+        history.seal_all()
+
+        [segment] = history.segments()
+        assert segment.players == ("alice", "bob")
+        assert segment.first_timestamp == "2026-10-01T09:00:00"
+        assert segment.last_timestamp == "2026-10-02T09:00:00"
+        with gzip.open(tmp_path / segment.file, "rt") as f:
+            assert [json.loads(line)["player"] for line in f] == ["bob", "alice"]
+        assert history.active_segments() == []
+
+
+class TestReading:
+    """Tests for querying segmented history."""
+
+    def test_iter_entries_is_chronological(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        for timestamp in ("2026-08-01T00:00:00", "2026-09-01T00:00:00"):
+            history.append(entry(timestamp))
+        history.seal_all()
+        history.append(entry("2026-10-01T00:00:00"))
+        writer.flush()
+
+        timestamps = [e["timestamp"][:7] for e in history.iter_entries()]
+        assert timestamps == ["2026-08", "2026-09", "2026-10"]
+
+    def test_size_rotated_segments_are_merged(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer, max_segment_bytes=1)
+        for day in (20, 5, 12):
+            history.append(entry(f"2026-03-{day:02d}T00:00:00"))
+            writer.flush()
+
+        assert len(history.segments()) == 3
+        days = [int(e["timestamp"][8:10]) for e in history.iter_entries()]
+        assert days == [5, 12, 20]
+
+    def test_filters_by_player_and_time(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        history.append(entry("2026-09-01T00:00:00", player="alice"))
+        history.append(entry("2026-09-02T00:00:00", player="bob"))
+        history.append(entry("2026-09-03T00:00:00", player="alice"))
+        writer.flush()
+
+        found = history.iter_entries(player="alice", since="2026-09-02")
+        assert [e["timestamp"] for e in found] == ["2026-09-03T00:00:00"]
+
+    def test_segments_that_cannot_match_are_not_opened(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        history.append(entry("2026-08-01T00:00:00", player="bob"))
+        history.seal_all()
+        history.append(entry("2026-09-01T00:00:00", player="alice"))
+        history.seal_all()
+
+        # Corrupt bob's segment: a query for alice must not open it
+        (tmp_path / "2026-08.000.jsonl.gz").write_bytes(b"not gzip")
+        found = list(history.iter_entries(player="alice"))
+        assert [e["player"] for e in found] == ["alice"]
+
+
+class TestCompaction:
+    """Tests for folding old segments into daily aggregates."""
+
+    def _session(self, timestamp: str, level: int, score: int) -> dict:
+        return {
+            **entry(timestamp, score=score),
+            "level_number": level,
+            "correct": 1,
+            "total": 2,
+            "time_seconds": 4.0,
+            "problems": [{"time_seconds": 0.5}, {"time_seconds": 20.0}],
+        }
+
+    def test_old_segments_become_aggregates(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        history.append(self._session("2025-03-01T09:00:00", 1, 100))
+        history.append(self._session("2025-03-01T18:00:00", 1, 300))
+        history.append(self._session("2025-03-02T09:00:00", 2, 50))
+        writer.flush()
+        history.append(self._session("2026-10-01T09:00:00", 1, 700))
+        writer.flush()
+
+        assert history.compact("2026-01-01") == 3
+
+        assert history.segments() == []
+        assert not (tmp_path / "2025-03.000.jsonl.gz").exists()
+        [day1, day2] = history.aggregates()
+        assert (day1.level_number, day1.attempts) == (1, 2)
+        assert (day1.best_score, day1.total_score) == (300, 400)
+        assert (day1.correct_count, day1.total_problems) == (2, 4)
+        assert day1.time_histogram == [2, 0, 0, 0, 0, 0, 2]
+        assert day2.day.isoformat() == "2025-03-02"
+        # Recent sessions stay raw
+        assert [e["score"] for e in history.iter_entries()] == [700]
+
+    def test_recent_segments_are_kept(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        history.append(self._session("2026-01-02T09:00:00", 1, 100))
+        history.append(self._session("2026-01-20T09:00:00", 1, 200))
+        history.seal_all()
+        history.append(self._session("2026-01-21T09:00:00", 1, 300))
+        writer.flush()
+
+        # The sealed segment straddles the horizon and the active segment
+        # is the horizon's month, so both stay raw
+        assert history.compact("2026-01-10") == 0
+        assert len(history.segments()) == 1
+        assert len(list(history.iter_entries())) == 3
+
+    def test_old_active_segment_is_sealed_and_compacted(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        history.append(self._session("2025-03-01T09:00:00", 1, 100))
+        writer.flush()
+
+        assert history.compact("2026-01-01") == 1
+        assert history.active_segments() == []
+
+    def test_compaction_accumulates_and_is_not_repeated(
+        self, tmp_path: Path, writer: WriteBehindLog
+    ) -> None:
+        history = SegmentedHistory(tmp_path, writer)
+        history.append(self._session("2025-03-01T09:00:00", 1, 100))
+        history.seal_all()
+        assert history.compact("2026-01-01") == 1
+        assert history.compact("2026-01-01") == 0
+
+        history.append(self._session("2025-03-01T10:00:00", 1, 200))
+        history.seal_all()
+        assert history.compact("2026-01-01") == 1
+
+        [aggregate] = history.aggregates()
+        assert (aggregate.attempts, aggregate.best_score) == (2, 200)
@@ -0,0 +1,234 @@
+"""Tests for the HTTP storage backend against the stand-in sync server."""
+
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from flashy.core.models import LevelResult, PlayerProgress
+from flashy.storage import FileStorage, HttpStorage
+from flashy.storage.http_server import SyncServer
+
+
+def _result(player: str, day: int) -> LevelResult:
+    return LevelResult(
+        1, "Trailhead", day, 1, 1, 1, 1.0, [], player, datetime(2026, 10, day)
+    )
+
+
+def _unused_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+class _MalformedHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a well-formed but wrong JSON document."""
+
+    def do_GET(self) -> None:
+        body = b'{"stars": [1, 2], "name": 3}' if "progress" in self.path else b"7"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _RefusingHandler(BaseHTTPRequestHandler):
+    """Refuses every POST as a bad request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(400)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextmanager
+def _serve(handler: type[BaseHTTPRequestHandler]) -> Iterator[str]:
+    """Run a stand-in server with the given handler and yield its URL."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+
+
+@pytest.fixture
+def server(tmp_path: Path):
+    storage = FileStorage(base_dir=tmp_path / "server")
+    server = SyncServer(storage)
+    server.start()
+    yield server
+    server.stop()
+    storage.close()
+
+
+@pytest.fixture
+def make_client(tmp_path: Path):
+    clients: list[HttpStorage] = []
+
+    def make(url: str, name: str = "client", **kwargs) -> HttpStorage:
+        kwargs.setdefault("flush_interval", 60.0)
+        client = HttpStorage(url, queue_dir=tmp_path / name, **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+class TestHttpStorage:
+    """Tests for HttpStorage and SyncServer."""
+
+    def test_progress_round_trip(self, server: SyncServer, make_client) -> None:
+        client = make_client(server.url)
+        client.save_progress("amy", PlayerProgress(stars={1: 3}, best_scores={1: 9}))
+        client.flush()
+
+        other = make_client(server.url, "other")
+        assert other.load_progress("amy").stars == {1: 3}
+        assert other.list_players() == ["amy"]
+        assert other.player_exists("amy")
+        assert [s.total_stars for s in other.list_player_summaries()] == [3]
+
+    def test_server_keeps_the_best_progress(
+        self, server: SyncServer, make_client
+    ) -> None:
+        first, second = make_client(server.url, "a"), make_client(server.url, "b")
+        first.save_progress("amy", PlayerProgress(stars={1: 3, 2: 1}))
+        second.save_progress("amy", PlayerProgress(stars={2: 2}))
+        first.flush()
+        second.flush()
+
+        assert server.storage.load_progress("amy").stars == {1: 3, 2: 2}
+
+    def test_calls_reuse_one_connection(self, server: SyncServer, make_client) -> None:
+        client = make_client(server.url)
+        for day in range(1, 4):
+            client.save_progress("amy", PlayerProgress(stars={day: 1}))
+            client.flush()
+            client.load_progress("amy")
+        list(client.iter_sessions())
+
+        assert server.connections == 1
+
+    def test_sessions_are_sent_in_batches(
+        self, server: SyncServer, make_client
+    ) -> None:
+        client = make_client(server.url, batch_size=2)
+        for day in (3, 1, 2, 5, 4):
+            client.log_session(_result("amy", day))
+        client.log_speech_recognition("fi", None, 5, False, partial=True)
+        client.log_speech_recognition("five", 5, 5, True)
+        client.flush()
+
+        assert server.batches == 3
+        assert [s.total_score for s in client.iter_sessions(player="amy")] == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+
+    def test_background_sender(self, server: SyncServer, make_client) -> None:
+        client = make_client(server.url, flush_interval=0.05)
+        client.log_session(_result("amy", 1))
+
+        deadline = time.monotonic() + 5
+        while server.batches == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert server.batches == 1
+
+    def test_offline_writes_wait_on_disk(
+        self, server: SyncServer, make_client
+    ) -> None:
+        offline = make_client(_unused_url(), "shared")
+        offline.save_progress("amy", PlayerProgress(stars={1: 2}))
+        offline.log_session(_result("amy", 1))
+
+        assert offline.load_progress("amy").stars == {1: 2}
+        assert offline.list_players() == ["amy"]
+        with pytest.raises(OSError):
+            offline.flush()
+        assert not offline.online
+        offline.close()
+
+        # A later client using the same queue directory delivers them
+        online = make_client(server.url, "shared")
+        online.flush()
+        assert server.storage.load_progress("amy").stars == {1: 2}
+        assert len(list(online.iter_sessions())) == 1
+
+    def test_resent_sessions_are_dropped(self, server: SyncServer) -> None:
+        record = {"kind": "session", **_result("amy", 1).to_log_entry()}
+        server.apply_batch([record])
+        server.apply_batch([record])
+
+        assert len(list(server.storage.iter_sessions())) == 1
+
+    def test_malformed_responses_fall_back_to_local_state(self, make_client) -> None:
+        with _serve(_MalformedHandler) as url:
+            client = make_client(url)
+            client.save_progress("amy", PlayerProgress(stars={1: 2}))
+
+            assert client.load_progress("amy").stars == {1: 2}
+            assert client.list_players() == ["amy"]
+            assert [s.name for s in client.list_player_summaries()] == ["amy"]
+
+    def test_refused_and_unreadable_records_are_set_aside(
+        self, tmp_path: Path, make_client
+    ) -> None:
+        (tmp_path / "client").mkdir()
+        (tmp_path / "client" / "sending-1.jsonl").write_bytes(b"\xff\xfe\n")
+        with _serve(_RefusingHandler) as url:
+            client = make_client(url)
+            client.log_session(_result("amy", 1))
+            client.flush()
+
+        assert sorted(p.name[:9] for p in (tmp_path / "client").iterdir()) == [
+            "rejected-",
+            "rejected-",
+        ]
+
+    def test_sender_survives_unexpected_errors(
+        self, server: SyncServer, make_client
+    ) -> None:
+        client = make_client(server.url, flush_interval=0.05)
+        send = client._send_outbox
+        calls = []
+
+        def fail_once() -> None:
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError("unexpected")
+            send()
+
+        client._send_outbox = fail_once  # type: ignore[method-assign]
+        client.log_session(_result("amy", 1))
+
+        deadline = time.monotonic() + 5
+        while server.batches == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert server.batches == 1
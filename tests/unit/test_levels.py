@@ -1,7 +1,13 @@
 """Tests for level definitions."""
 
+from dataclasses import replace
+
+import pytest
+
 from flashy.core.levels import (
     LEVELS,
+    Level,
+    LevelRegistry,
     LevelType,
     get_level,
     get_levels_for_world,
@@ -106,3 +112,64 @@ class TestGetLevelsForWorld:
     def test_nonexistent_world_returns_empty(self) -> None:
         world_99_levels = get_levels_for_world(99)
         assert world_99_levels == []
+
+
+def _level(number: int, world: int, in_world: int) -> Level:
+    return replace(
+        LEVELS[0], number=number, world_number=world, level_in_world=in_world
+    )
+
+
+class TestLevelRegistry:
+    """Tests for LevelRegistry."""
+
+    def test_lookups_match_the_level_list(self) -> None:
+        registry = LevelRegistry(reversed(LEVELS))
+
+        assert registry.levels == tuple(LEVELS)
+        assert registry.world_count == 4
+        assert registry.get(40) is LEVELS[39]
+        assert registry.get(41) is None
+        assert registry.for_world(2) == tuple(LEVELS[10:20])
+        assert registry.for_world(0) == ()
+
+    def test_type_and_operation_indexes(self) -> None:
+        registry = LevelRegistry(LEVELS)
+
+        bosses = registry.of_type(LevelType.BOSS)
+        assert [level.number for level in bosses] == [10, 20, 30, 40]
+        for operation in Operation:
+            expected = [
+                level
+                for level in LEVELS
+                if any(p.operation == operation for p in level.problems)
+            ]
+            assert list(registry.with_operation(operation)) == expected
+
+    def test_gap_in_numbering_is_rejected(self) -> None:
+        levels = [_level(1, 1, 1), _level(3, 1, 3)]
+
+        with pytest.raises(ValueError, match="without gaps"):
+            LevelRegistry(levels, levels_per_world=2)
+
+    def test_wrong_world_is_rejected(self) -> None:
+        levels = [_level(1, 1, 1), _level(2, 2, 1)]
+
+        with pytest.raises(ValueError, match="level 2 of world 1"):
+            LevelRegistry(levels, levels_per_world=2)
+
+    def test_incomplete_world_is_rejected(self) -> None:
+        levels = [_level(1, 1, 1), _level(2, 1, 2), _level(3, 2, 1)]
+
+        with pytest.raises(ValueError, match="World 2 has 1 levels"):
+            LevelRegistry(levels, levels_per_world=2)
+
+    def test_scales_to_large_packs(self) -> None:
+        levels = [
+            _level(n, (n - 1) // 10 + 1, (n - 1) % 10 + 1) for n in range(1, 5001)
+        ]
+        registry = LevelRegistry(levels)
+
+        assert registry.world_count == 500
+        assert registry.get(4321) is levels[4320]
+        assert registry.for_world(500)[-1] is levels[-1]
@@ -1,6 +1,16 @@
 """Tests for data models."""
 
-from flashy.core.models import PlayerProgress
+import json
+from datetime import datetime
+
+import pytest
+
+from flashy.core.models import (
+    LevelResult,
+    PlayerProgress,
+    PlayerSummary,
+    ProblemResult,
+)
 
 
 class TestPlayerProgressStars:
@@ -107,3 +117,120 @@ class TestPlayerProgressUnlocked:
         progress.set_stars(1, 3)
         progress.set_stars(2, 2)
         assert progress.get_highest_unlocked() == 3
+
+    def test_get_total_stars(self) -> None:
+        progress = PlayerProgress()
+        progress.set_stars(1, 3)
+        progress.set_stars(2, 2)
+        assert progress.get_total_stars() == 5
+
+
+class TestPlayerSummary:
+    """Tests for player summaries."""
+
+    def test_from_progress(self) -> None:
+        progress = PlayerProgress(stars={1: 3, 2: 1}, best_scores={1: 900})
+        summary = PlayerSummary.from_progress("alice", progress)
+        assert summary == PlayerSummary(
+            name="alice", total_stars=4, highest_unlocked=2, total_best_score=900
+        )
+
+
+class TestPackedProgress:
+    """Tests for the packed stars and best score tables."""
+
+    def test_dict_api(self) -> None:
+        progress = PlayerProgress(stars={1: 3, 12: 2}, best_scores={1: 900})
+        progress.stars[5] = 1
+
+        assert progress.stars == {1: 3, 5: 1, 12: 2}
+        assert list(progress.stars.items()) == [(1, 3), (5, 1), (12, 2)]
+        assert sum(progress.stars.values()) == 6
+        assert progress.best_scores == {1: 900}
+        assert 12 in progress.stars and 2 not in progress.stars
+        assert json.dumps(dict(progress.stars)) == '{"1": 3, "5": 1, "12": 2}'
+
+        del progress.stars[1]
+        assert progress.stars == {5: 1, 12: 2}
+        with pytest.raises(KeyError):
+            progress.stars[1]
+
+    def test_stars_out_of_range(self) -> None:
+        progress = PlayerProgress()
+        with pytest.raises(ValueError):
+            progress.stars[1] = 4
+        with pytest.raises(KeyError):
+            progress.stars[0] = 1
+
+    def test_incremental_totals(self) -> None:
+        progress = PlayerProgress(stars={1: 3, 2: 2, 11: 1})
+        assert progress.get_total_stars() == 6
+        assert progress.get_world_stars(1) == 5
+        assert progress.get_world_stars(2) == 1
+        assert progress.get_highest_unlocked() == 3
+
+        progress.stars[2] = 1  # Drops below the unlock threshold
+        assert progress.get_highest_unlocked() == 2
+        assert progress.get_total_stars() == 5
+
+        progress.set_best_score(3, 100)
+        progress.set_best_score(3, 400)
+        assert progress.get_total_best_score() == 400
+
+    def test_equality_with_plain_dicts(self) -> None:
+        assert PlayerProgress(stars={1: 3}) == PlayerProgress(stars={1: 3})
+        assert PlayerProgress(stars={1: 3}) != PlayerProgress(stars={1: 2})
+        assert PlayerProgress(stars={1: 3}).stars == {1: 3}
+
+    def test_copy_is_independent(self) -> None:
+        progress = PlayerProgress(stars={1: 2}, best_scores={1: 10})
+        copy = progress.copy()
+        copy.set_stars(1, 3)
+        copy.set_best_score(2, 50)
+        assert progress == PlayerProgress(stars={1: 2}, best_scores={1: 10})
+        assert copy.get_highest_unlocked() == 2
+
+    def test_pack_roundtrip(self) -> None:
+        progress = PlayerProgress(
+            stars={1: 3, 2: 2, 40: 1}, best_scores={1: 2700, 39: 12}
+        )
+        data = progress.pack()
+
+        # 3 byte header, 10 bytes of stars, 4 bytes of score per level
+        assert len(data) == 3 + 10 + 4 * 40
+        assert PlayerProgress.unpack(data) == progress
+        assert PlayerProgress.unpack(PlayerProgress().pack()) == PlayerProgress()
+
+    def test_unpack_rejects_bad_data(self) -> None:
+        data = PlayerProgress(stars={1: 3}).pack()
+        with pytest.raises(ValueError):
+            PlayerProgress.unpack(data[:-1])
+        with pytest.raises(ValueError):
+            PlayerProgress.unpack(b"\x09" + data[1:])
+
+
+class TestLevelResultLogEntry:
+    """Tests for converting level results to and from history entries."""
+
+    def test_roundtrip(self) -> None:
+        result = LevelResult(
+            level_number=3,
+            level_name="Snowy Path",
+            total_score=1200,
+            correct_count=1,
+            total_problems=2,
+            best_streak=1,
+            total_time_seconds=4.5,
+            problems=[
+                ProblemResult("8 + 6", 14, 14, True, 2.0, 1200),
+                ProblemResult("3 + 9", 12, None, False, 2.5, 0),
+            ],
+            player_name="alice",
+            timestamp=datetime(2026, 10, 17, 9, 30),
+        )
+        assert LevelResult.from_log_entry(result.to_log_entry()) == result
+
+    def test_untimestamped_result_gets_current_time(self) -> None:
+        result = LevelResult(1, "Trailhead", 0, 0, 0, 0, 0.0, [])
+        entry = result.to_log_entry()
+        assert datetime.fromisoformat(entry["timestamp"]) <= datetime.now()
@@ -0,0 +1,201 @@
+"""Tests for level packs and the compiled pack cache."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import flashy.packs
+from flashy.core.flow import BossVictoryDismissed, GameFlow, Screen
+from flashy.core.levels import (
+    LEVELS,
+    LevelType,
+    get_level,
+    get_total_worlds,
+    use_levels,
+)
+from flashy.core.packs import (
+    CompiledPack,
+    LevelPack,
+    compile_pack,
+    parse_pack,
+)
+from flashy.core.problems import Operation, Problem
+from flashy.core.worlds import get_world
+from flashy.packs import compile_pack_file, list_packs, load_pack
+
+
+def _pack_data(worlds: int = 2) -> dict:
+    def level(i: int) -> dict:
+        entry = {
+            "name": f"Level {i}",
+            "type": "boss" if i == 10 else "build",
+            "problems": [f"{i} + {n}" for n in range(3)],
+        }
+        if i == 10:
+            entry["time_limit"] = 60
+        return entry
+
+    return {
+        "name": "Practice",
+        "worlds": [
+            {"levels": [level(i) for i in range(1, 11)]} for _ in range(worlds)
+        ],
+    }
+
+
+class TestParsePack:
+    """Tests for parse_pack."""
+
+    def test_levels_are_numbered_by_position(self) -> None:
+        pack = parse_pack(_pack_data())
+
+        assert [level.number for level in pack.levels] == list(range(1, 21))
+        level = pack.levels[19]
+        assert (level.world_number, level.level_in_world) == (2, 10)
+        assert level.level_type == LevelType.BOSS
+        assert level.time_limit == 60
+
+    def test_errors_say_where(self) -> None:
+        data = _pack_data()
+        data["worlds"][1]["levels"][2]["problems"] = ["9 / 2"]
+
+        with pytest.raises(ValueError, match="World 2 level 3: Division"):
+            parse_pack(data)
+
+    def test_rules_are_checked(self) -> None:
+        short = _pack_data()
+        del short["worlds"][0]["levels"][-1]
+        untimed_boss = _pack_data()
+        del untimed_boss["worlds"][0]["levels"][-1]["time_limit"]
+        timed = _pack_data()
+        timed["worlds"][0]["levels"][0]["time_limit"] = 30
+        unknown_type = _pack_data()
+        unknown_type["worlds"][0]["levels"][0]["type"] = "secret"
+
+        for data in (short, untimed_boss, timed, unknown_type, {"name": "x"}):
+            with pytest.raises(ValueError):
+                parse_pack(data)
+
+
+class TestCompiledPack:
+    """Tests for compile_pack and CompiledPack."""
+
+    def test_round_trip_of_the_built_in_levels(self) -> None:
+        pack = LevelPack(name="Flashy", levels=tuple(LEVELS))
+        compiled = CompiledPack(compile_pack(pack))
+
+        assert compiled.name == "Flashy"
+        assert len(compiled) == 40
+        assert compiled.world_count == 4
+        assert [compiled.get(n) for n in range(1, 41)] == LEVELS
+        assert compiled.get(41) is None
+        assert compiled.for_world(5) == ()
+
+    def test_worlds_are_decoded_on_first_use(self) -> None:
+        compiled = CompiledPack(compile_pack(parse_pack(_pack_data(worlds=300))))
+
+        level = compiled.get(2995)
+        assert level is not None and level.world_number == 300
+        assert compiled.for_world(300)[4] is level
+        decoded = [world for world in compiled._worlds if world is not None]
+        assert len(decoded) == 1
+
+    def test_rejects_other_data(self) -> None:
+        with pytest.raises(ValueError):
+            CompiledPack(b"not a pack")
+
+
+class TestLoadPack:
+    """Tests for loading pack files through the cache."""
+
+    def test_json_and_toml(self, tmp_path: Path) -> None:
+        (tmp_path / "a.json").write_text(json.dumps(_pack_data(worlds=1)))
+        levels = "\n".join(
+            f'[[worlds.levels]]\nname = "L{i}"\ntype = "intro"\n'
+            f'problems = ["{i} × 2"]\n'
+            for i in range(1, 10)
+        )
+        (tmp_path / "b.toml").write_text(
+            'name = "Toml"\n[[worlds]]\n'
+            + levels
+            + '[[worlds.levels]]\nname = "Boss"\ntype = "boss"\n'
+            'time_limit = 90\nproblems = ["9 ÷ 3"]\n'
+        )
+        (tmp_path / "notes.txt").write_text("not a pack")
+
+        paths = list_packs(tmp_path)
+        assert [path.name for path in paths] == ["a.json", "b.toml"]
+        toml_pack = load_pack(paths[1])
+        assert toml_pack.name == "Toml"
+        level = toml_pack.get(10)
+        assert level is not None
+        assert level.problems == (Problem(9, 3, Operation.DIVIDE, 3),)
+
+    def test_second_load_uses_the_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "pack.json"
+        path.write_text(json.dumps(_pack_data()))
+        load_pack(path)
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pack was parsed again")
+
+        monkeypatch.setattr(flashy.packs, "parse_pack", fail)
+        assert load_pack(path).name == "Practice"
+
+    def test_edited_pack_is_recompiled(self, tmp_path: Path) -> None:
+        path = tmp_path / "pack.json"
+        path.write_text(json.dumps(_pack_data()))
+        load_pack(path)
+        data = _pack_data()
+        data["name"] = "Renamed"
+        path.write_text(json.dumps(data))
+
+        assert load_pack(path).name == "Renamed"
+
+    def test_invalid_file_names_the_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.json"
+        path.write_text("{")
+
+        with pytest.raises(ValueError, match="broken.json"):
+            load_pack(path)
+
+
+class TestPlayingPacks:
+    """Tests for playing a pack in place of the built-in levels."""
+
+    @pytest.fixture(autouse=True)
+    def restore_levels(self):
+        yield
+        use_levels(None)
+
+    def test_lookups_use_the_pack(self, tmp_path: Path) -> None:
+        path = tmp_path / "pack.json"
+        path.write_text(json.dumps(_pack_data(worlds=6)))
+        use_levels(CompiledPack(compile_pack_file(path)))
+
+        level = get_level(55)
+        assert level is not None and level.name == "Level 5"
+        assert get_total_worlds() == 6
+        # Worlds past the built-in four reuse their story in turn
+        world = get_world(6)
+        assert world is not None and world.number == 6
+        assert world.name == get_world(2).name  # type: ignore[union-attr]
+        assert get_world(7) is None
+
+        flow = GameFlow()
+        more = flow.handle(BossVictoryDismissed("amy", world_number=5))
+        done = flow.handle(BossVictoryDismissed("amy", world_number=6))
+        assert more.screen == Screen.WORLD_INTRO
+        assert done.screen == Screen.GAME_COMPLETE
+
+    def test_built_in_levels_come_back(self) -> None:
+        use_levels(CompiledPack(compile_pack(parse_pack(_pack_data(worlds=1)))))
+        assert get_world(2) is None
+
+        use_levels(None)
+        assert get_level(40) == LEVELS[-1]
+        assert get_total_worlds() == 4
@@ -1,6 +1,17 @@
 """Tests for problem generation."""
 
-from flashy.core.problems import Operation, Problem, generate_problem
+import random
+
+import pytest
+
+from flashy.core import problems
+from flashy.core.problems import (
+    Operation,
+    Problem,
+    generate_problem,
+    generate_problems,
+    parse_problem,
+)
 
 
 class TestProblem:
@@ -23,6 +34,21 @@ class TestProblem:
         assert problem.display() == "20 ÷ 4"
 
 
+class TestParseProblem:
+    """Tests for parse_problem."""
+
+    def test_operators(self) -> None:
+        assert parse_problem("12 - 5") == Problem(12, 5, Operation.SUBTRACT, 7)
+        assert parse_problem("3x4") == Problem(3, 4, Operation.MULTIPLY, 12)
+        assert parse_problem("12 ÷ 3") == Problem(12, 3, Operation.DIVIDE, 4)
+        assert parse_problem("-1 - (-8)") == Problem(-1, -8, Operation.SUBTRACT, 7)
+
+    def test_invalid_problems(self) -> None:
+        for text in ("7 % 2", "seven + 1", "7 / 2", "7 / 0", ""):
+            with pytest.raises(ValueError):
+                parse_problem(text)
+
+
 class TestGenerateProblem:
     """Tests for problem generation."""
 
@@ -74,3 +100,76 @@ class TestGenerateProblem:
         for _ in range(100):
             problem = generate_problem(Operation.DIVIDE, 0, 10)
             assert problem.operand2 != 0
+
+
+class TestGenerateProblems:
+    """Tests for batch problem generation."""
+
+    def _batches(self, monkeypatch: pytest.MonkeyPatch, operation: Operation):
+        """Yield a batch from each available path."""
+        yield generate_problems(operation, 0, 12, 500, rng=random.Random(1))
+        monkeypatch.setattr(problems, "np", None)
+        yield generate_problems(operation, 0, 12, 500, rng=random.Random(1))
+
+    def test_rules_match_generate_problem(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for operation in Operation:
+            for batch in self._batches(monkeypatch, operation):
+                assert len(batch) == 500
+                for problem in batch:
+                    assert problem.operation == operation
+                    if operation == Operation.ADD:
+                        assert problem.answer == problem.operand1 + problem.operand2
+                    elif operation == Operation.SUBTRACT:
+                        assert problem.operand1 >= problem.operand2
+                        assert problem.answer == problem.operand1 - problem.operand2
+                    elif operation == Operation.MULTIPLY:
+                        assert problem.answer == problem.operand1 * problem.operand2
+                    else:
+                        assert problem.operand2 != 0
+                        assert problem.operand1 == problem.answer * problem.operand2
+                        assert 0 <= problem.answer <= 12
+
+    def test_items_are_made_lazily(self) -> None:
+        batch = generate_problems(Operation.ADD, 1, 9, 10_000, rng=random.Random(2))
+
+        problem = batch[1234]
+        assert isinstance(problem, Problem)
+        assert type(problem.operand1) is int
+        assert problem == list(batch)[1234]
+
+    def test_same_seed_same_batch(self) -> None:
+        first = generate_problems(Operation.MULTIPLY, 1, 9, 50, rng=random.Random(3))
+        second = generate_problems(Operation.MULTIPLY, 1, 9, 50, rng=random.Random(3))
+
+        assert list(first) == list(second)
+
+    def test_numpy_path_matches_fallback(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pytest.importorskip("numpy")
+        for operation in Operation:
+            fast = list(
+                generate_problems(operation, 1, 6, 20_000, rng=random.Random(4))
+            )
+            with monkeypatch.context() as patch:
+                patch.setattr(problems, "np", None)
+                fallback = list(
+                    generate_problems(operation, 1, 6, 20_000, rng=random.Random(5))
+                )
+
+            # Same range: every possible problem turns up on both paths
+            assert set(fast) == set(fallback)
+            for column in ("operand1", "operand2", "answer"):
+                fast_mean = sum(getattr(p, column) for p in fast) / len(fast)
+                slow_mean = sum(getattr(p, column) for p in fallback) / len(fallback)
+                assert fast_mean == pytest.approx(slow_mean, rel=0.05)
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            generate_problems(Operation.ADD, 5, 1, 10)
+        with pytest.raises(ValueError):
+            generate_problems(Operation.ADD, 1, 5, -1)
+        with pytest.raises(ValueError):
+            generate_problems(Operation.MULTIPLY, 0, 2**40, 10)
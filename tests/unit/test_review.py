@@ -0,0 +1,172 @@
+"""Tests for the spaced-repetition fact scheduler."""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from flashy.core.models import LevelResult, ProblemResult
+from flashy.core.problems import Operation
+from flashy.core.review import (
+    DEFAULT_INTERVALS,
+    REVIEW_LEVEL_NUMBER,
+    Fact,
+    ReviewScheduler,
+    review_level,
+)
+from flashy.game import GameController
+from flashy.storage.checkpoint import CheckpointJournal
+
+SEVEN_EIGHTS = Fact(7, Operation.MULTIPLY, 8)
+SIX_SEVENS = Fact(6, Operation.MULTIPLY, 7)
+
+
+def _result(problem: str, correct: bool) -> ProblemResult:
+    return ProblemResult(
+        problem=problem,
+        correct_answer=0,
+        given_answer=None,
+        is_correct=correct,
+        time_seconds=1.0,
+        points=0,
+    )
+
+
+class TestReviewScheduler:
+    """Tests for ReviewScheduler."""
+
+    def test_boxes_move_up_and_reset(self) -> None:
+        scheduler = ReviewScheduler()
+        scheduler.record(SEVEN_EIGHTS, True, 0)
+        scheduler.record(SEVEN_EIGHTS, True, 100)
+
+        state = scheduler.state(SEVEN_EIGHTS)
+        assert state is not None
+        assert (state.box, state.due) == (2, 100 + DEFAULT_INTERVALS[2])
+
+        scheduler.record(SEVEN_EIGHTS, False, 200)
+        state = scheduler.state(SEVEN_EIGHTS)
+        assert state is not None
+        assert (state.box, state.seen, state.correct) == (0, 3, 2)
+
+    def test_next_due_is_the_soonest(self) -> None:
+        scheduler = ReviewScheduler()
+        scheduler.record(SEVEN_EIGHTS, True, 0)  # Due at 600
+        scheduler.record(SIX_SEVENS, False, 0)  # Due at 60
+
+        assert scheduler.next_due(30) is None
+        assert scheduler.next_due(60) == SIX_SEVENS
+        scheduler.record(SIX_SEVENS, True, 60)  # Now due at 660
+        assert scheduler.next_due(650) == SEVEN_EIGHTS
+        assert SEVEN_EIGHTS.problem().answer == 56
+
+    def test_due_lists_the_facts_due_soonest_first(self) -> None:
+        scheduler = ReviewScheduler()
+        scheduler.record(SEVEN_EIGHTS, True, 0)  # Due at 600
+        scheduler.record(SIX_SEVENS, False, 0)  # Due at 60
+        scheduler.record(SIX_SEVENS, False, 30)  # Now due at 90
+
+        assert scheduler.due(30) == []
+        assert scheduler.due(600) == [SIX_SEVENS, SEVEN_EIGHTS]
+        assert scheduler.due(600, limit=1) == [SIX_SEVENS]
+
+    def test_stale_entries_are_compacted(self) -> None:
+        scheduler = ReviewScheduler()
+        for now in range(1000):
+            scheduler.record(SEVEN_EIGHTS, now % 2 == 0, now)
+
+        assert len(scheduler._heap) <= 3
+        assert scheduler.peek() == (SEVEN_EIGHTS, 999 + DEFAULT_INTERVALS[0])
+
+    def test_from_sessions_reads_problem_text(self) -> None:
+        session = LevelResult(
+            1,
+            "Trailhead",
+            0,
+            1,
+            3,
+            1,
+            3.0,
+            [_result("7 × 8", True), _result("-1 - (-8)", False), _result("?", True)],
+            "amy",
+            datetime(2026, 10, 1),
+        )
+
+        scheduler = ReviewScheduler.from_sessions([session])
+        assert len(scheduler) == 2
+        assert Fact(-1, Operation.SUBTRACT, -8) in scheduler
+
+    def test_packed_state_round_trip(self) -> None:
+        scheduler = ReviewScheduler()
+        for i in range(100):
+            scheduler.record(Fact(i, Operation.ADD, i), i % 3 != 0, 1_700_000_000 + i)
+
+        data = scheduler.to_bytes()
+        restored = ReviewScheduler.from_bytes(data)
+
+        assert len(data) == 5 + 100 * 18
+        assert len(restored) == 100
+        assert restored.peek() == scheduler.peek()
+        assert restored.state(Fact(5, Operation.ADD, 5)) == scheduler.state(
+            Fact(5, Operation.ADD, 5)
+        )
+        with pytest.raises(ValueError):
+            ReviewScheduler.from_bytes(data[:-1])
+
+    def test_game_controller_updates_the_scheduler(self) -> None:
+        scheduler = ReviewScheduler()
+        controller = GameController("amy", 1, storage=MagicMock(), scheduler=scheduler)
+        problem = controller.current_problem
+        assert problem is not None
+
+        controller.submit_answer(problem.answer, time_taken=1.0)
+
+        state = scheduler.state(Fact.of(problem))
+        assert state is not None and state.correct == 1
+
+    def test_resumed_answers_are_not_recorded_twice(self, tmp_path: Path) -> None:
+        scheduler = ReviewScheduler()
+        journal = CheckpointJournal(tmp_path / "checkpoint.bin")
+        journal.start(1)
+        original = GameController(
+            "amy", 1, storage=MagicMock(), journal=journal, scheduler=scheduler
+        )
+        problem = original.current_problem
+        assert problem is not None
+        original.submit_answer(problem.answer, time_taken=1.0)
+        journal.close()
+
+        checkpoint = journal.resume()
+        assert checkpoint is not None
+        resumed = GameController(
+            "amy", 1, storage=MagicMock(), journal=journal, scheduler=scheduler
+        )
+        resumed.replay(checkpoint.answers)
+        journal.close()
+
+        state = scheduler.state(Fact.of(problem))
+        assert state is not None
+        assert (state.seen, state.correct, state.box) == (1, 1, 1)
+
+    def test_review_round_logs_without_touching_progress(self) -> None:
+        storage = MagicMock()
+        level = review_level([SEVEN_EIGHTS, SIX_SEVENS])
+        controller = GameController(
+            "amy", REVIEW_LEVEL_NUMBER, storage=storage, level=level
+        )
+        assert controller.is_review
+        assert controller.current_problem == SEVEN_EIGHTS.problem()
+
+        controller.submit_answer(56, time_taken=1.0)
+        controller.submit_answer(41, time_taken=1.0)
+        controller.finish()
+
+        storage.save_progress.assert_not_called()
+        [result] = storage.log_session.call_args.args
+        assert (result.level_number, result.correct_count) == (0, 1)
+        # The logged round counts when the scheduler is rebuilt
+        result.timestamp = datetime(2026, 10, 1)  # As read back from history
+        scheduler = ReviewScheduler.from_sessions([result])
+        state = scheduler.state(SIX_SEVENS)
+        assert state is not None and state.box == 0
@@ -0,0 +1,111 @@
+"""Tests for constraint-aware problem sampling."""
+
+import random
+
+import pytest
+
+from flashy.core.problems import Operation
+from flashy.core.sampling import (
+    Bounds,
+    NoBorrow,
+    NoCarry,
+    ProblemSampler,
+    WithBorrow,
+    WithCarry,
+    candidate_table,
+)
+
+
+class TestCandidateTable:
+    """Tests for candidate_table."""
+
+    def test_no_carry_two_digit_addition(self) -> None:
+        table = candidate_table(Operation.ADD, 10, 99, [NoCarry()])
+
+        problems = [table[i] for i in range(len(table))]
+        # Tens digits 1-8 summing to at most 9, ones digits summing to at most 9
+        assert len(problems) == 36 * 55
+        for problem in problems:
+            assert problem.operand1 % 10 + problem.operand2 % 10 < 10
+            assert problem.answer < 100
+
+    def test_carry_and_no_carry_split_the_range(self) -> None:
+        carry = candidate_table(Operation.ADD, 0, 20, [WithCarry()])
+        no_carry = candidate_table(Operation.ADD, 0, 20, [NoCarry()])
+
+        assert len(carry) + len(no_carry) == 21 * 21
+
+    def test_borrowing(self) -> None:
+        borrow = candidate_table(Operation.SUBTRACT, 0, 99, [WithBorrow()])
+        no_borrow = candidate_table(Operation.SUBTRACT, 0, 99, [NoBorrow()])
+
+        assert len(borrow) + len(no_borrow) == 100 * 101 // 2
+        problem = borrow[0]
+        assert problem.operand1 % 10 < problem.operand2 % 10
+
+    def test_division_facts(self) -> None:
+        table = candidate_table(Operation.DIVIDE, 0, 12, [Bounds("operand2", high=9)])
+
+        problems = [table[i] for i in range(len(table))]
+        assert len(problems) == 13 * 9
+        assert all(1 <= p.operand2 <= 9 for p in problems)
+        assert all(p.operand1 == p.answer * p.operand2 for p in problems)
+
+    def test_tables_are_cached(self) -> None:
+        first = candidate_table(
+            Operation.ADD, 0, 50, [NoCarry(), Bounds("answer", high=40)]
+        )
+        second = candidate_table(
+            Operation.ADD, 0, 50, [Bounds("answer", high=40), NoCarry()]
+        )
+
+        assert first is second
+
+    def test_invalid_keys(self) -> None:
+        with pytest.raises(ValueError, match="does not apply"):
+            candidate_table(Operation.MULTIPLY, 0, 9, [NoCarry()])
+        with pytest.raises(ValueError, match="too large"):
+            candidate_table(Operation.ADD, 0, 10_000)
+
+
+class TestProblemSampler:
+    """Tests for ProblemSampler."""
+
+    def test_samples_satisfy_constraints(self) -> None:
+        sampler = ProblemSampler(
+            Operation.SUBTRACT, 10, 99, [WithBorrow()], rng=random.Random(1)
+        )
+
+        for problem in sampler.sample_many(200):
+            assert problem.operand1 % 10 < problem.operand2 % 10
+
+    def test_draw_deals_every_problem_once(self) -> None:
+        sampler = ProblemSampler(Operation.MULTIPLY, 1, 5, rng=random.Random(2))
+
+        dealt = [sampler.draw() for _ in range(len(sampler))]
+        assert len(set(dealt)) == 25
+        assert sampler.remaining == 0
+        with pytest.raises(IndexError):
+            sampler.draw()
+
+        sampler.reset()
+        assert sampler.remaining == 25
+
+    def test_sample_without_replacement(self) -> None:
+        sampler = ProblemSampler(Operation.ADD, 0, 9, rng=random.Random(3))
+
+        problems = sampler.sample_many(100, replace=False)
+        assert len(set(problems)) == 100
+        with pytest.raises(ValueError):
+            sampler.sample_many(101, replace=False)
+
+    def test_same_seed_same_problems(self) -> None:
+        def run(seed: int) -> list:
+            sampler = ProblemSampler(Operation.ADD, 0, 20, rng=random.Random(seed))
+            return [sampler.draw() for _ in range(10)] + sampler.sample_many(10)
+
+        assert run(4) == run(4)
+
+    def test_impossible_constraints(self) -> None:
+        with pytest.raises(ValueError, match="No problems"):
+            ProblemSampler(Operation.ADD, 0, 9, [Bounds("answer", low=100)])
@@ -0,0 +1,57 @@
+"""Tests for the non-blocking speech recognition logger."""
+
+import json
+from pathlib import Path
+
+from flashy.storage.speech_log import SpeechLogger
+
+
+def read_entries(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestSpeechLogger:
+    """Tests for SpeechLogger."""
+
+    def test_final_results_are_written(self, tmp_path: Path) -> None:
+        path = tmp_path / "speech.log"
+        logger = SpeechLogger(path)
+        assert logger.log("seven", 7, 7, True)
+        logger.flush()
+
+        [entry] = read_entries(path)
+        assert entry["transcript"] == "seven"
+        assert entry["matched"] is True
+        assert entry["partial"] is False
+        logger.close()
+
+    def test_partials_are_rate_limited(self, tmp_path: Path) -> None:
+        path = tmp_path / "speech.log"
+        logger = SpeechLogger(path, partial_interval=60.0)
+        logged = [logger.log("twen", None, 21, False, partial=True) for _ in range(5)]
+        logger.flush()
+
+        assert logged == [True, False, False, False, False]
+        assert logger.sampled_out == 4
+        assert len(read_entries(path)) == 1
+        logger.close()
+
+    def test_matched_partials_are_always_logged(self, tmp_path: Path) -> None:
+        path = tmp_path / "speech.log"
+        logger = SpeechLogger(path, partial_interval=60.0)
+        logger.log("twen", None, 21, False, partial=True)
+        assert logger.log("twenty one", 21, 21, True, partial=True)
+        logger.flush()
+
+        assert [e["matched"] for e in read_entries(path)] == [False, True]
+        logger.close()
+
+    def test_zero_interval_logs_every_partial(self, tmp_path: Path) -> None:
+        path = tmp_path / "speech.log"
+        logger = SpeechLogger(path, partial_interval=0)
+        for text in ("t", "tw", "two"):
+            logger.log(text, None, 2, False, partial=True)
+        logger.flush()
+
+        assert len(read_entries(path)) == 3
+        logger.close()
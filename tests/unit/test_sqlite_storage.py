@@ -0,0 +1,149 @@
+"""Tests for the SQLite storage backend."""
+
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from flashy.core.models import (
+    LevelResult,
+    PlayerProgress,
+    PlayerSummary,
+    ProblemResult,
+)
+from flashy.storage import SqliteStorage
+
+
+def make_result(player: str, level: int, score: int = 100) -> LevelResult:
+    return LevelResult(
+        level_number=level,
+        level_name=f"Level {level}",
+        total_score=score,
+        correct_count=1,
+        total_problems=2,
+        best_streak=1,
+        total_time_seconds=3.5,
+        problems=[
+            ProblemResult("1 + 1", 2, 2, True, 1.5, score),
+            ProblemResult("2 + 2", 4, None, False, 2.0, 0),
+        ],
+        player_name=player,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path: Path):
+    storage = SqliteStorage(tmp_path / "flashy.db")
+    yield storage
+    storage.close()
+
+
+class TestSqliteStorageProgress:
+    """Tests for player progress persistence."""
+
+    def test_load_unknown_player_is_empty(self, storage: SqliteStorage) -> None:
+        assert storage.load_progress("nobody") == PlayerProgress()
+
+    def test_save_and_load_roundtrip(self, storage: SqliteStorage) -> None:
+        progress = PlayerProgress()
+        progress.set_stars(1, 3)
+        progress.set_stars(2, 2)
+        progress.set_best_score(1, 2700)
+        storage.save_progress("alice", progress)
+
+        loaded = storage.load_progress("alice")
+        assert loaded.stars == {1: 3, 2: 2}
+        assert loaded.best_scores == {1: 2700}
+
+    def test_save_replaces_previous_progress(self, storage: SqliteStorage) -> None:
+        storage.save_progress("alice", PlayerProgress(stars={1: 3, 2: 3}))
+        storage.save_progress("alice", PlayerProgress(stars={1: 2}))
+        assert storage.load_progress("alice").stars == {1: 2}
+
+    def test_players_are_listed_sorted(self, storage: SqliteStorage) -> None:
+        storage.save_progress("bob", PlayerProgress())
+        storage.save_progress("alice", PlayerProgress())
+        assert storage.list_players() == ["alice", "bob"]
+        assert storage.player_exists("bob")
+        assert not storage.player_exists("carol")
+
+    def test_data_survives_reopen(self, tmp_path: Path) -> None:
+        first = SqliteStorage(tmp_path / "flashy.db")
+        first.save_progress("alice", PlayerProgress(stars={1: 3}))
+        first.close()
+
+        second = SqliteStorage(tmp_path / "flashy.db")
+        assert second.load_progress("alice").stars == {1: 3}
+        second.close()
+
+    def test_player_summaries(self, storage: SqliteStorage) -> None:
+        storage.save_progress(
+            "bob", PlayerProgress(stars={1: 3, 2: 2}, best_scores={1: 500, 2: 300})
+        )
+        storage.save_progress("alice", PlayerProgress())
+
+        assert storage.list_player_summaries() == [
+            PlayerSummary("alice", 0, 1, 0),
+            PlayerSummary("bob", 5, 3, 800),
+        ]
+
+
+class TestSqliteStorageSessions:
+    """Tests for session history."""
+
+    def test_uses_wal_mode(self, storage: SqliteStorage) -> None:
+        mode = storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_log_session_roundtrip(self, storage: SqliteStorage) -> None:
+        result = make_result("alice", 1)
+        storage.log_session(result)
+        [loaded] = storage.load_sessions()
+        assert loaded.timestamp is not None
+        assert replace(loaded, timestamp=None) == result
+
+    def test_filter_by_player_and_level(self, storage: SqliteStorage) -> None:
+        storage.log_session(make_result("alice", 1))
+        storage.log_session(make_result("alice", 2))
+        storage.log_session(make_result("bob", 1))
+
+        assert len(storage.load_sessions(player_name="alice")) == 2
+        assert len(storage.load_sessions(level_number=1)) == 2
+        sessions = storage.load_sessions(player_name="bob", level_number=1)
+        assert [s.player_name for s in sessions] == ["bob"]
+
+    def test_newest_first_with_limit(self, storage: SqliteStorage) -> None:
+        for score in (100, 200, 300):
+            storage.log_session(make_result("alice", 1, score=score))
+        sessions = storage.load_sessions(player_name="alice", limit=2)
+        assert [s.total_score for s in sessions] == [300, 200]
+
+    def test_iter_sessions_is_chronological_and_filtered(
+        self, storage: SqliteStorage
+    ) -> None:
+        for day, player in ((3, "alice"), (1, "alice"), (2, "bob"), (4, "alice")):
+            result = make_result(player, 1, score=day)
+            result.timestamp = datetime(2026, 10, day)
+            storage.log_session(result)
+
+        sessions = storage.iter_sessions(
+            player="alice", since=datetime(2026, 10, 2), until=datetime(2026, 10, 4)
+        )
+        assert [s.total_score for s in sessions] == [3]
+        assert [s.total_score for s in storage.iter_sessions()] == [1, 2, 3, 4]
+
+    def test_iter_sessions_is_lazy(self, storage: SqliteStorage) -> None:
+        storage.log_session(make_result("alice", 1))
+        sessions = storage.iter_sessions()
+        first = next(sessions)
+        # Writes are not blocked while a reader is part way through
+        storage.log_session(make_result("alice", 2))
+        assert len(first.problems) == 2
+        sessions.close()
+
+    def test_player_lookups_use_index(self, storage: SqliteStorage) -> None:
+        plan = storage._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM sessions WHERE player_id = 1"
+        ).fetchall()
+        assert any("idx_sessions_player_time" in row["detail"] for row in plan)
@@ -0,0 +1,130 @@
+"""Tests for the TUI storage service and its prefetch snapshot."""
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from flashy.core.models import LevelResult, PlayerProgress
+from flashy.platforms.tui.storage_service import StorageService
+from flashy.storage import CachedStorage, FileStorage
+
+
+def _result(player: str, level: int, days_ago: int) -> LevelResult:
+    return LevelResult(
+        level,
+        "Trailhead",
+        100,
+        1,
+        1,
+        1,
+        1.0,
+        [],
+        player,
+        datetime.now() - timedelta(days=days_ago),
+    )
+
+
+@pytest.fixture
+def backend(tmp_path: Path):
+    storage = FileStorage(base_dir=tmp_path)
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def service(backend: FileStorage):
+    service = StorageService(CachedStorage(backend))
+    yield service
+    service.close()
+
+
+class TestStorageService:
+    """Tests for StorageService."""
+
+    def test_prefetch_loads_progress_and_recent_history(
+        self, backend: FileStorage, service: StorageService
+    ) -> None:
+        backend.save_progress("amy", PlayerProgress(stars={1: 2}))
+        for days_ago in (90, 3, 1):
+            backend.log_session(_result("amy", 1, days_ago))
+        backend.log_session(_result("ben", 1, 1))
+
+        async def scenario() -> PlayerProgress:
+            service.prefetch("amy")
+            return await service.load_progress("amy")
+
+        assert asyncio.run(scenario()).stars == {1: 2}
+        assert service.cached_progress("amy") == PlayerProgress(stars={1: 2})
+        assert service.cached_progress("ben") is None
+        # Only the last 30 days, and only amy's
+        assert len(service.recent_sessions("amy")) == 2
+        assert service.recent_sessions("ben") == []
+
+    def test_writes_keep_the_snapshot_current(
+        self, backend: FileStorage, service: StorageService
+    ) -> None:
+        async def scenario() -> None:
+            service.prefetch("amy")
+            await service.save_progress("amy", PlayerProgress(stars={3: 3}))
+            await service.log_session(_result("amy", 3, 0))
+            await service.log_session(_result("ben", 3, 0))
+
+        asyncio.run(scenario())
+
+        cached = service.cached_progress("amy")
+        assert cached is not None and cached.stars == {3: 3}
+        assert [s.level_number for s in service.recent_sessions("amy")] == [3]
+        assert backend.load_progress("amy").stars == {3: 3}
+
+    def test_snapshot_is_not_shared(self, service: StorageService) -> None:
+        async def scenario() -> PlayerProgress:
+            service.prefetch("amy")
+            return await service.load_progress("amy")
+
+        progress = asyncio.run(scenario())
+        progress.set_stars(1, 3)
+
+        assert service.cached_progress("amy") == PlayerProgress()
+
+    def test_saves_by_another_process_refresh_the_snapshot(
+        self, tmp_path: Path, service: StorageService
+    ) -> None:
+        other = FileStorage(base_dir=tmp_path)
+
+        async def scenario() -> PlayerProgress:
+            service.prefetch("amy")
+            await service.load_progress("amy")
+            other.save_progress("amy", PlayerProgress(stars={4: 2}))
+            other.log_session(_result("amy", 4, 0))
+            other.flush()
+            return await service.load_progress("amy")
+
+        try:
+            assert asyncio.run(scenario()).stars == {4: 2}
+        finally:
+            other.close()
+        assert service.cached_progress("amy") == PlayerProgress(stars={4: 2})
+        assert [s.level_number for s in service.recent_sessions("amy")] == [4]
+
+    def test_other_players_go_to_the_backend(
+        self, backend: FileStorage, service: StorageService
+    ) -> None:
+        backend.save_progress("ben", PlayerProgress(stars={2: 1}))
+
+        async def scenario() -> tuple[PlayerProgress, list[str]]:
+            service.prefetch("amy")
+            return await service.load_progress("ben"), await service.list_players()
+
+        progress, players = asyncio.run(scenario())
+        assert progress.stars == {2: 1}
+        assert players == ["ben"]
+
+    def test_checkpoint_journal_passthrough(
+        self, tmp_path: Path, service: StorageService
+    ) -> None:
+        journal = service.checkpoint_journal("amy")
+
+        assert journal is not None
+        assert journal.path == tmp_path / "players" / "amy" / "checkpoint.bin"
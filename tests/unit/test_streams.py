@@ -0,0 +1,71 @@
+"""Tests for seedable problem streams."""
+
+import pickle
+import random
+
+from flashy.core.problems import Operation, generate_problem
+from flashy.core.sampling import NoCarry
+from flashy.core.streams import ProblemStream
+
+
+def _take(stream: ProblemStream, n: int = 20) -> list:
+    return [stream.problem(Operation.MULTIPLY, 1, 12) for _ in range(n)]
+
+
+class TestProblemStream:
+    """Tests for ProblemStream."""
+
+    def test_same_inputs_same_problems(self) -> None:
+        first = ProblemStream(42, "amy", 7)
+        second = ProblemStream(42, "amy", 7)
+
+        assert _take(first) == _take(second)
+        assert list(first.problems(Operation.ADD, 0, 9, 50)) == list(
+            second.problems(Operation.ADD, 0, 9, 50)
+        )
+        first_sampler = first.sampler(Operation.ADD, 10, 99, [NoCarry()])
+        second_sampler = second.sampler(Operation.ADD, 10, 99, [NoCarry()])
+        assert [first_sampler.draw() for _ in range(10)] == [
+            second_sampler.draw() for _ in range(10)
+        ]
+
+    def test_inputs_change_the_stream(self) -> None:
+        base = _take(ProblemStream(42, "amy", 7))
+
+        assert _take(ProblemStream(43, "amy", 7)) != base
+        assert _take(ProblemStream(42, "ben", 7)) != base
+        assert _take(ProblemStream(42, "amy", 8)) != base
+
+    def test_global_random_is_untouched(self) -> None:
+        random.seed(5)
+        expected = generate_problem(Operation.ADD, 1, 100)
+        random.seed(5)
+        _take(ProblemStream(1))
+
+        assert generate_problem(Operation.ADD, 1, 100) == expected
+
+    def test_spawned_children_are_distinct_and_stable(self) -> None:
+        parent = ProblemStream(42, "amy", 7)
+        children = parent.spawn(4)
+        more = parent.spawn(2)
+
+        keys = {child.key for child in children + more} | {parent.key}
+        assert len(keys) == 7
+        assert ProblemStream(42, "amy", 7).child(5).key == more[1].key
+        assert len({tuple(_take(child)) for child in children}) == 4
+
+    def test_pickled_stream_continues_where_it_was(self) -> None:
+        stream = ProblemStream(42, "amy", 7)
+        expected = _take(ProblemStream(42, "amy", 7), 40)
+
+        assert _take(pickle.loads(pickle.dumps(stream))) == expected[:20]
+        _take(stream)
+        assert _take(pickle.loads(pickle.dumps(stream))) == expected[20:]
+
+    def test_pickled_parent_does_not_repeat_children(self) -> None:
+        parent = ProblemStream(42, "amy", 7)
+        spawned = parent.spawn(3)
+
+        restored = pickle.loads(pickle.dumps(parent))
+        keys = {child.key for child in spawned + restored.spawn(3)}
+        assert len(keys) == 6
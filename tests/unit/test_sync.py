@@ -0,0 +1,122 @@
+"""Tests for merging storages and sync bundles."""
+
+import gzip
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from flashy.core.models import LevelResult, PlayerProgress
+from flashy.storage import FileStorage
+from flashy.storage.sync import (
+    BundleSource,
+    export_bundle,
+    merge_progress,
+    session_hash,
+    sync_storage,
+)
+
+
+def _result(player: str, month: int, day: int, score: int = 100) -> LevelResult:
+    return LevelResult(
+        1, "Trailhead", score, 1, 1, 1, 1.0, [], player, datetime(2026, month, day)
+    )
+
+
+@pytest.fixture
+def make_storage(tmp_path: Path):
+    storages: list[FileStorage] = []
+
+    def make(name: str) -> FileStorage:
+        storage = FileStorage(base_dir=tmp_path / name)
+        storages.append(storage)
+        return storage
+
+    yield make
+    for storage in storages:
+        storage.close()
+
+
+class TestMergeProgress:
+    """Tests for merge_progress."""
+
+    def test_keeps_the_best_of_each_level(self) -> None:
+        merged = merge_progress(
+            [
+                PlayerProgress(stars={1: 3, 2: 1}, best_scores={1: 50, 2: 900}),
+                PlayerProgress(stars={2: 2, 3: 1}, best_scores={1: 70, 3: 10}),
+            ]
+        )
+
+        assert dict(merged.stars) == {1: 3, 2: 2, 3: 1}
+        assert dict(merged.best_scores) == {1: 70, 2: 900, 3: 10}
+
+
+class TestSyncStorage:
+    """Tests for sync_storage and bundles."""
+
+    def test_merges_sources_without_duplicates(self, make_storage) -> None:
+        laptop, desktop, target = (make_storage(n) for n in ("a", "b", "target"))
+        shared = _result("amy", 1, 5)
+        for storage in (laptop, desktop, target):
+            storage.log_session(shared)
+        laptop.log_session(_result("amy", 2, 1))
+        desktop.log_session(_result("ben", 1, 20))
+        laptop.save_progress("amy", PlayerProgress(stars={1: 1}))
+        desktop.save_progress("amy", PlayerProgress(stars={1: 3, 2: 1}))
+        desktop.save_progress("ben", PlayerProgress(stars={1: 2}))
+
+        report = sync_storage([laptop, desktop], target)
+
+        assert (report.players, report.sessions_added) == (2, 2)
+        assert report.duplicates_skipped == 2
+        assert [(s.player_name, s.timestamp) for s in target.iter_sessions()] == [
+            ("amy", datetime(2026, 1, 5)),
+            ("ben", datetime(2026, 1, 20)),
+            ("amy", datetime(2026, 2, 1)),
+        ]
+        assert dict(target.load_progress("amy").stars) == {1: 3, 2: 1}
+
+    def test_resync_adds_nothing(self, make_storage) -> None:
+        source, target = make_storage("a"), make_storage("target")
+        for day in range(1, 6):
+            source.log_session(_result("amy", 3, day))
+
+        sync_storage([source], target)
+        report = sync_storage([source], target)
+
+        assert (report.sessions_added, report.duplicates_skipped) == (0, 5)
+        assert len(list(target.iter_sessions())) == 5
+
+    def test_same_time_different_content_is_kept(self, make_storage) -> None:
+        source, target = make_storage("a"), make_storage("target")
+        source.log_session(_result("amy", 1, 1, score=10))
+        target.log_session(_result("amy", 1, 1, score=20))
+
+        assert session_hash(_result("amy", 1, 1, score=10)) != session_hash(
+            _result("amy", 1, 1, score=20)
+        )
+        assert sync_storage([source], target).sessions_added == 1
+
+    def test_bundle_round_trip(self, make_storage, tmp_path: Path) -> None:
+        source, target = make_storage("a"), make_storage("target")
+        source.save_progress("amy", PlayerProgress(stars={4: 2}, best_scores={4: 7}))
+        source.log_session(_result("amy", 1, 1))
+        source.log_session(_result("amy", 1, 2))
+
+        bundle_path = tmp_path / "room.flashy.gz"
+        assert export_bundle(source, bundle_path) == 2
+        bundle = BundleSource(bundle_path)
+
+        assert bundle.list_players() == ["amy"]
+        assert dict(bundle.load_progress("amy").best_scores) == {4: 7}
+        assert sync_storage([bundle], target).sessions_added == 2
+        assert target.load_progress("amy").get_stars(4) == 2
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "notes.gz"
+        with gzip.open(path, "wt") as f:
+            f.write('{"hello": 1}\n')
+
+        with pytest.raises(ValueError):
+            BundleSource(path)
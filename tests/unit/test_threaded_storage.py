@@ -0,0 +1,116 @@
+"""Tests for the thread-pool async storage adapter."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from flashy.core.models import LevelResult, PlayerProgress
+from flashy.storage import CachedStorage, FileStorage, ThreadedAsyncStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path):
+    backend = FileStorage(base_dir=tmp_path)
+    adapter = ThreadedAsyncStorage(CachedStorage(backend), session_batch_size=2)
+    yield adapter
+    adapter.close()
+    backend.close()
+
+
+def _result(player: str, day: int) -> LevelResult:
+    return LevelResult(
+        1, "Trailhead", day, 1, 1, 1, 1.0, [], player, datetime(2026, 10, day)
+    )
+
+
+class TestThreadedAsyncStorage:
+    """Tests for ThreadedAsyncStorage."""
+
+    def test_save_then_load(self, storage: ThreadedAsyncStorage) -> None:
+        async def scenario() -> PlayerProgress:
+            await storage.save_progress("amy", PlayerProgress(stars={1: 2}))
+            return await storage.load_progress("amy")
+
+        assert asyncio.run(scenario()).stars == {1: 2}
+
+    def test_calls_run_in_order(self, storage: ThreadedAsyncStorage) -> None:
+        async def scenario() -> list[bool]:
+            # Started together, the save is still seen by the later check
+            save = storage.save_progress("amy", PlayerProgress())
+            exists = storage.player_exists("amy")
+            _, amy_exists = await asyncio.gather(save, exists)
+            return [amy_exists, await storage.player_exists("ben")]
+
+        assert asyncio.run(scenario()) == [True, False]
+
+    def test_calls_run_off_the_event_loop_thread(
+        self, storage: ThreadedAsyncStorage
+    ) -> None:
+        threads: list[str] = []
+        backend = storage.backend
+        original = backend.list_players
+
+        def list_players() -> list[str]:
+            threads.append(threading.current_thread().name)
+            return original()
+
+        backend.list_players = list_players  # type: ignore[method-assign]
+        asyncio.run(storage.list_players())
+
+        assert threads[0].startswith("flashy-storage")
+
+    def test_iter_sessions_streams_in_batches(
+        self, storage: ThreadedAsyncStorage
+    ) -> None:
+        async def scenario() -> list[int]:
+            for day, player in ((3, "amy"), (1, "amy"), (2, "ben"), (4, "amy")):
+                await storage.log_session(_result(player, day))
+            return [s.total_score async for s in storage.iter_sessions(player="amy")]
+
+        assert asyncio.run(scenario()) == [1, 3, 4]
+
+    def test_abandoned_iter_sessions_is_closed_on_the_worker(
+        self, storage: ThreadedAsyncStorage
+    ) -> None:
+        closed_on: list[str] = []
+
+        def iter_sessions(*args) -> Iterator[LevelResult]:
+            try:
+                for day in range(1, 10):
+                    yield _result("amy", day)
+            finally:
+                closed_on.append(threading.current_thread().name)
+
+        storage.backend.iter_sessions = iter_sessions  # type: ignore[method-assign]
+
+        async def scenario() -> None:
+            sessions = storage.iter_sessions()
+            async for _ in sessions:
+                break
+            await sessions.aclose()
+
+        asyncio.run(scenario())
+        assert len(closed_on) == 1 and closed_on[0].startswith("flashy-storage")
+
+    def test_summaries_and_speech_log(self, storage: ThreadedAsyncStorage) -> None:
+        async def scenario() -> list[str]:
+            await storage.save_progress("amy", PlayerProgress(stars={1: 3}))
+            await storage.log_speech_recognition("five", 5, 5, True)
+            return [s.name for s in await storage.list_player_summaries()]
+
+        assert asyncio.run(scenario()) == ["amy"]
+
+    def test_close_stops_the_worker(self, tmp_path: Path) -> None:
+        backend = FileStorage(base_dir=tmp_path)
+        adapter = ThreadedAsyncStorage(backend)
+        asyncio.run(adapter.save_progress("amy", PlayerProgress()))
+        adapter.close()
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(adapter.list_players())
+        assert backend.player_exists("amy")
+        backend.close()
@@ -0,0 +1,127 @@
+"""Tests for the localStorage-backed web storage."""
+
+import json
+from datetime import datetime, timedelta
+
+from flashy.core.models import LevelResult
+from flashy.platforms.web.storage import HISTORY_CHUNK_SIZE, WebStorage
+
+
+class FakeLocalStorage:
+    """Dict-backed stand-in for the browser's localStorage."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, str] = {}
+        self.writes: list[str] = []
+
+    def getItem(self, key: str) -> str | None:  # noqa: N802
+        return self.items.get(key)
+
+    def setItem(self, key: str, value: str) -> None:  # noqa: N802
+        self.items[key] = value
+        self.writes.append(key)
+
+    def removeItem(self, key: str) -> None:  # noqa: N802
+        self.items.pop(key, None)
+
+
+def _result(level: int, minutes: int = 0, player: str = "Alice") -> LevelResult:
+    return LevelResult(
+        level_number=level,
+        level_name=f"Level {level}",
+        total_score=level * 10,
+        correct_count=5,
+        total_problems=10,
+        best_streak=3,
+        total_time_seconds=30.0,
+        problems=[],
+        player_name=player,
+        timestamp=datetime(2026, 1, 1) + timedelta(minutes=minutes),
+    )
+
+
+class TestChunkedHistory:
+    """Tests for chunked session history keys."""
+
+    def test_append_only_rewrites_last_chunk_and_head(self) -> None:
+        """Logging a session writes exactly the tail chunk and the head."""
+        store = FakeLocalStorage()
+        storage = WebStorage(store)
+        for i in range(HISTORY_CHUNK_SIZE + 1):
+            storage.log_session(_result(1, minutes=i))
+
+        store.writes.clear()
+        storage.log_session(_result(2, minutes=1000))
+
+        assert store.writes == ["flashy_history_0001", "flashy_history_head"]
+        assert json.loads(store.items["flashy_history_head"]) == {"chunks": 2}
+        assert len(json.loads(store.items["flashy_history_0000"])) == (
+            HISTORY_CHUNK_SIZE
+        )
+
+    def test_load_history_spans_chunks_in_order(self) -> None:
+        """Entries come back oldest first across chunk boundaries."""
+        storage = WebStorage(FakeLocalStorage())
+        count = HISTORY_CHUNK_SIZE * 2 + 3
+        for i in range(count):
+            storage.log_session(_result(i, minutes=i))
+
+        history = storage.load_history()
+        assert [entry["level_number"] for entry in history] == list(range(count))
+
+    def test_iter_sessions_filters(self) -> None:
+        """iter_sessions streams matching entries as LevelResults."""
+        storage = WebStorage(FakeLocalStorage())
+        storage.log_session(_result(1, minutes=0))
+        storage.log_session(_result(2, minutes=1, player="Bob"))
+        storage.log_session(_result(1, minutes=2))
+
+        results = list(storage.iter_sessions(player="Alice", level=1))
+        assert [r.timestamp for r in results] == [
+            datetime(2026, 1, 1),
+            datetime(2026, 1, 1, 0, 2),
+        ]
+
+    def test_legacy_history_is_migrated(self) -> None:
+        """A single flashy_history array is split into chunks on first use."""
+        store = FakeLocalStorage()
+        legacy = [_result(i, minutes=i).to_log_entry() for i in range(60)]
+        store.items["flashy_history"] = json.dumps(legacy)
+        storage = WebStorage(store)
+
+        storage.log_session(_result(99, minutes=100))
+
+        assert "flashy_history" not in store.items
+        history = storage.load_history()
+        assert [e["level_number"] for e in history] == [*range(60), 99]
+
+    def test_unreadable_chunk_is_skipped(self) -> None:
+        """A corrupt chunk does not hide the rest of the history."""
+        store = FakeLocalStorage()
+        storage = WebStorage(store)
+        for i in range(HISTORY_CHUNK_SIZE + 1):
+            storage.log_session(_result(1, minutes=i))
+        store.items["flashy_history_0000"] = "{not json"
+
+        assert len(storage.load_history()) == 1
+
+    def test_corrupt_head_is_rebuilt_from_chunks(self) -> None:
+        """A corrupt head is recounted instead of overwriting chunk 0."""
+        store = FakeLocalStorage()
+        storage = WebStorage(store)
+        count = HISTORY_CHUNK_SIZE + 1
+        for i in range(count):
+            storage.log_session(_result(i, minutes=i))
+        store.items["flashy_history_head"] = "{not json"
+
+        storage.log_session(_result(99, minutes=1000))
+
+        history = storage.load_history()
+        assert [e["level_number"] for e in history] == [*range(count), 99]
+        assert json.loads(store.items["flashy_history_head"]) == {"chunks": 2}
+
+    def test_without_local_storage(self) -> None:
+        """Outside the browser, history is simply empty."""
+        storage = WebStorage()
+        storage.log_session(_result(1))
+        assert storage.load_history() == []
@@ -0,0 +1,95 @@
+"""Tests for the write-behind log appender."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from flashy.storage.write_behind import WriteBehindLog
+
+
+class TestWriteBehindLog:
+    """Tests for WriteBehindLog."""
+
+    def test_flush_writes_queued_lines_in_order(self, tmp_path: Path) -> None:
+        log = WriteBehindLog()
+        path = tmp_path / "out.log"
+        for i in range(100):
+            log.append(path, str(i))
+        log.flush()
+
+        assert path.read_text().splitlines() == [str(i) for i in range(100)]
+        log.close()
+
+    def test_groups_lines_per_file(self, tmp_path: Path) -> None:
+        log = WriteBehindLog()
+        a, b = tmp_path / "a.log", tmp_path / "b.log"
+        log.append(a, "a1")
+        log.append(b, "b1")
+        log.append(a, "a2")
+        log.flush()
+
+        assert a.read_text() == "a1\na2\n"
+        assert b.read_text() == "b1\n"
+        log.close()
+
+    def test_close_writes_pending_lines(self, tmp_path: Path) -> None:
+        log = WriteBehindLog(fsync_interval=None)
+        path = tmp_path / "out.log"
+        log.append(path, "last words")
+        log.close()
+
+        assert path.read_text() == "last words\n"
+        assert not log.append(path, "too late")
+
+    def test_drops_when_queue_is_full(self, tmp_path: Path) -> None:
+        log = WriteBehindLog(max_pending=1)
+        path = tmp_path / "out.log"
+        # Hold the worker on its first item so the queue backs up
+        gate = threading.Event()
+        original_write = log._write
+
+        def slow_write(appends):
+            gate.wait()
+            original_write(appends)
+
+        log._write = slow_write  # type: ignore[method-assign]
+        log.append(path, "first")
+        results = [log.append(path, f"line {i}") for i in range(10)]
+        gate.set()
+        log.flush()
+
+        assert not all(results)
+        assert log.dropped == results.count(False)
+        log.close()
+
+    def test_flush_reports_write_errors(self, tmp_path: Path) -> None:
+        log = WriteBehindLog()
+        log.append(tmp_path / "missing" / "out.log", "x")
+        with pytest.raises(OSError):
+            log.flush()
+        log.close()
+
+    def test_call_after_close_raises(self, tmp_path: Path) -> None:
+        log = WriteBehindLog()
+        log.call(lambda: None)
+        log.close()
+
+        with pytest.raises(RuntimeError):
+            log.call(lambda: None)
+
+    def test_failing_callback_does_not_stop_the_writer(self, tmp_path: Path) -> None:
+        log = WriteBehindLog()
+        path = tmp_path / "out.log"
+
+        def broken(path: Path) -> None:
+            raise ValueError("bad callback")
+
+        log.append(path, "first", on_written=broken)
+        with pytest.raises(ValueError):
+            log.flush()
+        log.append(path, "second")
+        log.flush()
+
+        assert path.read_text() == "first\nsecond\n"
+        log.close()